@@ -6,6 +6,16 @@ import tkinter as tk
 from tkinter import filedialog, messagebox
 from functools import partial
 
+from unreal_io_worker import UnrealIOWorker
+from unreal_transform_stream import TransformStream
+from unreal_protocol import (BIN_MAX_COUNT, CODE_NOT_FOUND, CODE_TRANSPORT, CODE_UNKNOWN, FORMAT_JSON, PREVIEW_FIELDS,
+                             PROTO_VERSION, PUSH_WATCH, RELATIVE_VERBS, TRANSFORM_FIELDS,
+                             FrameReader, ProtocolError, TransformCache, TransformDeltaEncoder, Vec3,
+                             baselines_from_actor_state, decode_reply, encode_batch, encode_command,
+                             encode_transform_packet, format_material_multi, format_material_slots, format_relative,
+                             format_set_transforms, format_textures, Reply, is_editor_command, is_unknown_command, local_error,
+                             parse_actor_state, push_tag, slots_from_actor_state, transforms_from_state, verb_of)
+
 # ===============================
 # Project paths (edit if needed)
 # ===============================
@@ -20,27 +30,97 @@ DEFAULT_FBX_EXPORT_DIR   = r"C:\git\XR-Studio\MyProjectCamera\Content\Scripts\Ex
 EDITOR_SCRIPT_SPAWN  = r"C:\git\XR-Studio\MyProjectCamera\Content\Python\editor_spawn_actor.py"
 EDITOR_SCRIPT_PRESET = r"C:\git\XR-Studio\MyProjectCamera\Content\Python\editor_scene_preset.py"
 
+# ─────────────────────────────────────────────────────
+# 포트별 지속 연결 (9999 PIE / 9998 EDITOR 각각 하나씩 유지)
+class _PortConn:
+    def __init__(self, port, sock):
+        self.port = port
+        self.sock = sock
+        self.framed = False         # PROTO 협상 성공 시 v1 프레임 수신
+        self.json = False           # FORMAT JSON 협상 성공 시 응답이 JSON 봉투
+        self.reader = FrameReader()
+        self.orphans = 0            # 타임아웃으로 버린 요청 수 (늦게 도착한 응답 폐기용)
+        self.last_io = time.time()
+        self.caps = None            # HELLO로 받은 ServerCaps (None = 구버전 서버, 응답을 보고 폴백)
+        self.binary = None          # 바이너리 미리보기 패킷 지원 여부 (None = 아직 모름)
+        self.handles = {}           # 액터 이름 -> 서버 핸들 (연결이 바뀌면 새로 받음)
+        self.handle_refs = False    # 명령에 "#<핸들>" 참조를 써도 되는 서버 (LIST가 핸들을 줬으면 True)
+        self.watched = set()        # 이 연결로 WATCH 구독 중인 액터 이름 (푸시가 오는 연결)
+        self.selection = None       # 이 서버에 SELECT_SET으로 저장한 선택 (이름 튜플, None = 모름)
+        self.deltas = TransformDeltaEncoder()
+
+    def close(self):
+        try:
+            try: self.sock.shutdown(socket.SHUT_RDWR)
+            except Exception: pass
+            self.sock.close()
+        except Exception:
+            pass
+
+    def alive(self) -> bool:
+        """왕복 없이 소켓 상태만 확인 (상대가 닫았으면 recv(PEEK)가 b\"\" 반환)"""
+        try:
+            self.sock.setblocking(False)
+            try:
+                return self.sock.recv(1, socket.MSG_PEEK) != b""
+            finally:
+                self.sock.setblocking(True)
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+
+
 # ─────────────────────────────────────────────────────
 # 저지연 소켓 클라이언트
 class UnrealSocketClient:
     def __init__(self, ip='127.0.0.1', ports=[9999, 9998]):
         self.server_ip = ip
         self.ports = ports  # [PIE, EDITOR]
-        self.sock = None
-        self.current_port = None
         self.connect_timeout = 0.15
         self.recv_timeout    = 0.40
         self.mode_hint = "EDITOR"   # 우리가 기억하는 "현재 모드"
+        self.max_batch = 4096       # 서버 MaxBatchCommands와 맞춤
+        self.batch_item_timeout = 0.002
+        self.keepalive_interval = 5.0   # 이 시간 이상 조용한 연결은 PING으로 확인
+        self.reconnect_interval = 2.0   # 끊긴 포트 백그라운드 재연결 간격
+        self.prefer_json = True         # PROTO 1 연결이면 FORMAT JSON 협상 (False면 텍스트 응답 유지)
+        self._pool = {}             # port -> _PortConn
+        self._conn = None           # 현재 명령을 보낼 연결
+        self._last_attempt = {}     # port -> 마지막 백그라운드 연결 시도 시각
+        self.transforms = TransformCache()   # WATCH 푸시로 갱신되는 액터 트랜스폼 (조회 왕복 없이 읽기)
+        self._pushed = set()        # 아직 UI에 안 알린, 푸시로 바뀐 액터 이름
+        self._rewatch = {}          # port -> 끊긴 연결이 구독 중이던 액터 이름 (다시 연결되면 WATCH 재발행)
+        self.selection_set = f"ui{os.getpid()}"   # 서버 선택 집합 이름 (같은 서버를 쓰는 다른 도구와 안 겹치게)
+
+    # 현재 연결 상태 (기존 코드/외부 스크립트 호환용 읽기 전용)
+    @property
+    def sock(self):
+        return self._conn.sock if self._conn else None
+
+    @property
+    def current_port(self):
+        return self._conn.port if self._conn else None
+
+    @property
+    def framed(self):
+        return bool(self._conn and self._conn.framed)
 
     def close(self):
-        if self.sock:
-            try:
-                try: self.sock.shutdown(socket.SHUT_RDWR)
-                except Exception: pass
-                self.sock.close()
-            finally:
-                self.sock = None
-                self.current_port = None
+        for conn in list(self._pool.values()):
+            conn.close()
+        self._pool.clear()
+        self._conn = None
+
+    def _drop(self, conn):
+        self.transforms.forget(conn.watched)   # 푸시가 끊기면 캐시 값도 믿을 수 없음
+        if conn.watched:
+            self._rewatch[conn.port] = conn.watched
+        conn.close()
+        if self._pool.get(conn.port) is conn:
+            del self._pool[conn.port]
+        if self._conn is conn:
+            self._conn = None
 
     def _new_socket(self):
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -48,37 +128,162 @@ class UnrealSocketClient:
         s.settimeout(self.connect_timeout)
         return s
 
-    def connect(self, port):
-        if self.sock and self.current_port == port:
-            return True
-        self.close()
+    def _open(self, port):
+        """풀에 살아있는 연결이 있으면 재사용, 없으면 새로 연결 + PROTO 협상"""
+        conn = self._pool.get(port)
+        if conn is not None:
+            if conn.alive():
+                return conn
+            print(f"⚠️ 끊어진 연결 정리 {self.server_ip}:{port}")
+            self._drop(conn)
         try:
             s = self._new_socket()
             s.connect((self.server_ip, port))
             s.settimeout(self.recv_timeout)
-            self.sock = s
-            self.current_port = port
-            self.mode_hint = "PIE" if port == self.ports[0] else "EDITOR"
-            print(f"✅ 연결 {self.server_ip}:{port} (mode={self.mode_hint})")
-            return True
         except Exception as e:
             print(f"❌ 연결 실패 {port}: {e}")
-            self.sock = None
-            self.current_port = None
+            return None
+        conn = _PortConn(port, s)
+        self._negotiate(conn)
+        self._negotiate_format(conn)
+        self._negotiate_caps(conn)
+        self._restore_watch(conn)
+        self._pool[port] = conn
+        kind = conn.caps.kind if conn.caps else "?"
+        print(f"✅ 연결 {self.server_ip}:{port} (framed={conn.framed}, json={conn.json}, caps={kind})")
+        return conn
+
+    def _use(self, port):
+        # 모드 힌트는 건드리지 않고 보낼 연결만 선택 (에디터 전용 명령 라우팅용)
+        conn = self._open(port)
+        if conn is None:
             return False
+        self._conn = conn
+        return True
 
-    def _quick_probe(self):
-        order = [self.ports[1], self.ports[0]] if self.mode_hint == "EDITOR" else [self.ports[0], self.ports[1]]
-        for p in order:
-            if self.connect(p): return True
-        return False
+    def connect(self, port):
+        if not self._use(port):
+            return False
+        self.mode_hint = "PIE" if port == self.ports[0] else "EDITOR"
+        return True
+
+    def _negotiate(self, conn):
+        """접속 직후 PROTO 협상. 구버전 서버면 legacy(raw 응답) 모드로 남음"""
+        sock, reader = conn.sock, conn.reader
+        try:
+            sock.sendall(encode_command(f"PROTO {PROTO_VERSION}"))
+            end = time.time() + self.recv_timeout
+            while time.time() < end:
+                sock.settimeout(max(0.001, end - time.time()))
+                data = sock.recv(4096)
+                if not data: break
+                reader.feed(data)
+                kind = reader.looks_framed()
+                if kind is False:
+                    break   # legacy 서버: "알 수 없는 명령" 응답 → 바로 폴백
+                frame = reader.pop_frame() if kind else None
+                if frame is not None:
+                    p = frame[0].split()
+                    conn.framed = len(p) >= 3 and p[0] == "OK" and p[1] == "PROTO" and p[2] != "0"
+                    break
+        except (socket.timeout, ValueError):
+            pass
+        finally:
+            if not conn.framed:
+                reader.clear()
+            sock.settimeout(self.recv_timeout)
+
+    def _handshake(self, conn, command: str, json_mode: bool):
+        """PROTO 1 연결에서 협상 명령 1개 왕복 → Reply. 응답이 없으면 None"""
+        sock, reader = conn.sock, conn.reader
+        try:
+            sock.sendall(encode_command(command))
+            end = time.time() + self.recv_timeout
+            while True:
+                frame = reader.pop_frame()
+                if frame is not None:
+                    return decode_reply(frame[0], verb_of(command), json_mode)
+                if time.time() >= end:
+                    break
+                sock.settimeout(max(0.001, end - time.time()))
+                data = sock.recv(4096)
+                if not data:
+                    return None
+                reader.feed(data)
+        except socket.timeout:
+            pass
+        except ProtocolError:
+            return None
+        finally:
+            sock.settimeout(self.recv_timeout)
+        conn.orphans += 1   # 협상 응답이 늦게 오면 버림
+        return None
+
+    def _negotiate_format(self, conn):
+        """PROTO 1 연결이면 FORMAT JSON 협상. 모르는 서버면 텍스트 응답으로 남음 (decode_text_reply로 해석)"""
+        if not (conn.framed and self.prefer_json):
+            return
+        reply = self._handshake(conn, f"FORMAT {FORMAT_JSON}", json_mode=True)
+        conn.json = reply is not None and reply.ok and (reply.data or {}).get("format") == FORMAT_JSON
+
+    def _negotiate_caps(self, conn):
+        """HELLO로 서버 능력을 받아 연결에 캐시. 구버전 서버면 caps=None (기존처럼 응답을 보고 폴백)"""
+        if not conn.framed:
+            return
+        reply = self._handshake(conn, "HELLO", conn.json)
+        conn.caps = reply.value if reply is not None and reply.ok else None
+        if conn.caps is not None and not conn.caps.binary:
+            conn.binary = False   # HANDLE 왕복으로 확인할 필요 없음
+
+    def _restore_watch(self, conn):
+        """다시 연결된 포트에 끊기기 전 구독을 재발행 (새 연결은 watched가 비어 푸시가 안 옴). 스냅샷은 UI에 변경으로 알림"""
+        names = self._rewatch.pop(conn.port, None)
+        if not names or not conn.framed or (conn.caps is not None and not conn.caps.supports("WATCH")):
+            return
+        names = sorted(names)
+        reply = self._handshake(conn, f"WATCH {' '.join(names)}", conn.json)
+        if reply is None or not reply.ok or not isinstance(reply.data, dict):
+            return
+        missing = set(reply.data.get("missing", ()))
+        conn.watched = {n for n in names if n not in missing}
+        self._pushed.update(self.transforms.apply(reply.data))
+
+    def _recv_frame(self, timeout=None):
+        # 프레임이 완성되는 즉시 반환 → RTT = 서버 처리 시간 (recv_timeout은 상한), 타임아웃이면 None
+        conn = self._conn
+        end = time.time() + (self.recv_timeout if timeout is None else timeout)
+        while True:
+            frame = conn.reader.pop_frame()
+            if frame is not None:
+                if push_tag(frame[1]):
+                    self._on_push(conn, frame)   # 응답 사이에 끼어 온 푸시
+                    continue
+                if conn.orphans > 0:
+                    conn.orphans -= 1   # 이전에 타임아웃된 요청의 늦은 응답
+                    continue
+                return frame[0]
+            remaining = end - time.time()
+            if remaining <= 0:
+                conn.orphans += 1
+                return None
+            conn.sock.settimeout(remaining)
+            try:
+                data = conn.sock.recv(65536)
+            except socket.timeout:
+                conn.orphans += 1
+                return None
+            if not data:
+                self._drop(conn)
+                raise ConnectionError("서버가 연결을 닫았습니다")
+            conn.reader.feed(data)
 
     def _recv_until_newline(self):
+        sock = self._conn.sock
         end = time.time() + self.recv_timeout
         chunks = []
         while time.time() < end:
             try:
-                data = self.sock.recv(4096)
+                data = sock.recv(4096)
                 if not data: break
                 chunks.append(data)
                 if b'\n' in data: break
@@ -86,48 +291,123 @@ class UnrealSocketClient:
                 break
             except Exception as e:
                 return f"❌ 수신 오류: {e}"
-        if not chunks: return ""
+        if not chunks: return None
         try:
             return b"".join(chunks).decode("utf-8", "ignore")
         except Exception:
             return "(binary)"
-        
-    # ... (기존 close/_new_socket/connect/_quick_probe/_recv_until_newline 그대로)
 
     def _send_and_get(self, payload: str):
-        self.sock.sendall((payload.strip() + "\n").encode("utf-8"))
-        return self._recv_until_newline()
+        # 텍스트 명령이 트랜스폼을 바꿨을 수 있음 → 다음 미리보기는 절대값부터
+        conn = self._conn
+        conn.deltas.reset()
+        conn.sock.sendall(encode_command(payload))
+        conn.last_io = time.time()
+        raw = self._recv_frame() if conn.framed else self._recv_until_newline()
+        return self._decode(conn, raw, payload)
+
+    @staticmethod
+    def _decode(conn, raw, command: str):
+        if raw is None:
+            return local_error("⏳ (no response)", "Timeout")
+        return decode_reply(raw, verb_of(command), conn.json)
 
     def _auto_switch_if_needed(self, resp: str):
-        # 서버가 명시적으로 알려주는 경우 우선
+        # 서버가 명시적으로 알려주는 경우 우선 (풀에 연결이 있으면 재연결 없이 전환)
         if "SWITCH:PIE" in resp or "ERR PIE" in resp:
             if self.connect(self.ports[0]):   # PIE
-                self.mode_hint = "PIE"
                 return True
         if "SWITCH:EDITOR" in resp:
             if self.connect(self.ports[1]):   # EDITOR
-                self.mode_hint = "EDITOR"
                 return True
         return False
-    
+
     def _quick_probe(self):
-    # 시도 순서: EDITOR(9998) → PIE(9999)
-        order = [self.ports[1], self.ports[0]]
+        # 두 포트 모두 미리 열어두고, 모드 힌트 포트를 현재 연결로 선택
+        order = [self.ports[1], self.ports[0]] if self.mode_hint == "EDITOR" else [self.ports[0], self.ports[1]]
+        opened = [p for p in order if self._open(p) is not None]
+        if not opened:
+            return False
+        return self.connect(opened[0])
 
-        for port in order:
+    def keepalive(self):
+        """
+        I/O 스레드가 한가할 때 호출: 오래 조용한 연결은 PING으로 확인, 끊긴 포트는 주기적으로 재연결.
+        현재 연결/모드 힌트는 바꾸지 않음. 반환: {port: 살아있음 여부}
+        """
+        now = time.time()
+        active = self._conn
+        status = {}
+        for port in self.ports:
+            conn = self._pool.get(port)
+            if conn is None:
+                if now - self._last_attempt.get(port, 0.0) < self.reconnect_interval:
+                    status[port] = False
+                    continue
+                self._last_attempt[port] = now
+                conn = self._open(port)
+                status[port] = conn is not None
+                continue
+            if now - conn.last_io < self.keepalive_interval:
+                status[port] = conn.alive()
+                if not status[port]:
+                    self._drop(conn)
+                continue
+            self._conn = conn
             try:
-                if self.connect(port):
-                    if port == self.ports[1]:
-                        self.mode_hint = "EDITOR"
-                    else:
-                        self.mode_hint = "PIE"
-                    return True
-            except:
-                pass
+                ok = self._send_and_get("PING").code != CODE_TRANSPORT
+            except Exception:
+                ok = False
+            if not ok:
+                self._drop(conn)
+            status[port] = ok
+        self._conn = active if active is not None and self._pool.get(active.port) is active else None
+        return status
+
+    def _ensure_connected(self, command: str, preferred: str | None = None):
+        # 1) 기본 분류 (기존 로직 유지)
+        editor_only = is_editor_command(command)
+
+        # 2) preferred 값으로 강제 덮어쓰기
+        if preferred == "EDITOR":
+            target_port = self.ports[1]
+        elif preferred == "PIE":
+            target_port = self.ports[0]
+        else:
+            # AUTO 모드일 경우: 에디터 명령이면 9998, 아니면 현재 힌트 사용
+            if editor_only:
+                target_port = self.ports[1]
+            else:
+                # mode_hint를 보고 우선 포트 결정
+                target_port = self.ports[1] if self.mode_hint == "EDITOR" else self.ports[0]
 
-        # 둘 다 실패 → sock=None
-        self.sock = None
-        return False
+        # 3) 능력을 아는 연결이면 명령을 처리하는 서버로 (모르는 명령 왕복 없이)
+        if preferred is None:
+            target_port = self._route_by_caps(verb_of(command), target_port)
+
+        # 4) 풀에서 해당 포트 연결 선택 (없으면 연결), 안되면 다른 포트
+        if self._use(target_port):
+            return True
+        other = self.ports[0] if target_port == self.ports[1] else self.ports[1]
+        return self._use(other)
+
+    def _route_by_caps(self, verb: str, port):
+        conn = self._pool.get(port)
+        if conn is None or conn.caps is None or conn.caps.supports(verb):
+            return port
+        other = self.ports[0] if port == self.ports[1] else self.ports[1]
+        alt = self._pool.get(other)
+        return other if alt is not None and alt.caps is not None and alt.caps.supports(verb) else port
+
+    def supports(self, verb: str, preferred: str | None = None):
+        """
+        HELLO 능력 기준 명령 지원 여부 (send_command와 같은 포트 선택).
+        True/False = 서버가 알려준 값, None = 모름 (구버전 서버/연결 실패) → 호출 측이 응답을 보고 폴백
+        """
+        if not self._ensure_connected(verb, preferred):
+            return None
+        caps = self._conn.caps
+        return None if caps is None else caps.supports(verb)
 
     def send_command(self, command: str, preferred: str | None = None):
         """
@@ -135,35 +415,11 @@ class UnrealSocketClient:
           - None     : 기존 자동 분류 (is_editor_command 기반)
           - 'EDITOR' : 9998 우선 사용
           - 'PIE'    : 9999 우선 사용
+        반환: Reply (문자열 값 = 메시지, code/error/value로 결과 판별)
         """
         try:
-            # 1) 기본 분류 (기존 로직 유지)
-            is_editor_command = command.startswith("py ") or \
-                                command.startswith("SPAWN_ASSET") or \
-                                command.startswith("IMPORT_FBX") or \
-                                command.startswith("SAVE_PRESET") or \
-                                command.startswith("LOAD_PRESET")
-
-            # 2) preferred 값으로 강제 덮어쓰기
-            if preferred == "EDITOR":
-                target_port = self.ports[1]
-            elif preferred == "PIE":
-                target_port = self.ports[0]
-            else:
-                # AUTO 모드일 경우: 에디터 명령이면 9998, 아니면 현재 힌트 사용
-                if is_editor_command:
-                    target_port = self.ports[1]
-                else:
-                    # mode_hint를 보고 우선 포트 결정
-                    target_port = self.ports[1] if self.mode_hint == "EDITOR" else self.ports[0]
-
-            # 3) 연결 없으면 우선 포트로 연결 시도
-            if not self.sock:
-                if not self.connect(target_port):
-                    # 안되면 다른 포트도 한 번씩 시도
-                    other = self.ports[0] if target_port == self.ports[1] else self.ports[1]
-                    if not self.connect(other):
-                        return "❌ 연결 실패"
+            if not self._ensure_connected(command, preferred):
+                return local_error("❌ 연결 실패", "Connect")
 
             # 4) 실제 전송
             resp = self._send_and_get(command)
@@ -172,23 +428,405 @@ class UnrealSocketClient:
             if self._auto_switch_if_needed(resp):
                 resp = self._send_and_get(command)
 
-            # 6) 여전히 응답이 비면 다른 포트도 시도 (안정성 보강)
-            if not resp:
+            # 6) 여전히 응답이 없으면 다른 포트도 시도 (안정성 보강)
+            if resp.code == CODE_TRANSPORT:
                 other = self.ports[0] if self.current_port == self.ports[1] else self.ports[1]
-                if self.connect(other):
+                if self._use(other):
                     resp = self._send_and_get(command)
 
-            return resp or "⏳ (no response)"
+            return resp
 
         except Exception as e:
             # 에러 발생 시 다른 포트도 시도
             try:
                 other = self.ports[0] if self.current_port == self.ports[1] else self.ports[1]
-                if self.connect(other):
+                if self._use(other):
                     return self._send_and_get(command)
             except Exception as e2:
-                return f"❌ 통신 오류: {e2}"
-            return f"❌ 통신 오류: {e}"
+                return local_error(f"❌ 통신 오류: {e2}")
+            return local_error(f"❌ 통신 오류: {e}")
+
+    def _send_batch_and_get(self, commands):
+        self._conn.deltas.reset()
+        self._conn.sock.sendall(encode_batch(commands))
+        self._conn.last_io = time.time()
+        # 서버는 블록 전체를 한 틱에 처리 → 첫 응답까지는 명령 수에 비례해 여유를 둠
+        conn = self._conn
+        raws = [self._recv_frame(self.recv_timeout + self.batch_item_timeout * len(commands))]
+        raws += [self._recv_frame() for _ in commands[1:]]
+        return [self._decode(conn, raw, c) for raw, c in zip(raws, commands)]
+
+    def send_batch(self, commands, preferred: str | None = None):
+        """
+        여러 명령을 BATCH 블록 하나(sendall 1회)로 보내고 응답을 명령 순서대로 리스트로 반환.
+        PROTO 협상이 안 된 legacy 서버면 send_command 순차 호출로 폴백.
+        """
+        commands = [c.strip() for c in commands if c and c.strip()]
+        if not commands:
+            return []
+        try:
+            if not self._ensure_connected(commands[0], preferred):
+                return [local_error("❌ 연결 실패", "Connect")] * len(commands)
+            if not self.framed:
+                return [self.send_command(c, preferred) for c in commands]
+
+            caps = self._conn.caps
+            limit = min(self.max_batch, caps.max_batch) if caps and caps.max_batch > 0 else self.max_batch
+            out = []
+            for i in range(0, len(commands), limit):
+                chunk = commands[i:i + limit]
+                resps = self._send_batch_and_get(chunk)
+                # 서버가 모드 전환 요청하면 새 연결로 한 번 더 재전송
+                if self._auto_switch_if_needed(resps[0]):
+                    resps = (self._send_batch_and_get(chunk) if self.framed
+                             else [self.send_command(c, preferred) for c in chunk])
+                out.extend(resps)
+            return out
+        except Exception as e:
+            return [local_error(f"❌ 통신 오류: {e}")] * len(commands)
+
+    # ---------- 바이너리 미리보기 (9999 전용) ----------
+    def _resolve_handles(self, conn, names):
+        """액터 이름 → 숫자 핸들 (연결별 캐시, 없는 액터는 0). HANDLE 미지원 서버면 conn.binary=False"""
+        missing = list(dict.fromkeys(n for n in names if n not in conn.handles))
+        if missing:
+            resp = self._send_and_get("HANDLE " + " ".join(missing))
+            handles = resp.value if resp.ok else None
+            if not handles or len(handles) != len(missing):
+                conn.binary = False
+                return []
+            conn.binary = True
+            for name, h in zip(missing, handles):
+                conn.handles[name] = int(h)
+        return [conn.handles[n] for n in names]
+
+    def _remember_handles(self, conn, actors):
+        """LIST / GET_ACTOR_STATE가 준 핸들로 연결별 캐시를 교체 (파괴 후 같은 이름으로 다시 생긴 액터의 옛 핸들 제거)"""
+        known = {a.name: a.handle for a in actors if a.handle}
+        if not known:
+            return   # 구버전 서버 / 텍스트 LIST → 이름 그대로 사용
+        conn.handles = known
+        conn.handle_refs = True
+        if conn.binary is None and conn.caps is not None and conn.caps.binary:
+            conn.binary = True   # HANDLE 왕복 없이 바로 바이너리 미리보기
+
+    def _refs_for(self, command: str, names, preferred: str | None = None):
+        """명령이 갈 연결에서 아는 핸들이면 "#<핸들>", 아니면 이름 그대로 (서버 조회가 해시 대신 바로, 명령도 짧아짐)"""
+        names = list(names)
+        if not self._ensure_connected(command, preferred):
+            return names
+        conn = self._conn
+        if not conn.handle_refs:
+            return names
+        return [f"#{conn.handles[n]}" if conn.handles.get(n) else n for n in names]
+
+    def send_transforms(self, verb: str, items, delta: bool = True):
+        """
+        드래그 미리보기 전송 (응답 없음). items: [(actor, x, y, z), ...]
+        PIE 서버가 바이너리 패킷을 받으면 핸들 + float32(또는 양자화 델타)로, 아니면 텍스트 BATCH로 보냄
+        """
+        items = list(items)
+        if not items:
+            return
+        for a, *v in items:
+            self.transforms.patch(a, PREVIEW_FIELDS[verb], v)
+        try:
+            if (self._ensure_connected(verb) and self.framed and self.current_port == self.ports[0]
+                    and self._conn.binary is not False):
+                conn = self._conn
+                handles = self._resolve_handles(conn, [it[0] for it in items])
+                if conn.binary:
+                    entries = [(h, x, y, z) for h, (_a, x, y, z) in zip(handles, items) if h]
+                    for i in range(0, len(entries), BIN_MAX_COUNT):
+                        chunk = entries[i:i + BIN_MAX_COUNT]
+                        conn.sock.sendall(conn.deltas.encode(verb, chunk) if delta
+                                          else encode_transform_packet(verb, chunk))
+                    conn.last_io = time.time()
+                    return
+        except (OSError, ProtocolError) as e:   # HANDLE 응답 프레임이 깨져도 연결을 버리고 텍스트로
+            print(f"❌ 바이너리 미리보기 전송 실패: {e}")
+            if self._conn is not None:
+                self._drop(self._conn)
+        refs = self._refs_for(verb, [it[0] for it in items])
+        self.send_batch([f"{verb} {r} {x} {y} {z}" for r, (_a, x, y, z) in zip(refs, items)])
+
+    def set_transforms(self, fields: str, entries, preferred: str | None = None):
+        """
+        여러 액터 트랜스폼을 SET_TRANSFORMS 한 줄로 보내 서버 한 틱(같은 프레임)에 적용.
+        entries: [(actor, v...), ...] (fields = "L"/"S"/"LS"/"LRS" …, 필드당 값 3개)
+        SET_TRANSFORMS가 없는 서버면 단일 필드(L/S)에 한해 MOVE/SCALE BATCH로 폴백
+        (HELLO 능력으로 알면 바로, 구버전 서버면 모르는 명령 응답을 보고)
+        """
+        entries = list(entries)
+        if not entries:
+            return ""
+        refs = self._refs_for("SET_TRANSFORMS", [e[0] for e in entries], preferred)
+        sent = [(r, *e[1:]) for r, e in zip(refs, entries)]
+        single = fields in ("L", "S")
+        resp = None
+        if not single or self.supports("SET_TRANSFORMS", preferred) is not False:
+            resp = self.send_command(format_set_transforms(fields, sent), preferred)
+            if single and is_unknown_command(resp):
+                resp = None
+        if resp is None:
+            verb = "MOVE" if fields == "L" else "SCALE"
+            resps = self.send_batch([f"{verb} {a} {x} {y} {z}" for a, x, y, z in sent], preferred)
+            worst = next((r for r in resps if not r.ok), resps[0])
+            resp = Reply("\n".join(r.strip() for r in resps), worst.code, worst.error, "SET_TRANSFORMS")
+        if resp.ok:
+            for name, *values in entries:
+                self.transforms.patch(name, fields, values)
+        return resp
+
+    def apply_relative(self, field: str, entries, preferred: str | None = None):
+        """
+        MOVE_BY / ROTATE_BY / SCALE_MUL 한 줄: 서버가 지금 값에 델타/배율을 적용하고 적용 후 값을 돌려줌.
+        entries: [(actor, a, b, c), ...] (L/R 델타, S 배율) → Reply (value = {actor: ActorTransform})
+        상대 명령이 없는 서버면 L/S에 한해 지금 값(WATCH 캐시, 없으면 GET_ACTOR_STATE)으로 계산해 set_transforms
+        """
+        entries = list(entries)
+        if not entries:
+            return ""
+        verb = RELATIVE_VERBS[field]
+        names = [e[0] for e in entries]
+        if self.supports(verb, preferred) is not False:
+            refs = self._refs_for(verb, names, preferred)
+            resp = self.send_command(format_relative(field, [(r, *e[1:]) for r, e in zip(refs, entries)]), preferred)
+            if not is_unknown_command(resp):
+                if resp.ok and isinstance(resp.data, dict):
+                    by_ref = dict(zip(refs, names))
+                    resp.data["missing"] = [by_ref.get(m, m) for m in resp.data.get("missing", [])]
+                    for name, t in transforms_from_state(resp.data).items():
+                        self.transforms.patch(name, TRANSFORM_FIELDS, (*t.location, *t.rotation, *t.scale))
+                return resp
+        if field == "R":
+            return local_error(f"❌ {verb}를 지원하지 않는 서버", "Unknown")
+
+        current = {n: self.transforms.get(n) for n in names if n in self.transforms}
+        unknown = [n for n in names if n not in current]
+        if unknown:
+            current.update(transforms_from_state(self.get_actor_state(unknown, preferred=preferred)))
+        done = {}
+        for name, a, b, c in entries:
+            t = current.get(name)
+            if t is None:
+                continue
+            if field == "L":
+                done[name] = t._replace(location=Vec3(t.location.x + a, t.location.y + b, t.location.z + c))
+            else:
+                done[name] = t._replace(scale=Vec3(t.scale.x * a, t.scale.y * b, t.scale.z * c))
+        key = "location" if field == "L" else "scale"
+        resp = (self.set_transforms(field, [(n, *getattr(t, key)) for n, t in done.items()], preferred)
+                if done else Reply("", CODE_NOT_FOUND, "NotFound"))
+        data = {"actors": [{"name": n, "handle": t.handle, "location": list(t.location),
+                            "rotation": list(t.rotation), "scale": list(t.scale)} for n, t in done.items()],
+                "missing": [n for n in names if n not in done]}
+        return Reply(resp, resp.code, resp.error, verb, data)
+
+    def group_command(self, verb: str, args: str, names, preferred: str | None = None, state: bool = False):
+        """
+        선택(names) 전체에 "GROUP_<verb> <집합> <args>" 한 줄. 이 연결에 저장한 선택 집합이 names와 다르면
+        SELECT_SET을 같은 BATCH 앞에 실어 한 번에 보냄 → 같은 선택으로 하는 제스처는 액터 수와 상관없이 짧은 한 줄.
+        state=True인데 이 연결이 names를 WATCH 중이 아니면(재연결 직후 등 푸시가 안 옴) GET_ACTOR_STATE를 같은 BATCH
+        뒤에 실어 응답 data에 "actors"/"missing"을 합침 → transforms_from_state(resp.data)로 적용 후 값
+        GROUP 명령이 없는 서버면 None (호출 측은 액터마다 보냄)
+        """
+        names = tuple(names)
+        command = f"GROUP_{verb}"
+        if not names or self.supports(command, preferred) is False or not self._ensure_connected(command, preferred):
+            return None
+        conn = self._conn
+        lines = []
+        if conn.selection != names:
+            refs = self._refs_for("SELECT_SET", names, preferred)
+            lines.append(f"SELECT_SET {self.selection_set} {' '.join(refs)}")
+        lines.append(f"{command} {self.selection_set} {args}".rstrip())
+        at = len(lines) - 1
+        if state and not conn.watched.issuperset(names):
+            lines.append(f"GET_ACTOR_STATE {' '.join(self._refs_for('GET_ACTOR_STATE', names, preferred))}")
+        resps = self.send_batch(lines, preferred)
+        if len(resps) != len(lines) or is_unknown_command(resps[at]):
+            conn.selection = None
+            return None
+        if at == 1:
+            conn.selection = names if resps[0].ok else None
+        resp = resps[at]
+        after = parse_actor_state(resps[-1]) if len(lines) > at + 1 else None
+        if after is None:
+            return resp
+        return Reply(resp, resp.code, resp.error, resp.verb, {**(resp.data or {}), **after})
+
+    def set_material_multi(self, path: str, targets, preferred: str | None = None):
+        """
+        SET_MATERIAL_MULTI 한 줄: 머티리얼 하나를 여러 (액터, 슬롯)에 (서버 로드 1회, 한 패스) → 대상별 결과가 응답 하나로.
+        targets: [(actor, slot), ...] → Reply (data = {"applied","total","results":[{"actor","slot","status"}]}, JSON 모드)
+        명령이 없는 서버면 대상마다 SET_MATERIAL BATCH로 폴백하고 결과를 같은 모양으로 만듦
+        """
+        targets = [(a, int(s)) for a, s in targets]
+        if not targets:
+            return ""
+        names = [a for a, _s in targets]
+        if self.supports("SET_MATERIAL_MULTI", preferred) is not False:
+            refs = self._refs_for("SET_MATERIAL_MULTI", names, preferred)
+            resp = self.send_command(format_material_multi(path, zip(refs, (s for _a, s in targets))), preferred)
+            if not is_unknown_command(resp):
+                if isinstance(resp.data, dict):
+                    # 결과에는 보낸 참조가 그대로 옴 → 호출 측이 아는 이름으로 되돌림
+                    by_ref = dict(zip(refs, names))
+                    for r in resp.data.get("results", []):
+                        r["actor"] = by_ref.get(r["actor"], r["actor"])
+                return resp
+
+        resps = self.send_batch([f'SET_MATERIAL {a} {s} "{path}"' for a, s in targets], preferred)
+        results = [{"actor": a, "slot": s, "status": "Ok" if r.ok else (r.error or "Failed")}
+                   for (a, s), r in zip(targets, resps)]
+        applied = sum(1 for r in results if r["status"] == "Ok")
+        worst = next((r for r in resps if not r.ok), resps[0])
+        return Reply("\n".join(r.strip() for r in resps), worst.code, worst.error, "SET_MATERIAL_MULTI",
+                     {"applied": applied, "total": len(targets), "results": results})
+
+    def get_actor_state(self, names, also=(), preferred: str | None = None, watch: bool = False):
+        """
+        GET_ACTOR_STATE 한 번으로 여러 액터의 위치/회전/스케일/Mobility/슬롯 조회 → dict (모르는 서버면 None)
+        also: 같은 BATCH 앞에 실어 보낼 명령들 (응답은 버림) → 왕복 1회
+        watch=True면 names 구독 교체(UNWATCH + WATCH)도 같은 BATCH 맨 앞에 실음 (watch()와 같은 기록)
+        """
+        names = list(names)
+        if not names:
+            return {"actors": [], "missing": []}
+        plan = self._watch_plan(names, preferred) if watch else None
+        lines = plan[3] if plan else []
+        refs = self._refs_for("GET_ACTOR_STATE", names, preferred)
+        resps = self.send_batch(lines + list(also) + [f"GET_ACTOR_STATE {' '.join(refs)}"], preferred)
+        if plan:
+            self._record_watch(plan, resps[:len(lines)])
+        state = parse_actor_state(resps[-1] if resps else "")
+        if state is not None:
+            # missing에는 보낸 참조가 그대로 옴 → 호출 측이 아는 이름으로 되돌림
+            by_ref = dict(zip(refs, names))
+            state["missing"] = [by_ref.get(m, m) for m in state.get("missing", [])]
+        return state
+
+    def list_actors(self, static_only: bool = True, preferred: str | None = None):
+        """LIST_STATIC / LIST → [ActorRef(label, name, handle)] (실패면 빈 리스트). 받은 핸들은 연결별로 캐시"""
+        resp = self.send_command("LIST_STATIC" if static_only else "LIST", preferred)
+        actors = resp.value if resp.ok and resp.value is not None else []
+        if actors and self._conn is not None:
+            self._remember_handles(self._conn, actors)
+        return actors
+
+    def stats(self, reset: bool = False, preferred: str | None = None):
+        """서버 계측 (STATS) → Reply, JSON 모드면 value = 통계 dict. reset=True면 조회 후 서버 쪽 초기화"""
+        return self.send_command("STATS RESET" if reset else "STATS", preferred)
+
+    def set_log_level(self, level: int, preferred: str | None = None):
+        """서버 명령/응답 로그 레벨 (0 = 끔, 1 = 요약, 2 = 전부). 두 서버가 한 설정을 공유하므로 한쪽에만 보내면 됨"""
+        return self.send_command(f"LOG_VERBOSE {int(level)}", preferred)
+
+    # ---------- WATCH 푸시 ----------
+    def _on_push(self, conn, frame):
+        payload, extra = frame
+        if push_tag(extra) != PUSH_WATCH:
+            return
+        state = decode_reply(payload, "WATCH", conn.json).data
+        if not isinstance(state, dict):
+            return
+        conn.deltas.reset()   # 다른 경로로 서버 값이 바뀜 → 다음 미리보기는 절대값부터
+        self._pushed.update(self.transforms.apply(state))
+
+    @property
+    def watching(self) -> bool:
+        return any(conn.watched for conn in self._pool.values())
+
+    def watch(self, names, preferred: str | None = None):
+        """
+        names만 구독하도록 교체 (UNWATCH + WATCH를 BATCH 한 번으로). 응답 스냅샷으로 transforms를 채움.
+        WATCH가 없는 서버/PROTO 미협상이면 None (호출 측은 기존처럼 조회)
+        """
+        plan = self._watch_plan(names, preferred)
+        if plan is None:
+            return None
+        return self._record_watch(plan, self.send_batch(plan[3], preferred))
+
+    def _watch_plan(self, names, preferred: str | None = None):
+        """구독 교체에 보낼 줄 → (conn, names, refs, lines). 다른 명령과 한 BATCH에 실을 수 있음. 못 하면 None"""
+        names = list(dict.fromkeys(names))
+        if self.supports("WATCH", preferred) is False or not self.framed:
+            return None
+        refs = self._refs_for("WATCH", names, preferred)
+        conn = self._conn   # _refs_for가 연결을 바꿀 수 있음 → WATCH를 실제로 받을 연결
+        if conn is None:
+            return None
+        return conn, names, refs, ["UNWATCH"] + ([f"WATCH {' '.join(refs)}"] if names else [])
+
+    def _record_watch(self, plan, resps):
+        """_watch_plan 줄들의 응답으로 conn.watched / transforms 갱신 → WATCH 응답 (실패면 None)"""
+        conn, names, refs, _lines = plan
+        self.transforms.forget(conn.watched)
+        conn.watched = set()
+        self._rewatch.clear()   # 새 구독이 끊긴 연결의 옛 구독을 대신함
+        resp = resps[-1] if names and len(resps) == 2 else None
+        if resp is None or not resp.ok or not isinstance(resp.data, dict):
+            return None
+        missing = set(resp.data.get("missing", ()))
+        conn.watched = {n for n, r in zip(names, refs) if r not in missing}
+        self.transforms.apply(resp.data)
+        return resp
+
+    def unwatch(self):
+        """이 클라이언트의 구독 전부 해제 (모든 연결)"""
+        active = self._conn
+        for conn in list(self._pool.values()):
+            if not conn.watched:
+                continue
+            self._conn = conn
+            try:
+                self._send_and_get("UNWATCH")
+            except OSError:
+                self._drop(conn)
+                continue
+            self.transforms.forget(conn.watched)
+            conn.watched = set()
+        self._conn = active if active is not None and self._pool.get(active.port) is active else None
+
+    def poll_push(self):
+        """I/O 스레드가 한가할 때 호출: 구독 중인 연결에 와 있는 푸시만 읽음 (요청 없음, 블록 안 함)"""
+        for conn in list(self._pool.values()):
+            if not conn.watched:
+                continue
+            try:
+                conn.sock.setblocking(False)
+                try:
+                    while True:
+                        data = conn.sock.recv(65536)
+                        if not data:
+                            raise ConnectionError("서버가 연결을 닫았습니다")
+                        conn.reader.feed(data)
+                finally:
+                    conn.sock.settimeout(self.recv_timeout)
+            except BlockingIOError:
+                pass
+            except (OSError, ConnectionError):
+                self._drop(conn)
+                continue
+            try:
+                while (frame := conn.reader.pop_frame()) is not None:
+                    if push_tag(frame[1]):
+                        self._on_push(conn, frame)
+                    elif conn.orphans > 0:
+                        conn.orphans -= 1   # 타임아웃된 요청의 늦은 응답
+            except ProtocolError:
+                self._drop(conn)
+
+    def take_pushed(self):
+        """지난 호출 이후 푸시로 바뀐 액터 이름들 (I/O 워커가 UI로 넘김)"""
+        pushed, self._pushed = self._pushed, set()
+        return pushed
+
+    def reset_preview_state(self):
+        """다른 경로로 트랜스폼이 바뀐 뒤 호출 → 다음 미리보기는 절대값 패킷"""
+        for conn in self._pool.values():
+            conn.deltas.reset()
 
 # 경로 변환
 def convert_to_unreal_path(filepath):
@@ -203,14 +841,20 @@ class UnifiedUnrealEditorUI:
     def __init__(self):
         self.client = UnrealSocketClient()
         self.client.mode_hint = "EDITOR"
-        self.client._quick_probe()
 
         self.root = tk.Tk()
         self.root.title("🎮 Unreal Editor Control (Multi-Select + Preset UX)")
 
-        # 리스트 항목: [(label, name), ...]
+        # 소켓은 I/O 워커 스레드만 사용 (UI 스레드에서 send_command 직접 호출 금지)
+        self.io = UnrealIOWorker(self.client, self.root)
+        self.io.on_error = lambda e: self.log_output.insert(tk.END, f"\n❌ 통신 오류: {e}\n")
+        self.io.on_push = self._on_transforms_pushed
+        self.io.start()
+        self.io.run(lambda c: c._quick_probe())
+
+        # 리스트 항목: [ActorRef(label, name, handle), ...] (보이는 건 label, 명령에는 name → 연결이 아는 핸들로)
         self.actor_entries = []
-        self.selected_actor_names = []  # 여러 개
+        self.selected_actors = []  # 여러 개 (ActorRef)
 
         self.position = {"X": 0.0, "Y": 0.0, "Z": 0.0}
         self.scale    = {"X": 1.0, "Y": 1.0, "Z": 1.0}
@@ -218,6 +862,10 @@ class UnifiedUnrealEditorUI:
         self._move_after  = None
         self._scale_after = None
         self._tick_ms     = 10  # 30~60Hz 정도
+        self._stream_hz   = 60.0  # 드래그 미리보기 전송 주기
+
+        # 드래그 미리보기 채널 (액터별 최신 값만 고정 주기로 전송)
+        self.stream = TransformStream(self.io, self.root, rate_hz=self._stream_hz)
 
         self.preset_name_var = tk.StringVar(value="MyPreset")
         self.only_selected_var = tk.BooleanVar(value=False)
@@ -242,10 +890,11 @@ class UnifiedUnrealEditorUI:
         # 선택 시점 기준값(멀티 지원)
         self._baseline_loc = {}          # {actor: (x,y,z)}
         self._baseline_scale = {}        # {actor: (sx,sy,sz)}
+        self._select_seq = 0             # 선택 변경 시 증가 → 늦게 온 이전 선택 결과 무시
 
 
         self.build_gui()
-        self.client.send_command("LOG_VERBOSE 0")
+        self.io.run(lambda c: c.set_log_level(0))   # 드래그 스트림 중 출력 로그가 게임 스레드를 잡지 않게
 
     # ---------- GUI ----------
     def build_gui(self):
@@ -443,94 +1092,131 @@ class UnifiedUnrealEditorUI:
 
     # ---------- 액터 목록/선택 ----------
     def load_actor_list(self):
-        result = self.client.send_command("LIST_STATIC")
-        if not result.strip():
-            result = self.client.send_command("LIST")
-        self.actor_entries = []
-        for line in result.strip().splitlines():
-            if not line: continue
-            if "|" in line:
-                label, name = line.split("|", 1)
-            else:
-                label = name = line
-            label = label.strip(); name = name.strip()
-            self.actor_entries.append((label, name))
+        def fetch(c):
+            return c.list_actors(static_only=True) or c.list_actors(static_only=False)
+        self.io.run(fetch, self._on_actor_list, key="list")
+
+    def _on_actor_list(self, actors):
+        self.actor_entries = list(actors)
         self.render_actor_list()
 
-    def render_actor_list(self):
+    def _filtered_actor_entries(self):
         query = (self.search_var.get() or "").lower()
+        return [a for a in self.actor_entries if not query or query in a.label.lower()]
+
+    def render_actor_list(self):
         self.actor_listbox.delete(0, tk.END)
-        for label, _name in self.actor_entries:
-            if not query or query in label.lower():
-                self.actor_listbox.insert(tk.END, label)
+        for actor in self._filtered_actor_entries():
+            self.actor_listbox.insert(tk.END, actor.label)
 
-    def resolve_selected_actor_names(self):
+    def resolve_selected_actors(self):
         # map visual index -> underlying entries with filter
-        query = (self.search_var.get() or "").lower()
-        filtered = [e for e in self.actor_entries if (not query or query in e[0].lower())]
-        sel = self.actor_listbox.curselection()
-        names = []
-        for i in sel:
-            if 0 <= i < len(filtered):
-                names.append(filtered[i][1])  # internal Name
-        return names
-    
-    def _server_supports_get_textures_slot(self) -> bool:
-    # 가벼운 프로빙: 존재하지 않는 액터/슬롯으로 호출해보고
-    # '알 수 없는 명령'이 오면 미지원으로 간주
-        probe = self.client.send_command("GET_TEXTURES_SLOT __no__ 0")
-        return "알 수 없는 명령" not in (probe or "")
+        filtered = self._filtered_actor_entries()
+        return [filtered[i] for i in self.actor_listbox.curselection() if 0 <= i < len(filtered)]
+
+    @property
+    def selected_actor_names(self):
+        # 명령에 쓰는 내부 Name (핸들 변환은 Client가 연결별 캐시로)
+        return [a.name for a in self.selected_actors]
 
     def on_actor_selected(self, _evt):
-        self.selected_actor_names = self.resolve_selected_actor_names()
+        self.selected_actors = self.resolve_selected_actors()
         if not self.selected_actor_names:
             return
-
-        # 대표 한 개(첫 번째)만 상세 동기화
-        first = self.selected_actor_names[0]
-        self.client.send_command(f"CAM_TRACK_START CineCameraActor_0 {first}")
-
-        # 위치/스케일 동기화
-        loc = self.client.send_command(f"GET_LOCATION {first}")
-        p = loc.strip().split()
-        if len(p) == 4 and p[0] == "Location:":
-            self.position["X"] = float(p[1]); self.position["Y"] = float(p[2]); self.position["Z"] = float(p[3])
-
-        sres = self.client.send_command(f"GET_SCALE {first}")
-        sp = sres.strip().split()
-        if len(sp) == 4 and sp[0] == "Scale:":
-            self.scale["X"] = float(sp[1]); self.scale["Y"] = float(sp[2]); self.scale["Z"] = float(sp[3])
+        self._select_seq += 1
+        names = list(self.selected_actor_names)
+        self.io.run(partial(self._fetch_selection_state, names),
+                    partial(self._on_selection_state, self._select_seq, names), key="select")
+
+    @staticmethod
+    def _fetch_selection_state(names, client):
+        """워커 스레드: 선택된 액터들의 위치/스케일/슬롯 조회 (구독 교체 + 카메라 추적 + GET_ACTOR_STATE 왕복 1회)"""
+        first = names[0]
+        # 이후 변경은 푸시로 (WATCH가 없는 서버면 구독 줄은 빠짐)
+        state = client.get_actor_state(names, also=[f"CAM_TRACK_START CineCameraActor_0 {first}"], watch=True)
+        if state is None:
+            return UnifiedUnrealEditorUI._fetch_selection_state_legacy(names, client)
+
+        baseline_loc, baseline_scale = baselines_from_actor_state(state)
+        detail = next((a for a in state["actors"] if a["name"] == first), None)
+        slots = slots_from_actor_state(detail) if detail else []
+        return {
+            "loc": baseline_loc.get(first),
+            "scale": baseline_scale.get(first),
+            "slots": slots,
+            "slots_text": format_material_slots(slots) if detail else f"❌ '{first}' 이름의 액터를 찾을 수 없음",
+            "baseline_loc": baseline_loc,
+            "baseline_scale": baseline_scale,
+        }
+
+    @staticmethod
+    def _fetch_selection_state_legacy(names, client):
+        """GET_ACTOR_STATE가 없는 구버전 서버: 액터마다 GET_LOCATION / GET_SCALE 왕복"""
+        first = names[0]
+        slots = client.send_command(f"GET_MATERIAL_SLOTS {first}")
+        st = {
+            "loc": None,
+            "scale": None,
+            "slots": slots.value if slots.ok else [],
+            "slots_text": format_material_slots(slots.value) if slots.ok else slots,
+            "baseline_loc": {},
+            "baseline_scale": {},
+        }
+        for name in names:
+            # 위치
+            loc = client.send_command(f"GET_LOCATION {name}")
+            st["baseline_loc"][name] = tuple(loc.value) if loc.ok else (0.0, 0.0, 0.0)
+            if loc.ok and name == first:
+                st["loc"] = st["baseline_loc"][name]
+            # 스케일
+            sc = client.send_command(f"GET_SCALE {name}")
+            st["baseline_scale"][name] = tuple(sc.value) if sc.ok else (1.0, 1.0, 1.0)
+            if sc.ok and name == first:
+                st["scale"] = st["baseline_scale"][name]
+        return st
+
+    def _on_selection_state(self, seq, names, st):
+        if seq != self._select_seq:
+            return  # 그 사이 선택이 바뀜
+
+        # 위치/스케일 동기화 (첫 번째 선택 항목 기준)
+        if st["loc"]:
+            self.position["X"], self.position["Y"], self.position["Z"] = st["loc"]
+
+        if st["scale"]:
+            self.scale["X"], self.scale["Y"], self.scale["Z"] = st["scale"]
             self.scl_x.set(self.scale["X"]); self.scl_y.set(self.scale["Y"]); self.scl_z.set(self.scale["Z"])
 
         # 슬롯만(가벼운 모드)
-        slots = self.client.send_command(f"GET_MATERIAL_SLOTS {first}")
         self.texture_info.delete("1.0", tk.END)
-        self.texture_info.insert(tk.END, slots)
-
-        lines = [line for line in slots.splitlines() if line.startswith("Material Slot")]
-        self.render_slot_buttons(len(lines))
-        self._baseline_loc.clear()
-        self._baseline_scale.clear()
-        for name in self.selected_actor_names:
-            # 위치
-            loc = self.client.send_command(f"GET_LOCATION {name}").strip().split()
-            if len(loc) == 4 and loc[0] == "Location:":
-                bx, by, bz = float(loc[1]), float(loc[2]), float(loc[3])
-            else:
-                bx, by, bz = 0.0, 0.0, 0.0
-            self._baseline_loc[name] = (bx, by, bz)
-            # 스케일
-            sc = self.client.send_command(f"GET_SCALE {name}").strip().split()
-            if len(sc) == 4 and sc[0] == "Scale:":
-                sx, sy, sz = float(sc[1]), float(sc[2]), float(sc[3])
-            else:
-                sx, sy, sz = 1.0, 1.0, 1.0
-            self._baseline_scale[name] = (sx, sy, sz)
+        self.texture_info.insert(tk.END, st["slots_text"])
+        self.render_slot_buttons(len(st["slots"]))
+        self._baseline_loc = st["baseline_loc"]
+        self._baseline_scale = st["baseline_scale"]
 
         # 드래그 누적 초기화
         self._move_accum = [0.0, 0.0]
         self._scale_accum_factor = 1.0
 
+    def _on_transforms_pushed(self, names):
+        """WATCH 푸시 (UI 스레드): 뷰포트/다른 도구가 바꾼 선택 액터 값을 베이스라인과 슬라이더에 반영"""
+        if self._drag_active:
+            return   # 드래그 중에는 우리 값이 기준 (놓으면 커밋으로 덮어씀)
+        cache = self.client.transforms
+        for name in names:
+            t = cache.get(name)
+            if t is not None and name in self.selected_actor_names:
+                self._baseline_loc[name] = tuple(t.location)
+                self._baseline_scale[name] = tuple(t.scale)
+
+        first = self.selected_actor_names[0] if self.selected_actor_names else None
+        t = cache.get(first) if first in names else None
+        if t is None:
+            return
+        self.position["X"], self.position["Y"], self.position["Z"] = t.location
+        self.scale["X"], self.scale["Y"], self.scale["Z"] = t.scale
+        self.scl_x.set(self.scale["X"]); self.scl_y.set(self.scale["Y"]); self.scl_z.set(self.scale["Z"])
+
     # ---------- 위치/스케일 (디바운스 & 일괄) ----------
     def on_pos_slider_change(self, axis, value):
         if not self.selected_actor_names:
@@ -550,16 +1236,15 @@ class UnifiedUnrealEditorUI:
         self._move_after = None
         if not self.selected_actor_names: return
         x, y, z = self.position["X"], self.position["Y"], self.position["Z"]
-        for name in self.selected_actor_names:
-            self.client.send_command(f"MOVE {name} {x} {y} {z}")
+        self.io.set_transforms("L", [(name, x, y, z) for name in self.selected_actor_names], key="move")
 
     def on_pos_release(self, _evt):
         if not self.selected_actor_names: return
         x, y, z = self.position["X"], self.position["Y"], self.position["Z"]
-        for name in self.selected_actor_names:
-            resp = self.client.send_command(f"MOVE_COMMIT {name} {x} {y} {z}")
-            if resp:
-                self.log_output.insert(tk.END, f"\n{name}: {resp.strip()}\n")
+        names = list(self.selected_actor_names)
+        self.io.set_transforms("L", [(name, x, y, z) for name in names], self._log_response)
+        for name in names:
+            self._baseline_loc[name] = (x, y, z)
 
     def on_scale_slider_change(self, axis, value):
         if not self.selected_actor_names: return
@@ -571,46 +1256,41 @@ class UnifiedUnrealEditorUI:
         self._scale_after = None
         if not self.selected_actor_names: return
         sx, sy, sz = self.scale["X"], self.scale["Y"], self.scale["Z"]
-        for name in self.selected_actor_names:
-            self.client.send_command(f"SCALE {name} {sx} {sy} {sz}")
+        self.io.set_transforms("S", [(name, sx, sy, sz) for name in self.selected_actor_names], key="scale")
 
-    def _flush_move_drag(self):
-    # 누적 Δ를 베이스라인에 더해 미리보기(MOVE)
+    def _stream_move_drag(self):
+    # 누적 Δ를 베이스라인에 더해 미리보기(MOVE) → 스트림이 최신 값만 주기적으로 전송
         dx, dy = self._move_accum
         for name in self.selected_actor_names:
             bx, by, bz = self._baseline_loc.get(name, (0.0,0.0,0.0))
-            nx, ny, nz = bx + dx, by + dy, bz
-            self.client.send_command(f"MOVE {name} {nx} {ny} {nz}")
+            self.stream.set("MOVE", name, bx + dx, by + dy, bz)
 
-    def _flush_scale_drag(self):
+    def _stream_scale_drag(self):
         # 누적 배율로 미리보기(SCALE)
         f = self._scale_accum_factor
         for name in self.selected_actor_names:
             sx, sy, sz = self._baseline_scale.get(name, (1.0,1.0,1.0))
-            nsx, nsy, nsz = sx * f, sy * f, sz * f
-            self.client.send_command(f"SCALE {name} {nsx} {nsy} {nsz}")
+            self.stream.set("SCALE", name, sx * f, sy * f, sz * f)
     
     
     def on_scale_release(self, _evt):
-        # 서버에 SCALE_COMMIT이 없는 경우가 있으므로, 다시 한 번 SCALE 전송 + 로그만 남김
+        # 확정: 마지막 값을 SET_TRANSFORMS S 한 번으로 (서버 능력에 맞는 경로는 set_transforms가 고름) + 로그
         if not self.selected_actor_names: return
         sx, sy, sz = self.scale["X"], self.scale["Y"], self.scale["Z"]
-        for name in self.selected_actor_names:
-            resp = self.client.send_command(f"SCALE {name} {sx} {sy} {sz}")
+        names = list(self.selected_actor_names)
+        self.io.set_transforms("S", [(name, sx, sy, sz) for name in names], self._log_response)
+        for name in names:
+            self._baseline_scale[name] = (sx, sy, sz)
+
+    def _log_responses(self, names, resps):
+        for name, resp in zip(names, resps):
             if resp:
                 self.log_output.insert(tk.END, f"\n{name}: {resp.strip()}\n")
 
+    def _log_response(self, resp):
+        if resp:
+            self.log_output.insert(tk.END, f"\n{resp.strip()}\n")
 
-    def _get_scale_of(self, actor_name):
-        """서버에서 현재 스케일을 읽어 float(tuple)로 반환. 실패 시 None."""
-        res = self.client.send_command(f"GET_SCALE {actor_name}") or ""
-        parts = res.strip().split()
-        if len(parts) == 4 and parts[0] == "Scale:":
-            try:
-                return (float(parts[1]), float(parts[2]), float(parts[3]))
-            except Exception:
-                return None
-        return None
 
     def apply_scale_macro(self, mode: str):
         """
@@ -631,25 +1311,39 @@ class UnifiedUnrealEditorUI:
         else:
             mul = None  # normal
     
-        for name in self.selected_actor_names:
-            if mul is None:
-                # 보통(100%): 절대 스케일 1.0
-                sx, sy, sz = 1.0, 1.0, 1.0
-            else:
-                cur = self._get_scale_of(name) or (1.0, 1.0, 1.0)
-                sx, sy, sz = cur[0] * mul, cur[1] * mul, cur[2] * mul
-    
-            # 서버에 적용
-            resp = self.client.send_command(f"SCALE {name} {sx} {sy} {sz}")
-            if resp:
-                self.log_output.insert(tk.END, f"\n{name}: {resp.strip()}\n")
-    
+        names = list(self.selected_actor_names)
+        if mul is None:
+            # 보통(100%): 절대 스케일 1.0 → SET_TRANSFORMS 한 번 (선택된 액터가 같은 프레임에 바뀜)
+            ones = {name: (1.0, 1.0, 1.0) for name in names}
+            self.io.set_transforms("S", [(name, *s) for name, s in ones.items()],
+                                   lambda resp: self._on_scale_macro_done(resp, ones))
+        else:
+            # 서버가 지금 스케일에 곱함 (읽기-계산-쓰기 왕복 없음)
+            self.io.run(partial(self._scale_selection_by, names, mul), lambda r: self._on_scale_macro_done(*r))
+
+    @staticmethod
+    def _scale_selection_by(names, mul, client):
+        """워커 스레드: 선택 집합에 GROUP_SCALE_MUL 한 줄, 그룹 명령이 없으면 SCALE_MUL (적용 후 값이 응답으로)"""
+        resp = client.group_command("SCALE_MUL", f"{mul} {mul} {mul}", names, state=True)
+        if resp is not None:
+            # 구독 중이면 결과는 WATCH 푸시로 (_on_transforms_pushed가 갱신), 아니면 같은 BATCH의 GET_ACTOR_STATE로
+            transforms = transforms_from_state(resp.data) if resp.ok and isinstance(resp.data, dict) else {}
+            return resp, {name: tuple(t.scale) for name, t in transforms.items()}
+        resp = client.apply_relative("S", [(name, mul, mul, mul) for name in names])
+        transforms = (resp.value if resp.ok else None) or {}
+        return resp, {name: tuple(t.scale) for name, t in transforms.items()}
+
+    def _on_scale_macro_done(self, resp, scales):
+        self._log_response(resp.strip() or f"✅ {resp.verb}")
+        for name, s in scales.items():
+            self._baseline_scale[name] = s
         # 첫 번째 선택 항목 기준으로 UI 슬라이더 동기화
-        first = self.selected_actor_names[0]
-        cur = self._get_scale_of(first)
-        if cur:
-            self.scale["X"], self.scale["Y"], self.scale["Z"] = cur
-            self.scl_x.set(cur[0]); self.scl_y.set(cur[1]); self.scl_z.set(cur[2])
+        first = next((n for n in self.selected_actor_names if n in scales), None)
+        if first is None:
+            return
+        cur = scales[first]
+        self.scale["X"], self.scale["Y"], self.scale["Z"] = cur
+        self.scl_x.set(cur[0]); self.scl_y.set(cur[1]); self.scl_z.set(cur[2])
         
     def _drag_start(self, event, mode: str):
         if not self.selected_actor_names:
@@ -674,20 +1368,14 @@ class UnifiedUnrealEditorUI:
             # 좌←→우 = X, 위↑↓아래 = Y (Tk에서 위로 이동하면 dy<0)
             self._move_accum[0] += dx * self._drag_speed_move_x       # ΔX
             self._move_accum[1] += (-dy) * self._drag_speed_move_y     # ΔY (위로 드래그 = +Y)
-            # 디바운스 송신
-            if self._move_after:
-                self.root.after_cancel(self._move_after)
-            self._move_after = self.root.after(self._tick_ms, self._flush_move_drag)
+            self._stream_move_drag()
 
         else:  # scale (수평만 사용)
             factor_delta = 1.0 + (dx * self._drag_speed_scale)
             if factor_delta <= 0.0:
                 return
             self._scale_accum_factor *= factor_delta
-            # 디바운스 송신
-            if self._scale_after:
-                self.root.after_cancel(self._scale_after)
-            self._scale_after = self.root.after(self._tick_ms, self._flush_scale_drag)
+            self._stream_scale_drag()
 
     def _drag_end(self):
         if not self._drag_active:
@@ -699,12 +1387,11 @@ class UnifiedUnrealEditorUI:
         if mode == "move":
             # 최종 커밋
             dx, dy = self._move_accum
+            entries = []
             for name in self.selected_actor_names:
                 bx, by, bz = self._baseline_loc.get(name, (0.0,0.0,0.0))
-                nx, ny, nz = bx + dx, by + dy, bz
-                resp = self.client.send_command(f"MOVE_COMMIT {name} {nx} {ny} {nz}")
-                if resp:
-                    self.log_output.insert(tk.END, f"\n{name}: {resp.strip()}\n")
+                entries.append((name, bx + dx, by + dy, bz))
+            self.stream.commit_transforms("L", entries, self._log_response)
             # 베이스라인 갱신
             for n in self.selected_actor_names:
                 bx, by, bz = self._baseline_loc.get(n, (0,0,0))
@@ -713,12 +1400,11 @@ class UnifiedUnrealEditorUI:
 
         else:  # scale
             f = self._scale_accum_factor
+            entries = []
             for name in self.selected_actor_names:
                 sx, sy, sz = self._baseline_scale.get(name, (1,1,1))
-                nsx, nsy, nsz = sx * f, sy * f, sz * f
-                resp = self.client.send_command(f"SCALE {name} {nsx} {nsy} {nsz}")
-                if resp:
-                    self.log_output.insert(tk.END, f"\n{name}: {resp.strip()}\n")
+                entries.append((name, sx * f, sy * f, sz * f))
+            self.stream.commit_transforms("S", entries, self._log_response)
             # 베이스라인 갱신 + UI 슬라이더 동기화(첫 번째 대상)
             for n in self.selected_actor_names:
                 sx, sy, sz = self._baseline_scale.get(n, (1,1,1))
@@ -750,18 +1436,20 @@ class UnifiedUnrealEditorUI:
             return
         first = self.selected_actor_names[0]
 
-        # 서버가 지원하면 정확히 슬롯만, 아니면 전체 텍스처로 폴백
-        out = None
-        try:
-            out = self.client.send_command(f"GET_TEXTURES_SLOT {first} {idx}")
-            # 일부 서버는 빈 문자열을 줄 수 있으니 보강
-            if not out or "알 수 없는 명령" in out:
-                out = self.client.send_command(f"GET_TEXTURES {first}")
-                out = f"(서버 미지원 → 전체 텍스처)\n{out}"
-        except Exception:
-            out = self.client.send_command(f"GET_TEXTURES {first}")
-            out = f"(서버 미지원 → 전체 텍스처)\n{out}"
+        def fetch(c):
+            # 서버가 지원하면 정확히 슬롯만, 아니면 전체 텍스처로 (HELLO 능력으로 판단, 구버전 서버만 응답 보고 폴백)
+            if c.supports("GET_TEXTURES_SLOT") is not False:
+                resp = c.send_command(f"GET_TEXTURES_SLOT {first} {idx}")
+                if resp.ok:
+                    return format_textures([resp.value])
+                if resp.code not in (CODE_UNKNOWN, CODE_TRANSPORT):
+                    return resp   # 슬롯에 머티리얼 없음 등 (메시지 그대로)
+            resp = c.send_command(f"GET_TEXTURES {first}")
+            return f"(서버 미지원 → 전체 텍스처)\n{format_textures(resp.value) if resp.ok else resp}"
 
+        self.io.run(fetch, self._show_texture_text)
+
+    def _show_texture_text(self, out):
         # 보기 좋게 출력 영역 갱신
         self.texture_info.insert(tk.END, "\n" + out.strip() + "\n")
         self.texture_info.see(tk.END)
@@ -802,17 +1490,32 @@ class UnifiedUnrealEditorUI:
             self.texture_info.insert(tk.END, "\n❌ 경로 변환 실패\n")
             return
         # 여러 액터에 일괄 적용
-        for name in self.selected_actor_names:
-            cmd = f'SET_MATERIAL {name} {slot_index} "{upath}"'
-            resp = self.client.send_command(cmd)
-            if resp:
-                self.log_output.insert(tk.END, f"\n{name}: {resp.strip()}\n")
+        names = list(self.selected_actor_names)
+        self.io.run(partial(self._set_material_on, names, slot_index, upath), lambda r: self._log_responses(*r))
+
+    @staticmethod
+    def _set_material_on(names, slot_index, upath, client):
+        """워커 스레드: SET_MATERIAL_MULTI 한 줄 (서버 로드 1회) → 요약 한 줄 + 실패한 대상만 따로"""
+        resp = client.set_material_multi(upath, [(name, slot_index) for name in names])
+        data = resp.data if isinstance(resp.data, dict) else {}
+        failed = [r for r in data.get("results", []) if r.get("status") != "Ok"]
+        summary = resp.strip() or f"✅ {resp.verb} {data.get('applied', 0)}/{data.get('total', len(names))}"
+        labels = [f"선택 {len(names)}개"] + [f"{r['actor']}#{r['slot']}" for r in failed]
+        return labels, [summary] + [f"❌ {r['status']}" for r in failed]
 
     # ---------- 에디터 명령 ----------
-    def send_editor_command(self, command: str):
-        if not self.client.connect(self.client.ports[1]):  # 9998
+    @staticmethod
+    def _editor_roundtrip(client, command: str):
+        # 워커 스레드 전용
+        if not client.connect(client.ports[1]):  # 9998
             return "❌ Unreal Editor와 연결되지 않았습니다."
-        return self.client.send_command(command)
+        return client.send_command(command, preferred="EDITOR")
+
+    def send_editor_command(self, command: str):
+        self.io.run(lambda c: self._editor_roundtrip(c, command), self._log_text)
+
+    def _log_text(self, resp):
+        self.log_output.insert(tk.END, f"\n{resp}\n")
 
     def spawn_asset_via_file(self):
         filepath = filedialog.askopenfilename(
@@ -830,11 +1533,8 @@ class UnifiedUnrealEditorUI:
             # /Game 경로로 변환하여 --asset 사용
             unreal_path = convert_to_unreal_path(filepath)          # D:\...\Content\...\Foo.uasset → /Game/.../Foo
             # 객체 경로 점 보정은 필요 없을 가능성이 큼(/Game/Foo/Bar 형태면 OK)
-            if not self.client.connect(self.client.ports[1]):
-                self.log_output.insert(tk.END, "\n❌ Unreal Editor와 연결되지 않았습니다.\n"); return
             cmd = f'py "{EDITOR_SCRIPT_SPAWN}" --asset "{unreal_path}" --spawn --x 1700 --y 0 --z 10 --label "{label}"'
-            resp = self.client.send_command(cmd, preferred="EDITOR")
-            self.log_output.insert(tk.END, f"\n{resp}\n")
+            self.send_editor_command(cmd)
 
         else:
             # 디스크 경로는 --fbx 로 임포트+스폰
@@ -842,15 +1542,12 @@ class UnifiedUnrealEditorUI:
             if not os.path.isfile(fbx_path):
                 messagebox.showerror("오류", f"FBX 파일을 찾을 수 없습니다:\n{fbx_path}")
                 return
-            if not self.client.connect(self.client.ports[1]):
-                self.log_output.insert(tk.END, "\n❌ Unreal Editor와 연결되지 않았습니다.\n"); return
             cmd = (
                 f'py "{EDITOR_SCRIPT_SPAWN}" '
                 f'--fbx "{fbx_path}" --dest "/Game/Scripts/ExportedFBX" '
                 f'--spawn --x 1700 --y 0 --z 10 --label "{label}"'
             )
-            resp = self.client.send_command(cmd, preferred="EDITOR")
-            self.log_output.insert(tk.END, f"\n{resp}\n")
+            self.send_editor_command(cmd)
 
     # ---------- 프리셋 UX ----------
     def refresh_preset_list(self):
@@ -875,15 +1572,19 @@ class UnifiedUnrealEditorUI:
         if not name:
             messagebox.showinfo("알림", "프리셋 이름을 입력하세요.")
             return
-        # 런타임 서버가 있으면 우선 활용 (현재 구현은 씬 전체 저장)
-        if self.client.connect(self.client.ports[0]):  # 9999
-            resp = self.client.send_command(f"SAVE_PRESET {name}")
-        else:
-            # Editor 스크립트 대체 (선택된 액터만 옵션 지원)
-            cmd = f'py "{EDITOR_SCRIPT_PRESET}" --save-preset --name "{name}"'
-            if self.only_selected_var.get(): cmd += " --only-selected"
-            resp = self.send_editor_command(cmd)
-        self.log_output.insert(tk.END, f"\n{resp}\n")
+        # Editor 스크립트 대체 (선택된 액터만 옵션 지원)
+        cmd = f'py "{EDITOR_SCRIPT_PRESET}" --save-preset --name "{name}"'
+        if self.only_selected_var.get(): cmd += " --only-selected"
+
+        def work(c):
+            # 런타임 서버가 있으면 우선 활용 (현재 구현은 씬 전체 저장)
+            if c.connect(c.ports[0]):  # 9999
+                return c.send_command(f"SAVE_PRESET {name}", preferred="PIE")
+            return self._editor_roundtrip(c, cmd)
+        self.io.run(work, self._on_preset_done)
+
+    def _on_preset_done(self, resp):
+        self._log_text(resp)
         self.refresh_preset_list()
 
     def load_preset_btn(self):
@@ -894,14 +1595,14 @@ class UnifiedUnrealEditorUI:
         ox = self.offset_x_var.get() or 0.0
         oy = self.offset_y_var.get() or 0.0
         oz = self.offset_z_var.get() or 0.0
-        # 런타임 서버가 있으면 우선 활용
-        if self.client.connect(self.client.ports[0]):  # 9999
-            resp = self.client.send_command(f"LOAD_PRESET {name} {ox} {oy} {oz}")
-        else:
-            cmd = f'py "{EDITOR_SCRIPT_PRESET}" --load-preset --name "{name}" --offset-x {ox} --offset-y {oy} --offset-z {oz}'
-            resp = self.send_editor_command(cmd)
-        self.log_output.insert(tk.END, f"\n{resp}\n")
-        self.refresh_preset_list()
+        cmd = f'py "{EDITOR_SCRIPT_PRESET}" --load-preset --name "{name}" --offset-x {ox} --offset-y {oy} --offset-z {oz}'
+
+        def work(c):
+            # 런타임 서버가 있으면 우선 활용
+            if c.connect(c.ports[0]):  # 9999
+                return c.send_command(f"LOAD_PRESET {name} {ox} {oy} {oz}", preferred="PIE")
+            return self._editor_roundtrip(c, cmd)
+        self.io.run(work, self._on_preset_done)
 
     def delete_preset_btn(self):
         name = self.get_selected_preset_name()
@@ -922,7 +1623,7 @@ class UnifiedUnrealEditorUI:
     # ---------- 실행 ----------
     def run(self):
         self.root.mainloop()
-        self.client.close()
+        self.io.stop()   # 워커가 종료하면서 client.close()
 
 if __name__ == "__main__":
     ui = UnifiedUnrealEditorUI()
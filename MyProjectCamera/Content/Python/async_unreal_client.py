@@ -0,0 +1,367 @@
+# async_unreal_client.py
+# asyncio 기반 Unreal 소켓 클라이언트 (자동화/대량 질의용)
+#  - 9999(PIE) / 9998(EDITOR) 두 스트림을 오래 유지
+#  - 요청마다 "@<id>" 태그 → 응답 헤더의 id로 매칭, 여러 요청을 동시에 await 가능
+#  - 같은 이벤트 루프 턴에 쌓인 요청은 BATCH 블록 하나로 묶어 전송 (서버 1틱에 처리)
+#  - 요청별 timeout / 취소 지원 (늦게 온 응답은 버림)
+#
+# 사용 예:
+#   async with AsyncUnrealClient() as ue:
+#       locs = await asyncio.gather(*(ue.get_location(n) for n in names))
+import asyncio
+import itertools
+import socket
+
+from unreal_protocol import (FORMAT_JSON, PROTO_VERSION, FrameReader, ProtocolError, Reply,
+                             decode_reply, encode_batch, encode_command, format_material_multi, format_material_params,
+                             format_relative, format_set_transforms, is_editor_command, parse_actor_state, verb_of)
+
+MODES = ("PIE", "EDITOR")
+
+
+class _Stream:
+    """포트 하나에 대한 장기 연결 + in-flight 요청 테이블"""
+
+    def __init__(self, host, port, connect_timeout, max_batch, on_push):
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.max_batch = max_batch
+        self.on_push = on_push
+        self.reader = None
+        self.writer = None
+        self.json = False            # FORMAT JSON 협상 성공 여부 (응답 해석 방식)
+        self.caps = None             # HELLO로 받은 ServerCaps (None = 구버전 서버)
+        self.pending = {}            # request id -> Future
+        self._frames = FrameReader()
+        self._outbox = []            # "@<id> CMD ..." 줄
+        self._flush_task = None
+        self._rx_task = None
+        self._open_lock = asyncio.Lock()
+
+    @property
+    def connected(self):
+        return self.writer is not None and not self.writer.is_closing()
+
+    async def ensure_open(self):
+        async with self._open_lock:
+            if self.connected:
+                return
+            r, w = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.connect_timeout)
+            sock = w.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            frames = FrameReader()
+            try:
+                await asyncio.wait_for(self._negotiate(r, w, frames), self.connect_timeout)
+                fmt = await asyncio.wait_for(self._handshake(r, w, frames, f"FORMAT {FORMAT_JSON}", True),
+                                             self.connect_timeout)
+                json_mode = fmt.ok and (fmt.data or {}).get("format") == FORMAT_JSON
+                hello = await asyncio.wait_for(self._handshake(r, w, frames, "HELLO", json_mode), self.connect_timeout)
+            except BaseException:
+                w.close()
+                raise
+            self.reader, self.writer, self._frames = r, w, frames
+            self.json, self.caps = json_mode, (hello.value if hello.ok else None)
+            if self.caps is not None and self.caps.max_batch > 0:
+                self.max_batch = min(self.max_batch, self.caps.max_batch)
+            self._rx_task = asyncio.create_task(self._rx_loop())
+
+    @staticmethod
+    async def _negotiate(r, w, frames):
+        w.write(encode_command(f"PROTO {PROTO_VERSION}"))
+        await w.drain()
+        while True:
+            data = await r.read(4096)
+            if not data:
+                raise ConnectionError("PROTO 협상 중 연결 종료")
+            frames.feed(data)
+            if frames.looks_framed() is False:
+                raise ProtocolError("legacy 서버 (PROTO 미지원) → UnrealSocketClient를 사용하세요")
+            frame = frames.pop_frame()
+            if frame is not None:
+                p = frame[0].split()
+                if len(p) < 3 or p[:2] != ["OK", "PROTO"] or p[2] == "0":
+                    raise ProtocolError(f"PROTO 협상 실패: {frame[0]!r}")
+                return
+
+    @staticmethod
+    async def _handshake(r, w, frames, command, json_mode) -> Reply:
+        """협상 명령 1개 왕복 (FORMAT / HELLO). 모르는 서버면 code 501 응답이 그대로 돌아옴"""
+        w.write(encode_command(command))
+        await w.drain()
+        while (frame := frames.pop_frame()) is None:
+            data = await r.read(4096)
+            if not data:
+                raise ConnectionError(f"{command} 협상 중 연결 종료")
+            frames.feed(data)
+        return decode_reply(frame[0], verb_of(command), json_mode)
+
+    def submit(self, rid: str, command: str) -> asyncio.Future:
+        fut = asyncio.get_running_loop().create_future()
+        self.pending[rid] = fut
+        self._outbox.append(f"@{rid} {command.strip()}")
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+        return fut
+
+    async def _flush(self):
+        await asyncio.sleep(0)   # 같은 루프 턴에 들어온 요청까지 모으기
+        try:
+            while self._outbox:
+                lines, self._outbox = self._outbox[:self.max_batch], self._outbox[self.max_batch:]
+                self.writer.write(encode_batch(lines))
+                await self.writer.drain()
+        except Exception as e:
+            self._teardown(e)
+        finally:
+            self._flush_task = None
+
+    async def _rx_loop(self):
+        err = None
+        try:
+            while True:
+                data = await self.reader.read(65536)
+                if not data:
+                    break
+                self._frames.feed(data)
+                while (frame := self._frames.pop_frame()) is not None:
+                    payload, extra = frame
+                    fut = self.pending.pop(extra[0], None) if extra else None
+                    if fut is None:
+                        if not extra:
+                            self.on_push(self, decode_reply(payload, "SWITCH", self.json))   # id 없는 푸시
+                        continue                          # 취소/타임아웃된 요청의 늦은 응답
+                    if not fut.done():
+                        fut.set_result(payload)
+        except (OSError, ProtocolError) as e:
+            err = e
+        except asyncio.CancelledError:
+            err = ConnectionError("closed")
+            raise
+        finally:
+            self._teardown(err or ConnectionError(f"{self.host}:{self.port} 연결 종료"))
+
+    def _teardown(self, err):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+        self._outbox.clear()
+        pending, self.pending = self.pending, {}
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(err if isinstance(err, Exception) else ConnectionError(str(err)))
+
+    async def close(self):
+        task, self._rx_task = self._rx_task, None
+        if self.writer is not None:
+            self.writer.close()
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+
+class AsyncUnrealClient:
+    def __init__(self, ip='127.0.0.1', ports=(9999, 9998),
+                 connect_timeout=0.5, request_timeout=2.0, max_batch=4096):
+        self.request_timeout = request_timeout
+        self.streams = {
+            mode: _Stream(ip, port, connect_timeout, max_batch, self._on_push)
+            for mode, port in zip(MODES, ports)
+        }
+        self._ids = itertools.count(1)
+        self._bg = set()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def connect(self):
+        """두 포트 모두 연결 시도. 열린 모드 목록 반환"""
+        results = await asyncio.gather(*(s.ensure_open() for s in self.streams.values()),
+                                       return_exceptions=True)
+        return [m for m, r in zip(self.streams, results) if not isinstance(r, BaseException)]
+
+    async def close(self):
+        await asyncio.gather(*(s.close() for s in self.streams.values()))
+
+    def _on_push(self, stream, reply: Reply):
+        # 에디터가 PIE 시작을 알리면 9999 스트림을 미리 열어둠
+        if reply.startswith("SWITCH:PIE"):
+            task = asyncio.create_task(self.streams["PIE"].ensure_open())
+            self._bg.add(task)
+            task.add_done_callback(self._reap)
+
+    def _reap(self, task):
+        self._bg.discard(task)
+        if not task.cancelled():
+            task.exception()   # PIE 서버가 아직 안 떴으면 조용히 무시
+
+    def _route(self, command: str, target: str):
+        if target in MODES:
+            return [target]
+        if is_editor_command(command):
+            order = ["EDITOR", "PIE"]
+        else:
+            order = ["PIE", "EDITOR"] if self.streams["PIE"].connected or not self.streams["EDITOR"].connected \
+                else ["EDITOR", "PIE"]
+        # HELLO 능력을 아는 스트림이 명령을 모르면 뒤로 (모르는 명령 왕복 없이)
+        verb = verb_of(command)
+        return sorted(order, key=lambda m: self.supports(m, verb) is False)
+
+    def supports(self, mode: str, verb: str):
+        """스트림의 HELLO 능력 기준 지원 여부. None = 아직 모름 (미연결/구버전 서버)"""
+        caps = self.streams[mode].caps
+        return None if caps is None else caps.supports(verb)
+
+    async def _open_for(self, command: str, target: str) -> str:
+        last = None
+        for mode in self._route(command, target):
+            try:
+                await self.streams[mode].ensure_open()
+                return mode
+            except (OSError, asyncio.TimeoutError, ProtocolError) as e:
+                last = e
+        raise ConnectionError(f"연결 가능한 서버 없음: {last}")
+
+    async def send(self, command: str, target: str = "AUTO", timeout: float | None = None) -> Reply:
+        """
+        target: 'AUTO' | 'PIE' | 'EDITOR'
+        timeout: 요청별 타임아웃(초). 초과 시 asyncio.TimeoutError, 호출 취소 시 CancelledError
+        반환: Reply (str 그대로 쓸 수 있고 .ok / .code / .error / .value로 구조화된 결과)
+        """
+        mode = await self._open_for(command, target)
+        resp = await self._roundtrip(mode, command, timeout)
+        # 에디터가 PIE 중이라 거절하면 PIE 서버로 재시도
+        if target == "AUTO" and mode == "EDITOR" and resp.error == "PIE":
+            resp = await self._roundtrip(await self._open_for(command, "PIE"), command, timeout)
+        return resp
+
+    async def _roundtrip(self, mode, command, timeout):
+        stream = self.streams[mode]
+        rid = str(next(self._ids))
+        fut = stream.submit(rid, command)
+        try:
+            payload = await asyncio.wait_for(fut, self.request_timeout if timeout is None else timeout)
+        finally:
+            stream.pending.pop(rid, None)
+        return decode_reply(payload, verb_of(command), stream.json)
+
+    async def send_many(self, commands, target: str = "AUTO", timeout: float | None = None):
+        """독립 명령들을 동시에 보내고 결과(또는 예외)를 순서대로 반환"""
+        return await asyncio.gather(*(self.send(c, target, timeout) for c in commands),
+                                    return_exceptions=True)
+
+    # ---------- 동사(verb) 래퍼 ----------
+    async def move(self, actor, x, y, z, **kw):
+        return await self.send(f"MOVE {actor} {x} {y} {z}", **kw)
+
+    async def move_commit(self, actor, x, y, z, **kw):
+        return await self.send(f"MOVE_COMMIT {actor} {x} {y} {z}", **kw)
+
+    async def scale(self, actor, sx, sy, sz, **kw):
+        return await self.send(f"SCALE {actor} {sx} {sy} {sz}", **kw)
+
+    async def set_transforms(self, fields, entries, **kw):
+        """entries: [(actor, v...), ...] → SET_TRANSFORMS 한 줄 (서버 한 틱에 전부 적용)"""
+        return await self.send(format_set_transforms(fields, entries), **kw)
+
+    async def move_by(self, entries, **kw):
+        """entries: [(actor, dx, dy, dz), ...] → 적용 후 트랜스폼 응답 (MOVE_BY)"""
+        return await self.send(format_relative("L", entries), **kw)
+
+    async def rotate_by(self, entries, **kw):
+        """entries: [(actor, dpitch, dyaw, droll), ...] (ROTATE_BY)"""
+        return await self.send(format_relative("R", entries), **kw)
+
+    async def scale_mul(self, entries, **kw):
+        """entries: [(actor, fx, fy, fz), ...] (SCALE_MUL)"""
+        return await self.send(format_relative("S", entries), **kw)
+
+    async def select_set(self, name, actors, **kw):
+        """서버 선택 집합 정의 (같은 이름이면 교체) → 이후 group()은 집합 이름만 보냄"""
+        return await self.send(f"SELECT_SET {name} {' '.join(actors)}", **kw)
+
+    async def group(self, verb, name, *args, **kw):
+        """GROUP_<verb> <집합> <args...> (예: group("SCALE_MUL", "crowd", 1.2, 1.2, 1.2, "PIVOT", "CENTER"))"""
+        return await self.send(" ".join([f"GROUP_{verb}", name, *(str(a) for a in args)]), **kw)
+
+    async def get_location(self, actor, **kw):
+        return _value_or_none(await self.send(f"GET_LOCATION {actor}", **kw))
+
+    async def get_scale(self, actor, **kw):
+        return _value_or_none(await self.send(f"GET_SCALE {actor}", **kw))
+
+    async def get_actor_state(self, actors, **kw):
+        """위치/회전/스케일/Mobility/슬롯을 JSON 한 번으로 → dict (모르는 서버면 None)"""
+        return parse_actor_state(await self.send(f"GET_ACTOR_STATE {' '.join(actors)}", **kw))
+
+    async def get_material_slots(self, actor, **kw):
+        return await self.send(f"GET_MATERIAL_SLOTS {actor}", **kw)
+
+    async def set_material(self, actor, slot, path, **kw):
+        return await self.send(f'SET_MATERIAL {actor} {slot} "{path}"', **kw)
+
+    async def set_material_multi(self, path, targets, **kw):
+        """targets: [(actor, slot), ...] → 머티리얼 로드 1회, 응답 하나에 대상별 결과 (SET_MATERIAL_MULTI)"""
+        return await self.send(format_material_multi(path, targets), **kw)
+
+    async def set_texture(self, actor, slot, param, path, **kw):
+        return await self.send(f'SET_TEXTURE {actor} {slot} {param} "{path}"', **kw)
+
+    async def set_material_params(self, actor, slot, params, **kw):
+        """params: [("T", 이름, 경로) | ("S", 이름, 값) | ("V", 이름, r, g, b, a), ...] → 슬롯 MID에 한 번에 (SET_MATERIAL_PARAMS)"""
+        return await self.send(format_material_params(actor, slot, params), **kw)
+
+    async def release_mid(self, actor=None, slot=None, **kw):
+        """SET_TEXTURE가 만든 MID 해제 (원래 머티리얼로 되돌림). actor가 없으면 전부"""
+        args = [a for a in (actor, None if slot is None else str(slot)) if a is not None]
+        return await self.send(" ".join(["RELEASE_MID", *args]), **kw)
+
+    async def set_static_mesh(self, actor, path, **kw):
+        return await self.send(f'SET_STATIC_MESH {actor} "{path}"', **kw)
+
+    async def cam_track_start(self, camera, target_actor, **kw):
+        return await self.send(f"CAM_TRACK_START {camera} {target_actor}", **kw)
+
+    async def cam_track_stop(self, **kw):
+        return await self.send("CAM_TRACK_STOP", **kw)
+
+    async def list_actors(self, static_only=True, **kw):
+        out = await self.send("LIST_STATIC" if static_only else "LIST", **kw)
+        return [(a.label, a.name) for a in (out.value or [])] if out.ok else []
+
+    async def load_preset(self, name, ox=0.0, oy=0.0, oz=0.0, **kw):
+        kw.setdefault("target", "PIE")   # 프리셋 로드/저장은 런타임 서버 전용
+        return await self.send(f"LOAD_PRESET {name} {ox} {oy} {oz}", **kw)
+
+    async def save_preset(self, name, **kw):
+        kw.setdefault("target", "PIE")
+        return await self.send(f"SAVE_PRESET {name}", **kw)
+
+    async def stats(self, reset=False, **kw):
+        """서버 계측 (STATS) → dict (텍스트 모드 서버면 None)"""
+        resp = await self.send("STATS RESET" if reset else "STATS", **kw)
+        return resp.value if resp.ok and isinstance(resp.value, dict) else None
+
+    async def set_log_level(self, level, **kw):
+        """서버 명령/응답 로그 레벨 (0 = 끔, 1 = 요약, 2 = 전부, 두 서버 공용)"""
+        return await self.send(f"LOG_VERBOSE {int(level)}", **kw)
+
+    async def spawn_asset(self, asset_path, **kw):
+        kw.setdefault("target", "EDITOR")
+        return await self.send(f'SPAWN_ASSET "{asset_path}"', **kw)
+
+    async def py(self, script_and_args, **kw):
+        kw.setdefault("target", "EDITOR")
+        return await self.send(f"py {script_and_args}", **kw)
+
+
+def _value_or_none(resp: Reply):
+    return tuple(resp.value) if resp.ok and resp.value is not None else None
@@ -0,0 +1,132 @@
+# bench_batch_fanout.py
+# 멀티 셀렉트 fan-out 벤치마크: 액터 N개에 MOVE를 보낼 때
+#   before = send_command 왕복 N회 / after = send_batch 1회
+#
+# 사용:
+#   python bench_batch_fanout.py                    # 내장 에뮬레이터 서버 (틱 기반, 60Hz)
+#   python bench_batch_fanout.py --port 9999 --actor StaticMeshActor_0   # 실제 PIE 서버
+import argparse
+import socket
+import threading
+import time
+
+from ChangeMaterial import UnrealSocketClient
+
+
+class TickEmulatorServer:
+    """AMySocketServer::Tick 동작 흉내: 틱마다 수신 1회 → 명령 1개(또는 BATCH 블록 1개) 처리"""
+
+    def __init__(self, port: int, tick_ms: float):
+        self.port = port
+        self.tick = tick_ms / 1000.0
+        self._ls = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._ls.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._ls.bind(("127.0.0.1", port))
+        self._ls.listen(8)
+
+    def start(self):
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self):
+        while True:
+            c, _ = self._ls.accept()
+            c.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._client_loop, args=(c,), daemon=True).start()
+
+    @staticmethod
+    def _handle(cmd: str) -> str:
+        p = cmd.split()
+        if p and p[0] == "MOVE" and len(p) >= 5:
+            return f"✅ {p[1]} 이동 완료: ({float(p[2]):.1f}, {float(p[3]):.1f}, {float(p[4]):.1f})"
+        return "❌ 알 수 없는 명령"
+
+    @staticmethod
+    def _frame(text: str) -> bytes:
+        b = text.encode("utf-8")
+        return f"XR1 {len(b)}\n".encode("ascii") + b
+
+    def _client_loop(self, c):
+        c.setblocking(False)
+        framed = False
+        pending = b""
+        next_tick = time.perf_counter()
+        while True:
+            next_tick += self.tick
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+            try:
+                data = c.recv(1 << 20)
+                if not data:
+                    return
+                pending += data
+            except BlockingIOError:
+                pass
+            if not pending:
+                continue
+            if pending.startswith(b"BATCH"):
+                if b"\nEND\n" not in pending:
+                    continue
+                block, pending = pending.split(b"\nEND\n", 1)
+                cmds = block.decode("utf-8").splitlines()[1:]
+                c.setblocking(True)
+                c.sendall(b"".join(self._frame(self._handle(x)) for x in cmds))
+                c.setblocking(False)
+                continue
+            line, _, pending = pending.partition(b"\n")
+            cmd = line.decode("utf-8").strip()
+            if cmd.startswith("PROTO"):
+                framed = True
+                out = "OK PROTO 1"
+            else:
+                out = self._handle(cmd)
+            c.setblocking(True)
+            c.sendall(self._frame(out) if framed else out.encode("utf-8"))
+            c.setblocking(False)
+
+
+def run(client, actor, counts, preferred):
+    print(f"{'actors':>7} | {'before (N x send_command)':>26} | {'after (send_batch)':>19} | speedup")
+    print("-" * 72)
+    for n in counts:
+        names = [actor.format(i=i) for i in range(n)]
+        cmds = [f"MOVE {a} {i * 10.0} 0.0 100.0" for i, a in enumerate(names)]
+
+        t0 = time.perf_counter()
+        for c in cmds:
+            client.send_command(c, preferred=preferred)
+        before = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        client.send_batch(cmds, preferred=preferred)
+        after = time.perf_counter() - t0
+
+        print(f"{n:>7} | {before * 1000:>23.1f} ms | {after * 1000:>16.1f} ms | {before / max(after, 1e-9):>6.1f}x")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="BATCH fan-out 벤치마크")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=None, help="실제 Unreal 서버 포트 (생략 시 에뮬레이터 사용)")
+    ap.add_argument("--actor", default="StaticMeshActor_{i}", help="액터 이름 패턴 ({i} = 인덱스)")
+    ap.add_argument("--counts", default="1,10,100,1000")
+    ap.add_argument("--tick-ms", type=float, default=1000.0 / 60.0, help="에뮬레이터 틱 간격")
+    args = ap.parse_args()
+
+    counts = [int(x) for x in args.counts.split(",") if x]
+    if args.port is None:
+        port = 19999
+        TickEmulatorServer(port, args.tick_ms).start()
+        print(f"에뮬레이터 서버 127.0.0.1:{port} (tick {args.tick_ms:.1f} ms)")
+    else:
+        port = args.port
+
+    client = UnrealSocketClient(ip=args.host, ports=[port, port])
+    client.recv_timeout = 5.0
+    preferred = "PIE"
+    if not client.connect(port):
+        raise SystemExit(f"❌ {args.host}:{port} 연결 실패")
+    run(client, args.actor, counts, preferred)
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# socket_stats.py
+# 소켓 서버 계측 모니터: STATS 명령으로 명령별 처리 시간(p50/p95/p99)과
+# 원격 제어가 게임 스레드를 얼마나 쓰는지(busy %, 프레임 대비 최대 %)를 주기적으로 출력
+#
+# 사용:
+#   python socket_stats.py                      # 9999(PIE) 5초마다
+#   python socket_stats.py --port 9998 --interval 1 --reset   # 에디터 서버, 구간별(조회 후 초기화)
+import argparse
+import time
+
+from ChangeMaterial import UnrealSocketClient
+
+
+def print_stats(stats):
+    t = stats["ticks"]
+    busy = t["busy"]
+    q = stats["queue"]
+    print(f"\n[{stats['server']}] {stats['uptime_s']:.1f}s  commands={stats['commands']} errors={stats['errors']}  "
+          f"in={stats['bytes_in']}B out={stats['bytes_out']}B")
+    print(f"  game thread: busy {t['busy_share_pct']:.2f}%  frame max {t['max_frame_pct']:.1f}%  "
+          f"tick ms p50={busy['p50_ms']:.3f} p95={busy['p95_ms']:.3f} p99={busy['p99_ms']:.3f} max={busy['max_ms']:.3f}")
+    print(f"  cmds/tick avg {t['commands_avg']:.1f} max {t['commands_max']}  "
+          f"queue {q['last']} {q['unit']} (max {q['max']})")
+    print(f"  {'verb':<20} {'count':>7} {'err':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for verb, v in sorted(stats["verbs"].items(), key=lambda kv: -kv[1]["count"]):
+        print(f"  {verb:<20} {v['count']:>7} {v['errors']:>5} {v['p50_ms']:>8.3f} {v['p95_ms']:>8.3f} "
+              f"{v['p99_ms']:>8.3f} {v['max_ms']:>8.3f}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Unreal 소켓 서버 STATS 모니터")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=9999)
+    ap.add_argument("--interval", type=float, default=5.0, help="조회 간격(초), 0이면 한 번만")
+    ap.add_argument("--reset", action="store_true", help="조회할 때마다 서버 통계 초기화 (구간별 수치)")
+    args = ap.parse_args()
+
+    client = UnrealSocketClient(ip=args.host, ports=[args.port, args.port])
+    if not client.connect(args.port):
+        raise SystemExit(f"❌ {args.host}:{args.port} 연결 실패")
+    try:
+        while True:
+            resp = client.stats(reset=args.reset)
+            if resp.ok and isinstance(resp.value, dict):
+                print_stats(resp.value)
+            else:
+                print(resp)   # 텍스트 모드 서버 / 오류 응답은 그대로
+            if args.interval <= 0:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
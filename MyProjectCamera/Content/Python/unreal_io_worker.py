@@ -0,0 +1,150 @@
+# unreal_io_worker.py
+# Tk UI용 백그라운드 I/O 워커
+#  - 소켓(UnrealSocketClient)은 워커 스레드만 만짐 → 느리거나 죽은 서버가 UI를 멈추지 않음
+#  - UI는 send()/send_batch()/run()으로 요청만 큐에 넣고 바로 리턴
+#  - 완료 콜백은 결과 큐에 쌓였다가 root.after 펌프로 Tk 메인 스레드에서 실행
+#    fn이 예외를 던지면 callback 대신 errback(exc) (+ 전역 on_error) → 완료를 기다리는 쪽이 항상 끝을 알 수 있음
+#  - key를 주면 아직 시작 안 한 같은 key 요청을 최신 값으로 덮어씀 (드래그 미리보기 등)
+#  - 큐가 비어 있으면 idle_s마다 client.keepalive() 호출 (커넥션 풀 상태 확인/재연결)
+#  - WATCH 구독 중이면 push_poll_s마다 client.poll_push()로 푸시만 읽고, 바뀐 액터 이름을 on_push로 UI에 넘김
+import queue
+import threading
+import time
+import traceback
+
+_STOP = object()
+
+
+class _Job:
+    __slots__ = ("fn", "callback", "errback", "key")
+
+    def __init__(self, fn, callback, errback, key):
+        self.fn = fn
+        self.callback = callback
+        self.errback = errback
+        self.key = key
+
+
+class UnrealIOWorker:
+    def __init__(self, client, root, poll_ms: int = 8, idle_s: float = 1.0, push_poll_s: float = 0.016):
+        self.client = client
+        self.root = root
+        self.poll_ms = poll_ms
+        self.idle_s = idle_s
+        self.push_poll_s = push_poll_s
+        self.on_error = None                 # UI 스레드에서 호출: on_error(exc)
+        self.on_push = None                  # UI 스레드에서 호출: on_push(푸시로 바뀐 액터 이름 set)
+        self._jobs = queue.Queue()
+        self._done = queue.Queue()
+        self._keyed = {}                     # key -> 대기 중인 _Job
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._loop, name="UnrealIO", daemon=True)
+        self._pump_after = None
+
+    # ---------- 수명 ----------
+    def start(self):
+        self._thread.start()
+        self._pump_after = self.root.after(self.poll_ms, self._pump)
+
+    def stop(self, timeout: float = 2.0):
+        if self._pump_after is not None:
+            try:
+                self.root.after_cancel(self._pump_after)
+            except Exception:
+                pass
+            self._pump_after = None
+        self._jobs.put(_STOP)
+        self._thread.join(timeout)
+
+    # ---------- UI → 워커 ----------
+    def run(self, fn, callback=None, key=None, errback=None):
+        """
+        fn(client)를 워커 스레드에서 실행, 반환값으로 callback(result)을 UI 스레드에서 호출.
+        fn이 예외를 던지면 errback(exc)을 UI 스레드에서 호출 (전역 on_error도 따로 호출됨)
+        """
+        with self._lock:
+            if key is not None and key in self._keyed:
+                job = self._keyed[key]
+                job.fn, job.callback, job.errback = fn, callback, errback   # 아직 대기 중 → 최신 요청으로 교체
+                return
+            job = _Job(fn, callback, errback, key)
+            if key is not None:
+                self._keyed[key] = job
+        self._jobs.put(job)
+
+    def send(self, command: str, callback=None, preferred=None, key=None, errback=None):
+        self.run(lambda c: c.send_command(command, preferred=preferred), callback, key, errback)
+
+    def send_batch(self, commands, callback=None, preferred=None, key=None, errback=None):
+        commands = list(commands)
+        self.run(lambda c: c.send_batch(commands, preferred=preferred), callback, key, errback)
+
+    def set_transforms(self, fields: str, entries, callback=None, preferred=None, key=None, errback=None):
+        entries = list(entries)
+        self.run(lambda c: c.set_transforms(fields, entries, preferred=preferred), callback, key, errback)
+
+    def apply_relative(self, field: str, entries, callback=None, preferred=None, key=None, errback=None):
+        entries = list(entries)
+        self.run(lambda c: c.apply_relative(field, entries, preferred=preferred), callback, key, errback)
+
+    # ---------- 워커 스레드 ----------
+    def _loop(self):
+        keepalive = getattr(self.client, "keepalive", None)
+        poll_push = getattr(self.client, "poll_push", None)
+        last_keepalive = time.monotonic()
+        while True:
+            watching = poll_push is not None and self.client.watching
+            try:
+                job = self._jobs.get(timeout=self.push_poll_s if watching else self.idle_s)
+            except queue.Empty:
+                try:
+                    if watching:
+                        poll_push()
+                        self._deliver_pushed()
+                    if keepalive is not None and time.monotonic() - last_keepalive >= self.idle_s:
+                        last_keepalive = time.monotonic()
+                        keepalive()
+                except Exception:
+                    traceback.print_exc()
+                continue
+            if job is _STOP:
+                break
+            with self._lock:
+                if job.key is not None and self._keyed.get(job.key) is job:
+                    del self._keyed[job.key]
+                fn, callback, errback = job.fn, job.callback, job.errback
+            try:
+                result = fn(self.client)
+            except Exception as e:
+                traceback.print_exc()
+                self._done.put((errback, e))
+                self._done.put((self.on_error, e))
+                continue
+            if callback is not None:
+                self._done.put((callback, result))
+            self._deliver_pushed()   # 응답 사이에 끼어 온 푸시
+        try:
+            self.client.close()
+        except Exception:
+            pass
+
+    def _deliver_pushed(self):
+        take = getattr(self.client, "take_pushed", None)
+        names = take() if take is not None else None
+        if names and self.on_push is not None:
+            self._done.put((self.on_push, names))
+
+    # ---------- 워커 → UI (Tk 메인 스레드) ----------
+    def _pump(self):
+        while True:
+            try:
+                callback, value = self._done.get_nowait()
+            except queue.Empty:
+                break
+            if callback is None:
+                continue
+            try:
+                callback(value)
+            except Exception:
+                traceback.print_exc()
+        self._pump_after = self.root.after(self.poll_ms, self._pump)
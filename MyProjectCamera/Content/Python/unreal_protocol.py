@@ -0,0 +1,673 @@
+# unreal_protocol.py
+# Unreal 소켓 서버(9999 PIE / 9998 EDITOR) 응답 프레이밍 v1
+#
+#   프레임: b"XR1 <payload 바이트 수>\n" + UTF-8 payload
+#   - 접속 직후 "PROTO 1"을 보내 협상, 응답이 프레임이면 v1 사용
+#   - 구버전 서버(응답이 raw 문자열)는 legacy 모드로 폴백
+#   - "@<id> CMD ..."로 보내면 응답 헤더가 b"XR1 <len> <id>\n" (동시 요청 상관관계)
+#   - BATCH 블록: "BATCH <n>\n" + 명령 n줄 + "END\n" → 응답 n개가 한 번에 돌아옴
+#   - 바이너리 미리보기 패킷 (9999, 응답 없음): b"XB" + u8 op + u8 flags + u16 count + u16 0
+#       일반 엔트리: u32 handle + float32 x3 / 델타(flags&1): 헤더 뒤 float32 step, u32 handle + int16 x3
+#       handle은 "HANDLE <액터...>" 응답으로 받음
+#   - 액터 핸들: LIST/LIST_STATIC(JSON)/GET_ACTOR_STATE 응답의 "handle" (액터가 파괴될 때까지 유지)
+#       명령의 액터 이름 자리에 "#<handle>"을 쓰면 서버가 이름 대신 핸들로 바로 조회 (텍스트 LIST는 "라벨|이름" 그대로)
+#   - SET_TRANSFORMS <필드> <액터> <값...> ...: 여러 액터 트랜스폼을 한 틱에 적용 (필드 = L/R/S 조합, 필드당 값 3개)
+#   - MOVE_BY / ROTATE_BY / SCALE_MUL <액터> <값 3개> ...: 서버가 지금 값에 델타/배율을 적용
+#       응답은 적용 후 트랜스폼 ({"actors": [...], "missing": [...]}) → 읽기-계산-쓰기 왕복 없음
+#   - SELECT_SET <집합> <액터...> (+ _ADD / _REMOVE / _CLEAR): 서버에 이름 있는 액터 집합 저장 (포트마다 따로)
+#       GROUP_MOVE_BY / GROUP_ROTATE_BY / GROUP_SCALE_MUL <집합> <값 3개> [PIVOT CENTER | PIVOT x y z],
+#       GROUP_SET_MATERIAL <집합> <슬롯> <경로>, GROUP_SET_MOBILITY <집합> <Mobility>: 집합 이름만 보냄
+#       결과 트랜스폼은 응답 대신 WATCH 푸시로 옴 (보낸 연결 포함)
+#   - SET_MATERIAL_MULTI <경로> <액터> <슬롯> ...: 머티리얼 하나를 여러 (액터, 슬롯)에 (로드 1회, 한 패스)
+#       응답 하나에 대상별 결과 ({"applied","total","results":[{"actor","slot","status":"Ok|NotFound|NoSlot"}]})
+#   - SET_TEXTURE / SET_MATERIAL_PARAMS <액터> <슬롯> T <이름> <경로> | S <이름> <값> | V <이름> r g b a ... (9999)
+#       (컴포넌트, 슬롯)마다 MID 하나를 서버가 재사용 → 텍스처를 여러 번 바꿔도 파라미터 쓰기만
+#       RELEASE_MID [<액터> [<슬롯>]]: 원래 머티리얼로 되돌리고 MID 해제 (인자가 없으면 전부)
+#   - GET_ACTOR_STATE <액터...>: 위치/회전/스케일/Mobility/슬롯을 JSON 한 번으로 ({"actors": [...], "missing": [...]})
+#   - WATCH <액터...> / UNWATCH [<액터...>]: 트랜스폼 변경 푸시 구독 (PROTO 1 연결 전용)
+#       응답은 지금 값 스냅샷, 이후 바뀔 때마다 서버가 틱당 한 번 b"XR1 <len> !WATCH\n" 프레임을 보냄
+#       (요청 ID 자리가 '!'로 시작하면 푸시, payload는 {"actors": [...], "removed": [...]}) → TransformCache.apply
+#   - FORMAT JSON: 이후 응답이 {"ok","code","verb","error"?,"message"?,"data"?} JSON 한 줄 (연결 단위 협상)
+#       모르는 서버면 텍스트 모드로 남고, 문구 해석은 decode_text_reply 한 곳에서만 함
+#       → 호출 측은 어느 쪽이든 Reply(code/error/value)로 분기
+import json
+import struct
+from typing import NamedTuple
+
+PROTO_VERSION = 1
+FRAME_MAGIC = b"XR1 "
+MAX_HEADER = 64
+
+PUSH_PREFIX = "!"            # 푸시 프레임의 요청 ID 접두
+PUSH_WATCH = "!WATCH"
+
+BIN_MAGIC = b"XB"
+BIN_OPS = {"MOVE": 1, "SCALE": 2, "ROTATE": 3}
+BIN_FLAG_DELTA = 0x01
+BIN_MAX_COUNT = 0xFFFF
+# 델타 양자화 간격 (int16 범위 밖이면 절대값 패킷으로 보냄)
+# ROTATE는 항상 절대값: 서버의 GetActorRotation()은 쿼터니언을 거친 값이라 (Pitch 100 → 80, 180, 180)
+# 델타를 더하면 클라이언트가 기억한 last + d*step과 어긋남
+BIN_DELTA_STEP = {"MOVE": 0.01, "SCALE": 0.0005}
+
+_BIN_HEADER = struct.Struct("<2sBBHH")
+_BIN_STEP = struct.Struct("<f")
+_BIN_ABS = struct.Struct("<I3f")
+_BIN_DELTA = struct.Struct("<I3h")
+
+
+TRANSFORM_FIELDS = "LRS"   # L 위치 / R 회전(Pitch Yaw Roll) / S 스케일
+PREVIEW_FIELDS = {"MOVE": "L", "ROTATE": "R", "SCALE": "S"}   # 미리보기 명령 → 바꾸는 필드
+_FIELD_KEYS = {"L": "location", "R": "rotation", "S": "scale"}
+RELATIVE_VERBS = {"L": "MOVE_BY", "R": "ROTATE_BY", "S": "SCALE_MUL"}   # 필드 → 상대 명령 (델타/델타/배율)
+
+
+# 포트를 따로 지정하지 않으면 9998(EDITOR)로 보내는 명령들
+EDITOR_COMMAND_PREFIXES = ("py ", "SPAWN_ASSET", "IMPORT_FBX", "SAVE_PRESET", "LOAD_PRESET")
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def is_editor_command(command: str) -> bool:
+    return command.startswith(EDITOR_COMMAND_PREFIXES)
+
+
+def encode_command(command: str, request_id=None) -> bytes:
+    """한 줄 명령 → 전송 바이트 (개행 종료, request_id가 있으면 "@<id> " 접두)"""
+    line = command.strip()
+    if request_id is not None:
+        line = f"@{request_id} {line}"
+    return (line + "\n").encode("utf-8")
+
+
+def encode_batch(lines) -> bytes:
+    """명령 줄 목록 → BATCH 블록 바이트"""
+    body = "\n".join(lines)
+    return f"BATCH {len(lines)}\n{body}\nEND\n".encode("utf-8")
+
+
+def format_set_transforms(fields: str, entries) -> str:
+    """
+    entries: [(actor, v1, v2, ...), ...] (필드 하나당 값 3개, fields에 적은 순서대로)
+    → "SET_TRANSFORMS LS Cube 0 0 100 1 1 1 ..." 한 줄
+    """
+    if not fields or any(f not in TRANSFORM_FIELDS for f in fields) or len(set(fields)) != len(fields):
+        raise ValueError(f"bad fields: {fields!r}")
+    width = 3 * len(fields)
+    parts = ["SET_TRANSFORMS", fields]
+    for actor, *values in entries:
+        if len(values) != width:
+            raise ValueError(f"{actor}: expected {width} values, got {len(values)}")
+        parts.append(actor)
+        parts.extend(repr(float(v)) for v in values)
+    return " ".join(parts)
+
+
+def format_relative(field: str, entries) -> str:
+    """
+    entries: [(actor, a, b, c), ...] (L/R은 델타, S는 배율)
+    → "MOVE_BY Cube 10 0 0 Sphere 10 0 0" 한 줄
+    """
+    verb = RELATIVE_VERBS.get(field)
+    if verb is None:
+        raise ValueError(f"bad field: {field!r}")
+    parts = [verb]
+    for actor, *values in entries:
+        if len(values) != 3:
+            raise ValueError(f"{actor}: expected 3 values, got {len(values)}")
+        parts.append(actor)
+        parts.extend(repr(float(v)) for v in values)
+    return " ".join(parts)
+
+
+def format_material_multi(path: str, targets) -> str:
+    """
+    targets: [(actor, slot), ...]
+    → 'SET_MATERIAL_MULTI "/Game/M_Foo" Cube 0 Sphere 1' 한 줄 (경로는 공백이 있어도 되게 따옴표)
+    """
+    parts = ["SET_MATERIAL_MULTI", f'"{path.strip()}"']
+    for actor, slot in targets:
+        parts.append(actor)
+        parts.append(str(int(slot)))
+    return " ".join(parts)
+
+
+def format_material_params(actor: str, slot: int, params) -> str:
+    """
+    params: [("T", name, path) | ("S", name, value) | ("V", name, r, g, b, a), ...]
+    → 'SET_MATERIAL_PARAMS Cube 0 T BaseColor "/Game/T_Foo" S Roughness 0.4' 한 줄
+    """
+    parts = ["SET_MATERIAL_PARAMS", actor, str(int(slot))]
+    for kind, name, *values in params:
+        kind = kind.upper()
+        width = {"T": 1, "S": 1, "V": 4}.get(kind)
+        if width is None or len(values) != width:
+            raise ValueError(f"{name}: bad param {kind!r} with {len(values)} values")
+        parts += [kind, name]
+        parts += [f'"{str(values[0]).strip()}"'] if kind == "T" else [repr(float(v)) for v in values]
+    return " ".join(parts)
+
+
+def push_tag(extra):
+    """FrameReader.pop_frame의 extra → 푸시 프레임이면 태그("!WATCH"), 요청에 대한 응답이면 None"""
+    return extra[0] if extra and extra[0].startswith(PUSH_PREFIX) else None
+
+
+def verb_of(command: str) -> str:
+    """명령 줄의 첫 토큰 (응답 해석 기준)"""
+    head = command.split(None, 1)
+    return head[0] if head else ""
+
+
+# ---------- 응답 (FORMAT JSON / 텍스트 공용) ----------
+FORMAT_JSON = "JSON"
+
+CODE_TRANSPORT = 0      # 서버 응답 아님 (연결 실패/타임아웃, 클라이언트가 만든 응답)
+CODE_OK = 200
+CODE_BAD_REQUEST = 400
+CODE_NOT_FOUND = 404
+CODE_CONFLICT = 409     # PIE 중/Movable 아님 등 지금 상태에서 불가
+CODE_FAILED = 500
+CODE_UNKNOWN = 501      # 서버가 모르는 명령
+
+# 9998 "ERR <종류>" → 코드 (서버 FMyReply::FromEditorText와 같은 표)
+_EDITOR_ERRORS = {
+    "Args": CODE_BAD_REQUEST, "PyArgs": CODE_BAD_REQUEST, "Binary": CODE_BAD_REQUEST,
+    "BatchNeedsProto": CODE_BAD_REQUEST, "BatchTooMany": CODE_BAD_REQUEST, "BatchTooLarge": CODE_BAD_REQUEST,
+    "BatchCount": CODE_BAD_REQUEST, "WatchNeedsProto": CODE_BAD_REQUEST,
+    "NotFound": CODE_NOT_FOUND, "LoadFailed": CODE_NOT_FOUND, "LoadMesh": CODE_NOT_FOUND, "NoSet": CODE_NOT_FOUND,
+    "PIE": CODE_CONFLICT, "NoWorld": CODE_CONFLICT, "NoSMC": CODE_CONFLICT,
+    "Unknown": CODE_UNKNOWN,
+}
+
+
+class Vec3(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+
+class ActorRef(NamedTuple):
+    label: str
+    name: str
+    handle: int = 0   # 0 = 서버가 핸들을 안 줌 (텍스트 LIST / 구버전 서버)
+
+
+class ActorTransform(NamedTuple):
+    location: Vec3
+    rotation: Vec3   # Pitch, Yaw, Roll
+    scale: Vec3
+    handle: int = 0
+
+
+class MaterialSlot(NamedTuple):
+    index: int
+    material: str
+    path: str = ""
+    textures: tuple = ()
+
+
+class ServerCaps(NamedTuple):
+    """HELLO 응답 (연결별 캐시) → 명령 지원 여부를 프로빙/추측하지 않고 바로 경로 선택"""
+    kind: str                # "PIE" | "EDITOR"
+    proto: int
+    verbs: frozenset
+    binary: frozenset        # 바이너리 미리보기 패킷 op (MOVE/SCALE/ROTATE), 못 받는 서버면 빈 집합
+    max_batch: int
+    max_batch_bytes: int
+    max_clients: int
+
+    def supports(self, verb: str) -> bool:
+        return verb in self.verbs
+
+
+class Reply(str):
+    """
+    응답 1개. 문자열 값 = 사람용 메시지 (로그 출력/기존 문자열 비교 코드가 그대로 동작)
+      code / error : 상태 (ok = 2xx·3xx), 문구를 파싱하지 않고 분기
+      data         : 명령별 payload (JSON 모드면 서버가 준 그대로, 텍스트 모드면 decode_text_reply가 복원)
+      value        : data → 타입 레코드 (LIST → [ActorRef], GET_LOCATION → Vec3, GET_TEXTURES → [MaterialSlot] …)
+    JSON 모드의 목록형 응답(LIST/GET_TEXTURES 등)은 메시지가 비어 있음 → value를 쓸 것
+    """
+
+    def __new__(cls, message: str = "", code: int = CODE_OK, error: str = "", verb: str = "", data=None):
+        self = super().__new__(cls, message)
+        self.code = code
+        self.error = error
+        self.verb = verb
+        self.data = data
+        return self
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.code < 400
+
+    @property
+    def value(self):
+        record = _RECORDS.get(self.verb)
+        if record is None or self.data is None:
+            return self.data
+        return record(self.data)
+
+
+def local_error(message: str, error: str = "Transport") -> Reply:
+    """연결 실패/타임아웃처럼 서버 응답이 없을 때 클라이언트가 만드는 응답"""
+    return Reply(message, CODE_TRANSPORT, error)
+
+
+def _vec3_of(key):
+    return lambda d: Vec3(*d[key])
+
+
+def _actor_refs(d):
+    return [ActorRef(a["label"], a["name"], int(a.get("handle", 0))) for a in d["actors"]]
+
+
+def _material_slots(d):
+    return [MaterialSlot(s["index"], s["material"], s.get("path", ""), tuple(s.get("textures", ())))
+            for s in d["slots"]]
+
+
+def _server_caps(d):
+    limits = d.get("limits", {})
+    return ServerCaps(d["kind"], int(d["proto"]), frozenset(d["verbs"]), frozenset(d.get("binary", ())),
+                      int(limits.get("max_batch", 0)), int(limits.get("max_batch_bytes", 0)),
+                      int(limits.get("max_clients", 0)))
+
+
+# 명령 → data를 타입 레코드로 바꾸는 함수 (없으면 value = data 그대로)
+_RECORDS = {
+    "LIST": _actor_refs,
+    "LIST_STATIC": _actor_refs,
+    "MOVE": _vec3_of("location"),
+    "MOVE_COMMIT": _vec3_of("location"),
+    "GET_LOCATION": _vec3_of("location"),
+    "GET_SCALE": _vec3_of("scale"),
+    "SCALE": _vec3_of("scale"),
+    "MOVE_BY": lambda d: transforms_from_state(d),     # {actor: ActorTransform} 적용 후 값
+    "ROTATE_BY": lambda d: transforms_from_state(d),
+    "SCALE_MUL": lambda d: transforms_from_state(d),
+    "GET_MATERIAL_SLOTS": _material_slots,
+    "GET_TEXTURES": _material_slots,
+    "GET_TEXTURES_SLOT": lambda d: MaterialSlot(d["slot"], d["material"], "", tuple(d["textures"])),
+    "HANDLE": lambda d: d["handles"],
+    "GET_BLUEPRINTS": lambda d: d["classes"],
+    "HELLO": _server_caps,
+    "CAPS": _server_caps,
+}
+
+
+def decode_reply(payload: str, verb: str = "", json_mode: bool = False) -> Reply:
+    """응답 payload → Reply (JSON 봉투가 아니면 텍스트 응답으로 해석)"""
+    if json_mode and payload.startswith("{"):
+        try:
+            env = json.loads(payload)
+        except ValueError:
+            env = None
+        if isinstance(env, dict) and "code" in env:
+            return Reply(env.get("message", ""), env["code"], env.get("error", ""),
+                         env.get("verb") or verb, env.get("data"))
+    return decode_text_reply(payload, verb)
+
+
+def decode_text_reply(text: str, verb: str = "") -> Reply:
+    """
+    텍스트 모드(구버전 서버/FORMAT 미협상) 응답 → Reply.
+    사람용 문구는 여기서만 해석: 9999 "❌ …"는 종류 구분이 안 돼서 500, 9998 "ERR X"는 _EDITOR_ERRORS
+    """
+    s = text.strip()
+    if s.startswith("ERR "):
+        error = s[4:].split(None, 1)[0]
+        return Reply(text, _EDITOR_ERRORS.get(error, CODE_FAILED), error, verb)
+    if "알 수 없는 명령" in s:
+        return Reply(text, CODE_UNKNOWN, "Unknown", verb)
+    if s.startswith("❌"):
+        return Reply(text, CODE_FAILED, "Failed", verb)
+    parse = _TEXT_PARSERS.get(verb)
+    if parse is None:
+        return Reply(text, CODE_OK, "", verb)
+    data = parse(s)
+    if data is None:   # 조회 명령인데 결과 형식이 아님 (⚠️ 없음 문구 등)
+        return Reply(text, CODE_NOT_FOUND, "NoData", verb)
+    return Reply(text, CODE_OK, "", verb, data)
+
+
+def _text_actor_list(s):
+    actors = []
+    for line in s.splitlines():
+        line = line.strip()
+        if line:
+            label, _, name = line.partition("|")
+            actors.append({"label": label.strip(), "name": (name or label).strip()})
+    return {"actors": actors}
+
+
+def _text_vec3(tag, key):
+    def parse(s):
+        p = s.split()
+        if len(p) != 4 or p[0] != tag:
+            return None
+        try:
+            return {key: [float(p[1]), float(p[2]), float(p[3])]}
+        except ValueError:
+            return None
+    return parse
+
+
+def _text_slot_header(line):
+    # "Material Slot 0: M_Wood" → (0, "M_Wood")
+    idx, _, name = line[len("Material Slot "):].partition(":")
+    return int(idx), name.strip()
+
+
+def _text_material_slots(s):
+    slots = []
+    for line in s.splitlines():
+        if line.startswith("Material Slot "):
+            idx, name = _text_slot_header(line)
+            slots.append({"index": idx, "material": name})
+    return {"slots": slots}
+
+
+def _text_textures(s):
+    slots = []
+    for line in s.splitlines():
+        if line.startswith("Material Slot "):
+            idx, name = _text_slot_header(line)
+            slots.append({"index": idx, "material": name, "textures": []})
+        elif slots and line.strip().startswith("└ Texture:"):
+            slots[-1]["textures"].append(line.split(":", 1)[1].strip())
+    return {"slots": slots}
+
+
+def _text_textures_slot(s):
+    out = {"textures": []}
+    for line in s.splitlines():
+        line = line.strip()
+        if line.startswith("[Actor]"):
+            out["actor"] = line[7:].strip()
+        elif line.startswith("[Slot]"):
+            out["slot"] = int(line[6:])
+        elif line.startswith("[Mat]"):
+            out["material"] = line[5:].strip()
+        elif line.startswith("└ ") and line != "└ (none)":
+            out["textures"].append(line[2:].strip())
+    return out if "material" in out else None
+
+
+def _text_handles(s):
+    p = s.split()
+    if not p or p[0] != "HANDLE":
+        return None
+    try:
+        return {"handles": [int(h) for h in p[1:]]}
+    except ValueError:
+        return None
+
+
+def _csv(v):
+    return [x for x in v.split(",") if x]
+
+
+def _text_hello(s):
+    # "OK HELLO PIE proto=1 max_batch=4096 max_batch_bytes=.. max_clients=8 binary=MOVE,.. verbs=PING,.."
+    p = s.split()
+    if len(p) < 3 or p[:2] != ["OK", "HELLO"]:
+        return None
+    kv = dict(t.partition("=")[::2] for t in p[3:])
+    try:
+        return {"kind": p[2], "proto": int(kv.get("proto", 0)),
+                "verbs": _csv(kv.get("verbs", "")), "binary": _csv(kv.get("binary", "")),
+                "limits": {k: int(kv[k]) for k in ("max_batch", "max_batch_bytes", "max_clients") if k in kv}}
+    except ValueError:
+        return None
+
+
+def _text_actor_state(s):
+    try:
+        state = json.loads(s)
+    except ValueError:
+        return None
+    return state if isinstance(state, dict) and isinstance(state.get("actors"), list) else None
+
+
+def _text_unwatch(s):
+    # "OK UNWATCH 3"
+    p = s.split()
+    if len(p) != 3 or p[:2] != ["OK", "UNWATCH"] or not p[2].isdigit():
+        return None
+    return {"count": int(p[2])}
+
+
+# 텍스트 응답 → JSON 모드와 같은 모양의 data (조회 명령만)
+_TEXT_PARSERS = {
+    "LIST": _text_actor_list,
+    "LIST_STATIC": _text_actor_list,
+    "GET_LOCATION": _text_vec3("Location:", "location"),
+    "GET_SCALE": _text_vec3("Scale:", "scale"),
+    "GET_MATERIAL_SLOTS": _text_material_slots,
+    "GET_TEXTURES": _text_textures,
+    "GET_TEXTURES_SLOT": _text_textures_slot,
+    "HANDLE": _text_handles,
+    "GET_BLUEPRINTS": lambda s: {"classes": [line.strip() for line in s.splitlines() if line.startswith("/")]},
+    "GET_ACTOR_STATE": _text_actor_state,
+    "WATCH": _text_actor_state,
+    "UNWATCH": _text_unwatch,
+    "MOVE_BY": _text_actor_state,
+    "ROTATE_BY": _text_actor_state,
+    "SCALE_MUL": _text_actor_state,
+    "HELLO": _text_hello,
+    "CAPS": _text_hello,
+}
+
+
+def is_unknown_command(resp) -> bool:
+    """서버가 명령을 모를 때의 응답 (9999: "❌ 알 수 없는 명령", 9998: "ERR Unknown")"""
+    if isinstance(resp, Reply):
+        return resp.code == CODE_UNKNOWN
+    return decode_text_reply(resp or "").code == CODE_UNKNOWN
+
+
+def parse_actor_state(resp):
+    """GET_ACTOR_STATE 응답 → dict, 구버전 서버/오류 응답이면 None"""
+    if not isinstance(resp, Reply):
+        resp = decode_text_reply(resp or "", "GET_ACTOR_STATE")
+    state = resp.data if resp.ok else None
+    return state if isinstance(state, dict) and isinstance(state.get("actors"), list) else None
+
+
+def baselines_from_actor_state(state):
+    """GET_ACTOR_STATE 결과 → ({actor: (x,y,z)}, {actor: (sx,sy,sz)}) 선택 베이스라인"""
+    loc, scale = {}, {}
+    for a in state["actors"]:
+        loc[a["name"]] = tuple(float(v) for v in a["location"])
+        scale[a["name"]] = tuple(float(v) for v in a["scale"])
+    return loc, scale
+
+
+def _actor_transform(a) -> ActorTransform:
+    return ActorTransform(Vec3(*a["location"]), Vec3(*a["rotation"]), Vec3(*a["scale"]), int(a.get("handle", 0)))
+
+
+def transforms_from_state(state):
+    """{"actors": [...]} (WATCH / GET_ACTOR_STATE / 상대 명령 응답) → {actor: ActorTransform}"""
+    return {a["name"]: _actor_transform(a) for a in (state or {}).get("actors") or ()}
+
+
+class TransformCache:
+    """
+    WATCH 스냅샷/푸시(또는 GET_ACTOR_STATE)로 갱신되는 액터 트랜스폼 (이름 → ActorTransform).
+    I/O 스레드가 apply하고 UI 스레드는 get으로 읽기만 함 (값은 통째로 교체되는 NamedTuple)
+    """
+
+    def __init__(self):
+        self._by_name = {}
+
+    def get(self, name):
+        return self._by_name.get(name)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def apply(self, state) -> list:
+        """{"actors": [...], "removed": [...]} 반영 → 값이 바뀐 액터 이름들"""
+        changed = []
+        for a in state.get("actors") or ():
+            t = _actor_transform(a)
+            if self._by_name.get(a["name"]) != t:
+                self._by_name[a["name"]] = t
+                changed.append(a["name"])
+        for name in state.get("removed") or ():
+            if self._by_name.pop(name, None) is not None:
+                changed.append(name)
+        return changed
+
+    def patch(self, name, fields: str, values):
+        """
+        이 클라이언트가 직접 보낸 값 반영 (서버는 명령을 보낸 연결에는 푸시를 되돌려 보내지 않음).
+        values: fields 순서대로 필드당 3개. 캐시에 없는(구독 안 한) 액터는 무시
+        """
+        t = self._by_name.get(name)
+        if t is None:
+            return
+        parts = t._asdict()
+        for i, f in enumerate(fields):
+            parts[_FIELD_KEYS[f]] = Vec3(*(float(v) for v in values[3 * i:3 * i + 3]))
+        self._by_name[name] = ActorTransform(**parts)
+
+    def forget(self, names=None):
+        """구독 해제한 액터 (None이면 전부)"""
+        if names is None:
+            self._by_name.clear()
+        for name in names or ():
+            self._by_name.pop(name, None)
+
+
+def slots_from_actor_state(actor_state):
+    """GET_ACTOR_STATE의 액터 1개 → [MaterialSlot]"""
+    return _material_slots({"slots": (actor_state or {}).get("slots") or []})
+
+
+def format_material_slots(slots) -> str:
+    """[MaterialSlot] → GET_MATERIAL_SLOTS와 같은 텍스트"""
+    if not slots:
+        return "⚠️ 머티리얼 없음\n"
+    return "".join(f"Material Slot {s.index}: {s.material}\n" for s in slots)
+
+
+def format_textures(slots) -> str:
+    """[MaterialSlot] (텍스처 포함) → GET_TEXTURES와 같은 텍스트"""
+    if not slots:
+        return "⚠️ 머티리얼 또는 텍스처가 없음"
+    out = []
+    for s in slots:
+        out.append(f"Material Slot {s.index}: {s.material}\n")
+        out.extend(f"    └ Texture: {t}\n" for t in s.textures)
+    return "".join(out)
+
+
+def encode_transform_packet(verb: str, entries, step: float | None = None) -> bytes:
+    """
+    entries: [(handle, x, y, z), ...]
+    step이 None이면 float32 절대값, 있으면 (dx, dy, dz)를 step 단위 int16으로 보낸 델타 패킷
+    """
+    op = BIN_OPS[verb]
+    if len(entries) > BIN_MAX_COUNT:
+        raise ValueError(f"too many entries: {len(entries)}")
+    if step is None:
+        out = bytearray(_BIN_HEADER.pack(BIN_MAGIC, op, 0, len(entries), 0))
+        for h, x, y, z in entries:
+            out += _BIN_ABS.pack(h, x, y, z)
+    else:
+        out = bytearray(_BIN_HEADER.pack(BIN_MAGIC, op, BIN_FLAG_DELTA, len(entries), 0))
+        out += _BIN_STEP.pack(step)
+        for h, dx, dy, dz in entries:
+            out += _BIN_DELTA.pack(h, dx, dy, dz)
+    return bytes(out)
+
+
+class TransformDeltaEncoder:
+    """
+    핸들별 서버 쪽 값을 추적해서 가능하면 양자화 델타 패킷을 만듦.
+    서버는 델타를 현재 트랜스폼에 더하므로, 다른 경로(커밋/다른 클라이언트)로 값이 바뀌면 reset() 필요.
+    """
+
+    def __init__(self, steps=None):
+        # 서버와 같은 float32 값으로 계산해야 복원 값이 일치
+        self.steps = {k: _f32(v) for k, v in (BIN_DELTA_STEP if steps is None else steps).items()}
+        self._last = {}   # (verb, handle) -> 서버에 반영됐다고 보는 값
+
+    def reset(self):
+        self._last.clear()
+
+    def encode(self, verb: str, entries) -> bytes:
+        """entries: [(handle, x, y, z), ...] 절대값 → 델타 또는 절대값 패킷"""
+        step = self.steps.get(verb)
+        deltas = []
+        if step:
+            for h, x, y, z in entries:
+                base = self._last.get((verb, h))
+                if base is None:
+                    break
+                d = (round((x - base[0]) / step), round((y - base[1]) / step), round((z - base[2]) / step))
+                if not all(-32768 <= v <= 32767 for v in d):
+                    break
+                deltas.append((h,) + d)
+            else:
+                for h, dx, dy, dz in deltas:
+                    b = self._last[(verb, h)]
+                    # 서버가 복원할 값을 그대로 기억 (양자화 오차 누적 방지)
+                    self._last[(verb, h)] = (b[0] + dx * step, b[1] + dy * step, b[2] + dz * step)
+                return encode_transform_packet(verb, deltas, step)
+        for h, x, y, z in entries:
+            self._last[(verb, h)] = (_f32(x), _f32(y), _f32(z))
+        return encode_transform_packet(verb, entries)
+
+
+def _f32(v: float) -> float:
+    return _BIN_STEP.unpack(_BIN_STEP.pack(v))[0]
+
+
+class FrameReader:
+    """수신 바이트를 모아서 완성된 v1 프레임 단위로 꺼내줌"""
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def clear(self):
+        self._buf.clear()
+
+    def feed(self, data: bytes):
+        self._buf += data
+
+    def looks_framed(self) -> bool | None:
+        """버퍼 앞부분이 v1 헤더인지 판별 (판단 불가면 None)"""
+        n = min(len(self._buf), len(FRAME_MAGIC))
+        if n == 0:
+            return None
+        if self._buf[:n] != FRAME_MAGIC[:n]:
+            return False
+        return True if n == len(FRAME_MAGIC) else None
+
+    def pop_frame(self):
+        """완성된 프레임이 있으면 (payload: str, extra: list[str]) 반환, 없으면 None"""
+        nl = self._buf.find(b"\n", 0, MAX_HEADER)
+        if nl < 0:
+            if len(self._buf) >= MAX_HEADER:
+                raise ProtocolError(f"bad frame header: {bytes(self._buf[:MAX_HEADER])!r}")
+            return None
+        header = self._buf[:nl].decode("ascii", "replace").split()
+        if len(header) < 2 or header[0] != FRAME_MAGIC.strip().decode("ascii"):
+            raise ProtocolError(f"bad frame header: {bytes(self._buf[:nl])!r}")
+        try:
+            size = int(header[1])
+        except ValueError:
+            raise ProtocolError(f"bad frame length: {header[1]!r}")
+        end = nl + 1 + size
+        if len(self._buf) < end:
+            return None
+        payload = bytes(self._buf[nl + 1:end]).decode("utf-8", "ignore")
+        del self._buf[:end]
+        return payload, header[2:]
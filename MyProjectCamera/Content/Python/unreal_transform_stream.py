@@ -0,0 +1,79 @@
+# unreal_transform_stream.py
+# 드래그 제스처용 트랜스폼 스트리밍 채널 (latest-value-wins)
+#  - 액터(+동사)마다 미리보기 값은 최신 1개만 보관 → 네트워크가 밀리면 중간 값은 버려짐
+#  - 고정 주기(rate_hz)로 모인 값을 BATCH 1개로 전송
+#  - 전송 중(in-flight) 배치는 max_in_flight개까지만 → 큐가 쌓여 지연이 늘어나지 않음
+#    (전송이 예외로 끝나도 errback으로 자리를 돌려받음 → 한 번 실패했다고 미리보기가 멈추지 않음)
+#  - 제스처 끝에 commit()으로 남은 미리보기를 버리고 확정 명령(MOVE_COMMIT 등)을 1회 전송
+#  - binary=True면 client.send_transforms()로 바이너리 패킷 전송 (PIE 서버 미지원 시 텍스트로 자동 폴백)
+#
+# 소켓은 만지지 않음: 전송은 UnrealIOWorker 큐를 통해서만 (UI 스레드에서 사용)
+
+
+class TransformStream:
+    def __init__(self, io, root, rate_hz: float = 60.0, max_in_flight: int = 1, binary: bool = True):
+        self.io = io
+        self.root = root
+        self.rate_hz = rate_hz
+        self.max_in_flight = max_in_flight
+        self.binary = binary
+        self._pending = {}        # (verb, actor) -> (x, y, z)
+        self._in_flight = 0
+        self._after = None
+        self.sent = 0             # 전송한 미리보기 명령 수
+        self.dropped = 0          # 덮어써져 안 보낸 미리보기 수
+
+    @property
+    def interval_ms(self) -> int:
+        return max(1, int(round(1000.0 / self.rate_hz)))
+
+    # ---------- 미리보기 ----------
+    def set(self, verb: str, actor: str, x: float, y: float, z: float):
+        """verb: 'MOVE' | 'SCALE' | 'ROTATE' (미리보기용, 응답 무시)"""
+        key = (verb, actor)
+        if key in self._pending:
+            self.dropped += 1
+        self._pending[key] = (x, y, z)
+        if self._after is None:
+            self._after = self.root.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        self._after = None
+        if self._pending and self._in_flight < self.max_in_flight:
+            self._in_flight += 1
+            self.sent += len(self._pending)
+            if self.binary:
+                groups = {}
+                for (verb, actor), (x, y, z) in self._pending.items():
+                    groups.setdefault(verb, []).append((actor, x, y, z))
+                self.io.run(lambda c: [c.send_transforms(v, items) for v, items in groups.items()],
+                            self._on_ack, errback=self._on_ack)
+            else:
+                cmds = [f"{verb} {actor} {x} {y} {z}" for (verb, actor), (x, y, z) in self._pending.items()]
+                self.io.send_batch(cmds, self._on_ack, errback=self._on_ack)
+            self._pending.clear()
+        if self._pending:
+            self._after = self.root.after(self.interval_ms, self._tick)
+
+    def _on_ack(self, _resps_or_exc):
+        """성공(응답)이든 실패(예외)든 in-flight 자리 반환"""
+        self._in_flight = max(0, self._in_flight - 1)
+
+    # ---------- 제스처 종료 ----------
+    def cancel(self):
+        """아직 안 보낸 미리보기 폐기"""
+        self.dropped += len(self._pending)
+        self._pending.clear()
+        if self._after is not None:
+            self.root.after_cancel(self._after)
+            self._after = None
+
+    def commit(self, commands, callback=None):
+        """남은 미리보기는 버리고 확정 명령 전송 (in-flight 미리보기 뒤에 순서대로 도착)"""
+        self.cancel()
+        self.io.send_batch(commands, callback)
+
+    def commit_transforms(self, fields: str, entries, callback=None):
+        """commit과 같지만 확정값을 SET_TRANSFORMS 한 줄로 보냄 (선택된 액터가 같은 프레임에 적용)"""
+        self.cancel()
+        self.io.set_transforms(fields, entries, callback)
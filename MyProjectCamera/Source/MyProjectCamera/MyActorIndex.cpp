@@ -0,0 +1,213 @@
+#include "MyActorIndex.h"
+#include "Engine/World.h"
+#include "EngineUtils.h"
+#include "GameFramework/Actor.h"
+#include "Misc/CoreDelegates.h"
+
+void FMyActorIndex::Bind(UWorld* InWorld)
+{
+    if (World.Get() == InWorld && SpawnedHandle.IsValid())
+        return;
+
+    Unbind();
+    if (!InWorld)
+        return;
+
+    World = InWorld;
+    SpawnedHandle = InWorld->AddOnActorSpawnedHandler(
+        FOnActorSpawned::FDelegate::CreateRaw(this, &FMyActorIndex::OnActorSpawned));
+    DestroyedHandle = InWorld->AddOnActorDestroyedHandler(
+        FOnActorDestroyed::FDelegate::CreateRaw(this, &FMyActorIndex::OnActorDestroyed));
+    LevelAddedHandle = FWorldDelegates::LevelAddedToWorld.AddRaw(this, &FMyActorIndex::OnLevelChanged);
+    LevelRemovedHandle = FWorldDelegates::LevelRemovedFromWorld.AddRaw(this, &FMyActorIndex::OnLevelChanged);
+#if WITH_EDITOR
+    LabelChangedHandle = FCoreDelegates::OnActorLabelChanged.AddRaw(this, &FMyActorIndex::OnActorLabelChanged);
+#endif
+    bDirty = true;
+}
+
+void FMyActorIndex::Unbind()
+{
+    if (UWorld* W = World.Get())
+    {
+        W->RemoveOnActorSpawnedHandler(SpawnedHandle);
+        W->RemoveOnActorDestroyedHandler(DestroyedHandle);
+    }
+    FWorldDelegates::LevelAddedToWorld.Remove(LevelAddedHandle);
+    FWorldDelegates::LevelRemovedFromWorld.Remove(LevelRemovedHandle);
+#if WITH_EDITOR
+    FCoreDelegates::OnActorLabelChanged.Remove(LabelChangedHandle);
+#endif
+    SpawnedHandle.Reset();
+    DestroyedHandle.Reset();
+    LevelAddedHandle.Reset();
+    LevelRemovedHandle.Reset();
+    LabelChangedHandle.Reset();
+
+    World.Reset();
+    ByName.Reset();
+    ByLabel.Reset();
+    LabelOf.Reset();
+    ByHandle.Reset();
+    HandleOf.Reset();
+    bDirty = true;
+}
+
+void FMyActorIndex::Rebuild()
+{
+    ByName.Reset();
+    ByLabel.Reset();
+    LabelOf.Reset();
+    bDirty = false;
+
+    UWorld* W = World.Get();
+    if (!W) return;
+
+    for (TActorIterator<AActor> It(W); It; ++It)
+    {
+        Add(*It);
+    }
+    UE_LOG(LogTemp, Log, TEXT("🗂️ 액터 인덱스 재구축: %d개"), ByName.Num());
+}
+
+void FMyActorIndex::Add(AActor* Actor)
+{
+    if (!IsValid(Actor)) return;
+
+    ByName.Add(Actor->GetFName(), Actor);
+#if WITH_EDITOR
+    const FString Key = Actor->GetActorLabel().ToLower();
+    ByLabel.Add(Key, Actor);
+    LabelOf.Add(Actor, Key);
+#endif
+}
+
+void FMyActorIndex::Remove(AActor* Actor)
+{
+    if (!Actor) return;
+
+    const TWeakObjectPtr<AActor>* Found = ByName.Find(Actor->GetFName());
+    if (Found && Found->Get() == Actor)
+        ByName.Remove(Actor->GetFName());
+
+    FString Key;
+    if (LabelOf.RemoveAndCopyValue(Actor, Key))
+    {
+        const TWeakObjectPtr<AActor>* ByKey = ByLabel.Find(Key);
+        if (ByKey && ByKey->Get() == Actor)
+            ByLabel.Remove(Key);
+    }
+}
+
+void FMyActorIndex::OnActorDestroyed(AActor* Actor)
+{
+    Remove(Actor);
+
+    // 핸들은 파괴될 때만 무효화 (라벨 변경은 Remove+Add라 여기서만)
+    uint32 Handle = 0;
+    if (Actor && HandleOf.RemoveAndCopyValue(Actor, Handle))
+        ByHandle.Remove(Handle);
+}
+
+void FMyActorIndex::OnLevelChanged(ULevel* Level, UWorld* InWorld)
+{
+    if (InWorld == World.Get())
+        bDirty = true;   // 스트리밍 레벨 액터는 스폰 델리게이트를 안 탐
+}
+
+#if WITH_EDITOR
+void FMyActorIndex::OnActorLabelChanged(AActor* Actor)
+{
+    if (!Actor || Actor->GetWorld() != World.Get())
+        return;
+    Remove(Actor);
+    Add(Actor);
+}
+#endif
+
+AActor* FMyActorIndex::FindByName(const FString& Name)
+{
+    uint32 Handle = 0;
+    if (ParseHandleRef(Name, Handle))
+        return ResolveHandle(Handle);
+
+    if (bDirty) Rebuild();
+
+    // 없는 이름은 FName 테이블에 새로 등록하지 않음
+    const FName Key(*Name, FNAME_Find);
+    if (Key.IsNone())
+        return nullptr;
+
+    if (const TWeakObjectPtr<AActor>* Found = ByName.Find(Key))
+    {
+        AActor* Actor = Found->Get();
+        if (IsValid(Actor) && Actor->GetFName() == Key)
+            return Actor;
+        ByName.Remove(Key);   // 파괴/리네임된 항목 정리
+    }
+    return nullptr;
+}
+
+AActor* FMyActorIndex::FindByLabel(const FString& Label)
+{
+#if WITH_EDITOR
+    if (bDirty) Rebuild();
+
+    const FString Key = Label.ToLower();
+    if (const TWeakObjectPtr<AActor>* Found = ByLabel.Find(Key))
+    {
+        AActor* Actor = Found->Get();
+        if (IsValid(Actor))
+            return Actor;
+        ByLabel.Remove(Key);
+    }
+#endif
+    return nullptr;
+}
+
+AActor* FMyActorIndex::Find(const FString& NameOrLabel)
+{
+    if (AActor* Actor = FindByName(NameOrLabel))
+        return Actor;
+    return FindByLabel(NameOrLabel);
+}
+
+uint32 FMyActorIndex::GetOrAddHandle(AActor* Actor)
+{
+    if (!IsValid(Actor)) return 0;
+
+    if (const uint32* Found = HandleOf.Find(Actor))
+        return *Found;
+
+    // 서버 두 개(9999/9998)가 같은 번호를 쓰지 않게 전역 카운터 (0 = 없음)
+    static uint32 NextHandle = 0;
+    const uint32 Handle = ++NextHandle;
+    ByHandle.Add(Handle, Actor);
+    HandleOf.Add(Actor, Handle);
+    return Handle;
+}
+
+AActor* FMyActorIndex::ResolveHandle(uint32 Handle) const
+{
+    const TWeakObjectPtr<AActor>* Found = ByHandle.Find(Handle);
+    AActor* Actor = Found ? Found->Get() : nullptr;
+    return IsValid(Actor) ? Actor : nullptr;
+}
+
+bool FMyActorIndex::ParseHandleRef(const FString& Ref, uint32& OutHandle)
+{
+    if (Ref.Len() < 2 || Ref[0] != TEXT('#'))
+        return false;
+
+    uint64 Value = 0;
+    for (int32 i = 1; i < Ref.Len(); ++i)
+    {
+        if (!FChar::IsDigit(Ref[i]))
+            return false;
+        Value = Value * 10 + (Ref[i] - TEXT('0'));
+        if (Value > MAX_uint32)
+            return false;
+    }
+    OutHandle = uint32(Value);
+    return true;
+}
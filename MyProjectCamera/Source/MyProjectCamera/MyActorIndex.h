@@ -0,0 +1,73 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "UObject/ObjectKey.h"
+#include "Templates/Casts.h"
+
+class AActor;
+class UWorld;
+class ULevel;
+
+// 소켓 서버 공용 액터 조회 인덱스 (이름/라벨 → 액터)
+//
+//  - 명령마다 TActorIterator로 월드 전체를 훑던 것을 해시 조회로 대체
+//  - 스폰/파괴 델리게이트로 증분 갱신, 레벨 스트리밍 추가/제거 시에는 다음 조회 때 재구축
+//  - 이름 키는 FName (대소문자 무시 비교 = 기존 GetName().Equals(..., IgnoreCase)와 동일)
+//  - 라벨은 에디터 빌드에서만 (OnActorLabelChanged로 갱신)
+//  - 숫자 핸들: 액터마다 한 번 발급, 파괴될 때까지 유지 (LIST/LIST_STATIC/HANDLE 응답에 실림)
+//    명령의 액터 이름 자리에 "#<핸들>"을 쓰면 이름 대신 핸들로 조회 ('#'은 오브젝트 이름에 못 쓰는 문자라 안 겹침)
+//    번호는 프로세스 전체에서 한 번만 씀 → 9999 핸들을 9998에 보내도 다른 액터가 잡히지 않고 "없음"
+class FMyActorIndex
+{
+public:
+    ~FMyActorIndex() { Unbind(); }
+
+    // 같은 월드면 아무것도 안 함 → 매 명령마다 호출해도 됨
+    void Bind(UWorld* InWorld);
+    void Unbind();
+
+    AActor* FindByName(const FString& Name);
+    AActor* FindByLabel(const FString& Label);
+
+    // 이름 우선, 없으면 라벨
+    AActor* Find(const FString& NameOrLabel);
+
+    // 없으면 새로 발급 (nullptr → 0 = 없음)
+    uint32 GetOrAddHandle(AActor* Actor);
+    AActor* ResolveHandle(uint32 Handle) const;
+
+    // "#12" → 12 (형식이 아니면 false)
+    static bool ParseHandleRef(const FString& Ref, uint32& OutHandle);
+
+    template <typename T>
+    T* FindByName(const FString& Name) { return Cast<T>(FindByName(Name)); }
+
+    int32 Num() const { return ByName.Num(); }
+
+private:
+    void Rebuild();
+    void Add(AActor* Actor);
+    void Remove(AActor* Actor);
+    void OnActorSpawned(AActor* Actor) { Add(Actor); }
+    void OnActorDestroyed(AActor* Actor);
+    void OnLevelChanged(ULevel* Level, UWorld* InWorld);
+#if WITH_EDITOR
+    void OnActorLabelChanged(AActor* Actor);
+#endif
+
+    TWeakObjectPtr<UWorld> World;
+    bool bDirty = true;
+
+    TMap<FName, TWeakObjectPtr<AActor>> ByName;
+    TMap<FString, TWeakObjectPtr<AActor>> ByLabel;     // 키는 소문자
+    TMap<TObjectKey<AActor>, FString> LabelOf;         // 라벨 변경 시 이전 키 제거용
+
+    TMap<uint32, TWeakObjectPtr<AActor>> ByHandle;     // 재구축해도 유지 (월드가 바뀔 때만 비움)
+    TMap<TObjectKey<AActor>, uint32> HandleOf;
+
+    FDelegateHandle SpawnedHandle;
+    FDelegateHandle DestroyedHandle;
+    FDelegateHandle LevelAddedHandle;
+    FDelegateHandle LevelRemovedHandle;
+    FDelegateHandle LabelChangedHandle;
+};
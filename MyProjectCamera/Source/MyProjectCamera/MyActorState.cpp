@@ -0,0 +1,102 @@
+#include "MyActorState.h"
+#include "MyActorIndex.h"
+#include "GameFramework/Actor.h"
+#include "Components/StaticMeshComponent.h"
+#include "Materials/MaterialInterface.h"
+#include "Policies/CondensedJsonPrintPolicy.h"
+#include "Serialization/JsonWriter.h"
+
+namespace MyActorState
+{
+    using FCondensedWriter = TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>;
+
+    static void WriteVector(FCondensedWriter& W, const TCHAR* Field, double A, double B, double C)
+    {
+        W.WriteArrayStart(Field);
+        W.WriteValue(A);
+        W.WriteValue(B);
+        W.WriteValue(C);
+        W.WriteArrayEnd();
+    }
+
+    static const TCHAR* MobilityName(const AActor* Actor)
+    {
+        const USceneComponent* Root = Actor->GetRootComponent();
+        if (!Root) return TEXT("None");
+        switch (Root->Mobility)
+        {
+        case EComponentMobility::Static:     return TEXT("Static");
+        case EComponentMobility::Stationary: return TEXT("Stationary");
+        default:                             return TEXT("Movable");
+        }
+    }
+
+    FString BuildJson(FMyActorIndex& Index, const TArray<FString>& Names)
+    {
+        // DOM(FJsonObject) 없이 바로 문자열로 씀 (액터 수백 개여도 할당 최소)
+        FString Out;
+        Out.Reserve(256 * Names.Num());
+        TSharedRef<FCondensedWriter> W = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&Out);
+
+        TArray<FString> Missing;
+        TArray<UStaticMeshComponent*> MeshComponents;
+
+        W->WriteObjectStart();
+        W->WriteArrayStart(TEXT("actors"));
+        for (const FString& Name : Names)
+        {
+            AActor* Actor = Index.FindByName(Name);
+            if (!Actor)
+            {
+                Missing.Add(Name);
+                continue;
+            }
+
+            W->WriteObjectStart();
+            W->WriteValue(TEXT("name"), Actor->GetName());
+            W->WriteValue(TEXT("handle"), int64(Index.GetOrAddHandle(Actor)));
+#if WITH_EDITOR
+            W->WriteValue(TEXT("label"), Actor->GetActorLabel(true));
+#else
+            W->WriteValue(TEXT("label"), Actor->GetName());
+#endif
+            const FVector L = Actor->GetActorLocation();
+            const FRotator R = Actor->GetActorRotation();
+            const FVector S = Actor->GetActorScale3D();
+            WriteVector(*W, TEXT("location"), L.X, L.Y, L.Z);
+            WriteVector(*W, TEXT("rotation"), R.Pitch, R.Yaw, R.Roll);
+            WriteVector(*W, TEXT("scale"), S.X, S.Y, S.Z);
+            W->WriteValue(TEXT("mobility"), MobilityName(Actor));
+
+            W->WriteArrayStart(TEXT("slots"));
+            MeshComponents.Reset();
+            Actor->GetComponents<UStaticMeshComponent>(MeshComponents);
+            for (UStaticMeshComponent* MeshComp : MeshComponents)
+            {
+                const int32 MatCount = MeshComp->GetNumMaterials();
+                for (int32 i = 0; i < MatCount; ++i)
+                {
+                    UMaterialInterface* Mat = MeshComp->GetMaterial(i);
+                    W->WriteObjectStart();
+                    W->WriteValue(TEXT("index"), i);
+                    W->WriteValue(TEXT("material"), Mat ? Mat->GetName() : FString(TEXT("None")));
+                    W->WriteValue(TEXT("path"), Mat ? Mat->GetPathName() : FString());
+                    W->WriteObjectEnd();
+                }
+            }
+            W->WriteArrayEnd();
+            W->WriteObjectEnd();
+        }
+        W->WriteArrayEnd();
+
+        W->WriteArrayStart(TEXT("missing"));
+        for (const FString& Name : Missing)
+        {
+            W->WriteValue(Name);
+        }
+        W->WriteArrayEnd();
+        W->WriteObjectEnd();
+        W->Close();
+        return Out;
+    }
+}
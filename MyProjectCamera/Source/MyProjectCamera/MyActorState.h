@@ -0,0 +1,20 @@
+#pragma once
+
+#include "CoreMinimal.h"
+
+class FMyActorIndex;
+
+// GET_ACTOR_STATE: 선택 동기화용 복합 조회 (9999 PIE / 9998 EDITOR 공용)
+//
+//  GET_ACTOR_STATE <액터> <액터> ...
+//  → {"actors":[{"name","handle","label","location":[x,y,z],"rotation":[p,y,r],"scale":[x,y,z],
+//               "mobility":"Static|Stationary|Movable",
+//               "slots":[{"index","material","path"}]}, ...],
+//     "missing":["없는 액터", ...]}
+//  - GET_LOCATION / GET_SCALE / GET_MATERIAL_SLOTS를 액터마다 따로 왕복하던 것을 한 번으로
+//  - 액터 자리에 "#<핸들>"도 됨 (missing에는 보낸 그대로)
+//  - slots는 GET_MATERIAL_SLOTS와 같은 순서 (StaticMeshComponent별 슬롯 인덱스)
+namespace MyActorState
+{
+    FString BuildJson(FMyActorIndex& Index, const TArray<FString>& Names);
+}
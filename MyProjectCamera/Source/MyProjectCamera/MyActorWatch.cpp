@@ -0,0 +1,233 @@
+#include "MyActorWatch.h"
+#include "MyActorIndex.h"
+#include "MyReply.h"
+#include "MySocketLog.h"
+#include "MySocketStats.h"
+#include "MyTransformBatch.h"
+#include "Engine/World.h"
+#include "GameFramework/Actor.h"
+
+namespace
+{
+    const TCHAR* const PushId = TEXT("!WATCH");
+
+    bool IsLive(const MySocketProtocol::FClientConnection& Client)
+    {
+        return Client.Socket && Client.bFramed && !Client.bClosed && !Client.bDropRequested;
+    }
+}
+
+void FMyActorWatch::Bind(UWorld* InWorld)
+{
+    if (World.Get() == InWorld && DestroyedHandle.IsValid())
+        return;
+
+    Reset();
+    if (!InWorld)
+        return;
+
+    World = InWorld;
+    DestroyedHandle = InWorld->AddOnActorDestroyedHandler(
+        FOnActorDestroyed::FDelegate::CreateRaw(this, &FMyActorWatch::OnActorDestroyed));
+}
+
+void FMyActorWatch::Reset()
+{
+    if (UWorld* W = World.Get())
+        W->RemoveOnActorDestroyedHandler(DestroyedHandle);
+    DestroyedHandle.Reset();
+    World.Reset();
+
+    for (TPair<TObjectKey<AActor>, FEntry>& Pair : Entries)
+    {
+        if (USceneComponent* Root = Pair.Value.Root.Get())
+            Root->TransformUpdated.Remove(Pair.Value.TransformHandle);
+    }
+    Entries.Reset();
+    Dirty.Reset();
+
+    if (FlushTicker.IsValid())
+    {
+        FTSTicker::GetCoreTicker().RemoveTicker(FlushTicker);
+        FlushTicker.Reset();
+    }
+}
+
+FString FMyActorWatch::Watch(const MySocketProtocol::FClientRef& Client, const TArray<FString>& Names)
+{
+    TArray<AActor*> Actors;
+    TArray<FString> Missing;
+    for (const FString& Name : Names)
+    {
+        AActor* Actor = Index.FindByName(Name);
+        USceneComponent* Root = Actor ? Actor->GetRootComponent() : nullptr;
+        if (!Root)
+        {
+            Missing.Add(Name);
+            continue;
+        }
+
+        FEntry& Entry = Entries.FindOrAdd(Actor);
+        if (!Entry.TransformHandle.IsValid())
+        {
+            Entry.Actor = Actor;
+            Entry.Root = Root;
+            Entry.Name = Actor->GetName();
+            Entry.TransformHandle = Root->TransformUpdated.AddRaw(this, &FMyActorWatch::OnTransformUpdated);
+        }
+        if (!Entry.Subscribers.ContainsByPredicate([&](const FClientWeak& S) { return S.Pin() == Client; }))
+            Entry.Subscribers.Add(Client);
+
+        Actors.Add(Actor);
+    }
+
+    MYSOCKET_LOG(Verbose, Log, TEXT("👀 WATCH %d개 (전체 %d개)"), Actors.Num(), Entries.Num());
+    return MyTransformBatch::BuildJson(Index, Actors, TEXT("missing"), Missing);   // 스냅샷
+}
+
+int32 FMyActorWatch::Unwatch(const MySocketProtocol::FClientConnection* Client, const TArray<FString>& Names)
+{
+    TArray<TObjectKey<AActor>> Keys;
+    if (Names.IsEmpty())
+    {
+        Entries.GetKeys(Keys);
+    }
+    else
+    {
+        for (const FString& Name : Names)
+        {
+            if (AActor* Actor = Index.FindByName(Name))
+                Keys.Add(Actor);
+        }
+    }
+
+    int32 Count = 0;
+    for (const TObjectKey<AActor>& Key : Keys)
+    {
+        FEntry* Entry = Entries.Find(Key);
+        if (!Entry)
+            continue;
+        bool bSubscribed = false;
+        Entry->Subscribers.RemoveAll([Client, &bSubscribed](const FClientWeak& S)
+            {
+                const MySocketProtocol::FClientRef Pinned = S.Pin();
+                bSubscribed |= Pinned.Get() == Client;
+                return !Pinned || Pinned.Get() == Client;   // 끊긴 연결도 같이 정리
+            });
+        Count += bSubscribed ? 1 : 0;
+        if (Entry->Subscribers.IsEmpty())
+            RemoveEntry(Key);
+    }
+    return Count;
+}
+
+void FMyActorWatch::RemoveEntry(const TObjectKey<AActor>& Key)
+{
+    FEntry Entry;
+    if (!Entries.RemoveAndCopyValue(Key, Entry))
+        return;
+    if (USceneComponent* Root = Entry.Root.Get())
+        Root->TransformUpdated.Remove(Entry.TransformHandle);
+    Dirty.Remove(Key);
+}
+
+void FMyActorWatch::OnTransformUpdated(USceneComponent* Component, EUpdateTransformFlags /*Flags*/, ETeleportType /*Teleport*/)
+{
+    if (Component)
+        MarkDirty(Component->GetOwner(), false);
+}
+
+void FMyActorWatch::OnActorDestroyed(AActor* Actor)
+{
+    FEntry* Entry = Actor ? Entries.Find(Actor) : nullptr;
+    if (!Entry)
+        return;
+    if (USceneComponent* Root = Entry->Root.Get())
+        Root->TransformUpdated.Remove(Entry->TransformHandle);
+    Entry->TransformHandle.Reset();
+    MarkDirty(Actor, true);   // 항목은 "removed"를 보낸 뒤 Flush에서 제거
+}
+
+void FMyActorWatch::MarkDirty(AActor* Actor, bool bRemoved)
+{
+    if (!Actor || !Entries.Contains(Actor))
+        return;
+
+    if (FDirty* Existing = Dirty.Find(Actor))
+    {
+        if (Existing->Origin != Origin)
+            Existing->Origin = nullptr;   // 여러 곳에서 바뀜 → 모두에게
+        Existing->bRemoved |= bRemoved;
+    }
+    else
+    {
+        Dirty.Add(Actor, FDirty{ Origin, bRemoved });
+    }
+
+    // 더티가 생긴 틱에만 다음 틱 한 번짜리 ticker를 검 (구독만 있고 변경이 없으면 비용 없음)
+    if (!FlushTicker.IsValid())
+        FlushTicker = FTSTicker::GetCoreTicker().AddTicker(FTickerDelegate::CreateRaw(this, &FMyActorWatch::Flush));
+}
+
+bool FMyActorWatch::Flush(float /*DeltaTime*/)
+{
+    FlushTicker.Reset();
+
+    // 연결별로 보낼 액터를 모음 (한 연결에 이벤트 1개)
+    struct FOutbox
+    {
+        MySocketProtocol::FClientRef Client;
+        TArray<AActor*> Changed;
+        TArray<FString> Removed;
+    };
+    TMap<const MySocketProtocol::FClientConnection*, FOutbox> Outboxes;
+    TArray<TObjectKey<AActor>> Finished;
+
+    for (const TPair<TObjectKey<AActor>, FDirty>& Pair : Dirty)
+    {
+        FEntry* Entry = Entries.Find(Pair.Key);
+        if (!Entry)
+            continue;
+        AActor* Actor = Entry->Actor.Get();
+        const bool bRemoved = Pair.Value.bRemoved || !IsValid(Actor);
+
+        for (int32 i = Entry->Subscribers.Num() - 1; i >= 0; --i)
+        {
+            MySocketProtocol::FClientRef Client = Entry->Subscribers[i].Pin();
+            if (!Client || !IsLive(*Client))
+            {
+                Entry->Subscribers.RemoveAtSwap(i);   // 끊긴 연결 정리
+                continue;
+            }
+            if (!bRemoved && Client.Get() == Pair.Value.Origin)
+                continue;   // 자기가 보낸 값
+
+            FOutbox& Box = Outboxes.FindOrAdd(Client.Get());
+            Box.Client = Client;
+            if (bRemoved)
+                Box.Removed.Add(Entry->Name);
+            else
+                Box.Changed.Add(Actor);
+        }
+        if (bRemoved || Entry->Subscribers.IsEmpty())
+            Finished.Add(Pair.Key);
+    }
+    Dirty.Reset();
+
+    for (TPair<const MySocketProtocol::FClientConnection*, FOutbox>& Pair : Outboxes)
+    {
+        FOutbox& Box = Pair.Value;
+        FString Json = MyTransformBatch::BuildJson(Index, Box.Changed, TEXT("removed"), Box.Removed);
+
+        FMyReply Event;
+        (Box.Client->bJson ? Event.DataJson : Event.Text) = MoveTemp(Json);   // 텍스트 모드도 같은 JSON (GET_ACTOR_STATE와 같음)
+        TArray<uint8> Out;
+        MySocketProtocol::AppendResponse(Out, Event.Render(TEXT("WATCH"), Box.Client->bJson), true, PushId);
+        MySocketProtocol::SendAll(*Box.Client, Out.GetData(), Out.Num());
+        Stats.AddBytesOut(Out.Num());
+    }
+
+    for (const TObjectKey<AActor>& Key : Finished)
+        RemoveEntry(Key);
+    return false;   // 한 번만 (다음 변경 때 다시 검)
+}
@@ -0,0 +1,78 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "Components/SceneComponent.h"
+#include "Containers/Ticker.h"
+#include "UObject/ObjectKey.h"
+#include "MySocketProtocol.h"
+
+class AActor;
+class UWorld;
+class FMyActorIndex;
+class FMySocketStats;
+
+// WATCH / UNWATCH: 액터 트랜스폼 변경 푸시 구독 (9999 PIE / 9998 EDITOR 공용, 게임 스레드 전용)
+//
+//  WATCH <액터> <액터> ...   → 구독 추가 + 지금 값 스냅샷
+//      {"actors":[{"name","handle","location":[x,y,z],"rotation":[p,y,r],"scale":[x,y,z]}],"missing":[...]}
+//  UNWATCH [<액터> ...]      → 구독 해제 (인자가 없으면 이 연결의 구독 전부) → {"count"}
+//  - 루트 컴포넌트 TransformUpdated로 더티 표시만 해두고 다음 틱에 한 번 모아서 푸시
+//    (한 틱에 여러 번 바뀌어도 액터당 1개, 값은 보낼 때의 최신 값)
+//  - 푸시 프레임: "XR1 <len> !WATCH\n" + 스냅샷과 같은 형식 ("missing" 대신 파괴된 액터 이름 "removed")
+//    요청 ID 자리가 '!'로 시작하면 푸시 → 클라이언트가 응답과 구분 (PROTO 1 연결 전용)
+//  - 명령을 보낸 연결이 직접 바꾼 값은 그 연결에 되돌려 보내지 않음 (드래그 미리보기 에코 방지)
+//    GROUP_* 명령은 응답에 액터별 값이 없으니 보낸 연결에도 푸시함 (SetOrigin(nullptr))
+class FMyActorWatch
+{
+public:
+    FMyActorWatch(FMyActorIndex& InIndex, FMySocketStats& InStats) : Index(InIndex), Stats(InStats) {}
+    ~FMyActorWatch() { Reset(); }
+
+    // 같은 월드면 아무것도 안 함. 월드가 바뀌면 구독 전부 해제
+    void Bind(UWorld* InWorld);
+
+    // 구독 추가 → 스냅샷 JSON (없는 액터는 "missing", "#<핸들>"로 보낸 건 보낸 그대로)
+    FString Watch(const MySocketProtocol::FClientRef& Client, const TArray<FString>& Names);
+
+    // 구독 해제한 수 (Names가 비면 이 연결의 구독 전부, 연결이 끊겼을 때도 호출)
+    int32 Unwatch(const MySocketProtocol::FClientConnection* Client, const TArray<FString>& Names);
+
+    // 지금 처리 중인 명령의 송신자 (명령 처리가 끝나면 nullptr)
+    void SetOrigin(const MySocketProtocol::FClientConnection* Client) { Origin = Client; }
+
+    void Reset();
+    int32 Num() const { return Entries.Num(); }
+
+private:
+    using FClientWeak = TWeakPtr<MySocketProtocol::FClientConnection, ESPMode::ThreadSafe>;
+
+    struct FEntry
+    {
+        TWeakObjectPtr<AActor> Actor;
+        TWeakObjectPtr<USceneComponent> Root;
+        FDelegateHandle TransformHandle;
+        FString Name;
+        TArray<FClientWeak> Subscribers;
+    };
+
+    struct FDirty
+    {
+        const MySocketProtocol::FClientConnection* Origin = nullptr;   // 한 연결만 바꿨으면 그 연결 (외부 변경이 섞이면 nullptr)
+        bool bRemoved = false;
+    };
+
+    void OnTransformUpdated(USceneComponent* Component, EUpdateTransformFlags Flags, ETeleportType Teleport);
+    void OnActorDestroyed(AActor* Actor);
+    void MarkDirty(AActor* Actor, bool bRemoved);
+    void RemoveEntry(const TObjectKey<AActor>& Key);
+    bool Flush(float DeltaTime);
+
+    FMyActorIndex& Index;
+    FMySocketStats& Stats;
+    TWeakObjectPtr<UWorld> World;
+    FDelegateHandle DestroyedHandle;
+    TMap<TObjectKey<AActor>, FEntry> Entries;
+    TMap<TObjectKey<AActor>, FDirty> Dirty;
+    const MySocketProtocol::FClientConnection* Origin = nullptr;
+    FTSTicker::FDelegateHandle FlushTicker;
+};
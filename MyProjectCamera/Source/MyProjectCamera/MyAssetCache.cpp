@@ -0,0 +1,152 @@
+#include "MyAssetCache.h"
+#include "MySocketLog.h"
+#include "AssetRegistry/AssetRegistryModule.h"
+#include "AssetRegistry/IAssetRegistry.h"
+#include "HAL/IConsoleManager.h"
+#include "Misc/PackageName.h"
+#include "Misc/Paths.h"
+
+static TAutoConsoleVariable<int32> CVarAssetCacheSize(
+    TEXT("MySocket.AssetCacheSize"),
+    256,
+    TEXT("소켓 서버 에셋 경로 해석 캐시 최대 항목 수 (넘으면 가장 오래 안 쓴 항목부터 제거)"));
+
+FMyAssetCache& FMyAssetCache::Get()
+{
+    // 에셋 레지스트리 델리게이트는 해제하지 않음 (종료 때는 레지스트리 모듈이 먼저 내려감)
+    static FMyAssetCache Instance;
+    return Instance;
+}
+
+FSoftObjectPath FMyAssetCache::Normalize(const FString& RawPath)
+{
+    FString Path = RawPath.TrimStartAndEnd();
+    Path.ReplaceInline(TEXT("\\"), TEXT("/"));
+
+    // 디스크 경로 → /Game 경로: D:/.../Content/Textures/Foo_Mat → /Game/Textures/Foo_Mat
+    static const FString ContentAbs = []()
+        {
+            FString Dir = FPaths::ConvertRelativePathToFull(FPaths::ProjectContentDir());   // .../MyProject/Content/
+            Dir.ReplaceInline(TEXT("\\"), TEXT("/"));
+            return Dir;
+        }();
+    if (Path.StartsWith(ContentAbs, ESearchCase::IgnoreCase))
+    {
+        Path = TEXT("/Game/") + Path.Mid(ContentAbs.Len());
+        Path.RemoveFromEnd(TEXT(".uasset"), ESearchCase::IgnoreCase);
+    }
+
+    // 점(.) 자동 보정: /Game/Foo/Bar → /Game/Foo/Bar.Bar
+    if (!Path.Contains(TEXT(".")))
+    {
+        const FString Short = FPackageName::GetShortName(Path);
+        Path += TEXT(".") + Short;
+    }
+    return FSoftObjectPath(Path);
+}
+
+UObject* FMyAssetCache::Resolve(const FString& RawPath, UClass* Class)
+{
+    BindRegistry();
+
+    FEntry* Entry = Entries.Find(RawPath);
+    if (Entry)
+    {
+        Entry->LastUse = ++UseClock;
+        if (UObject* Cached = Entry->Object.Get())
+            return Cached->IsA(Class) ? Cached : nullptr;
+        // GC로 내려간 오브젝트 → 정규화 결과는 그대로 두고 다시 로드
+    }
+
+    const FSoftObjectPath Path = Entry ? Entry->Path : Normalize(RawPath);
+    UObject* Object = Load(Path, Class);
+    if (!Object)
+    {
+        if (Entry)
+            Entries.Remove(RawPath);
+        return nullptr;
+    }
+
+    if (!Entry)
+    {
+        if (Entries.Num() >= FMath::Max(1, CVarAssetCacheSize.GetValueOnGameThread()))
+            EvictOldest();
+        Entry = &Entries.Add(RawPath);
+        Entry->Path = Path;
+    }
+    Entry->Object = Object;
+    Entry->LastUse = ++UseClock;
+    MYSOCKET_LOG(Verbose, Log, TEXT("📦 에셋 로드: %s → %s"), *RawPath, *Path.ToString());
+    return Object;
+}
+
+UObject* FMyAssetCache::Load(const FSoftObjectPath& Path, UClass* Class)
+{
+    if (Path.IsNull())
+        return nullptr;
+
+    // 1) 직접 로드
+    if (UObject* Object = StaticLoadObject(Class, nullptr, *Path.ToString()))
+        return Object;
+
+    // 2) 에셋 레지스트리 (저장 안 된 에셋 등)
+    IAssetRegistry& Registry = FModuleManager::LoadModuleChecked<FAssetRegistryModule>(TEXT("AssetRegistry")).Get();
+    const FAssetData Data = Registry.GetAssetByObjectPath(Path, /*bIncludeOnlyOnDiskAssets*/ false);
+    UObject* Object = Data.IsValid() ? Data.GetAsset() : nullptr;
+    return Object && Object->IsA(Class) ? Object : nullptr;
+}
+
+void FMyAssetCache::EvictOldest()
+{
+    const FString* Oldest = nullptr;
+    uint64 OldestUse = MAX_uint64;
+    for (const TPair<FString, FEntry>& Pair : Entries)
+    {
+        if (Pair.Value.LastUse < OldestUse)
+        {
+            OldestUse = Pair.Value.LastUse;
+            Oldest = &Pair.Key;
+        }
+    }
+    if (Oldest)
+        Entries.Remove(FString(*Oldest));
+}
+
+void FMyAssetCache::Invalidate(const FSoftObjectPath& Path)
+{
+    for (auto It = Entries.CreateIterator(); It; ++It)
+    {
+        if (It.Value().Path == Path)
+            It.RemoveCurrent();
+    }
+}
+
+void FMyAssetCache::Reset()
+{
+    Entries.Reset();
+}
+
+void FMyAssetCache::BindRegistry()
+{
+    if (bRegistryBound)
+        return;
+    bRegistryBound = true;
+
+#if WITH_EDITOR
+    IAssetRegistry& Registry = FModuleManager::LoadModuleChecked<FAssetRegistryModule>(TEXT("AssetRegistry")).Get();
+    Registry.OnAssetRemoved().AddRaw(this, &FMyAssetCache::OnAssetRemoved);
+    Registry.OnAssetRenamed().AddRaw(this, &FMyAssetCache::OnAssetRenamed);
+#endif
+}
+
+#if WITH_EDITOR
+void FMyAssetCache::OnAssetRemoved(const FAssetData& Asset)
+{
+    Invalidate(Asset.GetSoftObjectPath());
+}
+
+void FMyAssetCache::OnAssetRenamed(const FAssetData& Asset, const FString& OldObjectPath)
+{
+    Invalidate(FSoftObjectPath(OldObjectPath));
+}
+#endif
@@ -0,0 +1,55 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "UObject/SoftObjectPath.h"
+#include "UObject/WeakObjectPtrTemplates.h"
+
+struct FAssetData;
+
+// 에셋 경로 해석 캐시 (9999 PIE / 9998 EDITOR 공용, 게임 스레드 전용)
+//
+//  - 키: 클라이언트가 보낸 경로 문자열 그대로 → 값: 정규화된 FSoftObjectPath + 로드된 오브젝트 약참조
+//  - 정규화: 디스크 경로(.../Content/Foo/Bar[.uasset]) → /Game/Foo/Bar, 점 없는 경로 → /Game/Foo/Bar.Bar
+//  - 같은 경로는 처음 한 번만 로드 (선택한 액터 여러 개에 같은 머티리얼을 넣는 BATCH도 로드 1회)
+//  - 오브젝트가 GC로 내려가면 저장된 정규화 경로로 다시 로드
+//  - 에셋 이름 변경/삭제 시 해당 항목 제거 (에디터 빌드, 에셋 레지스트리 이벤트)
+//  - 항목 수는 콘솔 변수 MySocket.AssetCacheSize (넘으면 가장 오래 안 쓴 항목부터 제거)
+class FMyAssetCache
+{
+public:
+    static FMyAssetCache& Get();
+
+    // 실패하면 nullptr (로드 실패 / Class가 아님). 실패는 캐시하지 않음 (나중에 만들어진 에셋도 잡히게)
+    UObject* Resolve(const FString& RawPath, UClass* Class);
+
+    template <typename T>
+    T* Resolve(const FString& RawPath) { return Cast<T>(Resolve(RawPath, T::StaticClass())); }
+
+    // 캐시를 거치지 않는 경로 정규화만
+    static FSoftObjectPath Normalize(const FString& RawPath);
+
+    void Invalidate(const FSoftObjectPath& Path);
+    void Reset();
+
+    int32 Num() const { return Entries.Num(); }
+
+private:
+    struct FEntry
+    {
+        FSoftObjectPath Path;
+        TWeakObjectPtr<UObject> Object;
+        uint64 LastUse = 0;
+    };
+
+    static UObject* Load(const FSoftObjectPath& Path, UClass* Class);
+    void EvictOldest();
+    void BindRegistry();
+#if WITH_EDITOR
+    void OnAssetRemoved(const FAssetData& Asset);
+    void OnAssetRenamed(const FAssetData& Asset, const FString& OldObjectPath);
+#endif
+
+    TMap<FString, FEntry> Entries;
+    uint64 UseClock = 0;
+    bool bRegistryBound = false;
+};
@@ -0,0 +1,301 @@
+#include "MyCommandTokenizer.h"
+#include "MySocketLog.h"
+#include "MySocketProtocol.h"
+#include "MyReply.h"
+#include "HAL/FileManager.h"
+#include "HAL/IConsoleManager.h"
+#include "Misc/FileHelper.h"
+#include "Misc/Paths.h"
+
+static TAutoConsoleVariable<int32> CVarRecordCorpus(
+    TEXT("MySocket.RecordCorpus"),
+    0,
+    TEXT("1이면 9999 서버가 받은 명령 줄을 Saved/SocketStats/corpus.txt에 모음 (MySocket.BenchTokenizer 입력)"));
+
+namespace MyCommandTokenizer
+{
+    bool FToken::operator==(const ANSICHAR* Other) const
+    {
+        for (int32 i = 0; i < Len; ++i)
+        {
+            if (Other[i] == '\0' || Data[i] != TCHAR(uint8(Other[i])))
+                return false;
+        }
+        return Other[Len] == '\0';
+    }
+
+    template <typename FNextCodePoint>
+    void FTokens::Run(int32 MaxChars, FNextCodePoint&& Next)
+    {
+        Tokens.Reset();
+        Id = FToken();
+
+        // 출력 글자 수 <= 입력 단위 수, 토큰 끝 NUL은 구분 공백/닫는 따옴표 자리를 씀 (마지막 토큰만 +1)
+        // → 한 번 잡아두면 파싱 중 재할당 없음 (토큰 포인터가 그대로 유효)
+        Buffer.SetNumUninitialized(MaxChars + 1, false);
+        TCHAR* const Base = Buffer.GetData();
+        int32 Write = 0;
+        int32 Start = INDEX_NONE;   // 쓰는 중인 토큰의 시작 위치
+        int32 Quote = 0;            // 따옴표 인자 안이면 여는 따옴표
+
+        auto Emit = [&](int32 C)
+        {
+            if (sizeof(TCHAR) == 2 && C >= 0x10000)
+            {
+                C -= 0x10000;
+                Base[Write++] = TCHAR(0xD800 + (C >> 10));
+                Base[Write++] = TCHAR(0xDC00 + (C & 0x3FF));
+                return;
+            }
+            Base[Write++] = TCHAR(C);
+        };
+        auto EndToken = [&]()
+        {
+            Base[Write] = TEXT('\0');
+            Tokens.Add(FToken{ Base + Start, Write - Start });
+            ++Write;
+            Start = INDEX_NONE;
+            Quote = 0;
+        };
+
+        for (int32 C = Next(); C >= 0; C = Next())
+        {
+            if ((C < 32 && C != '\t') || C == 127)
+                continue;   // 제어문자는 어디서든 버림
+
+            if (Quote)
+            {
+                if (C == Quote)
+                    EndToken();
+                else
+                    Emit(C);
+                continue;
+            }
+            if (C == ' ' || C == '\t')
+            {
+                if (Start != INDEX_NONE)
+                    EndToken();
+                continue;
+            }
+            if (Start == INDEX_NONE)
+            {
+                Start = Write;
+                if (C == '"' || C == '\'')
+                {
+                    Quote = C;
+                    continue;
+                }
+            }
+            Emit(C);
+        }
+        if (Start != INDEX_NONE)
+            EndToken();
+
+        if (Tokens.Num() > 0 && Tokens[0].Len > 0 && Tokens[0].Data[0] == TEXT('@'))
+        {
+            Id = FToken{ Tokens[0].Data + 1, Tokens[0].Len - 1 };
+            Tokens.RemoveAt(0, 1, false);
+        }
+    }
+
+    void FTokens::Parse(const uint8* Utf8, int32 Num)
+    {
+        static constexpr int32 MinCodePoint[4] = { 0, 0x80, 0x800, 0x10000 };   // 길이별 최소값 (과잉 인코딩 거부)
+
+        int32 i = 0;
+        Run(Num, [Utf8, Num, &i]() -> int32
+            {
+                while (i < Num)
+                {
+                    const uint8 Lead = Utf8[i];
+                    if (Lead < 0x80)
+                    {
+                        ++i;
+                        return Lead;
+                    }
+
+                    const int32 Extra = (Lead & 0xE0) == 0xC0 ? 1 : (Lead & 0xF0) == 0xE0 ? 2 : (Lead & 0xF8) == 0xF0 ? 3 : 0;
+                    bool bValid = Extra > 0 && i + Extra < Num;
+                    int32 C = Lead & (0x3F >> Extra);
+                    for (int32 k = 1; bValid && k <= Extra; ++k)
+                    {
+                        const uint8 Cont = Utf8[i + k];
+                        bValid = (Cont & 0xC0) == 0x80;
+                        C = (C << 6) | (Cont & 0x3F);
+                    }
+                    if (bValid && C >= MinCodePoint[Extra] && C <= 0x10FFFF && (C < 0xD800 || C > 0xDFFF))
+                    {
+                        i += Extra + 1;
+                        return C;
+                    }
+                    ++i;   // 잘못된 바이트는 버리고 다음 바이트부터 다시
+                }
+                return -1;
+            });
+    }
+
+    void FTokens::Parse(FStringView Line)
+    {
+        int32 i = 0;
+        Run(Line.Len(), [&Line, &i]() -> int32
+            {
+                return i < Line.Len() ? int32(Line[i++]) : -1;
+            });
+    }
+
+    FString FTokens::Join(int32 From, const TCHAR* Separator) const
+    {
+        FString Out;
+        for (int32 i = From; i < Tokens.Num(); ++i)
+        {
+            if (i > From)
+                Out += Separator;
+            Out.AppendChars(Tokens[i].Data, Tokens[i].Len);
+        }
+        return Out;
+    }
+
+    // 코퍼스 기록 (게임 스레드 전용, 64KB마다 / 벤치 실행 때 파일에 추가)
+    static TArray<uint8> PendingCorpus;
+
+    static FString CorpusPath()
+    {
+        return FPaths::ProjectSavedDir() / TEXT("SocketStats") / TEXT("corpus.txt");
+    }
+
+    static void FlushCorpus()
+    {
+        if (PendingCorpus.Num() == 0)
+            return;
+
+        IFileManager& FileManager = IFileManager::Get();
+        FileManager.MakeDirectory(*FPaths::GetPath(CorpusPath()), true);
+        FFileHelper::SaveArrayToFile(PendingCorpus, *CorpusPath(), &FileManager, FILEWRITE_Append);
+        PendingCorpus.Reset();
+    }
+
+    void RecordCorpusLine(const uint8* Utf8, int32 Num)
+    {
+        if (CVarRecordCorpus.GetValueOnGameThread() <= 0)
+            return;
+
+        PendingCorpus.Append(Utf8, Num);
+        PendingCorpus.Add('\n');
+        if (PendingCorpus.Num() >= 64 * 1024)
+            FlushCorpus();
+    }
+}
+
+#if !UE_BUILD_SHIPPING
+namespace
+{
+    // 코퍼스 파일이 없을 때 쓰는 대표 명령 (드래그 스트림 / 한글 라벨 / 따옴표 경로 / 요청 ID)
+    const TCHAR* const SampleCorpus[] = {
+        TEXT("@17 MOVE Cube 120.5 -30.25 100"),
+        TEXT("MOVE 의자_01 10 20 30"),
+        TEXT("SCALE Sphere 1.5 1.5 1.5"),
+        TEXT("SET_TRANSFORMS LS Cube 0 0 100 1 1 1 Sphere 50 0 100 2 2 2 의자_01 -40 12.5 0 1 1 1"),
+        TEXT("GET_ACTOR_STATE Cube Sphere 의자_01"),
+        TEXT("SET_MATERIAL 의자_01 0 \"/Game/My Materials/M_나무.M_나무\""),
+        TEXT("SET_STATIC_MESH Cube '/Game/Meshes/SM_Table'"),
+        TEXT("SET_TEXTURE Cube 0 BaseColor /Game/Textures/T_Wood_D"),
+        TEXT("PING"),
+        TEXT("LIST_STATIC"),
+    };
+
+    // 예전 수신 경로: FString 변환 → Replace 5번 → 제어문자 RemoveAt → @id/동사 분리 → 공백 토큰화
+    int32 LegacyParse(const uint8* Utf8, int32 Num)
+    {
+        FUTF8ToTCHAR Conv(reinterpret_cast<const ANSICHAR*>(Utf8), Num);
+        FString Command(Conv.Length(), Conv.Get());
+        Command.TrimStartAndEndInline();
+        Command = Command.Replace(TEXT("\x01"), TEXT("")).Replace(TEXT("\x02"), TEXT("")).Replace(TEXT("\x03"), TEXT("")).Replace(TEXT("\xFF"), TEXT("")).Replace(TEXT("\xFE"), TEXT(""));
+        for (int32 i = 0; i < Command.Len(); ++i)
+        {
+            if (Command[i] < 32 || Command[i] == 127)
+            {
+                Command.RemoveAt(i);
+                i--;
+            }
+        }
+
+        FString RequestId;
+        MySocketProtocol::SplitRequestId(Command, RequestId);
+        const FString Verb = MyReply::VerbOf(Command);
+        TArray<FString> Tokens;
+        Command.ParseIntoArrayWS(Tokens);
+        return Tokens.Num() + Verb.Len();
+    }
+
+    // 지금 수신 경로: 바이트에서 바로 토큰 뷰 + 통계/응답용 동사 문자열
+    int32 TokenizerParse(MyCommandTokenizer::FTokens& Tokens, const uint8* Utf8, int32 Num)
+    {
+        Tokens.Parse(Utf8, Num);
+        const FString Verb = Tokens.IsEmpty() ? FString() : FString(Tokens[0]);
+        return Tokens.Num() + Verb.Len();
+    }
+
+    // MySocket.BenchTokenizer [반복 횟수=200] [코퍼스 파일=Saved/SocketStats/corpus.txt]
+    void RunTokenizerBench(const TArray<FString>& Args)
+    {
+        const int32 Iterations = FMath::Max(1, Args.Num() >= 1 ? FCString::Atoi(*Args[0]) : 200);
+        MyCommandTokenizer::FlushCorpus();
+        const FString Path = Args.Num() >= 2 ? Args[1] : MyCommandTokenizer::CorpusPath();
+
+        TArray<uint8> Bytes;
+        FString Source = Path;
+        if (!FFileHelper::LoadFileToArray(Bytes, *Path, FILEREAD_Silent) || Bytes.Num() == 0)
+        {
+            Bytes.Reset();
+            for (const TCHAR* Line : SampleCorpus)
+            {
+                FTCHARToUTF8 Utf8(Line);
+                Bytes.Append(reinterpret_cast<const uint8*>(Utf8.Get()), Utf8.Length());
+                Bytes.Add('\n');
+            }
+            Source = TEXT("(내장 샘플)");
+        }
+
+        TArray<TPair<int32, int32>> Lines;   // (시작, 길이)
+        for (int32 Begin = 0, i = 0; i <= Bytes.Num(); ++i)
+        {
+            if (i == Bytes.Num() || Bytes[i] == '\n')
+            {
+                int32 Len = i - Begin;
+                while (Len > 0 && Bytes[Begin + Len - 1] == '\r')
+                    --Len;
+                if (Len > 0)
+                    Lines.Emplace(Begin, Len);
+                Begin = i + 1;
+            }
+        }
+        if (Lines.Num() == 0)
+            return;
+
+        int64 Sink = 0;
+        double Start = FPlatformTime::Seconds();
+        for (int32 n = 0; n < Iterations; ++n)
+            for (const TPair<int32, int32>& Line : Lines)
+                Sink += LegacyParse(Bytes.GetData() + Line.Key, Line.Value);
+        const double LegacySeconds = FPlatformTime::Seconds() - Start;
+
+        MyCommandTokenizer::FTokens Tokens;
+        Start = FPlatformTime::Seconds();
+        for (int32 n = 0; n < Iterations; ++n)
+            for (const TPair<int32, int32>& Line : Lines)
+                Sink += TokenizerParse(Tokens, Bytes.GetData() + Line.Key, Line.Value);
+        const double TokenizerSeconds = FPlatformTime::Seconds() - Start;
+
+        const double Count = double(Lines.Num()) * Iterations;
+        UE_LOG(LogMySocket, Display, TEXT("⏱️ 토크나이저 벤치: %s  %d줄 x %d회 (%d바이트)"), *Source, Lines.Num(), Iterations, Bytes.Num());
+        UE_LOG(LogMySocket, Display, TEXT("    예전 경로  %.1f ns/줄"), LegacySeconds / Count * 1e9);
+        UE_LOG(LogMySocket, Display, TEXT("    토크나이저 %.1f ns/줄 (x%.1f)  [%lld]"),
+            TokenizerSeconds / Count * 1e9, LegacySeconds / FMath::Max(TokenizerSeconds, 1e-9), Sink);
+    }
+
+    FAutoConsoleCommand BenchTokenizerCommand(
+        TEXT("MySocket.BenchTokenizer"),
+        TEXT("명령 토크나이저 마이크로 벤치마크 (예전 수신 경로와 비교). 인자: [반복 횟수=200] [코퍼스 파일=Saved/SocketStats/corpus.txt]"),
+        FConsoleCommandWithArgsDelegate::CreateStatic(&RunTokenizerBench));
+}
+#endif
@@ -0,0 +1,67 @@
+#pragma once
+
+#include "CoreMinimal.h"
+
+// 한 줄 명령 토크나이저 (9999 PIE 수신 경로 / SET_TRANSFORMS 공용)
+//
+//  - UTF-8 디코딩 + 제어문자 제거 + 공백 분리를 바이트 한 번 훑는 동안 처리 (한글 라벨이 깨지지 않음)
+//  - 토큰은 재사용 버퍼 안의 NUL 종료 문자열 → 워밍업 뒤에는 명령마다 할당 없음
+//  - 토큰 맨 앞의 "..." / '...'는 따옴표 인자: 안의 공백 유지, 따옴표는 벗김 (닫는 따옴표가 없으면 줄 끝까지)
+//    예) SET_MATERIAL Cube 0 "/Game/My Materials/M_Red"
+//  - 첫 토큰이 "@<id>"면 요청 ID로 떼어냄 (RequestId)
+//  - 잘못된 UTF-8 바이트(예: 0xFE 0xFF)와 제어문자(< 32, 127)는 버림, 탭은 공백으로 취급
+namespace MyCommandTokenizer
+{
+    // 토큰 1개: FTokens 버퍼를 가리키는 뷰 (다음 Parse 전까지만 유효)
+    struct FToken
+    {
+        const TCHAR* Data = TEXT("");
+        int32 Len = 0;
+
+        const TCHAR* operator*() const { return Data; }   // NUL 종료 → FCString::Atof(*Tokens[i]) 그대로 사용
+        FStringView View() const { return FStringView(Data, Len); }
+        operator FString() const { return FString(Len, Data); }   // 이름을 들고 있어야 할 때만 복사
+
+        bool Equals(const TCHAR* Other, ESearchCase::Type Case = ESearchCase::CaseSensitive) const
+        {
+            return View().Equals(Other, Case);
+        }
+        bool operator==(const TCHAR* Other) const { return View().Equals(Other, ESearchCase::CaseSensitive); }
+        bool operator!=(const TCHAR* Other) const { return !(*this == Other); }
+        bool operator==(const ANSICHAR* Other) const;   // 명령 비교 (Tokens[0] == "MOVE")
+        bool operator!=(const ANSICHAR* Other) const { return !(*this == Other); }
+    };
+
+    class FTokens
+    {
+    public:
+        // 수신 버퍼의 UTF-8 한 줄 (개행 제외)
+        void Parse(const uint8* Utf8, int32 Num);
+        // 이미 FString인 줄 (BATCH 안의 명령 / 에디터 서버)
+        void Parse(FStringView Line);
+
+        int32 Num() const { return Tokens.Num(); }
+        bool IsEmpty() const { return Tokens.Num() == 0; }
+        const FToken& operator[](int32 Index) const { return Tokens[Index]; }
+        const FToken* begin() const { return Tokens.GetData(); }
+        const FToken* end() const { return Tokens.GetData() + Tokens.Num(); }
+
+        const FToken& RequestId() const { return Id; }   // "@<id>"의 id (없으면 빈 토큰)
+
+        // From번째 토큰부터 끝까지 Separator로 이어 붙임
+        // (따옴표 없이 보낸 공백 포함 경로 복원 / 로그용, 호출할 때만 할당)
+        FString Join(int32 From = 0, const TCHAR* Separator = TEXT(" ")) const;
+
+    private:
+        template <typename FNextCodePoint>
+        void Run(int32 MaxChars, FNextCodePoint&& Next);
+
+        TArray<TCHAR> Buffer;                       // 디코딩된 토큰들 (각각 NUL 종료), 명령마다 재사용
+        TArray<FToken, TInlineAllocator<32>> Tokens;
+        FToken Id;
+    };
+
+    // 콘솔 변수 MySocket.RecordCorpus > 0이면 수신한 줄을 Saved/SocketStats/corpus.txt에 모음
+    // (콘솔 명령 MySocket.BenchTokenizer의 입력, 꺼져 있으면 비교 한 번)
+    void RecordCorpusLine(const uint8* Utf8, int32 Num);
+}
@@ -1,4 +1,6 @@
 ﻿#include "MyEditorSocketSubsystem.h"
+#include "MySocketProtocol.h"
+#include "MySocketLog.h"
 #include "Editor.h"
 #include "Engine/World.h"
 #include "Common/TcpSocketBuilder.h"
@@ -9,6 +11,14 @@
 #include "Engine/StaticMeshActor.h"   // ✅ 꼭 필요
 #include "EditorSubsystem.h"   // (선택) 에디터 관련
 #include "Containers/Ticker.h"        // ✅ FTSTicker 사용 시
+#include "MyEditorSocketWorker.h"
+#include "MyTransformBatch.h"
+#include "MySelectionSets.h"
+#include "MyCommandTokenizer.h"
+#include "MyActorState.h"
+#include "MyAssetCache.h"
+#include "Materials/MaterialInterface.h"
+#include "MyReply.h"
 #include "AssetRegistry/AssetRegistryModule.h"  // UAssetRegistryHelpers, FAssetData
 #include "AssetRegistry/IAssetRegistry.h"       // IAssetRegistry 인터페이스
 #include "UObject/SoftObjectPath.h"             // FSoftObjectPath
@@ -17,12 +27,42 @@
 #include "CineCameraActor.h"          // ⬅ 시네카메라
 #define UE_LOG_TAG LogTemp
 
+// "OK X" / "ERR X" 텍스트 응답 (JSON 협상된 연결에는 ERR 종류별 상태 코드로 변환해 전송)
 void UMyEditorSocketSubsystem::SendToClient(const FString& Text)
 {
-    if (!ClientSocket) return;
-    FTCHARToUTF8 Conv(*Text);
-    int32 Sent = 0;
-    ClientSocket->Send((uint8*)Conv.Get(), Conv.Length(), Sent);
+    SendReply(FMyReply::FromEditorText(Text));
+}
+
+void UMyEditorSocketSubsystem::SendReply(const FMyReply& Reply)
+{
+    // 응답은 지금 처리 중인 명령을 보낸 클라이언트에게만 (그 연결이 협상한 형식으로)
+    if (!CurrentClient) return;
+    bLastReplyOk = Reply.IsOk();
+    const FString Message = Reply.Render(CurrentVerb, CurrentClient->bJson);
+    if (bCollectingBatch)
+    {
+        MySocketProtocol::AppendResponse(BatchOut, Message, true, CurrentRequestId);
+        return;
+    }
+    if (!CurrentClient->Socket) return;
+    TArray<uint8> Out;
+    MySocketProtocol::AppendResponse(Out, Message, CurrentClient->bFramed, CurrentRequestId);
+    MySocketProtocol::SendAll(*CurrentClient, Out.GetData(), Out.Num());
+    Stats.AddBytesOut(Out.Num());
+}
+
+// 요청과 무관한 알림(SWITCH:*)은 접속 중인 모든 클라이언트에게 각자의 프레이밍/형식으로 전송
+void UMyEditorSocketSubsystem::Broadcast(const FString& Text)
+{
+    const FMyReply Push = FMyReply::Success(Text);
+    for (const MySocketProtocol::FClientRef& Client : Clients)
+    {
+        if (!Client->Socket) continue;
+        TArray<uint8> Out;
+        MySocketProtocol::AppendResponse(Out, Push.Render(TEXT("SWITCH"), Client->bJson), Client->bFramed, FString());
+        MySocketProtocol::SendAll(*Client, Out.GetData(), Out.Num());
+        Stats.AddBytesOut(Out.Num());
+    }
 }
 
 
@@ -32,16 +72,8 @@ void UMyEditorSocketSubsystem::Initialize(FSubsystemCollectionBase& Collection)
     FEditorDelegates::EndPIE.AddUObject(this, &UMyEditorSocketSubsystem::OnEndPIE);
 #if WITH_EDITOR
     UE_LOG(UE_LOG_TAG, Warning, TEXT("🔧 UMyEditorSocketSubsystem Initialize"));
+    // Accept/Recv는 수신 스레드가 소켓에서 대기하며 처리, 명령이 들어올 때만 게임 스레드 ticker를 깨움
     StartListening(9998);
-
-    // 100ms 간격으로 Accept + Recv 폴링 (에디터 어디서든 동작)
-    TickerHandle = FTSTicker::GetCoreTicker().AddTicker(
-        FTickerDelegate::CreateLambda([this](float)->bool
-            {
-                AcceptClients();
-                PumpClient();
-                return true; // 계속
-            }), 0.1f);
 #endif
 }
 
@@ -49,12 +81,9 @@ void UMyEditorSocketSubsystem::Deinitialize()
 {
 #if WITH_EDITOR
     UE_LOG(UE_LOG_TAG, Warning, TEXT("🔧 UMyEditorSocketSubsystem Deinitialize"));
-    if (TickerHandle.IsValid())
-    {
-        FTSTicker::GetCoreTicker().RemoveTicker(TickerHandle);
-        TickerHandle.Reset();
-    }
     StopListening();
+    Watches.Reset();
+    ActorIndex.Unbind();
 #endif
 }
 
@@ -75,16 +104,26 @@ void UMyEditorSocketSubsystem::StartListening(int32 Port)
         return;
     }
     UE_LOG(UE_LOG_TAG, Warning, TEXT("✅ 에디터 소켓 리슨 시작 (포트 %d)"), Port);
+
+    TWeakObjectPtr<UMyEditorSocketSubsystem> WeakThis(this);
+    Worker = MakeUnique<FMyEditorSocketWorker>(ListenSocket, Stats, [this, WeakThis]()
+        {
+            // 워커 스레드: 이미 깨워둔 ticker가 없을 때만 새로 등록 (FTSTicker는 스레드 안전)
+            if (bDrainArmed.exchange(true))
+                return;
+            FTSTicker::GetCoreTicker().AddTicker(FTickerDelegate::CreateLambda([WeakThis](float DeltaTime)->bool
+                {
+                    UMyEditorSocketSubsystem* Self = WeakThis.Get();
+                    return Self && Self->DrainInbox(DeltaTime);
+                }));
+        });
 }
 
 void UMyEditorSocketSubsystem::StopListening()
 {
-    if (ClientSocket)
-    {
-        ClientSocket->Close();
-        ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->DestroySocket(ClientSocket);
-        ClientSocket = nullptr;
-    }
+    Worker.Reset();   // 수신 스레드 종료 대기 후 소켓 정리
+    MySocketProtocol::CloseAll(Clients);
+    bDrainArmed = false;
 
     if (ListenSocket)
     {
@@ -96,70 +135,144 @@ void UMyEditorSocketSubsystem::StopListening()
 
 void UMyEditorSocketSubsystem::OnBeginPIE(const bool /*bIsSimulating*/)
 {
-    // 9998에 붙어 있던 클라에게 전환 지시 후 연결 끊기
-    SendToClient(TEXT("SWITCH:PIE\n"));
-    if (ClientSocket)
+    // 9998에 붙어 있던 클라 전부에게 전환 지시 후 연결 끊기
+    Broadcast(TEXT("SWITCH:PIE\n"));
+    for (const MySocketProtocol::FClientRef& Client : Clients)
     {
-        ClientSocket->Close();
-        ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->DestroySocket(ClientSocket);
-        ClientSocket = nullptr;
+        Client->bDropRequested = true;   // 실제 정리는 수신 스레드가 함
     }
+    Clients.Reset();
+    Watches.Reset();
 }
 
 void UMyEditorSocketSubsystem::OnEndPIE(const bool /*bIsSimulating*/)
 {
     // 에디터 모드 복귀 알림 (연결이 이미 끊어졌을 수 있으니 best-effort)
-    SendToClient(TEXT("SWITCH:EDITOR\n"));
+    Broadcast(TEXT("SWITCH:EDITOR\n"));
     // 9998 리슨은 계속 유지 중이니 추가 처리 불필요
 }
 
 
-void UMyEditorSocketSubsystem::AcceptClients()
+// 수신 스레드가 넣어둔 명령을 시간 예산만큼 실행 (게임 스레드 ticker), 남은 게 있으면 true → 다음 틱에 계속
+bool UMyEditorSocketSubsystem::DrainInbox(float DeltaTime)
+{
+    if (!Worker)
+    {
+        bDrainArmed = false;
+        return false;
+    }
+
+    const double Start = FPlatformTime::Seconds();
+    const double Deadline = Start + MySocketProtocol::GetCommandBudgetSeconds();
+    FMyEditorSocketWorker::FInbound Item;
+    do   // 예산이 0이어도 최소 1개는 처리
+    {
+        if (!Worker->Dequeue(Item))
+            break;
+        HandleInbound(Item);
+    } while (FPlatformTime::Seconds() < Deadline);
+    Stats.RecordTick(FPlatformTime::Seconds() - Start, DeltaTime, Worker->NumPending());
+
+    if (Worker->HasPending())
+        return true;
+
+    // 해제 직후 워커가 넣은 항목이 있으면 (워커는 ticker를 새로 안 걸었으므로) 이 ticker를 유지
+    bDrainArmed = false;
+    return Worker->HasPending() && !bDrainArmed.exchange(true);
+}
+
+// 수신 스레드 이벤트 1개 처리 (응답은 CurrentClient로 라우팅)
+void UMyEditorSocketSubsystem::HandleInbound(FMyEditorSocketWorker::FInbound& Item)
 {
-    if (!ListenSocket) return;
+    using EType = FMyEditorSocketWorker::FInbound::EType;
+    if (Item.Type == EType::Connected)
+    {
+        Clients.Add(Item.Client);
+        return;
+    }
+    if (Item.Type == EType::Disconnected)
+    {
+        Clients.Remove(Item.Client);
+        Watches.Unwatch(Item.Client.Get(), {});
+        return;
+    }
+    if (Item.Client->bDropRequested)
+        return;   // PIE 시작으로 끊은 연결에 남아 있던 명령
+
+    CurrentClient = Item.Client.Get();
+    Watches.SetOrigin(CurrentClient);   // 이 명령이 바꾼 트랜스폼은 이 연결에 푸시 안 함
+    ON_SCOPE_EXIT { CurrentClient = nullptr; Watches.SetOrigin(nullptr); };
 
-    bool bPending = false;
-    if (!ListenSocket->HasPendingConnection(bPending))
+    switch (Item.Kind)
+    {
+    case MySocketProtocol::EMessageKind::None:
         return;
 
-    if (!bPending) return;
+    case MySocketProtocol::EMessageKind::TooLarge:
+        SendToClient(TEXT("ERR BatchTooLarge\n"));
+        return;
 
-    TSharedRef<FInternetAddr> ClientAddr =
-        ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->CreateInternetAddr();
+    case MySocketProtocol::EMessageKind::BatchCount:
+        SendToClient(TEXT("ERR BatchCount\n"));
+        return;
 
-    FSocket* NewClient = ListenSocket->Accept(*ClientAddr, TEXT("EditorClient"));
-    if (NewClient)
-    {
-        if (ClientSocket)
-        {
-            ClientSocket->Close();
-            ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->DestroySocket(ClientSocket);
-        }
-        ClientSocket = NewClient;
-        UE_LOG(UE_LOG_TAG, Log, TEXT("✅ Editor 클라이언트 접속: %s"), *ClientAddr->ToString(true));
+    case MySocketProtocol::EMessageKind::Invalid:
+    case MySocketProtocol::EMessageKind::Binary:
+        // 바이너리 미리보기는 PIE 서버(9999) 전용
+        SendToClient(TEXT("ERR Binary\n"));
+        return;
+
+    case MySocketProtocol::EMessageKind::Batch:
+        HandleBatch(Item.Commands);
+        return;
+
+    case MySocketProtocol::EMessageKind::Line:
+        break;
     }
+
+    FString Command = MoveTemp(Item.Line);
+    Command.TrimStartAndEndInline();
+    MYSOCKET_LOG(Summary, Log, TEXT("📩 에디터 명령 수신: [%s]"), *Command);
+    MySocketProtocol::SplitRequestId(Command, CurrentRequestId);
+    CurrentVerb = MyReply::VerbOf(Command);
+    const double Start = FPlatformTime::Seconds();
+    HandleIncomingCommand(Command);
+    Stats.RecordCommand(CurrentVerb, FPlatformTime::Seconds() - Start, bLastReplyOk);
+    CurrentRequestId.Reset();
+    CurrentVerb.Reset();
 }
 
-void UMyEditorSocketSubsystem::PumpClient()
+// BATCH: 명령 N개를 순서대로 실행하고, 각 SendToClient 응답을 모아 한 번에 전송
+void UMyEditorSocketSubsystem::HandleBatch(const TArray<FString>& Commands)
 {
-    if (!ClientSocket) return;
-
-    uint32 DataSize = 0;
-    if (!ClientSocket->HasPendingData(DataSize) || DataSize == 0)
+    if (!CurrentClient || !CurrentClient->bFramed)
+    {
+        SendToClient(TEXT("ERR BatchNeedsProto\n"));
         return;
+    }
 
-    TArray<uint8> Data;
-    Data.SetNumUninitialized(DataSize);
-
-    int32 Read = 0;
-    if (ClientSocket->Recv(Data.GetData(), Data.Num(), Read) && Read > 0)
+    BatchOut.Reset();
+    bCollectingBatch = true;
+    for (int32 i = 0; i < Commands.Num(); ++i)
     {
-        Data.Add(0);
-        FString Command = FString(ANSI_TO_TCHAR(reinterpret_cast<const char*>(Data.GetData())));
-        Command.TrimStartAndEndInline();
-        UE_LOG(UE_LOG_TAG, Warning, TEXT("📩 에디터 명령 수신: [%s]"), *Command);
-        HandleIncomingCommand(Command);
+        FString Command = Commands[i];
+        MySocketProtocol::SplitRequestId(Command, CurrentRequestId);
+        CurrentVerb = MyReply::VerbOf(Command);
+
+        const double Start = FPlatformTime::Seconds();
+        if (i < MySocketProtocol::MaxBatchCommands)
+            HandleIncomingCommand(Command);
+        else
+            SendToClient(TEXT("ERR BatchTooMany\n"));
+        Stats.RecordCommand(CurrentVerb, FPlatformTime::Seconds() - Start, bLastReplyOk);
     }
+    CurrentRequestId.Reset();
+    CurrentVerb.Reset();
+    bCollectingBatch = false;
+
+    MySocketProtocol::SendAll(*CurrentClient, BatchOut.GetData(), BatchOut.Num());
+    Stats.AddBytesOut(BatchOut.Num());
+    BatchOut.Reset();
 }
 
 bool UMyEditorSocketSubsystem::IsPIEActive() const
@@ -170,36 +283,115 @@ bool UMyEditorSocketSubsystem::IsPIEActive() const
     return PIECtx && PIECtx->World() != nullptr;
 }
 
-static UObject* LoadAnyObjectByPath(const FString& InPath)
+// LIST / LIST_STATIC 응답: 텍스트 모드는 "라벨|이름" 줄, JSON 모드는 {"actors":[{"label","name","handle"}]}만 만듦
+struct FActorListBuilder
 {
-    FString Path = InPath;
+    explicit FActorListBuilder(bool bInJson) : bJson(bInJson) {}
 
-    // "/Game/Foo/Bar" → "/Game/Foo/Bar.Bar" 자동 보정
-    if (!Path.Contains(TEXT(".")))
+    void Add(const FString& Label, const FString& Name, uint32 Handle)
     {
-        const FString Short = FPackageName::GetShortName(Path);
-        Path += TEXT(".") + Short;
+        if (!bJson)
+        {
+            Text += FString::Printf(TEXT("%s|%s\n"), *Label, *Name);
+            return;
+        }
+        TSharedPtr<FJsonObject> Entry = MakeShared<FJsonObject>();
+        Entry->SetStringField(TEXT("label"), Label);
+        Entry->SetStringField(TEXT("name"), Name);
+        Entry->SetNumberField(TEXT("handle"), Handle);
+        Actors.Add(MakeShared<FJsonValueObject>(Entry));
     }
 
-    // 1) 직접 로드
-    if (UObject* Obj = StaticLoadObject(UObject::StaticClass(), nullptr, *Path))
-        return Obj;
-
-    // 2) 에셋 레지스트리 (모듈 통해 가져오기)
-    FAssetRegistryModule& ARM = FModuleManager::LoadModuleChecked<FAssetRegistryModule>(TEXT("AssetRegistry"));
-    IAssetRegistry& Registry = ARM.Get();
-
-    const FSoftObjectPath SoftPath(Path);
-    FAssetData Data = Registry.GetAssetByObjectPath(SoftPath, /*bIncludeOnlyOnDiskAssets*/ false);
-    if (Data.IsValid())
+    FMyReply Finish()
     {
-        return Data.GetAsset();
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+        Data->SetArrayField(TEXT("actors"), Actors);
+        return FMyReply::Success(MoveTemp(Text), Data);
     }
 
-    return nullptr;
-}
+    bool bJson;
+    FString Text;
+    TArray<TSharedPtr<FJsonValue>> Actors;
+};
+
+// HELLO 응답에 싣는 지원 명령 (HandleIncomingCommand에 명령을 추가하면 여기도 추가)
+static const TCHAR* const EditorVerbs[] = {
+    TEXT("PROTO"), TEXT("FORMAT"), TEXT("HELLO"), TEXT("BATCH"), TEXT("PING"),
+    TEXT("SPAWN_ASSET"), TEXT("SET_STATIC_MESH"), TEXT("py"),
+    TEXT("LIST"), TEXT("LIST_STATIC"), TEXT("HANDLE"), TEXT("GET_SCALE"), TEXT("GET_ACTOR_STATE"), TEXT("SCALE"), TEXT("SET_TRANSFORMS"),
+    TEXT("MOVE_BY"), TEXT("ROTATE_BY"), TEXT("SCALE_MUL"), TEXT("SET_MATERIAL_MULTI"),
+    TEXT("SELECT_SET"), TEXT("SELECT_SET_ADD"), TEXT("SELECT_SET_REMOVE"), TEXT("SELECT_SET_CLEAR"),
+    TEXT("GROUP_MOVE_BY"), TEXT("GROUP_ROTATE_BY"), TEXT("GROUP_SCALE_MUL"), TEXT("GROUP_SET_MATERIAL"), TEXT("GROUP_SET_MOBILITY"),
+    TEXT("WATCH"), TEXT("UNWATCH"), TEXT("STATS"), TEXT("LOG_VERBOSE"),
+};
+
 void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
 {
+    // 프레이밍 협상은 PIE 여부와 무관하게 처리 (9998 연결 자체의 속성)
+    int32 ProtoVersion = 0;
+    if (MySocketProtocol::ParseProtoRequest(Command, ProtoVersion))
+    {
+        const bool bFramed = ProtoVersion >= 1;
+        if (CurrentClient) CurrentClient->bFramed = bFramed;
+        SendToClient(bFramed
+            ? FString::Printf(TEXT("OK PROTO %d\n"), FMath::Min(ProtoVersion, MySocketProtocol::Version))
+            : TEXT("OK PROTO 0\n"));
+        return;
+    }
+
+    // 응답 형식 협상도 연결 속성 → PIE 중에도 처리 (이 응답부터 새 형식)
+    bool bJsonRequested = false;
+    if (MySocketProtocol::ParseFormatRequest(Command, bJsonRequested))
+    {
+        if (CurrentClient) CurrentClient->bJson = bJsonRequested;
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"format"}
+        Data->SetStringField(TEXT("format"), bJsonRequested ? TEXT("JSON") : TEXT("TEXT"));
+        SendReply(FMyReply::Success(bJsonRequested ? TEXT("OK FORMAT JSON\n") : TEXT("OK FORMAT TEXT\n"), Data));
+        return;
+    }
+
+    // 능력 조회도 연결 속성 → PIE 중에도 응답 (클라이언트가 접속 때 한 번 받아 캐시)
+    if (MySocketProtocol::IsHelloRequest(Command))
+    {
+        MySocketProtocol::FServerCaps Caps;
+        Caps.Kind = TEXT("EDITOR");
+        Caps.Verbs = EditorVerbs;
+        Caps.bBinary = false;   // 바이너리 패킷은 ERR Binary
+        FMyReply Reply = MySocketProtocol::MakeHelloReply(Caps);
+        Reply.Text += TEXT("\n");
+        SendReply(Reply);
+        return;
+    }
+
+    // 서버 계측 조회도 PIE 중에 응답 ("STATS RESET"은 조회 후 초기화)
+    if (Command.StartsWith(TEXT("STATS")) && MyReply::VerbOf(Command) == TEXT("STATS"))
+    {
+        FMyReply Reply = Stats.BuildReply();
+        Reply.Text += TEXT("\n");
+        SendReply(Reply);
+        if (Command.EndsWith(TEXT(" RESET")))
+            Stats.Reset();
+        return;
+    }
+
+    // 명령/응답 로그 레벨도 PIE 중에 전환 가능 (두 서버 공용 설정)
+    int32 LogLevel = 0;
+    if (MySocketLog::ParseLogVerboseRequest(Command, LogLevel))
+    {
+        MySocketLog::SetLevel(LogLevel);
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"level"}
+        Data->SetNumberField(TEXT("level"), MySocketLog::GetLevel());
+        SendReply(FMyReply::Success(FString::Printf(TEXT("OK LOG_VERBOSE %d\n"), MySocketLog::GetLevel()), Data));
+        return;
+    }
+
+    // keep-alive 확인도 PIE 가드 전에 응답 (PIE 중에도 9998 연결이 살아있음을 알려야 함)
+    if (Command.TrimStartAndEnd() == TEXT("PING"))
+    {
+        SendToClient(TEXT("PONG\n"));
+        return;
+    }
+
     // 에디터 전용 가드 (PIE 차단)
     if (IsPIEActive())
     {
@@ -213,8 +405,7 @@ void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
     if (GEditor)
     {
         FWorldContext& Ctx = GEditor->GetEditorWorldContext();
-        UWorld* EditorWorld = Ctx.World();
-
+        EditorWorld = Ctx.World();
     }
 
     if (!EditorWorld)
@@ -223,6 +414,10 @@ void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
         return;
     }
 
+    // 맵이 바뀌었으면 새 월드로 다시 바인딩 (같은 월드면 no-op)
+    ActorIndex.Bind(EditorWorld);
+    Watches.Bind(EditorWorld);
+
 
 
     if (Command.StartsWith(TEXT("SPAWN_ASSET")))
@@ -248,8 +443,7 @@ void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
         const int32 PrefixLen = 12; // "SPAWN_ASSET " (뒤 공백 포함)
         const FString AssetPath = CleanArg(Command.Mid(PrefixLen));
 
-        UObject* Obj = LoadAnyObjectByPath(AssetPath);          // ← 점 없는 경로 자동보정 포함
-        UStaticMesh* StaticMesh = Cast<UStaticMesh>(Obj);
+        UStaticMesh* StaticMesh = FMyAssetCache::Get().Resolve<UStaticMesh>(AssetPath);   // ← 점 없는 경로 자동보정 + 캐시
 
         if (!StaticMesh)
         {
@@ -277,7 +471,10 @@ void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
             MeshActor->GetStaticMeshComponent()->SetStaticMesh(StaticMesh);
             MeshActor->SetActorLabel(TEXT("Spawned_StaticMesh"));
             UE_LOG(UE_LOG_TAG, Log, TEXT("✅ Spawned: %s"), *MeshActor->GetName());
-            SendToClient(TEXT("OK Spawned\n"));
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","label"}
+            Data->SetStringField(TEXT("actor"), MeshActor->GetName());
+            Data->SetStringField(TEXT("label"), MeshActor->GetActorLabel());
+            SendReply(FMyReply::Success(TEXT("OK Spawned\n"), Data));
             return;
         }
 
@@ -316,14 +513,8 @@ void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
             return;
         }
 
-        FString MeshPath = CleanArg(AssetArg);
-        if (!MeshPath.Contains(TEXT(".")))
-        {
-            const FString Short = FPackageName::GetShortName(MeshPath);
-            MeshPath += TEXT(".") + Short;
-        }
-
-        UStaticMesh* NewMesh = Cast<UStaticMesh>(LoadAnyObjectByPath(MeshPath));
+        const FString MeshPath = CleanArg(AssetArg);
+        UStaticMesh* NewMesh = FMyAssetCache::Get().Resolve<UStaticMesh>(MeshPath);
         if (!NewMesh)
         {
             SendToClient(TEXT("ERR LoadMesh\n"));
@@ -332,24 +523,30 @@ void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
 
 
         int32 Applied = 0;
-        for (TActorIterator<AActor> It(EditorWorld); It; ++It)
+        AActor* Actor = ActorIndex.FindByName(ActorName);
+        if (Actor)
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
+            TArray<UStaticMeshComponent*> Comps;
+            Actor->GetComponents<UStaticMeshComponent>(Comps);
+            for (UStaticMeshComponent* C : Comps)
             {
-                TArray<UStaticMeshComponent*> Comps;
-                It->GetComponents<UStaticMeshComponent>(Comps);
-                for (UStaticMeshComponent* C : Comps)
-                {
-                    C->SetMobility(EComponentMobility::Movable);
-                    C->SetStaticMesh(NewMesh);
-                    C->MarkRenderStateDirty();
-                    ++Applied;
-                }
-                break;
+                C->SetMobility(EComponentMobility::Movable);
+                C->SetStaticMesh(NewMesh);
+                C->MarkRenderStateDirty();
+                ++Applied;
             }
         }
 
-        SendToClient(Applied > 0 ? TEXT("OK SetMesh\n") : TEXT("ERR NoSMC\n"));
+        if (Applied == 0)
+        {
+            SendToClient(TEXT("ERR NoSMC\n"));
+            return;
+        }
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","mesh","components"}
+        Data->SetStringField(TEXT("actor"), Actor->GetName());
+        Data->SetStringField(TEXT("mesh"), NewMesh->GetPathName());
+        Data->SetNumberField(TEXT("components"), Applied);
+        SendReply(FMyReply::Success(TEXT("OK SetMesh\n"), Data));
         return;
     }
 
@@ -375,22 +572,62 @@ void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
         FString ActorName = Command.Mid(10).TrimStartAndEnd();
         if (!EditorWorld) { SendToClient(TEXT("ERR NoWorld\n")); return; }
 
-        for (TActorIterator<AActor> It(EditorWorld); It; ++It)
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
-            {
-                const FVector S = It->GetActorScale3D();
-                SendToClient(FString::Printf(TEXT("Scale: %.6f %.6f %.6f\n"), S.X, S.Y, S.Z));
-                return;
-            }
+            const FVector S = Actor->GetActorScale3D();
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","scale"}
+            Data->SetStringField(TEXT("actor"), Actor->GetName());
+            Data->SetArrayField(TEXT("scale"), MyReply::Vec3(S));
+            SendReply(FMyReply::Success(FString::Printf(TEXT("Scale: %.6f %.6f %.6f\n"), S.X, S.Y, S.Z), Data));
+            return;
         }
         SendToClient(TEXT("ERR NotFound\n"));
         return;
     }
 
+    // 선택 동기화용 복합 조회 (형식은 MyActorState.h)
+    if (Command.StartsWith(TEXT("GET_ACTOR_STATE ")))
+    {
+        TArray<FString> Names;
+        Command.Mid(16).ParseIntoArrayWS(Names);
+        FMyReply Reply;
+        if (CurrentClient && CurrentClient->bJson)
+            Reply.DataJson = MyActorState::BuildJson(ActorIndex, Names);
+        else
+            Reply.Text = MyActorState::BuildJson(ActorIndex, Names) + TEXT("\n");
+        SendReply(Reply);
+        return;
+    }
+
+    // 트랜스폼 변경 푸시 구독 (형식은 MyActorWatch.h)
+    if (Command.StartsWith(TEXT("WATCH ")))
+    {
+        if (!CurrentClient || !CurrentClient->bFramed) { SendToClient(TEXT("ERR WatchNeedsProto\n")); return; }
+        TArray<FString> Names;
+        Command.Mid(6).ParseIntoArrayWS(Names);
+        FMyReply Reply;
+        if (CurrentClient->bJson)
+            Reply.DataJson = Watches.Watch(CurrentClient->AsShared(), Names);
+        else
+            Reply.Text = Watches.Watch(CurrentClient->AsShared(), Names) + TEXT("\n");
+        SendReply(Reply);
+        return;
+    }
+
+    if (Command.Equals(TEXT("UNWATCH")) || Command.StartsWith(TEXT("UNWATCH ")))
+    {
+        TArray<FString> Names;
+        Command.Mid(7).ParseIntoArrayWS(Names);
+        const int32 Count = Watches.Unwatch(CurrentClient, Names);
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"count"}
+        Data->SetNumberField(TEXT("count"), Count);
+        SendReply(FMyReply::Success(FString::Printf(TEXT("OK UNWATCH %d\n"), Count), Data));
+        return;
+    }
+
       if (Command.Equals(TEXT("LIST")))
     {
-        FString Out;
+        FActorListBuilder Actors(CurrentClient && CurrentClient->bJson);
         for (TActorIterator<AActor> It(EditorWorld); It; ++It)
         {
             const FString Name  = It->GetName();
@@ -399,9 +636,9 @@ void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
         #else
             const FString Label = Name;
         #endif
-            Out += FString::Printf(TEXT("%s|%s\n"), *Label, *Name);
+            Actors.Add(Label, Name, ActorIndex.GetOrAddHandle(*It));
         }
-        SendToClient(Out.IsEmpty() ? TEXT("") : Out);   // ← SendToClient 사용
+        SendReply(Actors.Finish());
         return;
     }
 
@@ -409,7 +646,7 @@ void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
 // ✅ LIST_STATIC (StaticMeshActor + CameraActor + CineCameraActor, 라벨|네임)
       if (Command.Equals(TEXT("LIST_STATIC")))
       {
-          FString Out;
+          FActorListBuilder Actors(CurrentClient && CurrentClient->bJson);
           for (TActorIterator<AActor> It(EditorWorld); It; ++It)
           {
               AActor* Actor = *It;
@@ -425,10 +662,10 @@ void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
 #else
                   const FString Label = Name;
 #endif
-                  Out += FString::Printf(TEXT("%s|%s\n"), *Label, *Name);
+                  Actors.Add(Label, Name, ActorIndex.GetOrAddHandle(Actor));
               }
           }
-          SendToClient(Out.IsEmpty() ? TEXT("") : Out);
+          SendReply(Actors.Finish());
           return;
       }
 
@@ -450,25 +687,240 @@ void UMyEditorSocketSubsystem::HandleIncomingCommand(const FString& Command)
 
         if (!EditorWorld) { SendToClient(TEXT("ERR NoWorld\n")); return; }
 
-        for (TActorIterator<AActor> It(EditorWorld); It; ++It)
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
-            {
-                // Movable 보장
-                TArray<UStaticMeshComponent*> Comps;
-                It->GetComponents<UStaticMeshComponent>(Comps);
-                for (UStaticMeshComponent* C : Comps)
-                    C->SetMobility(EComponentMobility::Movable);
-
-                It->SetActorScale3D(FVector(Sx, Sy, Sz));
-                SendToClient(TEXT("OK Scale\n"));
-                return;
-            }
+            // Movable 보장
+            TArray<UStaticMeshComponent*> Comps;
+            Actor->GetComponents<UStaticMeshComponent>(Comps);
+            for (UStaticMeshComponent* C : Comps)
+                C->SetMobility(EComponentMobility::Movable);
+
+            Actor->SetActorScale3D(FVector(Sx, Sy, Sz));
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","scale"}
+            Data->SetStringField(TEXT("actor"), Actor->GetName());
+            Data->SetArrayField(TEXT("scale"), MyReply::Vec3(Actor->GetActorScale3D()));
+            SendReply(FMyReply::Success(TEXT("OK Scale\n"), Data));
+            return;
         }
         SendToClient(TEXT("ERR NotFound\n"));
         return;
     }
 
+    // 숫자 핸들 발급: "HANDLE A B C" → "OK HANDLE 1 2 0" (0 = 없음, 명령의 액터 자리에 "#<핸들>"로 씀)
+    if (Command.StartsWith(TEXT("HANDLE ")))
+    {
+        if (!EditorWorld) { SendToClient(TEXT("ERR NoWorld\n")); return; }
+
+        TArray<FString> Names;
+        Command.Mid(7).ParseIntoArrayWS(Names);
+
+        FString Result = TEXT("OK HANDLE");
+        TArray<TSharedPtr<FJsonValue>> Handles;   // data: {"handles":[...]}
+        for (const FString& Name : Names)
+        {
+            const uint32 Handle = ActorIndex.GetOrAddHandle(ActorIndex.FindByName(Name));
+            Result += FString::Printf(TEXT(" %u"), Handle);
+            Handles.Add(MakeShared<FJsonValueNumber>(Handle));
+        }
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+        Data->SetArrayField(TEXT("handles"), Handles);
+        SendReply(FMyReply::Success(Result + TEXT("\n"), Data));
+        return;
+    }
+
+    // 여러 액터 트랜스폼 일괄 적용 (형식은 MyTransformBatch.h)
+    if (Command.StartsWith(TEXT("SET_TRANSFORMS ")))
+    {
+        MyCommandTokenizer::FTokens Tokens;
+        Tokens.Parse(Command);
+
+        MyTransformBatch::FRequest Request;
+        FString Error;
+        if (!MyTransformBatch::Parse(Tokens, Request, Error))
+        {
+            SendToClient(TEXT("ERR Args\n")); return;
+        }
+
+        TArray<FString> Missing;
+        const int32 Applied = MyTransformBatch::Apply(ActorIndex, Request, Missing);
+        if (GEditor) GEditor->RedrawLevelEditingViewports();   // 뷰포트 갱신은 전부 적용한 뒤 한 번
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"applied","total","missing"}
+        Data->SetNumberField(TEXT("applied"), Applied);
+        Data->SetNumberField(TEXT("total"), Request.Entries.Num());
+        Data->SetArrayField(TEXT("missing"), MyReply::Strings(Missing));
+        SendReply(FMyReply::Success(FString::Printf(TEXT("OK SetTransforms %d/%d\n"), Applied, Request.Entries.Num()), Data));
+        return;
+    }
+
+    // 상대 트랜스폼 (형식은 MyTransformBatch.h) → 적용 후 값
+    if (Command.StartsWith(TEXT("MOVE_BY ")) || Command.StartsWith(TEXT("ROTATE_BY ")) || Command.StartsWith(TEXT("SCALE_MUL ")))
+    {
+        MyCommandTokenizer::FTokens Tokens;
+        Tokens.Parse(Command);
+
+        MyTransformBatch::FRequest Request;
+        FString Error;
+        if (!MyTransformBatch::ParseRelative(Tokens, Request, Error))
+        {
+            SendToClient(TEXT("ERR Args\n")); return;
+        }
+
+        TArray<FString> Missing;
+        TArray<AActor*> Applied;
+        MyTransformBatch::Apply(ActorIndex, Request, Missing, &Applied);
+        if (GEditor) GEditor->RedrawLevelEditingViewports();
+        FMyReply Reply;
+        if (CurrentClient && CurrentClient->bJson)
+            Reply.DataJson = MyTransformBatch::BuildJson(ActorIndex, Applied, TEXT("missing"), Missing);
+        else
+            Reply.Text = MyTransformBatch::BuildJson(ActorIndex, Applied, TEXT("missing"), Missing) + TEXT("\n");
+        SendReply(Reply);
+        return;
+    }
+
+    // 머티리얼 하나를 여러 (액터, 슬롯)에 (형식은 MySelectionSets.h)
+    if (Command.StartsWith(TEXT("SET_MATERIAL_MULTI ")))
+    {
+        MyCommandTokenizer::FTokens Tokens;
+        Tokens.Parse(Command);
+
+        FString MaterialPath;
+        TArray<MyGroupOps::FMaterialTarget> Targets;
+        if (!MyGroupOps::ParseMaterialTargets(Tokens, MaterialPath, Targets)) { SendToClient(TEXT("ERR Args\n")); return; }
+
+        UMaterialInterface* NewMaterial = FMyAssetCache::Get().Resolve<UMaterialInterface>(MaterialPath);
+        if (!NewMaterial) { SendToClient(TEXT("ERR LoadFailed\n")); return; }
+
+        const int32 Applied = MyGroupOps::ApplyMaterialTargets(ActorIndex, NewMaterial, Targets);
+        TArray<TSharedPtr<FJsonValue>> Results;   // data: {"path","material","applied","total","results":[{"actor","slot","status"}]}
+        Results.Reserve(Targets.Num());
+        for (const MyGroupOps::FMaterialTarget& Target : Targets)
+        {
+            TSharedPtr<FJsonObject> Item = MakeShared<FJsonObject>();
+            Item->SetStringField(TEXT("actor"), Target.Actor);
+            Item->SetNumberField(TEXT("slot"), Target.Slot);
+            Item->SetStringField(TEXT("status"), MyGroupOps::StatusName(Target.Status));
+            Results.Add(MakeShared<FJsonValueObject>(Item));
+        }
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+        Data->SetStringField(TEXT("path"), NewMaterial->GetPathName());
+        Data->SetStringField(TEXT("material"), NewMaterial->GetName());
+        Data->SetNumberField(TEXT("applied"), Applied);
+        Data->SetNumberField(TEXT("total"), Targets.Num());
+        Data->SetArrayField(TEXT("results"), Results);
+        if (GEditor) GEditor->RedrawLevelEditingViewports();
+        SendReply(FMyReply::Success(FString::Printf(TEXT("OK SetMaterialMulti %d/%d\n"), Applied, Targets.Num()), Data));
+        return;
+    }
+
+    // 선택 집합 / 그룹 명령 (형식은 MySelectionSets.h)
+    if (Command.StartsWith(TEXT("SELECT_SET")) || Command.StartsWith(TEXT("GROUP_")))
+    {
+        MyCommandTokenizer::FTokens Tokens;
+        Tokens.Parse(Command);
+
+        if ((Tokens[0] == "SELECT_SET" || Tokens[0] == "SELECT_SET_ADD" || Tokens[0] == "SELECT_SET_REMOVE") && Tokens.Num() >= 2)
+        {
+            const FString Set = Tokens[1];
+            TArray<FString> Names;
+            Names.Reserve(Tokens.Num() - 2);
+            for (int32 i = 2; i < Tokens.Num(); ++i)
+                Names.Emplace(Tokens[i]);
+
+            TArray<FString> Missing;
+            const int32 Count = Tokens[0] == "SELECT_SET" ? SelectionSets.Define(Set, Names, Missing)
+                : Tokens[0] == "SELECT_SET_ADD" ? SelectionSets.Add(Set, Names, Missing)
+                : SelectionSets.Remove(Set, Names, Missing);
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"set","count","missing"}
+            Data->SetStringField(TEXT("set"), Set);
+            Data->SetNumberField(TEXT("count"), Count);
+            Data->SetArrayField(TEXT("missing"), MyReply::Strings(Missing));
+            SendReply(FMyReply::Success(FString::Printf(TEXT("OK SelectSet %s %d\n"), *Set, Count), Data));
+            return;
+        }
+
+        if (Tokens[0] == "SELECT_SET_CLEAR")
+        {
+            const int32 Count = SelectionSets.Clear(Tokens.Num() >= 2 ? FString(Tokens[1]) : FString());
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"count"}
+            Data->SetNumberField(TEXT("count"), Count);
+            SendReply(FMyReply::Success(FString::Printf(TEXT("OK SelectSetClear %d\n"), Count), Data));
+            return;
+        }
+
+        if (Tokens[0] == "GROUP_MOVE_BY" || Tokens[0] == "GROUP_ROTATE_BY" || Tokens[0] == "GROUP_SCALE_MUL")
+        {
+            MyTransformBatch::FGroupRequest Request;
+            FString Error;
+            if (!MyTransformBatch::ParseGroup(Tokens, Request, Error)) { SendToClient(TEXT("ERR Args\n")); return; }
+
+            TArray<AActor*> Actors;
+            if (!SelectionSets.Resolve(Request.Set, Actors)) { SendToClient(TEXT("ERR NoSet\n")); return; }
+
+            // 응답에는 액터별 값을 싣지 않음 → 보낸 연결도 WATCH 푸시로 결과를 받게
+            FVector Pivot;
+            Watches.SetOrigin(nullptr);
+            const int32 Applied = MyTransformBatch::ApplyGroup(Actors, Request, Pivot);
+            Watches.SetOrigin(CurrentClient);
+            if (GEditor) GEditor->RedrawLevelEditingViewports();
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"set","applied","pivot"?}
+            Data->SetStringField(TEXT("set"), Request.Set);
+            Data->SetNumberField(TEXT("applied"), Applied);
+            if (Request.Pivot != MyTransformBatch::EPivot::None)
+                Data->SetArrayField(TEXT("pivot"), MyReply::Vec3(Pivot));
+            SendReply(FMyReply::Success(FString::Printf(TEXT("OK Group %d\n"), Applied), Data));
+            return;
+        }
+
+        if (Tokens[0] == "GROUP_SET_MATERIAL" && Tokens.Num() >= 4)
+        {
+            const FString Set = Tokens[1];
+            const int32 SlotIndex = FCString::Atoi(*Tokens[2]);
+            FString MaterialPath = Tokens.Join(3);
+            MaterialPath.TrimStartAndEndInline();
+
+            TArray<AActor*> Actors;
+            if (!SelectionSets.Resolve(Set, Actors)) { SendToClient(TEXT("ERR NoSet\n")); return; }
+
+            UMaterialInterface* NewMaterial = FMyAssetCache::Get().Resolve<UMaterialInterface>(MaterialPath);
+            if (!NewMaterial) { SendToClient(TEXT("ERR LoadFailed\n")); return; }
+
+            const int32 Applied = MyGroupOps::SetMaterial(Actors, SlotIndex, NewMaterial);
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"set","slot","applied","total","path"}
+            Data->SetStringField(TEXT("set"), Set);
+            Data->SetNumberField(TEXT("slot"), SlotIndex);
+            Data->SetNumberField(TEXT("applied"), Applied);
+            Data->SetNumberField(TEXT("total"), Actors.Num());
+            Data->SetStringField(TEXT("path"), NewMaterial->GetPathName());
+            SendReply(FMyReply::Success(FString::Printf(TEXT("OK GroupMaterial %d/%d\n"), Applied, Actors.Num()), Data));
+            return;
+        }
+
+        if (Tokens[0] == "GROUP_SET_MOBILITY" && Tokens.Num() >= 3)
+        {
+            const FString Set = Tokens[1];
+            EComponentMobility::Type Mobility;
+            if (!MyGroupOps::ParseMobility(FString(Tokens[2]), Mobility)) { SendToClient(TEXT("ERR Args\n")); return; }
+
+            TArray<AActor*> Actors;
+            if (!SelectionSets.Resolve(Set, Actors)) { SendToClient(TEXT("ERR NoSet\n")); return; }
+
+            const int32 Applied = MyGroupOps::SetMobility(Actors, Mobility);
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"set","applied","mobility"}
+            Data->SetStringField(TEXT("set"), Set);
+            Data->SetNumberField(TEXT("applied"), Applied);
+            Data->SetStringField(TEXT("mobility"), FString(Tokens[2]));
+            SendReply(FMyReply::Success(FString::Printf(TEXT("OK GroupMobility %d\n"), Applied), Data));
+            return;
+        }
+
+        // 아는 명령인데 인자가 모자람 (모르는 SELECT_SET*/GROUP_*는 아래 Unknown으로)
+        if (MakeArrayView(EditorVerbs).ContainsByPredicate([&Tokens](const TCHAR* Verb) { return Tokens[0] == Verb; }))
+        {
+            SendToClient(TEXT("ERR Args\n")); return;
+        }
+    }
+
     UE_LOG(UE_LOG_TAG, Warning, TEXT("⚠️ 알 수 없는 명령: %s"), *Command);
     SendToClient(TEXT("ERR Unknown\n"));
 }
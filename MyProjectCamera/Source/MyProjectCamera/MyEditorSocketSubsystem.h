@@ -4,6 +4,13 @@
 #include "EditorSubsystem.h"
 #include "Sockets.h"
 #include "SocketSubsystem.h"
+#include "MyActorIndex.h"
+#include "MyActorWatch.h"
+#include "MySelectionSets.h"
+#include "MySocketProtocol.h"
+#include "MyReply.h"
+#include "MySocketStats.h"
+#include "MyEditorSocketWorker.h"
 
 #include "MyEditorSocketSubsystem.generated.h"
 
@@ -16,13 +23,16 @@ public:
     virtual void Initialize(FSubsystemCollectionBase& Collection) override;
     virtual void Deinitialize() override;
     void SendToClient(const FString& Text);
+    void SendReply(const FMyReply& Reply);
 
 private:
     void StartListening(int32 Port);
     void StopListening();
-    void AcceptClients();
-    void PumpClient();
+    bool DrainInbox(float DeltaTime);
+    void HandleInbound(FMyEditorSocketWorker::FInbound& Item);
+    void Broadcast(const FString& Text);
     void HandleIncomingCommand(const FString& Command);
+    void HandleBatch(const TArray<FString>& Commands);
     void ExecPython(const FString& PyCommand);
     bool IsPIEActive() const;
     void OnBeginPIE(const bool bIsSimulating);
@@ -31,7 +41,17 @@ private:
 
 private:
     FSocket* ListenSocket = nullptr;
-    FSocket* ClientSocket = nullptr;
-
-    FTSTicker::FDelegateHandle TickerHandle;   // 0.1s Accept/Pump
+    FMySocketStats Stats{ TEXT("EDITOR"), TEXT("messages") };   // STATS (Ŀ   Ŀ  , ť  = ó  ޽ )
+    TUniquePtr<FMyEditorSocketWorker> Worker;                   // Accept/Recv  
+    std::atomic<bool> bDrainArmed{ false };                     //  ó ticker ɷ ִ
+    MySocketProtocol::FClientList Clients;                      //   Ŭ̾Ʈ (   , SWITCH ˸)
+    MySocketProtocol::FClientConnection* CurrentClient = nullptr; //  ó   ۽   
+    FMyActorIndex ActorIndex;     // ̸   ؽ ȸ ( )
+    FMyActorWatch Watches{ ActorIndex, Stats };   // WATCH Ʈ  Ǫ 
+    FMySelectionSets SelectionSets{ ActorIndex };  // SELECT_SET ̸ ִ   (GROUP_*  )
+    bool bLastReplyOk = true;     //      (ɺ   )
+    TArray<uint8> BatchOut;       // BATCH   SendToClient  Ƶδ 
+    bool bCollectingBatch = false;
+    FString CurrentVerb;          // ó   ù ū (JSON  "verb")
+    FString CurrentRequestId;     // ó   "@<id>" (SendToClient   ȸ)
 };
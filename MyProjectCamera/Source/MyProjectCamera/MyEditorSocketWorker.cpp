@@ -0,0 +1,129 @@
+#include "MyEditorSocketWorker.h"
+#include "MySocketStats.h"
+#include "Sockets.h"
+#include "HAL/RunnableThread.h"
+
+// 소켓 하나만 볼 때 최대 대기 시간 (종료 요청 / 새 접속 확인 주기)
+static constexpr double MaxWaitMs = 20.0;
+
+FMyEditorSocketWorker::FMyEditorSocketWorker(FSocket* InListenSocket, FMySocketStats& InStats, TFunction<void()> InOnWork)
+    : ListenSocket(InListenSocket)
+    , Stats(InStats)
+    , OnWork(MoveTemp(InOnWork))
+{
+    Thread = FRunnableThread::Create(this, TEXT("MyEditorSocketWorker"), 0, TPri_BelowNormal);
+}
+
+FMyEditorSocketWorker::~FMyEditorSocketWorker()
+{
+    if (Thread)
+    {
+        Stop();
+        Thread->WaitForCompletion();
+        delete Thread;
+        Thread = nullptr;
+    }
+    MySocketProtocol::CloseAll(Clients);
+}
+
+uint32 FMyEditorSocketWorker::Run()
+{
+    FString Line;
+    TArray<FString> Commands;
+    MySocketProtocol::FBinaryPacketView Packet;
+    bool bWaitTimedOut = false;
+
+    while (!bStopping)
+    {
+        bool bPosted = false;
+
+        const int32 Before = Clients.Num();
+        MySocketProtocol::AcceptPending(ListenSocket, Clients, TEXT("EditorClient"));
+        for (int32 i = Before; i < Clients.Num(); ++i)
+        {
+            Post(FInbound::EType::Connected, Clients[i]);
+            bPosted = true;
+        }
+
+        MySocketProtocol::FClientList Removed;
+        MySocketProtocol::RemoveDisconnected(Clients, &Removed);
+        for (const MySocketProtocol::FClientRef& Client : Removed)
+        {
+            Post(FInbound::EType::Disconnected, Client);
+            bPosted = true;
+        }
+
+        // 받은 바이트를 명령 단위로 잘라 전부 큐에 넣음 (실행 시간 예산은 게임 스레드 쪽에서 적용)
+        for (const MySocketProtocol::FClientRef& Client : Clients)
+        {
+            Stats.AddBytesIn(MySocketProtocol::ReadAvailable(*Client));
+            // 개행 없는 꼬리(구버전 클라)는 대기 한 번이 조용히 끝난 뒤에만 명령으로 처리
+            Client->bIdleTail = Client->bIdleTail && bWaitTimedOut;
+
+            MySocketProtocol::EMessageKind Kind;
+            while ((Kind = MySocketProtocol::NextMessage(*Client, Line, Commands, Packet)) != MySocketProtocol::EMessageKind::None)
+            {
+                FInbound Item;
+                Item.Client = Client;
+                Item.Kind = Kind;
+                Item.Line = MoveTemp(Line);
+                Item.Commands = MoveTemp(Commands);
+                Enqueue(MoveTemp(Item));
+                Line.Reset();
+                Commands.Reset();
+                bPosted = true;
+            }
+        }
+
+        if (bPosted)
+        {
+            OnWork();
+            bWaitTimedOut = false;
+        }
+        else
+        {
+            bWaitTimedOut = !WaitForActivity();
+        }
+    }
+    return 0;
+}
+
+void FMyEditorSocketWorker::Post(FInbound::EType Type, const MySocketProtocol::FClientRef& Client)
+{
+    FInbound Item;
+    Item.Type = Type;
+    Item.Client = Client;
+    Enqueue(MoveTemp(Item));
+}
+
+void FMyEditorSocketWorker::Enqueue(FInbound&& Item)
+{
+    ++NumQueued;
+    Inbox.Enqueue(MoveTemp(Item));
+}
+
+// 읽을 게 생기거나 새 접속이 올 때까지 블로킹 대기 (시간 초과면 false)
+// (FSocket에는 여러 소켓을 한 번에 기다리는 select가 없어서 소켓마다 나눠서 대기)
+bool FMyEditorSocketWorker::WaitForActivity()
+{
+    if (Clients.Num() == 0)
+    {
+        bool bPending = false;
+        return ListenSocket->WaitForPendingConnection(bPending, FTimespan::FromMilliseconds(MaxWaitMs)) && bPending;
+    }
+
+    const FTimespan Slice = FTimespan::FromMilliseconds(FMath::Max(1.0, MaxWaitMs / Clients.Num()));
+    for (const MySocketProtocol::FClientRef& Client : Clients)
+    {
+        if (!Client->Socket->Wait(ESocketWaitConditions::WaitForRead, Slice))
+            continue;
+
+        // 읽기 가능인데 쌓인 데이터가 없으면 상대가 연결을 정상 종료한 것 (HasPendingData로는 구분 안 됨)
+        uint8 Probe = 0;
+        int32 Read = 0;
+        if (!Client->Socket->Recv(&Probe, 1, Read, ESocketReceiveFlags::Peek) || Read <= 0)
+            Client->bClosed = true;
+        return true;
+    }
+    return false;
+}
@@ -0,0 +1,60 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "HAL/Runnable.h"
+#include "Containers/Queue.h"
+#include "MySocketProtocol.h"
+
+class FRunnableThread;
+class FMySocketStats;
+
+// 에디터 소켓(9998) 수신 스레드
+//  - Accept / Recv / 명령 경계 분리는 이 스레드에서, 명령 실행과 응답 전송은 게임 스레드에서
+//  - 소켓에서 블로킹 대기(FSocket::Wait)하다가 명령이 완성되면 lock-free 큐에 넣고 OnWork로 게임 스레드를 깨움
+//  - 연결 목록(Clients)과 수신 버퍼는 이 스레드 전용, 게임 스레드는 Connected/Disconnected 이벤트로 자기 목록을 유지
+class FMyEditorSocketWorker : public FRunnable
+{
+public:
+    struct FInbound
+    {
+        enum class EType : uint8 { Connected, Disconnected, Message };
+
+        EType Type = EType::Message;
+        MySocketProtocol::FClientRef Client;
+        MySocketProtocol::EMessageKind Kind = MySocketProtocol::EMessageKind::None;
+        FString Line;               // Kind == Line
+        TArray<FString> Commands;   // Kind == Batch
+    };
+
+    // OnWork: 큐에 새 항목을 넣은 뒤 워커 스레드에서 호출됨
+    // Stats: 수신 바이트만 이 스레드에서 기록 (워커보다 오래 살아 있어야 함)
+    FMyEditorSocketWorker(FSocket* InListenSocket, FMySocketStats& InStats, TFunction<void()> InOnWork);
+    virtual ~FMyEditorSocketWorker() override;
+
+    // 게임 스레드 전용 (단일 소비자)
+    bool Dequeue(FInbound& Out)
+    {
+        if (!Inbox.Dequeue(Out)) return false;
+        --NumQueued;
+        return true;
+    }
+    bool HasPending() const { return !Inbox.IsEmpty(); }
+    int32 NumPending() const { return NumQueued; }   // 큐 깊이 (STATS)
+
+    virtual uint32 Run() override;
+    virtual void Stop() override { bStopping = true; }
+
+private:
+    void Post(FInbound::EType Type, const MySocketProtocol::FClientRef& Client);
+    void Enqueue(FInbound&& Item);
+    bool WaitForActivity();
+
+    FSocket* ListenSocket = nullptr;
+    FMySocketStats& Stats;
+    TFunction<void()> OnWork;
+    MySocketProtocol::FClientList Clients;
+    TQueue<FInbound, EQueueMode::Spsc> Inbox;
+    std::atomic<int32> NumQueued{ 0 };
+    std::atomic<bool> bStopping{ false };
+    FRunnableThread* Thread = nullptr;
+};
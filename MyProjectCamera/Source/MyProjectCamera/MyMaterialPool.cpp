@@ -0,0 +1,143 @@
+#include "MyMaterialPool.h"
+#include "MyAssetCache.h"
+#include "MyCommandTokenizer.h"
+#include "MySocketLog.h"
+#include "Components/MeshComponent.h"
+#include "Engine/Texture.h"
+#include "GameFramework/Actor.h"
+#include "Materials/MaterialInstanceDynamic.h"
+
+UMaterialInstanceDynamic* FMyMaterialPool::Acquire(UMeshComponent* Component, int32 Slot)
+{
+    if (!Component || Slot < 0 || Component->GetNumMaterials() <= Slot)
+        return nullptr;
+
+    UMaterialInterface* Current = Component->GetMaterial(Slot);
+    const FKey Key(Component, Slot);
+    if (FEntry* Entry = Entries.Find(Key))
+    {
+        UMaterialInstanceDynamic* Instance = Entry->Instance.Get();
+        if (Instance && Instance == Current)
+            return Instance;   // 재사용: 파라미터만 바꾸면 됨
+        // 슬롯이 다른 머티리얼로 바뀜 → 아래에서 새 부모로 다시 만듦
+    }
+    if (!Current)
+        return nullptr;
+
+    // 이미 MID가 들어 있으면 (블루프린트 등에서 만든 것) 그대로 채택 → 해제 때 건드리지 않음 (다른 코드가 넣은 파라미터 유지)
+    UMaterialInstanceDynamic* Instance = Cast<UMaterialInstanceDynamic>(Current);
+    const bool bOwned = Instance == nullptr;
+    if (bOwned)
+    {
+        Instance = UMaterialInstanceDynamic::Create(Current, Component);
+        Component->SetMaterial(Slot, Instance);
+    }
+
+    FEntry& Entry = Entries.Add(Key);
+    Entry.Component = Component;
+    Entry.Instance = Instance;
+    Entry.Original = Current;
+    Entry.bOwned = bOwned;
+    MYSOCKET_LOG(Verbose, Log, TEXT("🎨 MID 생성: %s #%d (풀 %d개)"), *Component->GetName(), Slot, Entries.Num());
+    return Instance;
+}
+
+int32 FMyMaterialPool::Release(AActor* Actor, int32 Slot)
+{
+    int32 Count = 0;
+    for (auto It = Entries.CreateIterator(); It; ++It)
+    {
+        FEntry& Entry = It.Value();
+        UMeshComponent* Component = Entry.Component.Get();
+        if (!Component)
+        {
+            It.RemoveCurrent();   // 파괴된 컴포넌트 정리
+            continue;
+        }
+        if ((Actor && Component->GetOwner() != Actor) || (Slot != INDEX_NONE && It.Key().Value != Slot))
+            continue;
+
+        // 풀이 만든 MID가 슬롯에 아직 있을 때만 되돌림 (그 사이 다른 머티리얼로 바뀌었거나 채택한 MID면 그대로 둠)
+        UMaterialInstanceDynamic* Instance = Entry.Instance.Get();
+        if (Entry.bOwned && Instance && Component->GetMaterial(It.Key().Value) == Instance)
+        {
+            Component->SetMaterial(It.Key().Value, Entry.Original.Get());
+            ++Count;
+        }
+        It.RemoveCurrent();
+    }
+    return Count;
+}
+
+namespace MyMaterialParams
+{
+    bool Parse(const MyCommandTokenizer::FTokens& Tokens, int32 From, TArray<FParam>& OutParams)
+    {
+        int32 t = From;
+        while (t < Tokens.Num())
+        {
+            if (t + 2 >= Tokens.Num())
+                return false;
+
+            FParam& Param = OutParams.AddDefaulted_GetRef();
+            Param.Name = FName(*Tokens[t + 1]);
+            if (Tokens[t].Equals(TEXT("T"), ESearchCase::IgnoreCase))
+            {
+                Param.Type = EType::Texture;
+                Param.Path = FString(Tokens[t + 2]).TrimStartAndEnd();
+                t += 3;
+            }
+            else if (Tokens[t].Equals(TEXT("S"), ESearchCase::IgnoreCase))
+            {
+                Param.Type = EType::Scalar;
+                Param.Scalar = FCString::Atof(*Tokens[t + 2]);
+                t += 3;
+            }
+            else if (Tokens[t].Equals(TEXT("V"), ESearchCase::IgnoreCase))
+            {
+                if (t + 5 >= Tokens.Num())
+                    return false;
+                Param.Type = EType::Vector;
+                Param.Vector = FLinearColor(FCString::Atof(*Tokens[t + 2]), FCString::Atof(*Tokens[t + 3]),
+                    FCString::Atof(*Tokens[t + 4]), FCString::Atof(*Tokens[t + 5]));
+                t += 6;
+            }
+            else
+            {
+                return false;
+            }
+        }
+        return OutParams.Num() > 0;
+    }
+
+    int32 Apply(UMaterialInstanceDynamic* Instance, TConstArrayView<FParam> Params, TArray<FString>& OutFailed)
+    {
+        int32 Count = 0;
+        for (const FParam& Param : Params)
+        {
+            switch (Param.Type)
+            {
+            case EType::Texture:
+                if (UTexture* Texture = FMyAssetCache::Get().Resolve<UTexture>(Param.Path))
+                {
+                    Instance->SetTextureParameterValue(Param.Name, Texture);
+                    ++Count;
+                }
+                else
+                {
+                    OutFailed.Add(Param.Name.ToString());
+                }
+                break;
+            case EType::Scalar:
+                Instance->SetScalarParameterValue(Param.Name, Param.Scalar);
+                ++Count;
+                break;
+            case EType::Vector:
+                Instance->SetVectorParameterValue(Param.Name, Param.Vector);
+                ++Count;
+                break;
+            }
+        }
+        return Count;
+    }
+}
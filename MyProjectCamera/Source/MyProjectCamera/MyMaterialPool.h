@@ -0,0 +1,69 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "UObject/ObjectKey.h"
+#include "UObject/WeakObjectPtrTemplates.h"
+
+class AActor;
+class UMaterialInterface;
+class UMaterialInstanceDynamic;
+class UMeshComponent;
+namespace MyCommandTokenizer { class FTokens; }
+
+// 동적 머티리얼 인스턴스(MID) 풀: (컴포넌트, 슬롯)마다 MID 하나를 만들어 두고 재사용 (9999 PIE, 게임 스레드 전용)
+//
+//  SET_TEXTURE <액터> <슬롯> <파라미터> <경로>
+//  SET_MATERIAL_PARAMS <액터> <슬롯> T <이름> <경로> | S <이름> <값> | V <이름> r g b a ...
+//  → {"actor","slot","set","failed":[...]}   (failed = 로드 못 한 텍스처 파라미터 이름)
+//  RELEASE_MID [<액터> [<슬롯>]]   → 원래 머티리얼로 되돌리고 풀에서 뺌 (인자가 없으면 전부) → {"count"}
+//  - 텍스처를 여러 번 바꿔 봐도 MID는 슬롯당 1개 → 바꿀 때마다 파라미터 쓰기만 (새 오브젝트 없음)
+//  - 다른 명령(SET_MATERIAL 등)이 슬롯을 바꿨으면 다음 요청 때 새 머티리얼을 부모로 다시 만듦
+//  - 슬롯에 이미 MID가 있으면(블루프린트 등) 새로 만들지 않고 채택, RELEASE_MID는 풀이 만든 MID만 되돌림
+//  - MID는 컴포넌트가 들고 있으니 여기선 약참조만 (컴포넌트가 파괴되면 항목은 다음 해제 때 정리)
+class FMyMaterialPool
+{
+public:
+    // 슬롯의 MID (없으면 만들어서 슬롯에 넣음). 슬롯이 없거나 머티리얼이 비었으면 nullptr
+    UMaterialInstanceDynamic* Acquire(UMeshComponent* Component, int32 Slot);
+
+    // Actor가 nullptr이면 전부, Slot이 INDEX_NONE이면 그 액터의 모든 슬롯 → 되돌린 수 (채택한 MID는 풀에서만 뺌)
+    int32 Release(AActor* Actor, int32 Slot = INDEX_NONE);
+
+    // 되돌리지 않고 항목만 비움 (월드가 내려갈 때)
+    void Reset() { Entries.Reset(); }
+    int32 Num() const { return Entries.Num(); }
+
+private:
+    using FKey = TPair<TObjectKey<UMeshComponent>, int32>;
+
+    struct FEntry
+    {
+        TWeakObjectPtr<UMeshComponent> Component;
+        TWeakObjectPtr<UMaterialInstanceDynamic> Instance;
+        TWeakObjectPtr<UMaterialInterface> Original;   // 풀이 MID를 넣기 전 슬롯 머티리얼 (되돌릴 값)
+        bool bOwned = false;   // 풀이 만든 MID인지 (이미 있던 MID를 채택했으면 해제 때 되돌리지 않음)
+    };
+
+    TMap<FKey, FEntry> Entries;
+};
+
+// SET_MATERIAL_PARAMS 파라미터 목록
+namespace MyMaterialParams
+{
+    enum class EType : uint8 { Texture, Scalar, Vector };
+
+    struct FParam
+    {
+        EType Type = EType::Scalar;
+        FName Name;
+        FString Path;        // Texture
+        float Scalar = 0.f;  // Scalar
+        FLinearColor Vector = FLinearColor::Black;   // Vector
+    };
+
+    // Tokens[From]부터 "T 이름 경로 | S 이름 값 | V 이름 r g b a" 반복. 형식이 틀리면 false
+    bool Parse(const MyCommandTokenizer::FTokens& Tokens, int32 From, TArray<FParam>& OutParams);
+
+    // 텍스처는 에셋 캐시로 해석, 로드 못 한 파라미터 이름은 OutFailed → 쓴 파라미터 수
+    int32 Apply(UMaterialInstanceDynamic* Instance, TConstArrayView<FParam> Params, TArray<FString>& OutFailed);
+}
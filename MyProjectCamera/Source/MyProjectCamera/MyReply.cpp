@@ -0,0 +1,130 @@
+#include "MyReply.h"
+#include "Dom/JsonValue.h"
+#include "Policies/CondensedJsonPrintPolicy.h"
+#include "Serialization/JsonSerializer.h"
+#include "Serialization/JsonWriter.h"
+
+namespace
+{
+    using FCondensedWriterFactory = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>;
+
+    // 에디터 서버 "ERR <종류>" → 상태 코드
+    int32 EditorErrorCode(const FString& Error)
+    {
+        static const TMap<FString, int32> Codes = {
+            { TEXT("Args"),            FMyReply::BadRequest },
+            { TEXT("PyArgs"),          FMyReply::BadRequest },
+            { TEXT("Binary"),          FMyReply::BadRequest },
+            { TEXT("BatchNeedsProto"), FMyReply::BadRequest },
+            { TEXT("BatchTooMany"),    FMyReply::BadRequest },
+            { TEXT("BatchTooLarge"),   FMyReply::BadRequest },
+            { TEXT("BatchCount"),      FMyReply::BadRequest },
+            { TEXT("WatchNeedsProto"), FMyReply::BadRequest },
+            { TEXT("NotFound"),        FMyReply::NotFound },
+            { TEXT("LoadFailed"),      FMyReply::NotFound },
+            { TEXT("LoadMesh"),        FMyReply::NotFound },
+            { TEXT("NoSet"),           FMyReply::NotFound },
+            { TEXT("PIE"),             FMyReply::Conflict },
+            { TEXT("NoWorld"),         FMyReply::Conflict },
+            { TEXT("NoSMC"),           FMyReply::Conflict },
+            { TEXT("Unknown"),         FMyReply::Unknown },
+        };
+        const int32* Found = Codes.Find(Error);
+        return Found ? *Found : FMyReply::Failed;
+    }
+}
+
+FMyReply FMyReply::Success(FString InText, TSharedPtr<FJsonObject> InData)
+{
+    FMyReply Reply;
+    Reply.Text = MoveTemp(InText);
+    Reply.Data = MoveTemp(InData);
+    return Reply;
+}
+
+FMyReply FMyReply::Fail(int32 InCode, const TCHAR* InError, FString InText)
+{
+    FMyReply Reply;
+    Reply.Code = InCode;
+    Reply.Error = InError;
+    Reply.Text = MoveTemp(InText);
+    return Reply;
+}
+
+FMyReply FMyReply::FromEditorText(const FString& InText)
+{
+    if (!InText.StartsWith(TEXT("ERR "), ESearchCase::CaseSensitive))
+        return Success(InText);
+
+    FString Error = InText.Mid(4);
+    Error.TrimStartAndEndInline();
+    const int32 Code = EditorErrorCode(Error);
+    return Fail(Code, *Error, InText);
+}
+
+FString FMyReply::Render(const FString& Verb, bool bJson) const
+{
+    if (!bJson)
+        return Text;
+
+    FString Out;
+    {
+        TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> W = FCondensedWriterFactory::Create(&Out);
+        W->WriteObjectStart();
+        W->WriteValue(TEXT("ok"), IsOk());
+        W->WriteValue(TEXT("code"), Code);
+        W->WriteValue(TEXT("verb"), Verb);
+        if (!IsOk())
+            W->WriteValue(TEXT("error"), Error);
+        if (!Text.IsEmpty())
+            W->WriteValue(TEXT("message"), Text.TrimEnd());
+        W->WriteObjectEnd();
+        W->Close();
+    }
+
+    // data는 봉투 뒤에 이어 붙임 (GET_ACTOR_STATE 같은 대용량 JSON을 DOM으로 다시 읽지 않도록)
+    FString DataOut;
+    const FString* Payload = &DataJson;
+    if (Data.IsValid())
+    {
+        TSharedRef<TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>> W = FCondensedWriterFactory::Create(&DataOut);
+        FJsonSerializer::Serialize(Data.ToSharedRef(), W);
+        Payload = &DataOut;
+    }
+    if (!Payload->IsEmpty())
+    {
+        Out.LeftChopInline(1);   // 닫는 '}'
+        Out += TEXT(",\"data\":");
+        Out += *Payload;
+        Out += TEXT("}");
+    }
+    return Out;
+}
+
+namespace MyReply
+{
+    FString VerbOf(const FString& Command)
+    {
+        int32 Space = INDEX_NONE;
+        return Command.FindChar(TEXT(' '), Space) ? Command.Left(Space) : Command;
+    }
+
+    TArray<TSharedPtr<FJsonValue>> Vec3(const FVector& V)
+    {
+        return { MakeShared<FJsonValueNumber>(V.X), MakeShared<FJsonValueNumber>(V.Y), MakeShared<FJsonValueNumber>(V.Z) };
+    }
+
+    TArray<TSharedPtr<FJsonValue>> Rot3(const FRotator& R)
+    {
+        return { MakeShared<FJsonValueNumber>(R.Pitch), MakeShared<FJsonValueNumber>(R.Yaw), MakeShared<FJsonValueNumber>(R.Roll) };
+    }
+
+    TArray<TSharedPtr<FJsonValue>> Strings(const TArray<FString>& Values)
+    {
+        TArray<TSharedPtr<FJsonValue>> Out;
+        Out.Reserve(Values.Num());
+        for (const FString& Value : Values)
+            Out.Add(MakeShared<FJsonValueString>(Value));
+        return Out;
+    }
+}
@@ -0,0 +1,54 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "Dom/JsonObject.h"
+
+// 명령 응답 1개 (9999 PIE / 9998 EDITOR 공용)
+//
+//  텍스트 모드(기본):  Text를 그대로 전송 (구버전 클라이언트 호환)
+//  JSON 모드:  연결에서 "FORMAT JSON"을 협상하면 응답마다 JSON 한 줄
+//    {"ok":true,"code":200,"verb":"GET_LOCATION","data":{"actor":"Cube","location":[0,0,100]}}
+//    {"ok":false,"code":404,"verb":"MOVE","error":"NotFound","message":"❌ 'Cube' 이름의 액터를 찾을 수 없음"}
+//  - code:    200 성공 / 400 인자 오류 / 404 액터·에셋 없음 / 409 지금 상태에서 불가 / 500 실행 실패 / 501 모르는 명령
+//  - error:   code보다 세분화된 영문 식별자 (클라이언트는 문구 대신 code/error로 분기)
+//  - message: 사람용 문구 (Text가 있을 때만. 목록형 응답은 JSON 모드에서 Text를 만들지 않음)
+//  - data:    명령별 payload (필드는 각 명령 처리부 주석 참고)
+struct FMyReply
+{
+    enum ECode : int32
+    {
+        Ok = 200,
+        BadRequest = 400,
+        NotFound = 404,
+        Conflict = 409,
+        Failed = 500,
+        Unknown = 501,
+    };
+
+    int32 Code = Ok;
+    FString Error;
+    FString Text;
+    TSharedPtr<FJsonObject> Data;
+    FString DataJson;     // 이미 직렬화된 data (GET_ACTOR_STATE처럼 DOM 없이 만든 것)
+
+    bool IsOk() const { return Code < 400; }
+
+    static FMyReply Success(FString InText, TSharedPtr<FJsonObject> InData = nullptr);
+    static FMyReply Fail(int32 InCode, const TCHAR* InError, FString InText);
+
+    // 에디터 서버의 "OK X" / "ERR X" / 데이터 텍스트 → 같은 의미의 응답 (ERR 종류별로 코드 매핑)
+    static FMyReply FromEditorText(const FString& InText);
+
+    // bJson이면 JSON 봉투, 아니면 Text
+    FString Render(const FString& Verb, bool bJson) const;
+};
+
+namespace MyReply
+{
+    // 명령 문자열의 첫 토큰 ("@id"는 이미 떼어낸 상태)
+    FString VerbOf(const FString& Command);
+
+    TArray<TSharedPtr<FJsonValue>> Vec3(const FVector& V);
+    TArray<TSharedPtr<FJsonValue>> Rot3(const FRotator& R);
+    TArray<TSharedPtr<FJsonValue>> Strings(const TArray<FString>& Values);
+}
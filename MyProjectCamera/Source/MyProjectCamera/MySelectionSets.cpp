@@ -0,0 +1,229 @@
+#include "MySelectionSets.h"
+#include "MyActorIndex.h"
+#include "MyCommandTokenizer.h"
+#include "MySocketLog.h"
+#include "GameFramework/Actor.h"
+#include "Components/SceneComponent.h"
+#include "Components/StaticMeshComponent.h"
+#include "Materials/MaterialInterface.h"
+
+int32 FMySelectionSets::AddTo(FSet& Target, TConstArrayView<FString> Names, TArray<FString>& OutMissing)
+{
+    Target.Members.Reserve(Target.Members.Num() + Names.Num());
+    for (const FString& Name : Names)
+    {
+        AActor* Actor = Index.FindByName(Name);
+        if (!Actor)
+        {
+            OutMissing.Add(Name);
+            continue;
+        }
+        bool bAlready = false;
+        Target.Keys.Add(Actor, &bAlready);
+        if (!bAlready)
+            Target.Members.Add(Actor);
+    }
+    return Target.Members.Num();
+}
+
+int32 FMySelectionSets::Define(const FString& Set, TConstArrayView<FString> Names, TArray<FString>& OutMissing)
+{
+    FSet& Target = Sets.Add(Set);   // 있으면 비운 새 값으로 교체
+    const int32 Count = AddTo(Target, Names, OutMissing);
+    MYSOCKET_LOG(Verbose, Log, TEXT("🧺 선택 집합 '%s': %d개"), *Set, Count);
+    return Count;
+}
+
+int32 FMySelectionSets::Add(const FString& Set, TConstArrayView<FString> Names, TArray<FString>& OutMissing)
+{
+    return AddTo(Sets.FindOrAdd(Set), Names, OutMissing);
+}
+
+int32 FMySelectionSets::Remove(const FString& Set, TConstArrayView<FString> Names, TArray<FString>& OutMissing)
+{
+    FSet* Target = Sets.Find(Set);
+    if (!Target)
+    {
+        OutMissing.Append(Names.GetData(), Names.Num());
+        return 0;
+    }
+
+    TSet<TObjectKey<AActor>> Removed;
+    for (const FString& Name : Names)
+    {
+        AActor* Actor = Index.FindByName(Name);
+        if (Actor && Target->Keys.Remove(Actor) > 0)
+            Removed.Add(Actor);
+        else
+            OutMissing.Add(Name);
+    }
+    // 한 패스로 정리 (멤버 수천 개에서 이름마다 RemoveSingle 하지 않게)
+    if (Removed.Num() > 0)
+    {
+        Target->Members.RemoveAll([&Removed](const TWeakObjectPtr<AActor>& Member)
+            {
+                return Removed.Contains(TObjectKey<AActor>(Member.Get()));
+            });
+    }
+    return Target->Members.Num();
+}
+
+int32 FMySelectionSets::Clear(const FString& Set)
+{
+    if (Set.IsEmpty())
+    {
+        const int32 Count = Sets.Num();
+        Sets.Reset();
+        return Count;
+    }
+    return Sets.Remove(Set);
+}
+
+bool FMySelectionSets::Resolve(const FString& Set, TArray<AActor*>& OutActors)
+{
+    FSet* Target = Sets.Find(Set);
+    if (!Target)
+        return false;
+
+    OutActors.Reserve(OutActors.Num() + Target->Members.Num());
+    bool bStale = false;
+    for (const TWeakObjectPtr<AActor>& Member : Target->Members)
+    {
+        AActor* Actor = Member.Get();
+        if (IsValid(Actor))
+            OutActors.Add(Actor);
+        else
+            bStale = true;
+    }
+
+    // 파괴된 액터 정리 (약참조가 풀린 키는 다시 맞을 일이 없으니 멤버 배열만 다시 만듦)
+    if (bStale)
+    {
+        Target->Members.RemoveAll([](const TWeakObjectPtr<AActor>& Member) { return !IsValid(Member.Get()); });
+        Target->Keys.Reset();
+        for (const TWeakObjectPtr<AActor>& Member : Target->Members)
+            Target->Keys.Add(Member.Get());
+    }
+    return true;
+}
+
+bool FMySelectionSets::ParseSetRef(const FString& Ref, FString& OutSet)
+{
+    if (Ref.Len() < 2 || Ref[0] != TEXT('$'))
+        return false;
+    OutSet = Ref.Mid(1);
+    return true;
+}
+
+namespace MyGroupOps
+{
+    FVector Center(TConstArrayView<AActor*> Actors)
+    {
+        if (Actors.IsEmpty())
+            return FVector::ZeroVector;
+
+        FBox Box(ForceInit);
+        for (const AActor* Actor : Actors)
+            Box += Actor->GetActorLocation();
+        return Box.GetCenter();
+    }
+
+    // 슬롯이 있는 StaticMeshComponent마다 교체 (MeshComponents는 호출 측이 재사용하는 임시 버퍼)
+    static bool SetMaterialSlot(AActor* Actor, int32 SlotIndex, UMaterialInterface* Material, TArray<UStaticMeshComponent*>& MeshComponents)
+    {
+        MeshComponents.Reset();
+        Actor->GetComponents<UStaticMeshComponent>(MeshComponents);
+
+        bool bApplied = false;
+        for (UStaticMeshComponent* MeshComp : MeshComponents)
+        {
+            if (SlotIndex < 0 || MeshComp->GetNumMaterials() <= SlotIndex) continue;
+            MeshComp->SetMaterial(SlotIndex, Material);
+            bApplied = true;
+        }
+        return bApplied;
+    }
+
+    int32 SetMaterial(TConstArrayView<AActor*> Actors, int32 SlotIndex, UMaterialInterface* Material)
+    {
+        int32 Count = 0;
+        TArray<UStaticMeshComponent*> MeshComponents;
+        for (AActor* Actor : Actors)
+            Count += SetMaterialSlot(Actor, SlotIndex, Material, MeshComponents) ? 1 : 0;
+        return Count;
+    }
+
+    bool ParseMaterialTargets(const MyCommandTokenizer::FTokens& Tokens, FString& OutPath, TArray<FMaterialTarget>& OutTargets)
+    {
+        // 경로 1개 + (액터, 슬롯) 쌍
+        if (Tokens.Num() < 4 || (Tokens.Num() - 2) % 2 != 0)
+            return false;
+
+        OutPath = FString(Tokens[1]).TrimStartAndEnd();
+        OutTargets.SetNum((Tokens.Num() - 2) / 2);
+        int32 t = 2;
+        for (FMaterialTarget& Target : OutTargets)
+        {
+            Target.Actor = FString(Tokens[t]);
+            if (!FCString::IsNumeric(*FString(Tokens[t + 1])))
+                return false;
+            Target.Slot = FCString::Atoi(*Tokens[t + 1]);
+            Target.Status = EMaterialStatus::NotFound;
+            t += 2;
+        }
+        return !OutPath.IsEmpty();
+    }
+
+    int32 ApplyMaterialTargets(FMyActorIndex& Index, UMaterialInterface* Material, TArray<FMaterialTarget>& Targets)
+    {
+        int32 Count = 0;
+        TArray<UStaticMeshComponent*> MeshComponents;
+        for (FMaterialTarget& Target : Targets)
+        {
+            AActor* Actor = Index.FindByName(Target.Actor);
+            if (!Actor)
+            {
+                Target.Status = EMaterialStatus::NotFound;
+                continue;
+            }
+            const bool bApplied = SetMaterialSlot(Actor, Target.Slot, Material, MeshComponents);
+            Target.Status = bApplied ? EMaterialStatus::Ok : EMaterialStatus::NoSlot;
+            Count += bApplied ? 1 : 0;
+        }
+        return Count;
+    }
+
+    const TCHAR* StatusName(EMaterialStatus Status)
+    {
+        switch (Status)
+        {
+        case EMaterialStatus::Ok:     return TEXT("Ok");
+        case EMaterialStatus::NoSlot: return TEXT("NoSlot");
+        default:                      return TEXT("NotFound");
+        }
+    }
+
+    int32 SetMobility(TConstArrayView<AActor*> Actors, EComponentMobility::Type Mobility)
+    {
+        int32 Count = 0;
+        TArray<USceneComponent*> Components;
+        for (AActor* Actor : Actors)
+        {
+            Components.Reset();
+            Actor->GetComponents<USceneComponent>(Components);
+            for (USceneComponent* Comp : Components)
+                Comp->SetMobility(Mobility);
+            Count += Components.Num() > 0 ? 1 : 0;
+        }
+        return Count;
+    }
+
+    bool ParseMobility(const FString& Text, EComponentMobility::Type& OutMobility)
+    {
+        if (Text.Equals(TEXT("Static"), ESearchCase::IgnoreCase))          OutMobility = EComponentMobility::Static;
+        else if (Text.Equals(TEXT("Stationary"), ESearchCase::IgnoreCase)) OutMobility = EComponentMobility::Stationary;
+        else if (Text.Equals(TEXT("Movable"), ESearchCase::IgnoreCase))    OutMobility = EComponentMobility::Movable;
+        else return false;
+        return true;
+    }
+}
@@ -0,0 +1,100 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "Engine/EngineTypes.h"
+
+class AActor;
+class FMyActorIndex;
+class UMaterialInterface;
+namespace MyCommandTokenizer { class FTokens; }
+
+// SELECT_SET: 서버에 저장하는 이름 있는 액터 집합 (9999 PIE / 9998 EDITOR 공용, 게임 스레드 전용)
+//
+//  SELECT_SET <집합> <액터...>          정의 (같은 이름이 있으면 교체)
+//  SELECT_SET_ADD <집합> <액터...>      추가 (없는 집합이면 새로 만듦)
+//  SELECT_SET_REMOVE <집합> <액터...>   빼기
+//  SELECT_SET_CLEAR [<집합>]            삭제 (인자가 없으면 전부)
+//  → {"set","count","missing":[...]} (CLEAR는 {"count"} = 지운 집합 수)
+//
+//  그룹 명령은 액터 목록 대신 집합 이름 하나만 보냄 → 2,000개 선택이어도 제스처당 짧은 한 줄
+//  GROUP_MOVE_BY <집합> dx dy dz
+//  GROUP_ROTATE_BY <집합> dp dy dr [PIVOT CENTER | PIVOT x y z]
+//  GROUP_SCALE_MUL <집합> fx fy fz [PIVOT CENTER | PIVOT x y z]
+//  GROUP_SET_MATERIAL <집합> <슬롯> <경로>
+//  GROUP_SET_MOBILITY <집합> Static|Stationary|Movable
+//  CAM_LOOKAT / CAM_TRACK_START <카메라> $<집합>   → 집합 중심 (9999)
+//  - PIVOT이 없으면 액터마다 자기 원점 기준, 있으면 위치도 피벗 기준으로 같이 회전/확대 (그룹이 한 덩어리로)
+//  - 집합은 서버(포트)마다 따로, 액터는 약참조 (파괴된 액터는 조회 때 빠짐)
+//  - 집합 이름은 대소문자 무시
+class FMySelectionSets
+{
+public:
+    explicit FMySelectionSets(FMyActorIndex& InIndex) : Index(InIndex) {}
+
+    // 멤버 수 반환, 못 찾은 액터는 OutMissing
+    int32 Define(const FString& Set, TConstArrayView<FString> Names, TArray<FString>& OutMissing);
+    int32 Add(const FString& Set, TConstArrayView<FString> Names, TArray<FString>& OutMissing);
+    int32 Remove(const FString& Set, TConstArrayView<FString> Names, TArray<FString>& OutMissing);
+
+    // 지운 집합 수 (Set이 비면 전부)
+    int32 Clear(const FString& Set);
+
+    // 살아 있는 멤버 → OutActors. 없는 집합이면 false
+    bool Resolve(const FString& Set, TArray<AActor*>& OutActors);
+
+    // "$crowd" → "crowd" (형식이 아니면 false)
+    static bool ParseSetRef(const FString& Ref, FString& OutSet);
+
+    void Reset() { Sets.Reset(); }
+    int32 Num() const { return Sets.Num(); }
+
+private:
+    struct FSet
+    {
+        TArray<TWeakObjectPtr<AActor>> Members;
+        TSet<TObjectKey<AActor>> Keys;   // 중복 방지 / 빼기 조회
+    };
+
+    int32 AddTo(FSet& Target, TConstArrayView<FString> Names, TArray<FString>& OutMissing);
+
+    FMyActorIndex& Index;
+    TMap<FString, FSet> Sets;   // FString 키 = 대소문자 무시
+};
+
+// 액터 여러 개에 한 번에 적용하는 그룹 연산 (그룹 명령 / 집합 대상 명령 공용)
+//
+// SET_MATERIAL_MULTI <경로> <액터> <슬롯> [<액터> <슬롯> ...]
+//  → {"path","material","applied","total","results":[{"actor","slot","status":"Ok|NotFound|NoSlot"}]}
+//  - 머티리얼은 한 번만 해석/로드, 대상 전부 한 패스로 적용, 대상별 결과를 응답 하나로
+//  - 경로에 공백이 있으면 따옴표로 ("SET_MATERIAL_MULTI \"/Game/My Mats/M_Foo\" Cube 0 Sphere 1")
+namespace MyGroupOps
+{
+    enum class EMaterialStatus : uint8 { Ok, NotFound, NoSlot };
+
+    struct FMaterialTarget
+    {
+        FString Actor;
+        int32 Slot = 0;
+        EMaterialStatus Status = EMaterialStatus::NotFound;
+    };
+
+    // Tokens[0]은 "SET_MATERIAL_MULTI", Tokens[1]은 경로. 형식이 틀리면 false
+    bool ParseMaterialTargets(const MyCommandTokenizer::FTokens& Tokens, FString& OutPath, TArray<FMaterialTarget>& OutTargets);
+
+    // 대상마다 Status를 채우고 성공한 수 반환
+    int32 ApplyMaterialTargets(FMyActorIndex& Index, UMaterialInterface* Material, TArray<FMaterialTarget>& Targets);
+
+    const TCHAR* StatusName(EMaterialStatus Status);
+
+    // 위치 AABB 중심 (빈 배열이면 원점)
+    FVector Center(TConstArrayView<AActor*> Actors);
+
+    // 슬롯이 있는 StaticMeshComponent마다 교체 → 하나라도 바뀐 액터 수
+    int32 SetMaterial(TConstArrayView<AActor*> Actors, int32 SlotIndex, UMaterialInterface* Material);
+
+    // 액터의 모든 SceneComponent Mobility 변경 → 바꾼 액터 수
+    int32 SetMobility(TConstArrayView<AActor*> Actors, EComponentMobility::Type Mobility);
+
+    // "Static" / "Stationary" / "Movable" (대소문자 무시)
+    bool ParseMobility(const FString& Text, EComponentMobility::Type& OutMobility);
+}
@@ -0,0 +1,73 @@
+#include "MySocketLog.h"
+#include "HAL/IConsoleManager.h"
+
+DEFINE_LOG_CATEGORY(LogMySocket);
+
+static int32 GMySocketLogLevel = MySocketLog::Summary;
+static FAutoConsoleVariableRef CVarLogVerbose(
+    TEXT("MySocket.LogVerbose"),
+    GMySocketLogLevel,
+    TEXT("소켓 서버 명령/응답 로그 레벨. 0 = 끔, 1 = 요약(초당 한도), 2 = 전부"));
+
+static int32 GMySocketLogRateLimit = 20;
+static FAutoConsoleVariableRef CVarLogRateLimit(
+    TEXT("MySocket.LogRateLimit"),
+    GMySocketLogRateLimit,
+    TEXT("로그 레벨 1(요약)에서 초당 남기는 최대 줄 수"));
+
+namespace MySocketLog
+{
+    // 초 단위 창: 창 안에서 한도까지만 통과, 나머지는 개수만 셈 (게임 스레드 전용)
+    static double WindowStart = 0.0;
+    static int32 WindowCount = 0;
+    static int32 Suppressed = 0;
+
+    int32 GetLevel()
+    {
+        return GMySocketLogLevel;
+    }
+
+    void SetLevel(int32 Level)
+    {
+        GMySocketLogLevel = FMath::Clamp(Level, int32(Off), int32(Verbose));
+    }
+
+    bool ShouldLog(int32 Level)
+    {
+        if (Level > GMySocketLogLevel)
+            return false;
+        if (GMySocketLogLevel >= Verbose)
+            return true;
+
+        const double Now = FPlatformTime::Seconds();
+        if (Now - WindowStart >= 1.0)
+        {
+            if (Suppressed > 0)
+                UE_LOG(LogMySocket, Log, TEXT("… 소켓 로그 %d줄 생략 (MySocket.LogRateLimit=%d)"), Suppressed, GMySocketLogRateLimit);
+            WindowStart = Now;
+            WindowCount = 0;
+            Suppressed = 0;
+        }
+        if (WindowCount >= GMySocketLogRateLimit)
+        {
+            ++Suppressed;
+            return false;
+        }
+        ++WindowCount;
+        return true;
+    }
+
+    bool ParseLogVerboseRequest(const FString& Command, int32& OutLevel)
+    {
+        if (!Command.StartsWith(TEXT("LOG_VERBOSE"), ESearchCase::CaseSensitive))
+            return false;
+
+        TArray<FString> Tokens;
+        Command.ParseIntoArrayWS(Tokens);
+        if (Tokens.Num() < 2 || Tokens[0] != TEXT("LOG_VERBOSE") || !Tokens[1].IsNumeric())
+            return false;
+
+        OutLevel = FMath::Clamp(FCString::Atoi(*Tokens[1]), int32(Off), int32(Verbose));
+        return true;
+    }
+}
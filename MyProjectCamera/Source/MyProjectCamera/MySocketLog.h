@@ -0,0 +1,40 @@
+#pragma once
+
+#include "CoreMinimal.h"
+
+DECLARE_LOG_CATEGORY_EXTERN(LogMySocket, Log, All);
+
+// 소켓 서버 명령/응답 로그 (9999 PIE / 9998 EDITOR 공용)
+//
+//  레벨  0 = 끔 (오류/접속 로그만 남음)
+//        1 = 요약 (명령 수신 등을 초당 MySocket.LogRateLimit 줄까지만, 넘친 줄 수는 다음 초에 한 줄로)
+//        2 = 전부 (명령/응답마다, 드래그 스트림 중에는 출력 로그가 병목이 될 수 있음)
+//  - 콘솔 변수 MySocket.LogVerbose 또는 클라이언트 명령 "LOG_VERBOSE <0|1|2>"로 실행 중 전환 (두 서버 공용)
+//  - MYSOCKET_LOG는 레벨/한도를 먼저 보고 통과할 때만 인자를 평가 → 꺼져 있으면 포맷팅 비용 없음
+namespace MySocketLog
+{
+    enum ELevel : int32
+    {
+        Off = 0,
+        Summary = 1,
+        Verbose = 2,
+    };
+
+    int32 GetLevel();
+    void SetLevel(int32 Level);
+
+    // Level 로그를 지금 남겨도 되면 true (Summary는 초당 한도 안에서만)
+    bool ShouldLog(int32 Level);
+
+    // "LOG_VERBOSE <n>" 명령이면 true (OutLevel = 요청 레벨, 범위 밖이면 잘라서)
+    bool ParseLogVerboseRequest(const FString& Command, int32& OutLevel);
+}
+
+#define MYSOCKET_LOG(Level, Verbosity, Format, ...) \
+    do \
+    { \
+        if (MySocketLog::ShouldLog(MySocketLog::Level)) \
+        { \
+            UE_LOG(LogMySocket, Verbosity, Format, ##__VA_ARGS__); \
+        } \
+    } while (0)
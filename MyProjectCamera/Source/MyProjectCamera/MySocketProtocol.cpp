@@ -0,0 +1,425 @@
+#include "MySocketProtocol.h"
+#include "MyReply.h"
+#include "Sockets.h"
+#include "SocketSubsystem.h"
+#include "HAL/IConsoleManager.h"
+
+static TAutoConsoleVariable<float> CVarCommandBudgetMs(
+    TEXT("MySocket.CommandBudgetMs"),
+    4.0f,
+    TEXT("소켓 서버가 틱마다 명령 처리에 쓰는 최대 시간(ms). 남은 명령은 다음 틱으로 이월"));
+
+namespace MySocketProtocol
+{
+    double GetCommandBudgetSeconds()
+    {
+        return FMath::Max(0.f, CVarCommandBudgetMs.GetValueOnGameThread()) * 0.001;
+    }
+
+    bool ParseProtoRequest(const FString& Command, int32& OutVersion)
+    {
+        if (!Command.StartsWith(TEXT("PROTO"), ESearchCase::CaseSensitive))
+            return false;
+
+        TArray<FString> Tokens;
+        Command.ParseIntoArrayWS(Tokens);
+        if (Tokens.Num() < 2 || Tokens[0] != TEXT("PROTO"))
+            return false;
+
+        OutVersion = FCString::Atoi(*Tokens[1]);
+        return true;
+    }
+
+    bool ParseFormatRequest(const FString& Command, bool& bOutJson)
+    {
+        if (!Command.StartsWith(TEXT("FORMAT "), ESearchCase::CaseSensitive))
+            return false;
+
+        const FString Format = Command.Mid(7).TrimStartAndEnd();
+        bOutJson = Format.Equals(TEXT("JSON"), ESearchCase::IgnoreCase);
+        return bOutJson || Format.Equals(TEXT("TEXT"), ESearchCase::IgnoreCase);
+    }
+
+    bool IsHelloRequest(const FString& Command)
+    {
+        const FString Verb = Command.TrimStartAndEnd();
+        return Verb == TEXT("HELLO") || Verb == TEXT("CAPS");
+    }
+
+    FMyReply MakeHelloReply(const FServerCaps& Caps)
+    {
+        TArray<FString> Verbs;
+        Verbs.Reserve(Caps.Verbs.Num());
+        for (const TCHAR* Verb : Caps.Verbs)
+            Verbs.Add(Verb);
+
+        TArray<FString> Binary;   // EBinaryOp 순서
+        if (Caps.bBinary)
+            Binary = { TEXT("MOVE"), TEXT("SCALE"), TEXT("ROTATE") };
+
+        const FString Text = FString::Printf(
+            TEXT("OK HELLO %s proto=%d max_batch=%d max_batch_bytes=%d max_clients=%d binary=%s verbs=%s"),
+            Caps.Kind, Version, MaxBatchCommands, MaxBatchBytes, MaxClients,
+            *FString::Join(Binary, TEXT(",")), *FString::Join(Verbs, TEXT(",")));
+
+        TSharedPtr<FJsonObject> Limits = MakeShared<FJsonObject>();
+        Limits->SetNumberField(TEXT("max_batch"), MaxBatchCommands);
+        Limits->SetNumberField(TEXT("max_batch_bytes"), MaxBatchBytes);
+        Limits->SetNumberField(TEXT("max_clients"), MaxClients);
+
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+        Data->SetStringField(TEXT("kind"), Caps.Kind);
+        Data->SetNumberField(TEXT("proto"), Version);
+        Data->SetArrayField(TEXT("verbs"), MyReply::Strings(Verbs));
+        Data->SetArrayField(TEXT("binary"), MyReply::Strings(Binary));
+        Data->SetObjectField(TEXT("limits"), Limits);
+        return FMyReply::Success(Text, Data);
+    }
+
+    void SplitRequestId(FString& Command, FString& OutId)
+    {
+        OutId.Reset();
+        if (!Command.StartsWith(TEXT("@"), ESearchCase::CaseSensitive))
+            return;
+
+        FString Rest;
+        if (!Command.Split(TEXT(" "), &OutId, &Rest))
+        {
+            OutId = Command;
+            Rest.Reset();
+        }
+        OutId.RightChopInline(1);   // '@' 제거
+        Command = Rest.TrimStart();
+    }
+
+    void AppendResponse(TArray<uint8>& Out, const FString& Message, bool bFramed, const FString& RequestId)
+    {
+        FTCHARToUTF8 Payload(*Message);
+
+        if (bFramed)
+        {
+            const FString Header = RequestId.IsEmpty()
+                ? FString::Printf(TEXT("XR1 %d\n"), Payload.Length())
+                : FString::Printf(TEXT("XR1 %d %s\n"), Payload.Length(), *RequestId);
+            FTCHARToUTF8 HeaderUtf8(*Header);
+            Out.Append(reinterpret_cast<const uint8*>(HeaderUtf8.Get()), HeaderUtf8.Length());
+        }
+        Out.Append(reinterpret_cast<const uint8*>(Payload.Get()), Payload.Length());
+    }
+
+    bool IsBatchStart(const uint8* Data, int32 Num)
+    {
+        return Num >= 5 && FMemory::Memcmp(Data, "BATCH", 5) == 0
+            && (Num == 5 || Data[5] == ' ' || Data[5] == '\r' || Data[5] == '\n');   // 5바이트뿐이면 나머지를 기다림
+    }
+
+    int32 TryExtractBatch(const uint8* Data, int32 Num, TArray<FString>& OutCommands, bool& bOutCountOk)
+    {
+        // "\nEND\n" (또는 "\nEND\r\n") 위치 찾기
+        int32 EndLine = INDEX_NONE;
+        for (int32 i = 0; i + 4 < Num; ++i)
+        {
+            if (Data[i] == '\n' && Data[i + 1] == 'E' && Data[i + 2] == 'N' && Data[i + 3] == 'D' &&
+                (Data[i + 4] == '\n' || Data[i + 4] == '\r'))
+            {
+                EndLine = i;
+                break;
+            }
+        }
+        if (EndLine == INDEX_NONE)
+            return 0;
+
+        int32 Consumed = EndLine + 4;
+        while (Consumed < Num && (Data[Consumed] == '\r' || Data[Consumed] == '\n'))
+            ++Consumed;
+
+        FUTF8ToTCHAR Conv(reinterpret_cast<const ANSICHAR*>(Data), EndLine);
+        const FString Block(Conv.Length(), Conv.Get());
+
+        TArray<FString> Lines;
+        Block.ParseIntoArrayLines(Lines);
+
+        // 첫 줄은 "BATCH <n>" 헤더
+        for (int32 i = 1; i < Lines.Num(); ++i)
+        {
+            FString Line = Lines[i].TrimStartAndEnd();
+            if (!Line.IsEmpty())
+                OutCommands.Add(MoveTemp(Line));
+        }
+
+        const FString Declared = Lines.Num() > 0 ? Lines[0].Mid(5).TrimStartAndEnd() : FString();
+        bOutCountOk = !Declared.IsEmpty() && Declared.IsNumeric() && FCString::Atoi(*Declared) == OutCommands.Num();
+        return Consumed;
+    }
+
+    uint32 FBinaryPacketView::Handle(int32 Index) const
+    {
+        uint32 H;
+        FMemory::Memcpy(&H, Entries + Index * EntrySize(), sizeof(H));
+        return H;
+    }
+
+    FVector FBinaryPacketView::Value(int32 Index) const
+    {
+        const uint8* P = Entries + Index * EntrySize() + sizeof(uint32);
+        if (bDelta)
+        {
+            int16 D[3];
+            FMemory::Memcpy(D, P, sizeof(D));
+            return FVector(D[0] * Step, D[1] * Step, D[2] * Step);
+        }
+        float V[3];
+        FMemory::Memcpy(V, P, sizeof(V));
+        return FVector(V[0], V[1], V[2]);
+    }
+
+    bool IsBinaryStart(const uint8* Data, int32 Num)
+    {
+        return Num >= 3 && Data[0] == 'X' && Data[1] == 'B'
+            && Data[2] >= uint8(EBinaryOp::Move) && Data[2] <= uint8(EBinaryOp::Rotate);
+    }
+
+    int32 PeekBinaryPacket(const uint8* Data, int32 Num, FBinaryPacketView& OutPacket)
+    {
+        if (Num < BinHeaderSize)
+            return 0;
+        if (!IsBinaryStart(Data, Num))
+            return -1;
+
+        uint16 Count;
+        FMemory::Memcpy(&Count, Data + 4, sizeof(Count));
+
+        OutPacket.Op = static_cast<EBinaryOp>(Data[2]);
+        OutPacket.bDelta = (Data[3] & BinFlagDelta) != 0;
+        OutPacket.Count = Count;
+
+        int32 Offset = BinHeaderSize;
+        if (OutPacket.bDelta)
+        {
+            if (Num < Offset + int32(sizeof(float)))
+                return 0;
+            FMemory::Memcpy(&OutPacket.Step, Data + Offset, sizeof(float));
+            Offset += sizeof(float);
+            if (!FMath::IsFinite(OutPacket.Step))
+                return -1;
+        }
+
+        const int32 Total = Offset + Count * OutPacket.EntrySize();
+        if (Total > MaxBatchBytes)
+            return -1;
+        if (Num < Total)
+            return 0;
+
+        OutPacket.Entries = Data + Offset;
+        return Total;
+    }
+
+    int32 ReadAvailable(FClientConnection& Client)
+    {
+        if (!Client.Socket || Client.bClosed) return 0;
+
+        // 이미 처리한 앞부분은 여기서 한 번에 당겨서 버림 (남은 건 보통 잘린 꼬리 몇 바이트)
+        if (Client.ReadPos > 0)
+        {
+            Client.InBuffer.RemoveAt(0, Client.ReadPos, false);
+            Client.ReadPos = 0;
+        }
+
+        const int32 Before = Client.InBuffer.Num();
+        uint32 DataSize = 0;
+        while (Client.InBuffer.Num() < MaxBatchBytes && Client.Socket->HasPendingData(DataSize) && DataSize > 0)
+        {
+            const int32 Offset = Client.InBuffer.Num();
+            const int32 Want = FMath::Min<int32>(DataSize, MaxBatchBytes - Offset);
+            Client.InBuffer.AddUninitialized(Want);
+
+            int32 Read = 0;
+            if (!Client.Socket->Recv(Client.InBuffer.GetData() + Offset, Want, Read) || Read <= 0)
+            {
+                UE_LOG(LogTemp, Error, TEXT("❌ 데이터 수신 실패 또는 데이터 없음 (Read: %d)"), Read);
+                Client.InBuffer.SetNum(Offset, false);
+                Client.bClosed = true;
+                break;
+            }
+            Client.InBuffer.SetNum(Offset + Read, false);
+        }
+        Client.bIdleTail = Client.InBuffer.Num() == Before;
+        return Client.InBuffer.Num() - Before;
+    }
+
+    EMessageKind NextMessage(FClientConnection& Client, TArrayView<const uint8>& OutLine, TArray<FString>& OutCommands, FBinaryPacketView& OutPacket)
+    {
+        while (Client.PendingNum() > 0)
+        {
+            const uint8* Cursor = Client.PendingData();
+            const int32 Remaining = Client.PendingNum();
+
+            if (IsBinaryStart(Cursor, Remaining))
+            {
+                const int32 Used = PeekBinaryPacket(Cursor, Remaining, OutPacket);
+                if (Used < 0)
+                {
+                    Client.ResetBuffer();
+                    return EMessageKind::Invalid;
+                }
+                if (Used == 0)
+                    break;
+                Client.ReadPos += Used;
+                return EMessageKind::Binary;
+            }
+
+            if (IsBatchStart(Cursor, Remaining))
+            {
+                bool bCountOk = false;
+                const int32 Used = TryExtractBatch(Cursor, Remaining, OutCommands, bCountOk);
+                if (Used == 0)
+                    break;
+                Client.ReadPos += Used;
+                if (!bCountOk)
+                {
+                    OutCommands.Reset();   // 일부만 실행하지 않음
+                    return EMessageKind::BatchCount;
+                }
+                return EMessageKind::Batch;
+            }
+
+            int32 LineLen = 0;
+            while (LineLen < Remaining && Cursor[LineLen] != '\n')
+                ++LineLen;
+            const bool bHasNewLine = LineLen < Remaining;
+            if (!bHasNewLine)
+            {
+                // 개행 없는 꼬리: 패킷/블록 머리가 잘려 왔거나 아직 수신 중이면 대기,
+                // 한 틱 동안 더 안 오면 개행 없이 보내는 구버전 클라 명령으로 보고 처리
+                const bool bMaybeHeader = Remaining < 5 && (Cursor[0] == 'X' || Cursor[0] == 'B');
+                if (!Client.bIdleTail || bMaybeHeader)
+                    break;
+            }
+            Client.ReadPos += bHasNewLine ? LineLen + 1 : LineLen;
+
+            while (LineLen > 0 && (Cursor[LineLen - 1] == '\r' || Cursor[LineLen - 1] == '\0'))
+                --LineLen;
+            if (LineLen == 0)
+                continue;   // 빈 줄은 건너뜀
+
+            OutLine = TArrayView<const uint8>(Cursor, LineLen);
+            return EMessageKind::Line;
+        }
+
+        if (Client.PendingNum() >= MaxBatchBytes)
+        {
+            Client.ResetBuffer();
+            return EMessageKind::TooLarge;
+        }
+        return EMessageKind::None;
+    }
+
+    EMessageKind NextMessage(FClientConnection& Client, FString& OutLine, TArray<FString>& OutCommands, FBinaryPacketView& OutPacket)
+    {
+        TArrayView<const uint8> Line;
+        const EMessageKind Kind = NextMessage(Client, Line, OutCommands, OutPacket);
+        if (Kind == EMessageKind::Line)
+        {
+            FUTF8ToTCHAR Conv(reinterpret_cast<const ANSICHAR*>(Line.GetData()), Line.Num());
+            OutLine = FString(Conv.Length(), Conv.Get());
+        }
+        return Kind;
+    }
+
+    bool SendAll(FSocket* Socket, const uint8* Data, int32 Num)
+    {
+        if (!Socket) return false;
+
+        int32 Offset = 0;
+        while (Offset < Num)
+        {
+            int32 Sent = 0;
+            if (!Socket->Send(Data + Offset, Num - Offset, Sent))
+                return false;
+            Offset += Sent;
+        }
+        return true;
+    }
+
+    bool SendAll(FClientConnection& Client, const uint8* Data, int32 Num)
+    {
+        if (Client.bDropRequested)
+            return false;
+        if (SendAll(Client.Socket, Data, Num))
+            return true;
+
+        Client.bDropRequested = true;
+        UE_LOG(LogTemp, Warning, TEXT("❌ 전송 실패 → 연결 종료: %s"), *Client.Address);
+        return false;
+    }
+
+    void AcceptPending(FSocket* ListenSocket, FClientList& Clients, const TCHAR* Description)
+    {
+        if (!ListenSocket) return;
+
+        ISocketSubsystem* Subsystem = ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM);
+        bool bPending = false;
+        while (ListenSocket->HasPendingConnection(bPending) && bPending)
+        {
+            TSharedRef<FInternetAddr> RemoteAddress = Subsystem->CreateInternetAddr();
+            FSocket* NewSocket = ListenSocket->Accept(*RemoteAddress, Description);
+            if (!NewSocket)
+                break;
+
+            if (Clients.Num() >= MaxClients)
+            {
+                UE_LOG(LogTemp, Warning, TEXT("⚠️ 클라이언트 수 초과(%d) → 접속 거절: %s"), MaxClients, *RemoteAddress->ToString(true));
+                NewSocket->Close();
+                Subsystem->DestroySocket(NewSocket);
+                continue;
+            }
+
+            FClientRef Client = MakeShared<FClientConnection, ESPMode::ThreadSafe>();
+            Client->Socket = NewSocket;
+            Client->Address = RemoteAddress->ToString(true);
+            UE_LOG(LogTemp, Warning, TEXT("✅ %s 접속: %s (%d/%d)"), Description, *Client->Address, Clients.Num() + 1, MaxClients);
+            Clients.Add(MoveTemp(Client));
+        }
+    }
+
+    void RemoveDisconnected(FClientList& Clients, FClientList* OutRemoved)
+    {
+        for (int32 i = Clients.Num() - 1; i >= 0; --i)
+        {
+            FClientConnection& Client = *Clients[i];
+            if (Client.Socket && !Client.bClosed && !Client.bDropRequested
+                && Client.Socket->GetConnectionState() == SCS_Connected)
+                continue;
+
+            UE_LOG(LogTemp, Warning, TEXT("🔌 클라이언트 연결 종료: %s"), *Client.Address);
+            if (OutRemoved)
+                OutRemoved->Add(Clients[i]);
+            Clients.RemoveAt(i);   // 소켓은 마지막 참조가 사라질 때 닫힘
+        }
+    }
+
+    FClientConnection::~FClientConnection()
+    {
+        CloseClient(*this);
+    }
+
+    void CloseClient(FClientConnection& Client)
+    {
+        if (Client.Socket)
+        {
+            Client.Socket->Close();
+            ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->DestroySocket(Client.Socket);
+            Client.Socket = nullptr;
+        }
+        Client.ResetBuffer();
+    }
+
+    void CloseAll(FClientList& Clients)
+    {
+        for (FClientRef& Client : Clients)
+        {
+            CloseClient(*Client);
+        }
+        Clients.Reset();
+    }
+}
@@ -0,0 +1,182 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include <atomic>
+
+class FSocket;
+struct FMyReply;
+
+// Python 클라이언트 ↔ 소켓 서버(9999 PIE / 9998 EDITOR) 공용 응답 프레이밍
+//
+//  요청:  명령 1개 = 한 줄 ("\n" 종료). 한 번에 여러 줄을 이어 보내도 서버가 줄 단위로 나눠 순서대로 실행
+//         (틱당 MySocket.CommandBudgetMs 만큼 처리하고 남은 명령은 다음 틱으로 이월)
+//         공백이 들어간 인자는 "..." 로 감쌈 (9999 분리 규칙은 MyCommandTokenizer.h)
+//
+//  v1 프레임:  "XR1 <payload 바이트 수>\n" + UTF-8 payload
+//  - 클라이언트가 접속 직후 "PROTO 1"을 보내면 해당 연결만 프레이밍 모드로 전환
+//  - 협상하지 않은 구버전 클라이언트는 기존처럼 raw 문자열을 그대로 받음
+//  - 명령 앞에 "@<id> "를 붙이면 응답 헤더가 "XR1 <len> <id>\n"이 됨 (동시 요청 상관관계용)
+//
+//  응답 형식:  "FORMAT JSON"을 보내면 해당 연결만 상태 코드 + 타입 있는 payload의 JSON 봉투로 응답 (MyReply.h)
+//
+//  능력 조회:  "HELLO" (별칭 "CAPS") → 서버 종류/프로토콜 버전/지원 명령/한도 (MakeHelloReply)
+//  - 클라이언트는 접속 직후 한 번 받아 연결별로 캐시 → 명령 지원 여부를 프로빙/추측하지 않음
+//
+//  액터 핸들:  명령의 액터 이름 자리에 "#<핸들>"을 쓰면 이름 해시 대신 핸들로 바로 조회 (MyActorIndex.h)
+//  - 핸들은 LIST/LIST_STATIC JSON 응답의 "handle" 또는 "HANDLE <액터이름...>"으로 받음 (텍스트 LIST는 그대로 "라벨|이름")
+//  - 액터가 파괴되면 무효 → 그 핸들을 쓴 명령은 NotFound (번호는 다시 쓰지 않음)
+//
+//  푸시:  요청 없이 서버가 보내는 프레임은 요청 ID 자리가 '!'로 시작 ("XR1 <len> !WATCH", MyActorWatch.h)
+//
+//  BATCH 블록:  "BATCH <n>\n" + 명령 n줄 + "END\n"  (PROTO 1 협상된 연결 전용)
+//  - 서버는 블록 전체를 한 틱에서 실행하고 응답 n개를 순서대로 v1 프레임으로 한 번에 전송
+//  - 헤더의 n과 실제 명령 줄 수가 다르면 블록을 실행하지 않고 BatchCount 에러 응답 1개
+//
+//  바이너리 트랜스폼 미리보기 패킷 (PROTO 1 연결 전용, 응답 없음, 리틀 엔디안)
+//  - 헤더 8바이트: 'X' 'B' | u8 Op | u8 Flags | u16 Count | u16 Reserved
+//  - 일반:       엔트리 = u32 Handle + float32 x3                       (16바이트)
+//  - BinFlagDelta: 헤더 뒤 float32 Step, 엔트리 = u32 Handle + int16 x3 (10바이트, 값 += d * Step)
+//    Rotate는 델타로 보내지 않음 (GetActorRotation()이 쿼터니언 왕복 값이라 클라이언트의 last + d*Step과 달라짐)
+//  - Handle은 "HANDLE <액터이름...>" 텍스트 명령으로 받은 숫자 (0 = 없음)
+namespace MySocketProtocol
+{
+    constexpr int32 Version = 1;
+    constexpr int32 MaxBatchCommands = 4096;
+    constexpr int32 MaxBatchBytes = 4 * 1024 * 1024;
+    constexpr int32 MaxClients = 8;
+
+    // 서버에 붙은 클라이언트 1개의 연결 단위 상태 (PROTO 협상/수신 버퍼는 연결마다 따로)
+    // 소켓은 마지막 참조가 사라질 때 닫힘 (수신 스레드와 게임 스레드가 같은 연결을 함께 들고 있을 수 있음)
+    struct FClientConnection : public TSharedFromThis<FClientConnection, ESPMode::ThreadSafe>
+    {
+        ~FClientConnection();
+
+        FSocket* Socket = nullptr;
+        FString Address;
+        bool bFramed = false;         // "PROTO 1" 협상된 연결이면 v1 프레임으로 응답
+        bool bJson = false;           // "FORMAT JSON" 협상된 연결이면 응답을 JSON 봉투로 (MyReply.h)
+        bool bClosed = false;         // 수신 실패 등으로 끊김 확인 → 다음 정리 때 제거
+        bool bIdleTail = false;       // 이번 틱에 새로 받은 바이트 없음 → 개행 없는 꼬리도 명령으로 처리 (구버전 클라)
+        std::atomic<bool> bDropRequested{ false };   // 다른 스레드에서 연결 종료 요청 (다음 정리 때 제거)
+
+        // 수신 스트림 버퍼: [ReadPos, Num) 구간이 아직 처리 안 된 바이트
+        // 명령 경계(개행 / BATCH..END / 바이너리 헤더 길이)로 잘라 쓰고, 다 못 쓴 건 다음 틱으로 이월
+        TArray<uint8> InBuffer;
+        int32 ReadPos = 0;
+
+        const uint8* PendingData() const { return InBuffer.GetData() + ReadPos; }
+        int32 PendingNum() const { return InBuffer.Num() - ReadPos; }
+        void ResetBuffer() { InBuffer.Reset(); ReadPos = 0; }
+    };
+
+    using FClientRef = TSharedPtr<FClientConnection, ESPMode::ThreadSafe>;
+    using FClientList = TArray<FClientRef>;
+
+    enum class EMessageKind : uint8
+    {
+        None,       // 완성된 메시지 없음 (다음 수신까지 대기)
+        Line,       // 한 줄 명령
+        Batch,      // BATCH 블록
+        Binary,     // 바이너리 미리보기 패킷
+        Invalid,    // 잘못된 바이너리 패킷 → 버퍼 폐기
+        TooLarge,   // MaxBatchBytes 넘도록 메시지가 완성되지 않음 → 버퍼 폐기
+        BatchCount, // BATCH 헤더의 <n>과 실제 명령 줄 수가 다름 → 블록 버림 (에러 응답 1개)
+    };
+
+    struct FBinaryPacketView;
+
+    // 틱당 명령 처리 시간 예산 (콘솔 변수 MySocket.CommandBudgetMs)
+    double GetCommandBudgetSeconds();
+
+    // 대기 중인 접속을 모두 받아 Clients 뒤에 추가 (MaxClients를 넘으면 바로 닫음)
+    void AcceptPending(FSocket* ListenSocket, FClientList& Clients, const TCHAR* Description);
+
+    // 끊긴 연결 / 종료 요청된 연결을 목록에서 뺌 (OutRemoved가 있으면 뺀 연결을 담아줌)
+    void RemoveDisconnected(FClientList& Clients, FClientList* OutRemoved = nullptr);
+
+    void CloseClient(FClientConnection& Client);
+    void CloseAll(FClientList& Clients);
+
+    // "PROTO <n>" 협상 명령이면 true (OutVersion = 클라이언트 요청 버전)
+    bool ParseProtoRequest(const FString& Command, int32& OutVersion);
+
+    // "FORMAT JSON|TEXT" 응답 형식 협상 명령이면 true (bOutJson = JSON 요청 여부)
+    bool ParseFormatRequest(const FString& Command, bool& bOutJson);
+
+    // 서버 능력 (HELLO 응답 내용)
+    struct FServerCaps
+    {
+        const TCHAR* Kind = TEXT("");             // "PIE" | "EDITOR"
+        TArrayView<const TCHAR* const> Verbs;     // 처리하는 명령 (PROTO/FORMAT/HELLO/BATCH 포함)
+        bool bBinary = false;                     // 바이너리 미리보기 패킷(XB) 수신 여부
+    };
+
+    // "HELLO" / "CAPS" 능력 조회 명령이면 true
+    bool IsHelloRequest(const FString& Command);
+
+    // 텍스트: "OK HELLO <kind> proto=1 max_batch=.. max_batch_bytes=.. max_clients=.. binary=MOVE,.. verbs=PING,.."
+    // JSON data: {"kind","proto","verbs":[...],"binary":[...],"limits":{"max_batch","max_batch_bytes","max_clients"}}
+    FMyReply MakeHelloReply(const FServerCaps& Caps);
+
+    // "@<id> CMD ..." 형태면 id를 떼어내 OutId에 담고 Command에는 명령만 남김
+    void SplitRequestId(FString& Command, FString& OutId);
+
+    // Message를 UTF-8로 인코딩해 Out 뒤에 붙임 (bFramed면 v1 헤더 포함, RequestId가 있으면 헤더에 회신)
+    void AppendResponse(TArray<uint8>& Out, const FString& Message, bool bFramed, const FString& RequestId = FString());
+
+    // 수신 바이트가 BATCH 블록의 시작인지 ("BATCH" 뒤가 공백/줄 끝일 때만, "BATCHX ..."는 일반 명령)
+    bool IsBatchStart(const uint8* Data, int32 Num);
+
+    // Data에 "END" 줄까지 완성된 BATCH 블록이 있으면 명령들을 꺼내고 소비할 바이트 수 반환 (0 = 아직 덜 옴)
+    // (MaxBatchCommands 초과분도 그대로 꺼냄 → 호출 측에서 응답 개수를 맞춰 에러 처리)
+    // bOutCountOk: 헤더 "BATCH <n>"의 n이 꺼낸 명령 수와 같은지 (n이 없거나 숫자가 아니면 false)
+    int32 TryExtractBatch(const uint8* Data, int32 Num, TArray<FString>& OutCommands, bool& bOutCountOk);
+
+    enum class EBinaryOp : uint8
+    {
+        Move   = 1,
+        Scale  = 2,
+        Rotate = 3,   // (Pitch, Yaw, Roll) 도 단위
+    };
+
+    constexpr uint8 BinFlagDelta = 0x01;
+    constexpr int32 BinHeaderSize = 8;
+
+    // 수신 버퍼 위에 그대로 얹는 읽기 전용 뷰 (복사/할당 없음)
+    struct FBinaryPacketView
+    {
+        EBinaryOp Op = EBinaryOp::Move;
+        bool bDelta = false;
+        float Step = 0.f;
+        int32 Count = 0;
+        const uint8* Entries = nullptr;
+
+        int32 EntrySize() const { return bDelta ? 10 : 16; }
+        uint32 Handle(int32 Index) const;
+        FVector Value(int32 Index) const;   // bDelta면 Step이 곱해진 변화량
+    };
+
+    // 수신 바이트가 바이너리 패킷의 시작인지
+    bool IsBinaryStart(const uint8* Data, int32 Num);
+
+    // 완성된 패킷이면 OutPacket을 채우고 소비할 바이트 수 반환 (0 = 아직 덜 옴, -1 = 잘못된 패킷)
+    int32 PeekBinaryPacket(const uint8* Data, int32 Num, FBinaryPacketView& OutPacket);
+
+    // 소켓에 쌓인 바이트를 InBuffer 뒤에 모두 읽어 붙임 (버퍼가 MaxBatchBytes 이상이면 나머지는 다음 틱)
+    // 수신 실패 시 bClosed 설정. 반환: 이번에 읽은 바이트 수
+    int32 ReadAvailable(FClientConnection& Client);
+
+    // InBuffer에서 완성된 메시지 하나를 꺼내고 ReadPos를 그만큼 진행
+    // Binary면 OutPacket, Line이면 OutLine(UTF-8, 개행 제외)이 InBuffer를 가리키므로 다음 ReadAvailable 전까지만 유효
+    EMessageKind NextMessage(FClientConnection& Client, TArrayView<const uint8>& OutLine, TArray<FString>& OutCommands, FBinaryPacketView& OutPacket);
+
+    // 위와 같지만 Line을 FString으로 복사 (다른 스레드로 넘길 때)
+    EMessageKind NextMessage(FClientConnection& Client, FString& OutLine, TArray<FString>& OutCommands, FBinaryPacketView& OutPacket);
+
+    // 부분 전송까지 고려해 Num 바이트를 모두 보냄
+    bool SendAll(FSocket* Socket, const uint8* Data, int32 Num);
+
+    // 연결에 보냄. 중간에 실패하면 잘린 프레임이 스트림에 남아 프레이밍이 어긋나므로
+    // bDropRequested를 세워 다음 정리 때 연결을 제거 (이미 종료 요청된 연결에는 보내지 않음)
+    bool SendAll(FClientConnection& Client, const uint8* Data, int32 Num);
+}
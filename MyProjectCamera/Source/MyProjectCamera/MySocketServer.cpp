@@ -1,4 +1,12 @@
 ﻿#include "MySocketServer.h"
+#include "MySocketProtocol.h"
+#include "MySocketLog.h"
+#include "MyTransformBatch.h"
+#include "MySelectionSets.h"
+#include "MyMaterialPool.h"
+#include "MyActorState.h"
+#include "MyAssetCache.h"
+#include "MyReply.h"
 #include "EngineUtils.h"
 #include "Sockets.h"
 #include "SocketSubsystem.h"
@@ -27,6 +35,8 @@ AMySocketServer::AMySocketServer()
 void AMySocketServer::BeginPlay()
 {
     Super::BeginPlay();
+    ActorIndex.Bind(GetWorld());
+    Watches.Bind(GetWorld());
     StartListening(9999);
 }
 
@@ -45,81 +55,154 @@ void AMySocketServer::Tick(float DeltaTime)
 {
     Super::Tick(DeltaTime);
 
-    if (!ClientSocket)
+    MySocketProtocol::FClientList Removed;
+    MySocketProtocol::RemoveDisconnected(Clients, &Removed);
+    for (const MySocketProtocol::FClientRef& Client : Removed)
     {
-        static int SkipLog = 0;
-        if (++SkipLog % 30 == 0)
-            UE_LOG(LogTemp, Warning, TEXT("❌ ClientSocket is NULL"));
-        return;
+        Watches.Unwatch(Client.Get(), {});
     }
 
-    if (ClientSocket->GetConnectionState() != SCS_Connected)
+    // 소켓에 쌓인 바이트는 전부 각 클라이언트 버퍼로 옮겨두고,
+    // 완성된 명령을 클라이언트별로 하나씩 돌아가며 시간 예산이 다할 때까지 실행 (남으면 다음 틱)
+    const double TickStart = FPlatformTime::Seconds();
+    for (const MySocketProtocol::FClientRef& Client : Clients)
     {
-        UE_LOG(LogTemp, Warning, TEXT("🔌 ClientSocket disconnected"));
-        return;
+        Stats.AddBytesIn(MySocketProtocol::ReadAvailable(*Client));
     }
 
-    uint32 DataSize = 0;
-    if (ClientSocket->HasPendingData(DataSize))
+    const int32 NumClients = Clients.Num();
+    if (NumClients > 0)
     {
-        TArray<uint8> Data;
-        Data.SetNumUninitialized(DataSize);
+        // 라운드로빈: 매 틱 시작 클라이언트를 한 칸씩 돌려서 특정 클라이언트가 항상 먼저 처리되지 않게 함
+        const int32 Start = NextClientIndex % NumClients;
+        NextClientIndex = Start + 1;
+
+        const double Deadline = FPlatformTime::Seconds() + MySocketProtocol::GetCommandBudgetSeconds();
+        bool bProgress = false;
+        do   // 예산이 0이어도 클라이언트당 최소 1개는 처리
+        {
+            bProgress = false;
+            for (int32 k = 0; k < NumClients; ++k)
+            {
+                CurrentClient = Clients[(Start + k) % NumClients].Get();
+                Watches.SetOrigin(CurrentClient);   // 이 명령이 바꾼 트랜스폼은 이 연결에 푸시 안 함
+                bProgress |= ServiceClient(*CurrentClient);
+            }
+        } while (bProgress && FPlatformTime::Seconds() < Deadline);
+        CurrentClient = nullptr;
+        Watches.SetOrigin(nullptr);
+    }
 
-        int32 Read = 0;
-        bool bReceived = ClientSocket->Recv(Data.GetData(), Data.Num(), Read);
+    int64 Backlog = 0;
+    for (const MySocketProtocol::FClientRef& Client : Clients)
+    {
+        Backlog += Client->PendingNum();
+    }
+    Stats.RecordTick(FPlatformTime::Seconds() - TickStart, DeltaTime, Backlog);
 
-        if (!bReceived || Read <= 0)
+    if (bCameraTracking && TrackedCamera.IsValid())
+    {
+        // 타겟: 액터 하나 또는 선택 집합 중심
+        TOptional<FVector> TargetLoc;
+        if (TrackedTarget.IsValid())
         {
-            UE_LOG(LogTemp, Error, TEXT("❌ 데이터 수신 실패 또는 데이터 없음 (Read: %d)"), Read);
-            return;
+            TargetLoc = TrackedTarget->GetActorLocation();
+        }
+        else if (!TrackedSet.IsEmpty())
+        {
+            TArray<AActor*> Members;
+            if (SelectionSets.Resolve(TrackedSet, Members) && Members.Num() > 0)
+                TargetLoc = MyGroupOps::Center(Members);
         }
 
-        Data.Add(0);
-
-        const char* CharData = reinterpret_cast<const char*>(Data.GetData());
-        if (!CharData || CharData[0] == '\0')
+        if (TargetLoc.IsSet())
         {
-            UE_LOG(LogTemp, Error, TEXT("❌ CharData is empty or null"));
-            return;
+            FVector CamLoc = TrackedCamera->GetActorLocation();
+            FRotator NewRot = (TargetLoc.GetValue() - CamLoc).Rotation();
+            TrackedCamera->SetActorRotation(NewRot);
         }
+    }
+}
 
-        FString Command = FString(ANSI_TO_TCHAR(CharData));
-        Command.TrimStartAndEndInline();
-        Command.ReplaceInline(TEXT("\n"), TEXT(""));
-        Command.ReplaceInline(TEXT("\r"), TEXT(""));
-        Command.ReplaceInline(TEXT("\0"), TEXT(""));
+// HELLO 응답에 싣는 지원 명령 (HandleCommand / ServiceClient에 명령을 추가하면 여기도 추가)
+static const TCHAR* const RuntimeVerbs[] = {
+    TEXT("PROTO"), TEXT("FORMAT"), TEXT("HELLO"), TEXT("BATCH"), TEXT("PING"),
+    TEXT("MOVE"), TEXT("MOVE_COMMIT"), TEXT("SCALE"), TEXT("SET_TRANSFORMS"), TEXT("HANDLE"),
+    TEXT("MOVE_BY"), TEXT("ROTATE_BY"), TEXT("SCALE_MUL"),
+    TEXT("SELECT_SET"), TEXT("SELECT_SET_ADD"), TEXT("SELECT_SET_REMOVE"), TEXT("SELECT_SET_CLEAR"),
+    TEXT("GROUP_MOVE_BY"), TEXT("GROUP_ROTATE_BY"), TEXT("GROUP_SCALE_MUL"), TEXT("GROUP_SET_MATERIAL"), TEXT("GROUP_SET_MOBILITY"),
+    TEXT("LIST_STATIC"), TEXT("GET_LOCATION"), TEXT("GET_SCALE"), TEXT("GET_MATERIAL_SLOTS"), TEXT("GET_ACTOR_STATE"),
+    TEXT("CAM_LOOKAT"), TEXT("CAM_TRACK_START"), TEXT("CAM_TRACK_STOP"),
+    TEXT("SET_TEXTURE"), TEXT("SET_MATERIAL_PARAMS"), TEXT("RELEASE_MID"), TEXT("GET_TEXTURES"), TEXT("GET_TEXTURES_SLOT"), TEXT("SET_MATERIAL"), TEXT("SET_MATERIAL_MULTI"), TEXT("SET_STATIC_MESH"),
+    TEXT("GET_BLUEPRINTS"), TEXT("LOAD_PRESET"), TEXT("SAVE_PRESET"), TEXT("WATCH"), TEXT("UNWATCH"),
+    TEXT("STATS"), TEXT("LOG_VERBOSE"),
+};
+
+// 클라이언트 버퍼에서 완성된 메시지 1개 처리 (응답은 CurrentClient로 라우팅), 처리한 게 없으면 false
+bool AMySocketServer::ServiceClient(MySocketProtocol::FClientConnection& Client)
+{
+    TArrayView<const uint8> Line;
+    TArray<FString> BatchCommands;
+    MySocketProtocol::FBinaryPacketView Packet;
 
-        // 👇 이 부분 꼭 있어야 함!
-        Command = Command.Replace(TEXT("\x01"), TEXT("")).Replace(TEXT("\x02"), TEXT("")).Replace(TEXT("\x03"), TEXT("")).Replace(TEXT("\xFF"), TEXT("")).Replace(TEXT("\xFE"), TEXT(""));
+    switch (MySocketProtocol::NextMessage(Client, Line, BatchCommands, Packet))
+    {
+    case MySocketProtocol::EMessageKind::None:
+        return false;
+
+    case MySocketProtocol::EMessageKind::Invalid:
+        SendResponseToPython(FMyReply::Fail(FMyReply::BadRequest, TEXT("Binary"), TEXT("❌ 잘못된 바이너리 패킷")), TEXT("BINARY"));
+        return true;
+
+    case MySocketProtocol::EMessageKind::TooLarge:
+        SendResponseToPython(FMyReply::Fail(FMyReply::BadRequest, TEXT("BatchTooLarge"), TEXT("❌ BATCH 크기 초과")), TEXT("BATCH"));
+        return true;
+
+    case MySocketProtocol::EMessageKind::BatchCount:
+        SendResponseToPython(FMyReply::Fail(FMyReply::BadRequest, TEXT("BatchCount"), TEXT("❌ BATCH 헤더의 명령 수와 실제 줄 수가 다름 (블록 무시)")), TEXT("BATCH"));
+        return true;
 
-        for (int32 i = 0; i < Command.Len(); ++i)
+    case MySocketProtocol::EMessageKind::Binary:
+        // 버퍼 위에서 바로 디코딩 (복사 없음)
+        if (!Client.bFramed)
         {
-            if (Command[i] < 32 || Command[i] == 127)
-            {
-                Command.RemoveAt(i);
-                i--;
-            }
+            Client.ResetBuffer();
+            SendResponseToPython(FMyReply::Fail(FMyReply::BadRequest, TEXT("Binary"), TEXT("❌ 바이너리 패킷은 PROTO 1 협상 후에만 사용 가능")), TEXT("BINARY"));
+            return true;
+        }
+        {
+            const double Start = FPlatformTime::Seconds();
+            ApplyBinaryPacket(Packet);
+            Stats.RecordCommand(TEXT("BINARY"), FPlatformTime::Seconds() - Start, true);
         }
+        return true;
 
-        UE_LOG(LogTemp, Warning, TEXT("📩 명령 수신: [%s]"), *Command);
+    case MySocketProtocol::EMessageKind::Batch:
+        HandleBatch(BatchCommands);   // 통계는 안의 명령별로
+        return true;
 
+    case MySocketProtocol::EMessageKind::Line:
+        break;
+    }
 
-        TArray<FString> Tokens;
-        Command.ParseIntoArrayWS(Tokens);
+    // 수신 버퍼의 UTF-8 바이트를 한 번만 훑어 토큰으로 (제어문자 제거 / 따옴표 인자 / @id 분리 포함)
+    MyCommandTokenizer::RecordCorpusLine(Line.GetData(), Line.Num());
+    CommandTokens.Parse(Line.GetData(), Line.Num());
+    const MyCommandTokenizer::FTokens& Tokens = CommandTokens;
 
-        FString Result = HandleCommand(Command);
-        SendResponseToPython(Result);
-    }
+    MYSOCKET_LOG(Summary, Log, TEXT("📩 명령 수신: [%s]"), *Tokens.Join());
 
-    if (bCameraTracking && TrackedCamera.IsValid() && TrackedTarget.IsValid())
-    {
-        FVector CamLoc = TrackedCamera->GetActorLocation();
-        FVector TargetLoc = TrackedTarget->GetActorLocation();
-        FRotator NewRot = (TargetLoc - CamLoc).Rotation();
-        TrackedCamera->SetActorRotation(NewRot);
-    }
+    const FString RequestId = Tokens.RequestId();
+
+    const double Start = FPlatformTime::Seconds();
+    const FString Verb = Tokens.IsEmpty() ? FString() : FString(Tokens[0]);
+    const FMyReply Reply = HandleCommand(Tokens);
+    SendResponseToPython(Reply, Verb, RequestId);
+    Stats.RecordCommand(Verb, FPlatformTime::Seconds() - Start, Reply.IsOk());
+    return true;
 }
 
+
 void AMySocketServer::StartListening(int32 Port)
 {
     ISocketSubsystem* SocketSubsystem = ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM);
@@ -141,35 +224,26 @@ void AMySocketServer::StartListening(int32 Port)
 
 void AMySocketServer::AcceptClients()
 {
-    bool bHasPending;
-    if (ListenSocket->HasPendingConnection(bHasPending) && bHasPending)
-    {
-        TSharedRef<FInternetAddr> RemoteAddress = ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->CreateInternetAddr();
-        ClientSocket = ListenSocket->Accept(*RemoteAddress, TEXT("PythonClient"));
-
-        if (ClientSocket)
-        {
-            UE_LOG(LogTemp, Warning, TEXT("✅ Python 클라이언트 접속: %s"), *RemoteAddress->ToString(true));
-        }
-    }
+    // 새 연결은 PROTO 협상 전까지 legacy 응답, 수신 버퍼도 연결마다 따로
+    MySocketProtocol::AcceptPending(ListenSocket, Clients, TEXT("PythonClient"));
 }
 
 // 프리셋 로드 
-FString AMySocketServer::CmdLoadPreset(const FString& Name, float Ox, float Oy, float Oz)
+FMyReply AMySocketServer::CmdLoadPreset(const FString& Name, float Ox, float Oy, float Oz)
 {
     const FString Path = FPaths::Combine(FPaths::ProjectSavedDir(), TEXT("ScenePresets"), Name + TEXT(".json"));
     FString Json;
     if (!FFileHelper::LoadFileToString(Json, *Path))
-        return FString::Printf(TEXT("❌ 프리셋 없음: %s"), *Path);
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NoPreset"), FString::Printf(TEXT("❌ 프리셋 없음: %s"), *Path));
 
     TSharedPtr<FJsonObject> Root;
     const TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(Json);
     if (!FJsonSerializer::Deserialize(Reader, Root) || !Root.IsValid())
-        return TEXT("❌ JSON 파싱 실패");
+        return FMyReply::Fail(FMyReply::Failed, TEXT("BadPreset"), TEXT("❌ JSON 파싱 실패"));
 
     const TArray<TSharedPtr<FJsonValue>>* Actors;
     if (!Root->TryGetArrayField(TEXT("actors"), Actors))
-        return TEXT("⚠️ actors 없음");
+        return FMyReply::Fail(FMyReply::Failed, TEXT("BadPreset"), TEXT("⚠️ actors 없음"));
 
     int32 Count = 0;
     for (const TSharedPtr<FJsonValue>& V : *Actors)
@@ -180,7 +254,7 @@ FString AMySocketServer::CmdLoadPreset(const FString& Name, float Ox, float Oy,
         if (!ClassPath.EndsWith(TEXT("StaticMeshActor"))) continue;
 
         FString MeshPath;   A->TryGetStringField(TEXT("static_mesh"), MeshPath);
-        UStaticMesh* Mesh = LoadObject<UStaticMesh>(nullptr, *MeshPath);
+        UStaticMesh* Mesh = FMyAssetCache::Get().Resolve<UStaticMesh>(MeshPath);
         if (!Mesh) continue;
 
         auto Arr3 = [](const TArray<TSharedPtr<FJsonValue>>& Arr) { return FVector(Arr[0]->AsNumber(), Arr[1]->AsNumber(), Arr[2]->AsNumber()); };
@@ -212,7 +286,7 @@ FString AMySocketServer::CmdLoadPreset(const FString& Name, float Ox, float Oy,
                     const FString MPath = MV->AsString();
                     if (!MPath.IsEmpty())
                     {
-                        if (UMaterialInterface* MI = LoadObject<UMaterialInterface>(nullptr, *MPath))
+                        if (UMaterialInterface* MI = FMyAssetCache::Get().Resolve<UMaterialInterface>(MPath))
                             SMC->SetMaterial(Idx, MI);
                     }
                     ++Idx;
@@ -224,11 +298,14 @@ FString AMySocketServer::CmdLoadPreset(const FString& Name, float Ox, float Oy,
         if (A->TryGetStringField(TEXT("label"), Label)) { SMA->SetActorLabel(Label); }
         ++Count;
     }
-    return FString::Printf(TEXT("OK Loaded %d"), Count);
+    TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"preset","loaded"}
+    Data->SetStringField(TEXT("preset"), Name);
+    Data->SetNumberField(TEXT("loaded"), Count);
+    return FMyReply::Success(FString::Printf(TEXT("OK Loaded %d"), Count), Data);
 }
 
 // 현재 씬의 모든 StaticMeshActor를 JSON으로 저장
-FString AMySocketServer::CmdSavePreset(const FString& Name)
+FMyReply AMySocketServer::CmdSavePreset(const FString& Name)
 {
     TArray<TSharedPtr<FJsonValue>> OutActors;
     for (TActorIterator<AStaticMeshActor> It(GetWorld()); It; ++It)
@@ -277,22 +354,90 @@ FString AMySocketServer::CmdSavePreset(const FString& Name)
     const FString Path = FPaths::Combine(FPaths::ProjectSavedDir(), TEXT("ScenePresets"), Name + TEXT(".json"));
     IFileManager::Get().MakeDirectory(*FPaths::GetPath(Path), true);
     if (!FFileHelper::SaveStringToFile(JsonOut, *Path))
-        return TEXT("❌ 저장 실패");
-    return FString::Printf(TEXT("OK Saved: %s"), *Path);
+        return FMyReply::Fail(FMyReply::Failed, TEXT("SaveFailed"), TEXT("❌ 저장 실패"));
+
+    TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"preset","path","saved"}
+    Data->SetStringField(TEXT("preset"), Name);
+    Data->SetStringField(TEXT("path"), Path);
+    Data->SetNumberField(TEXT("saved"), OutActors.Num());
+    return FMyReply::Success(FString::Printf(TEXT("OK Saved: %s"), *Path), Data);
 }
 
 
-FString AMySocketServer::HandleCommand(const FString& Command)
+// GET_TEXTURES / GET_TEXTURES_SLOT JSON payload용 텍스처 이름 배열
+static TArray<TSharedPtr<FJsonValue>> TextureNames(const TArray<UTexture*>& Textures)
+{
+    TArray<TSharedPtr<FJsonValue>> Names;
+    Names.Reserve(Textures.Num());
+    for (UTexture* Tex : Textures)
+    {
+        if (Tex)
+            Names.Add(MakeShared<FJsonValueString>(Tex->GetName()));
+    }
+    return Names;
+}
+
+FMyReply AMySocketServer::HandleCommand(const MyCommandTokenizer::FTokens& Tokens)
 {
-    TArray<FString> Tokens;
-    Command.ParseIntoArrayWS(Tokens);
+    if (Tokens.Num() == 0)
+        return FMyReply::Fail(FMyReply::BadRequest, TEXT("Empty"), TEXT("❌ 빈 명령"));
 
-    UE_LOG(LogTemp, Warning, TEXT("🧪 Tokens (%d):"), Tokens.Num());
-    for (int i = 0; i < Tokens.Num(); ++i)
+    // JSON 협상된 연결이면 목록형 응답은 data만 만들고 사람용 텍스트는 생략
+    const bool bJson = CurrentClient && CurrentClient->bJson;
+
+    // 연결 상태 확인 (클라이언트 커넥션 풀 keep-alive)
+    if (Tokens.Num() >= 1 && Tokens[0] == "PING")
     {
-        UE_LOG(LogTemp, Warning, TEXT("    [%d] %s"), i, *Tokens[i]);
+        return FMyReply::Success(TEXT("PONG"));
     }
 
+    // 연결 협상 (한 줄 / BATCH 안 모두, 에디터 서버와 같음)
+    // 프레이밍: 이후 응답은 "XR1 <len>\n" 헤더와 함께 전송
+    if (Tokens.Num() >= 2 && Tokens[0] == "PROTO" && CurrentClient)
+    {
+        const int32 ProtoVersion = FCString::Atoi(*Tokens[1]);
+        CurrentClient->bFramed = ProtoVersion >= 1;
+        return FMyReply::Success(CurrentClient->bFramed
+            ? FString::Printf(TEXT("OK PROTO %d"), FMath::Min(ProtoVersion, MySocketProtocol::Version))
+            : TEXT("OK PROTO 0"));
+    }
+    // 응답 형식: 이 응답부터 새 형식으로 전송 (Render가 처리 후의 bJson을 봄)
+    if (Tokens.Num() == 2 && Tokens[0] == "FORMAT" && CurrentClient
+        && (Tokens[1].Equals(TEXT("JSON"), ESearchCase::IgnoreCase) || Tokens[1].Equals(TEXT("TEXT"), ESearchCase::IgnoreCase)))
+    {
+        const bool bJsonRequested = Tokens[1].Equals(TEXT("JSON"), ESearchCase::IgnoreCase);
+        CurrentClient->bJson = bJsonRequested;
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"format"}
+        Data->SetStringField(TEXT("format"), bJsonRequested ? TEXT("JSON") : TEXT("TEXT"));
+        return FMyReply::Success(bJsonRequested ? TEXT("OK FORMAT JSON") : TEXT("OK FORMAT TEXT"), Data);
+    }
+    // 능력 조회: 클라이언트가 접속 때 한 번 받아 캐시
+    if (Tokens.Num() == 1 && (Tokens[0] == "HELLO" || Tokens[0] == "CAPS"))
+    {
+        MySocketProtocol::FServerCaps Caps;
+        Caps.Kind = TEXT("PIE");
+        Caps.Verbs = RuntimeVerbs;
+        Caps.bBinary = true;
+        return MySocketProtocol::MakeHelloReply(Caps);
+    }
+
+    // 서버 계측 조회: "STATS" / "STATS RESET" (조회 후 초기화)
+    if (Tokens[0] == "STATS")
+    {
+        FMyReply Reply = Stats.BuildReply();
+        if (Tokens.Num() >= 2 && Tokens[1] == "RESET")
+            Stats.Reset();
+        return Reply;
+    }
+
+    // 명령/응답 로그 레벨: "LOG_VERBOSE <0|1|2>" (두 서버 공용 설정, MySocketLog.h 참고)
+    if (Tokens[0] == "LOG_VERBOSE" && Tokens.Num() >= 2 && FCString::IsNumeric(*Tokens[1]))
+    {
+        MySocketLog::SetLevel(FCString::Atoi(*Tokens[1]));
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"level"}
+        Data->SetNumberField(TEXT("level"), MySocketLog::GetLevel());
+        return FMyReply::Success(FString::Printf(TEXT("✅ 로그 레벨: %d"), MySocketLog::GetLevel()), Data);
+    }
 
     if (Tokens.Num() >= 5 && Tokens[0] == "MOVE")
     {
@@ -301,22 +446,19 @@ FString AMySocketServer::HandleCommand(const FString& Command)
         float Y = FCString::Atof(*Tokens[3]);
         float Z = FCString::Atof(*Tokens[4]);
 
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
-            {
-                USceneComponent* RootComp = It->GetRootComponent();
-                if (!RootComp)
-                    return FString::Printf(TEXT("❌ '%s' 액터의 루트 컴포넌트를 찾을 수 없습니다."), *ActorName);
-
-                if (RootComp->Mobility != EComponentMobility::Movable)
-                    return FString::Printf(TEXT("❌ '%s'의 Mobility가 'Movable'이 아닙니다."), *ActorName);
-
-                It->SetActorLocation(FVector(X, Y, Z));
-                return FString::Printf(TEXT("✅ %s 이동 완료: (%.1f, %.1f, %.1f)"), *ActorName, X, Y, Z);
-            }
+            // Static/Stationary는 Movable로 바꿔 적용 (SET_TRANSFORMS / 미리보기와 같은 규칙, MyTransformBatch.h)
+            if (!MyTransformBatch::EnsureMovable(Actor))
+                return FMyReply::Fail(FMyReply::Conflict, TEXT("NoRoot"), FString::Printf(TEXT("❌ '%s' 액터의 루트 컴포넌트를 찾을 수 없습니다."), *ActorName));
+
+            Actor->SetActorLocation(FVector(X, Y, Z));
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","location"}
+            Data->SetStringField(TEXT("actor"), Actor->GetName());
+            Data->SetArrayField(TEXT("location"), MyReply::Vec3(Actor->GetActorLocation()));
+            return FMyReply::Success(FString::Printf(TEXT("✅ %s 이동 완료: (%.1f, %.1f, %.1f)"), *ActorName, X, Y, Z), Data);
         }
-        return FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName);
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName));
     }
 
 
@@ -325,6 +467,7 @@ FString AMySocketServer::HandleCommand(const FString& Command)
     else if (Tokens[0] == "LIST_STATIC")
     {
         FString Out;
+        TArray<TSharedPtr<FJsonValue>> Actors;   // data: {"actors":[{"label","name","handle"}]} (텍스트 모드는 기존 "라벨|이름")
 
         // 모든 액터 순회
         for (TActorIterator<AActor> It(GetWorld()); It; ++It)
@@ -339,16 +482,29 @@ FString AMySocketServer::HandleCommand(const FString& Command)
 
 #if WITH_EDITOR
                 const FString Label = Actor->GetActorLabel(/*bIncludeCounts=*/true);
-                UE_LOG(LogTemp, Warning, TEXT("🎯 라벨: %s | 이름: %s"), *Label, *Name);
+                MYSOCKET_LOG(Verbose, Log, TEXT("🎯 라벨: %s | 이름: %s"), *Label, *Name);
 #else
                 const FString Label = Name;
 #endif
 
-                Out += FString::Printf(TEXT("%s|%s\n"), *Label, *Name);
+                if (bJson)
+                {
+                    TSharedPtr<FJsonObject> Entry = MakeShared<FJsonObject>();
+                    Entry->SetStringField(TEXT("label"), Label);
+                    Entry->SetStringField(TEXT("name"), Name);
+                    Entry->SetNumberField(TEXT("handle"), ActorIndex.GetOrAddHandle(Actor));
+                    Actors.Add(MakeShared<FJsonValueObject>(Entry));
+                }
+                else
+                {
+                    Out += FString::Printf(TEXT("%s|%s\n"), *Label, *Name);
+                }
             }
         }
 
-        return Out.IsEmpty() ? TEXT("\n") : Out;
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+        Data->SetArrayField(TEXT("actors"), Actors);
+        return FMyReply::Success(bJson || !Out.IsEmpty() ? Out : FString(TEXT("\n")), Data);
     }
 
 
@@ -357,60 +513,110 @@ FString AMySocketServer::HandleCommand(const FString& Command)
     {
         FString ActorName = Tokens[1];
 
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
-            {
-                FVector Loc = It->GetActorLocation();
-                return FString::Printf(TEXT("Location: %.1f %.1f %.1f"), Loc.X, Loc.Y, Loc.Z);
-            }
+            FVector Loc = Actor->GetActorLocation();
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","location"}
+            Data->SetStringField(TEXT("actor"), Actor->GetName());
+            Data->SetArrayField(TEXT("location"), MyReply::Vec3(Loc));
+            return FMyReply::Success(FString::Printf(TEXT("Location: %.1f %.1f %.1f"), Loc.X, Loc.Y, Loc.Z), Data);
         }
-        return FString::Printf(TEXT("❌ 액터 '%s'을(를) 찾을 수 없습니다."), *ActorName);
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ 액터 '%s'을(를) 찾을 수 없습니다."), *ActorName));
     }
 
 
     else if (Tokens[0] == "GET_SCALE" && Tokens.Num() >= 2)
     {
         const FString ActorName = Tokens[1];
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
-            {
-                const FVector S = It->GetActorScale3D();
-                return FString::Printf(TEXT("Scale: %.6f %.6f %.6f"), S.X, S.Y, S.Z);
-            }
+            const FVector S = Actor->GetActorScale3D();
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","scale"}
+            Data->SetStringField(TEXT("actor"), Actor->GetName());
+            Data->SetArrayField(TEXT("scale"), MyReply::Vec3(S));
+            return FMyReply::Success(FString::Printf(TEXT("Scale: %.6f %.6f %.6f"), S.X, S.Y, S.Z), Data);
         }
-        return FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName);
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName));
     }
 
 
     else if (Tokens[0] == "GET_MATERIAL_SLOTS" && Tokens.Num() >= 2)
     {
         FString ActorName = Tokens[1];
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
-            {
-                FString Result;
-                TArray<UStaticMeshComponent*> MeshComponents;
-                It->GetComponents<UStaticMeshComponent>(MeshComponents);
+            FString Result;
+            TArray<TSharedPtr<FJsonValue>> Slots;   // data: {"actor","slots":[{"index","material","path"}]}
+            TArray<UStaticMeshComponent*> MeshComponents;
+            Actor->GetComponents<UStaticMeshComponent>(MeshComponents);
 
-                for (UStaticMeshComponent* MeshComp : MeshComponents)
+            for (UStaticMeshComponent* MeshComp : MeshComponents)
+            {
+                int32 MatCount = MeshComp->GetNumMaterials();
+                for (int32 i = 0; i < MatCount; ++i)
                 {
-                    int32 MatCount = MeshComp->GetNumMaterials();
-                    for (int32 i = 0; i < MatCount; ++i)
+                    UMaterialInterface* Mat = MeshComp->GetMaterial(i);
+                    FString MatName = Mat ? Mat->GetName() : TEXT("None");
+                    if (bJson)
+                    {
+                        TSharedPtr<FJsonObject> Slot = MakeShared<FJsonObject>();
+                        Slot->SetNumberField(TEXT("index"), i);
+                        Slot->SetStringField(TEXT("material"), MatName);
+                        Slot->SetStringField(TEXT("path"), Mat ? Mat->GetPathName() : FString());
+                        Slots.Add(MakeShared<FJsonValueObject>(Slot));
+                    }
+                    else
                     {
-                        UMaterialInterface* Mat = MeshComp->GetMaterial(i);
-                        FString MatName = Mat ? Mat->GetName() : TEXT("None");
                         Result += FString::Printf(TEXT("Material Slot %d: %s\n"), i, *MatName);
                     }
                 }
-
-                return Result.IsEmpty() ? TEXT("⚠️ 머티리얼 없음\n") : Result;
             }
+
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+            Data->SetStringField(TEXT("actor"), Actor->GetName());
+            Data->SetArrayField(TEXT("slots"), Slots);
+            return FMyReply::Success(bJson || !Result.IsEmpty() ? Result : FString(TEXT("⚠️ 머티리얼 없음\n")), Data);
         }
 
-        return FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName);
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName));
+    }
+
+
+    // 선택 동기화: 여러 액터의 위치/회전/스케일/Mobility/슬롯을 JSON 한 번으로
+    else if (Tokens[0] == "GET_ACTOR_STATE" && Tokens.Num() >= 2)
+    {
+        TArray<FString> Names;
+        Names.Reserve(Tokens.Num() - 1);
+        for (int32 i = 1; i < Tokens.Num(); ++i)
+            Names.Emplace(Tokens[i]);
+        FMyReply Reply;
+        (bJson ? Reply.DataJson : Reply.Text) = MyActorState::BuildJson(ActorIndex, Names);   // 텍스트 모드도 같은 JSON
+        return Reply;
+    }
+
+    // 트랜스폼 변경 푸시 구독 (형식은 MyActorWatch.h)
+    else if (Tokens[0] == "WATCH" && Tokens.Num() >= 2)
+    {
+        if (!CurrentClient || !CurrentClient->bFramed)
+            return FMyReply::Fail(FMyReply::BadRequest, TEXT("WatchNeedsProto"), TEXT("❌ WATCH는 PROTO 1 연결에서만 사용할 수 있음"));
+        TArray<FString> Names;
+        Names.Reserve(Tokens.Num() - 1);
+        for (int32 i = 1; i < Tokens.Num(); ++i)
+            Names.Emplace(Tokens[i]);
+        FMyReply Reply;
+        (bJson ? Reply.DataJson : Reply.Text) = Watches.Watch(CurrentClient->AsShared(), Names);
+        return Reply;
+    }
+
+    else if (Tokens[0] == "UNWATCH")
+    {
+        TArray<FString> Names;
+        for (int32 i = 1; i < Tokens.Num(); ++i)
+            Names.Emplace(Tokens[i]);
+        const int32 Count = Watches.Unwatch(CurrentClient, Names);
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"count"}
+        Data->SetNumberField(TEXT("count"), Count);
+        return FMyReply::Success(FString::Printf(TEXT("✅ 구독 해제: %d개"), Count), Data);
     }
 
 
@@ -421,23 +627,181 @@ FString AMySocketServer::HandleCommand(const FString& Command)
         const float Sy = FCString::Atof(*Tokens[3]);
         const float Sz = FCString::Atof(*Tokens[4]);
 
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
+            // StaticMeshComponent가 있으면 Movable로 풀어주기 (편의)
+            TArray<UStaticMeshComponent*> Comps;
+            Actor->GetComponents<UStaticMeshComponent>(Comps);
+            for (UStaticMeshComponent* C : Comps)
             {
-                // StaticMeshComponent가 있으면 Movable로 풀어주기 (편의)
-                TArray<UStaticMeshComponent*> Comps;
-                It->GetComponents<UStaticMeshComponent>(Comps);
-                for (UStaticMeshComponent* C : Comps)
-                {
-                    C->SetMobility(EComponentMobility::Movable);
-                }
-
-                It->SetActorScale3D(FVector(Sx, Sy, Sz));
-                return FString::Printf(TEXT("OK Scale %.3f %.3f %.3f"), Sx, Sy, Sz);
+                C->SetMobility(EComponentMobility::Movable);
             }
+
+            Actor->SetActorScale3D(FVector(Sx, Sy, Sz));
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","scale"}
+            Data->SetStringField(TEXT("actor"), Actor->GetName());
+            Data->SetArrayField(TEXT("scale"), MyReply::Vec3(Actor->GetActorScale3D()));
+            return FMyReply::Success(FString::Printf(TEXT("OK Scale %.3f %.3f %.3f"), Sx, Sy, Sz), Data);
+        }
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName));
+    }
+
+    // 여러 액터 트랜스폼 일괄 적용: "SET_TRANSFORMS LS A x y z sx sy sz B ..." (같은 틱/같은 프레임)
+    else if (Tokens[0] == "SET_TRANSFORMS")
+    {
+        MyTransformBatch::FRequest Request;
+        FString Error;
+        if (!MyTransformBatch::Parse(Tokens, Request, Error))
+            return FMyReply::Fail(FMyReply::BadRequest, TEXT("Args"), FString::Printf(TEXT("❌ SET_TRANSFORMS 형식 오류: %s"), *Error));
+
+        TArray<FString> Missing;
+        const int32 Applied = MyTransformBatch::Apply(ActorIndex, Request, Missing);
+        FString Result = FString::Printf(TEXT("✅ 트랜스폼 일괄 적용: %d/%d"), Applied, Request.Entries.Num());
+        if (Missing.Num() > 0)
+            Result += FString::Printf(TEXT(" (없음: %s)"), *FString::Join(Missing, TEXT(", ")));
+
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"applied","total","missing"}
+        Data->SetNumberField(TEXT("applied"), Applied);
+        Data->SetNumberField(TEXT("total"), Request.Entries.Num());
+        Data->SetArrayField(TEXT("missing"), MyReply::Strings(Missing));
+        return FMyReply::Success(Result, Data);
+    }
+
+    // 상대 트랜스폼: "MOVE_BY A dx dy dz B ...", ROTATE_BY, SCALE_MUL (형식은 MyTransformBatch.h) → 적용 후 값
+    else if (Tokens[0] == "MOVE_BY" || Tokens[0] == "ROTATE_BY" || Tokens[0] == "SCALE_MUL")
+    {
+        MyTransformBatch::FRequest Request;
+        FString Error;
+        if (!MyTransformBatch::ParseRelative(Tokens, Request, Error))
+            return FMyReply::Fail(FMyReply::BadRequest, TEXT("Args"), FString::Printf(TEXT("❌ %s 형식 오류: %s"), *FString(Tokens[0]), *Error));
+
+        TArray<FString> Missing;
+        TArray<AActor*> Applied;
+        MyTransformBatch::Apply(ActorIndex, Request, Missing, &Applied);
+        FMyReply Reply;
+        (bJson ? Reply.DataJson : Reply.Text) = MyTransformBatch::BuildJson(ActorIndex, Applied, TEXT("missing"), Missing);   // 텍스트 모드도 같은 JSON
+        return Reply;
+    }
+
+    // 선택 집합 정의/추가/빼기: "SELECT_SET crowd A B C ..." (형식은 MySelectionSets.h)
+    else if ((Tokens[0] == "SELECT_SET" || Tokens[0] == "SELECT_SET_ADD" || Tokens[0] == "SELECT_SET_REMOVE") && Tokens.Num() >= 2)
+    {
+        const FString Set = Tokens[1];
+        TArray<FString> Names;
+        Names.Reserve(Tokens.Num() - 2);
+        for (int32 i = 2; i < Tokens.Num(); ++i)
+            Names.Emplace(Tokens[i]);
+
+        TArray<FString> Missing;
+        const int32 Count = Tokens[0] == "SELECT_SET" ? SelectionSets.Define(Set, Names, Missing)
+            : Tokens[0] == "SELECT_SET_ADD" ? SelectionSets.Add(Set, Names, Missing)
+            : SelectionSets.Remove(Set, Names, Missing);
+
+        FString Result = FString::Printf(TEXT("✅ 선택 집합 '%s': %d개"), *Set, Count);
+        if (Missing.Num() > 0)
+            Result += FString::Printf(TEXT(" (없음 %d개)"), Missing.Num());
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"set","count","missing"}
+        Data->SetStringField(TEXT("set"), Set);
+        Data->SetNumberField(TEXT("count"), Count);
+        Data->SetArrayField(TEXT("missing"), MyReply::Strings(Missing));
+        return FMyReply::Success(Result, Data);
+    }
+
+    else if (Tokens[0] == "SELECT_SET_CLEAR")
+    {
+        const int32 Count = SelectionSets.Clear(Tokens.Num() >= 2 ? FString(Tokens[1]) : FString());
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"count"}
+        Data->SetNumberField(TEXT("count"), Count);
+        return FMyReply::Success(FString::Printf(TEXT("✅ 선택 집합 삭제: %d개"), Count), Data);
+    }
+
+    // 그룹 트랜스폼: "GROUP_SCALE_MUL crowd 1.2 1.2 1.2 PIVOT CENTER" (형식은 MyTransformBatch.h)
+    else if (Tokens[0] == "GROUP_MOVE_BY" || Tokens[0] == "GROUP_ROTATE_BY" || Tokens[0] == "GROUP_SCALE_MUL")
+    {
+        MyTransformBatch::FGroupRequest Request;
+        FString Error;
+        if (!MyTransformBatch::ParseGroup(Tokens, Request, Error))
+            return FMyReply::Fail(FMyReply::BadRequest, TEXT("Args"), FString::Printf(TEXT("❌ %s 형식 오류: %s"), *FString(Tokens[0]), *Error));
+
+        TArray<AActor*> Actors;
+        if (!SelectionSets.Resolve(Request.Set, Actors))
+            return FMyReply::Fail(FMyReply::NotFound, TEXT("NoSet"), FString::Printf(TEXT("❌ 선택 집합 '%s' 없음"), *Request.Set));
+
+        // 응답에는 액터별 값을 싣지 않음 → 보낸 연결도 WATCH 푸시로 결과를 받게
+        FVector Pivot;
+        Watches.SetOrigin(nullptr);
+        const int32 Applied = MyTransformBatch::ApplyGroup(Actors, Request, Pivot);
+        Watches.SetOrigin(CurrentClient);
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"set","applied","pivot"?}
+        Data->SetStringField(TEXT("set"), Request.Set);
+        Data->SetNumberField(TEXT("applied"), Applied);
+        if (Request.Pivot != MyTransformBatch::EPivot::None)
+            Data->SetArrayField(TEXT("pivot"), MyReply::Vec3(Pivot));
+        return FMyReply::Success(FString::Printf(TEXT("✅ 그룹 '%s' %s: %d개"), *Request.Set, *FString(Tokens[0]), Applied), Data);
+    }
+
+    // 그룹 머티리얼: "GROUP_SET_MATERIAL crowd 0 /Game/M_Foo" (로드 1회, 멤버 전부 한 패스)
+    else if (Tokens[0] == "GROUP_SET_MATERIAL" && Tokens.Num() >= 4)
+    {
+        const FString Set = Tokens[1];
+        const int32 SlotIndex = FCString::Atoi(*Tokens[2]);
+        FString MaterialPath = Tokens.Join(3);
+        MaterialPath.TrimStartAndEndInline();
+
+        TArray<AActor*> Actors;
+        if (!SelectionSets.Resolve(Set, Actors))
+            return FMyReply::Fail(FMyReply::NotFound, TEXT("NoSet"), FString::Printf(TEXT("❌ 선택 집합 '%s' 없음"), *Set));
+
+        UMaterialInterface* NewMaterial = FMyAssetCache::Get().Resolve<UMaterialInterface>(MaterialPath);
+        if (!NewMaterial)
+            return FMyReply::Fail(FMyReply::NotFound, TEXT("LoadFailed"), FString::Printf(TEXT("❌ 머티리얼 로드 실패: %s"), *MaterialPath));
+
+        const int32 Applied = MyGroupOps::SetMaterial(Actors, SlotIndex, NewMaterial);
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"set","slot","applied","total","path"}
+        Data->SetStringField(TEXT("set"), Set);
+        Data->SetNumberField(TEXT("slot"), SlotIndex);
+        Data->SetNumberField(TEXT("applied"), Applied);
+        Data->SetNumberField(TEXT("total"), Actors.Num());
+        Data->SetStringField(TEXT("path"), NewMaterial->GetPathName());
+        return FMyReply::Success(FString::Printf(TEXT("✅ 그룹 '%s' %d번 슬롯 머티리얼 교체: %d/%d (%s)"),
+            *Set, SlotIndex, Applied, Actors.Num(), *NewMaterial->GetName()), Data);
+    }
+
+    // 그룹 Mobility: "GROUP_SET_MOBILITY crowd Movable"
+    else if (Tokens[0] == "GROUP_SET_MOBILITY" && Tokens.Num() >= 3)
+    {
+        const FString Set = Tokens[1];
+        EComponentMobility::Type Mobility;
+        if (!MyGroupOps::ParseMobility(FString(Tokens[2]), Mobility))
+            return FMyReply::Fail(FMyReply::BadRequest, TEXT("Args"), FString::Printf(TEXT("❌ Mobility는 Static/Stationary/Movable 중 하나: %s"), *FString(Tokens[2])));
+
+        TArray<AActor*> Actors;
+        if (!SelectionSets.Resolve(Set, Actors))
+            return FMyReply::Fail(FMyReply::NotFound, TEXT("NoSet"), FString::Printf(TEXT("❌ 선택 집합 '%s' 없음"), *Set));
+
+        const int32 Applied = MyGroupOps::SetMobility(Actors, Mobility);
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"set","applied","mobility"}
+        Data->SetStringField(TEXT("set"), Set);
+        Data->SetNumberField(TEXT("applied"), Applied);
+        Data->SetStringField(TEXT("mobility"), FString(Tokens[2]));
+        return FMyReply::Success(FString::Printf(TEXT("✅ 그룹 '%s' Mobility → %s: %d개"), *Set, *FString(Tokens[2]), Applied), Data);
+    }
+
+    // 숫자 핸들 발급: "HANDLE A B C" → "HANDLE 1 2 0" (0 = 없음)
+    // 바이너리 미리보기 패킷 / 텍스트 명령의 "#<핸들>" 액터 참조에 씀 (액터가 파괴되면 무효)
+    else if (Tokens[0] == "HANDLE" && Tokens.Num() >= 2)
+    {
+        FString Result = TEXT("HANDLE");
+        TArray<TSharedPtr<FJsonValue>> Handles;   // data: {"handles":[...]}
+        for (int32 i = 1; i < Tokens.Num(); ++i)
+        {
+            const uint32 Handle = ActorIndex.GetOrAddHandle(ActorIndex.FindByName(Tokens[i]));
+            Result += FString::Printf(TEXT(" %u"), Handle);
+            Handles.Add(MakeShared<FJsonValueNumber>(Handle));
         }
-        return FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName);
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+        Data->SetArrayField(TEXT("handles"), Handles);
+        return FMyReply::Success(Result, Data);
     }
 
     else if (Tokens[0] == "MOVE_COMMIT" && Tokens.Num() >= 5)
@@ -447,15 +811,16 @@ FString AMySocketServer::HandleCommand(const FString& Command)
         float Y = FCString::Atof(*Tokens[3]);
         float Z = FCString::Atof(*Tokens[4]);
 
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
-            {
-                It->SetActorLocation(FVector(X, Y, Z));
-                return FString::Printf(TEXT("✅ %s 위치 커밋 완료: (%.1f, %.1f, %.1f)"), *ActorName, X, Y, Z);
-            }
+            MyTransformBatch::EnsureMovable(Actor);
+            Actor->SetActorLocation(FVector(X, Y, Z));
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","location"}
+            Data->SetStringField(TEXT("actor"), Actor->GetName());
+            Data->SetArrayField(TEXT("location"), MyReply::Vec3(Actor->GetActorLocation()));
+            return FMyReply::Success(FString::Printf(TEXT("✅ %s 위치 커밋 완료: (%.1f, %.1f, %.1f)"), *ActorName, X, Y, Z), Data);
         }
-        return FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName);
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName));
         }
 
     else if (Tokens[0] == "CAM_LOOKAT" && Tokens.Num() >= 3)
@@ -463,41 +828,38 @@ FString AMySocketServer::HandleCommand(const FString& Command)
         const FString CamName = Tokens[1];
         const FString TargetName = Tokens[2];
 
-        ACineCameraActor* Cam = nullptr;
-        AActor* Target = nullptr;
-
         // 카메라 찾기
-        for (TActorIterator<ACineCameraActor> It(GetWorld()); It; ++It)
-        {
-            if (It->GetName().Equals(CamName, ESearchCase::IgnoreCase))
-            {
-                Cam = *It;
-                break;
-            }
-        }
-
+        ACineCameraActor* Cam = ActorIndex.FindByName<ACineCameraActor>(CamName);
         if (!Cam)
-            return FString::Printf(TEXT("❌ CineCamera '%s' 을(를) 찾을 수 없음"), *CamName);
+            return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ CineCamera '%s' 을(를) 찾을 수 없음"), *CamName));
 
-        // 타겟 찾기 (모든 액터)
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        // 타겟 찾기 (모든 액터, "$<집합>"이면 집합 중심)
+        FVector TargetLoc;
+        FString SetName;
+        if (FMySelectionSets::ParseSetRef(TargetName, SetName))
         {
-            if (It->GetName().Equals(TargetName, ESearchCase::IgnoreCase))
-            {
-                Target = *It;
-                break;
-            }
+            TArray<AActor*> Members;
+            if (!SelectionSets.Resolve(SetName, Members) || Members.IsEmpty())
+                return FMyReply::Fail(FMyReply::NotFound, TEXT("NoSet"), FString::Printf(TEXT("❌ 선택 집합 '%s' 없음 (또는 비어 있음)"), *SetName));
+            TargetLoc = MyGroupOps::Center(Members);
+        }
+        else
+        {
+            AActor* Target = ActorIndex.FindByName(TargetName);
+            if (!Target)
+                return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ 타겟 액터 '%s' 을(를) 찾을 수 없음"), *TargetName));
+            TargetLoc = Target->GetActorLocation();
         }
-
-        if (!Target)
-            return FString::Printf(TEXT("❌ 타겟 액터 '%s' 을(를) 찾을 수 없음"), *TargetName);
 
         const FVector CamLoc = Cam->GetActorLocation();
-        const FVector TargetLoc = Target->GetActorLocation();
         const FRotator NewRot = (TargetLoc - CamLoc).Rotation();
         Cam->SetActorRotation(NewRot);
 
-        return FString::Printf(TEXT("✅ %s → %s 바라보기 완료"), *CamName, *TargetName);
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"camera","target","rotation"}
+        Data->SetStringField(TEXT("camera"), CamName);
+        Data->SetStringField(TEXT("target"), TargetName);
+        Data->SetArrayField(TEXT("rotation"), MyReply::Rot3(NewRot));
+        return FMyReply::Success(FString::Printf(TEXT("✅ %s → %s 바라보기 완료"), *CamName, *TargetName), Data);
         }
 
     else if (Tokens[0] == "CAM_TRACK_START" && Tokens.Num() >= 3)
@@ -505,34 +867,33 @@ FString AMySocketServer::HandleCommand(const FString& Command)
         const FString CamName = Tokens[1];
         const FString TargetName = Tokens[2];
 
-        ACineCameraActor* Cam = nullptr;
-        AActor* Target = nullptr;
+        ACineCameraActor* Cam = ActorIndex.FindByName<ACineCameraActor>(CamName);
+        if (!Cam) return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ CineCamera '%s' 없음"), *CamName));
 
-        for (TActorIterator<ACineCameraActor> It(GetWorld()); It; ++It)
+        // "$<집합>"이면 매 틱 집합 중심을 따라감
+        FString SetName;
+        AActor* Target = nullptr;
+        if (FMySelectionSets::ParseSetRef(TargetName, SetName))
         {
-            if (It->GetName().Equals(CamName, ESearchCase::IgnoreCase))
-            {
-                Cam = *It;
-                break;
-            }
+            TArray<AActor*> Members;
+            if (!SelectionSets.Resolve(SetName, Members))
+                return FMyReply::Fail(FMyReply::NotFound, TEXT("NoSet"), FString::Printf(TEXT("❌ 선택 집합 '%s' 없음"), *SetName));
         }
-        if (!Cam) return FString::Printf(TEXT("❌ CineCamera '%s' 없음"), *CamName);
-
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        else
         {
-            if (It->GetName().Equals(TargetName, ESearchCase::IgnoreCase))
-            {
-                Target = *It;
-                break;
-            }
+            Target = ActorIndex.FindByName(TargetName);
+            if (!Target) return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ 타겟 '%s' 없음"), *TargetName));
         }
-        if (!Target) return FString::Printf(TEXT("❌ 타겟 '%s' 없음"), *TargetName);
 
         TrackedCamera = Cam;
         TrackedTarget = Target;
+        TrackedSet = SetName;
         bCameraTracking = true;
 
-        return FString::Printf(TEXT("✅ 카메라 트래킹 시작: %s → %s"), *CamName, *TargetName);
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"camera","target"}
+        Data->SetStringField(TEXT("camera"), CamName);
+        Data->SetStringField(TEXT("target"), TargetName);
+        return FMyReply::Success(FString::Printf(TEXT("✅ 카메라 트래킹 시작: %s → %s"), *CamName, *TargetName), Data);
         }
 
     else if (Tokens[0] == "CAM_TRACK_STOP")
@@ -540,81 +901,133 @@ FString AMySocketServer::HandleCommand(const FString& Command)
         bCameraTracking = false;
         TrackedCamera = nullptr;
         TrackedTarget = nullptr;
-        return TEXT("✅ 카메라 트래킹 중지");
+        TrackedSet.Reset();
+        return FMyReply::Success(TEXT("✅ 카메라 트래킹 중지"));
         }
 
-    else if (Tokens[0] == "SET_TEXTURE" && Tokens.Num() >= 5)
+    // 텍스처 교체: (컴포넌트, 슬롯)마다 MID 하나를 재사용 → 여러 번 바꿔도 파라미터 쓰기만 (형식은 MyMaterialPool.h)
+    else if ((Tokens[0] == "SET_TEXTURE" && Tokens.Num() >= 5) || (Tokens[0] == "SET_MATERIAL_PARAMS" && Tokens.Num() >= 6))
     {
+        const bool bTexture = Tokens[0] == "SET_TEXTURE";
         FString ActorName = Tokens[1];
         int32 SlotIndex = FCString::Atoi(*Tokens[2]);
-        FString ParamName = Tokens[3];
-        FString TexturePath = Tokens[4];
-
-        UTexture* NewTexture = Cast<UTexture>(StaticLoadObject(UTexture::StaticClass(), nullptr, *TexturePath));
-        if (!NewTexture) return TEXT("❌ 텍스처 로드 실패");
 
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        TArray<MyMaterialParams::FParam> Params;
+        if (bTexture)
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
-            {
-                TArray<UStaticMeshComponent*> MeshComponents;
-                It->GetComponents<UStaticMeshComponent>(MeshComponents);
+            MyMaterialParams::FParam& Param = Params.AddDefaulted_GetRef();
+            Param.Type = MyMaterialParams::EType::Texture;
+            Param.Name = FName(*Tokens[3]);
+            Param.Path = Tokens[4];
+            if (!FMyAssetCache::Get().Resolve<UTexture>(Param.Path))
+                return FMyReply::Fail(FMyReply::NotFound, TEXT("LoadFailed"), TEXT("❌ 텍스처 로드 실패"));
+        }
+        else if (!MyMaterialParams::Parse(Tokens, 3, Params))
+        {
+            return FMyReply::Fail(FMyReply::BadRequest, TEXT("Args"), TEXT("❌ SET_MATERIAL_PARAMS 형식 오류: <액터> <슬롯> T|S|V <이름> <값> ..."));
+        }
 
-                for (UStaticMeshComponent* MeshComp : MeshComponents)
-                {
-                    if (MeshComp->GetNumMaterials() <= SlotIndex)
-                        continue;
+        AActor* Actor = ActorIndex.FindByName(ActorName);
+        if (!Actor)
+            return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName));
 
-                    UMaterialInstanceDynamic* DynMat = MeshComp->CreateAndSetMaterialInstanceDynamic(SlotIndex);
-                    if (!DynMat) continue;
+        TArray<UStaticMeshComponent*> MeshComponents;
+        Actor->GetComponents<UStaticMeshComponent>(MeshComponents);
 
-                    DynMat->SetTextureParameterValue(*ParamName, NewTexture);
-                    return FString::Printf(TEXT("✅ '%s'의 %d번 슬롯 [%s] 텍스처 교체 성공"), *ActorName, SlotIndex, *ParamName);
-                }
+        for (UStaticMeshComponent* MeshComp : MeshComponents)
+        {
+            UMaterialInstanceDynamic* DynMat = MaterialPool.Acquire(MeshComp, SlotIndex);
+            if (!DynMat) continue;
+
+            TArray<FString> Failed;
+            const int32 Count = MyMaterialParams::Apply(DynMat, Params, Failed);
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","slot","set","failed":[...]} (+ SET_TEXTURE는 "param","texture")
+            Data->SetStringField(TEXT("actor"), Actor->GetName());
+            Data->SetNumberField(TEXT("slot"), SlotIndex);
+            Data->SetNumberField(TEXT("set"), Count);
+            TArray<TSharedPtr<FJsonValue>> FailedJson;
+            for (const FString& Name : Failed)
+                FailedJson.Add(MakeShared<FJsonValueString>(Name));
+            Data->SetArrayField(TEXT("failed"), FailedJson);
+            if (bTexture)
+            {
+                Data->SetStringField(TEXT("param"), Params[0].Name.ToString());
+                Data->SetStringField(TEXT("texture"), Params[0].Path);
+                return FMyReply::Success(FString::Printf(TEXT("✅ '%s'의 %d번 슬롯 [%s] 텍스처 교체 성공"), *ActorName, SlotIndex, *Params[0].Name.ToString()), Data);
             }
-        }
 
+            FString Result = FString::Printf(TEXT("✅ '%s'의 %d번 슬롯 파라미터 %d개 적용"), *ActorName, SlotIndex, Count);
+            if (Failed.Num() > 0)
+                Result += FString::Printf(TEXT(" (텍스처 로드 실패: %s)"), *FString::Join(Failed, TEXT(", ")));
+            return FMyReply::Success(Result, Data);
+        }
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ '%s'에 %d번 슬롯이 없음"), *ActorName, SlotIndex));
+    }
 
+    // MID 해제: "RELEASE_MID" (전부) / "RELEASE_MID Cube" / "RELEASE_MID Cube 0" → 원래 머티리얼로 되돌림
+    else if (Tokens[0] == "RELEASE_MID")
+    {
+        AActor* Actor = nullptr;
+        if (Tokens.Num() >= 2)
+        {
+            Actor = ActorIndex.FindByName(FString(Tokens[1]));
+            if (!Actor)
+                return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *FString(Tokens[1])));
+        }
+        const int32 Count = MaterialPool.Release(Actor, Tokens.Num() >= 3 ? FCString::Atoi(*Tokens[2]) : INDEX_NONE);
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+        Data->SetNumberField(TEXT("count"), Count);
+        return FMyReply::Success(FString::Printf(TEXT("✅ MID 해제: %d개 (풀 %d개 남음)"), Count, MaterialPool.Num()), Data);
     }
 
     else if (Tokens[0] == "GET_TEXTURES" && Tokens.Num() >= 2)
     {
         FString ActorName = Tokens[1];
 
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
-            {
-                FString Result;
-                TArray<UStaticMeshComponent*> MeshComponents;
-                It->GetComponents<UStaticMeshComponent>(MeshComponents);
+            FString Result;
+            TArray<TSharedPtr<FJsonValue>> Slots;   // data: {"actor","slots":[{"index","material","textures":[...]}]}
+            TArray<UStaticMeshComponent*> MeshComponents;
+            Actor->GetComponents<UStaticMeshComponent>(MeshComponents);
 
-                for (UStaticMeshComponent* MeshComp : MeshComponents)
+            for (UStaticMeshComponent* MeshComp : MeshComponents)
+            {
+                int32 MatCount = MeshComp->GetNumMaterials();
+                for (int32 i = 0; i < MatCount; ++i)
                 {
-                    int32 MatCount = MeshComp->GetNumMaterials();
-                    for (int32 i = 0; i < MatCount; ++i)
-                    {
-                        UMaterialInterface* Mat = MeshComp->GetMaterial(i);
-                        if (!Mat) continue;
+                    UMaterialInterface* Mat = MeshComp->GetMaterial(i);
+                    if (!Mat) continue;
 
-                        Result += FString::Printf(TEXT("Material Slot %d: %s\n"), i, *Mat->GetName());
+                    TArray<UTexture*> Textures;
+                    Mat->GetUsedTextures(Textures, EMaterialQualityLevel::High, false, ERHIFeatureLevel::SM5, true);
 
-                        TArray<UTexture*> Textures;
-                        Mat->GetUsedTextures(Textures, EMaterialQualityLevel::High, false, ERHIFeatureLevel::SM5, true);
+                    if (bJson)
+                    {
+                        TSharedPtr<FJsonObject> Slot = MakeShared<FJsonObject>();
+                        Slot->SetNumberField(TEXT("index"), i);
+                        Slot->SetStringField(TEXT("material"), Mat->GetName());
+                        Slot->SetArrayField(TEXT("textures"), TextureNames(Textures));
+                        Slots.Add(MakeShared<FJsonValueObject>(Slot));
+                        continue;
+                    }
 
-                        for (UTexture* Tex : Textures)
-                        {
-                            if (Tex)
-                                Result += FString::Printf(TEXT("    └ Texture: %s\n"), *Tex->GetName());
-                        }
+                    Result += FString::Printf(TEXT("Material Slot %d: %s\n"), i, *Mat->GetName());
+                    for (UTexture* Tex : Textures)
+                    {
+                        if (Tex)
+                            Result += FString::Printf(TEXT("    └ Texture: %s\n"), *Tex->GetName());
                     }
                 }
-
-                return Result.IsEmpty() ? TEXT("⚠️ 머티리얼 또는 텍스처가 없음") : Result;
             }
+
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+            Data->SetStringField(TEXT("actor"), Actor->GetName());
+            Data->SetArrayField(TEXT("slots"), Slots);
+            return FMyReply::Success(bJson || !Result.IsEmpty() ? Result : FString(TEXT("⚠️ 머티리얼 또는 텍스처가 없음")), Data);
         }
 
-        return FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName);
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName));
     }
 
     else if (Tokens[0] == "GET_TEXTURES_SLOT" && Tokens.Num() >= 3)
@@ -622,14 +1035,12 @@ FString AMySocketServer::HandleCommand(const FString& Command)
         const FString ActorName = Tokens[1];
         const int32 SlotIndex = FCString::Atoi(*Tokens[2]);
 
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            if (!It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
-                continue;
-
             FString Result;
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","slot","material","textures":[...]}
             TArray<UStaticMeshComponent*> MeshComponents;
-            It->GetComponents<UStaticMeshComponent>(MeshComponents);
+            Actor->GetComponents<UStaticMeshComponent>(MeshComponents);
 
             bool bFoundAny = false;
 
@@ -650,6 +1061,11 @@ FString AMySocketServer::HandleCommand(const FString& Command)
                 TArray<UTexture*> Textures;
                 Mat->GetUsedTextures(Textures, EMaterialQualityLevel::High, false, ERHIFeatureLevel::SM5, true);
 
+                Data->SetStringField(TEXT("actor"), Actor->GetName());
+                Data->SetNumberField(TEXT("slot"), SlotIndex);
+                Data->SetStringField(TEXT("material"), Mat->GetName());
+                Data->SetArrayField(TEXT("textures"), TextureNames(Textures));
+
                 if (Textures.Num() == 0)
                 {
                     Result += TEXT("  [Textures]\n    └ (none)\n");
@@ -670,13 +1086,14 @@ FString AMySocketServer::HandleCommand(const FString& Command)
 
             if (!bFoundAny)
             {
-                return FString::Printf(TEXT("⚠️ 슬롯 %d에 머티리얼/텍스처 없음 또는 컴포넌트 미일치"), SlotIndex);
+                return FMyReply::Fail(FMyReply::NotFound, TEXT("NoMaterial"),
+                    FString::Printf(TEXT("⚠️ 슬롯 %d에 머티리얼/텍스처 없음 또는 컴포넌트 미일치"), SlotIndex));
             }
 
-            return Result.IsEmpty() ? TEXT("⚠️ 텍스처 없음") : Result;
+            return FMyReply::Success(bJson ? FString() : Result, Data);
         }
 
-        return FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName);
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName));
         }
 
     else if (Tokens[0] == "SET_MATERIAL" && Tokens.Num() >= 4)
@@ -684,72 +1101,78 @@ FString AMySocketServer::HandleCommand(const FString& Command)
         FString ActorName = Tokens[1];
         int32 SlotIndex = FCString::Atoi(*Tokens[2]);
 
-        // 3번 인덱스부터 끝까지 다시 합쳐 경로 복원 + 정리
-        FString MaterialPath;
-        {
-            TArray<FString> TailTokens;
-            for (int32 i = 3; i < Tokens.Num(); ++i) { TailTokens.Add(Tokens[i]); }
-            MaterialPath = FString::Join(TailTokens, TEXT(" "));
+        // 3번 인덱스부터 끝까지 = 경로 (따옴표는 토크나이저가 벗김, 따옴표 없이 보낸 공백 포함 경로는 다시 이어 붙임)
+        FString MaterialPath = Tokens.Join(3);
+        MaterialPath.TrimStartAndEndInline();
 
-            MaterialPath.ReplaceInline(TEXT("\r"), TEXT(""));
-            MaterialPath.ReplaceInline(TEXT("\n"), TEXT(""));
-            MaterialPath.TrimStartAndEndInline();
-            if ((MaterialPath.StartsWith(TEXT("\"")) && MaterialPath.EndsWith(TEXT("\""))) ||
-                (MaterialPath.StartsWith(TEXT("'")) && MaterialPath.EndsWith(TEXT("'"))))
-            {
-                MaterialPath = MaterialPath.Mid(1, MaterialPath.Len() - 2);
-                MaterialPath.TrimStartAndEndInline();
-            }
+        // 디스크 경로 → /Game 변환, 점(.) 보정, 로드는 캐시에서 (같은 경로는 한 번만 로드)
+        UMaterialInterface* NewMaterial = FMyAssetCache::Get().Resolve<UMaterialInterface>(MaterialPath);
+        if (!NewMaterial)
+        {
+            return FMyReply::Fail(FMyReply::NotFound, TEXT("LoadFailed"), FString::Printf(TEXT("❌ 머티리얼 로드 실패: %s"), *MaterialPath));
         }
 
-        // ✅ (1) 디스크 경로 → /Game 경로 자동 변환
+        // 적용
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            FString ContentAbs = FPaths::ConvertRelativePathToFull(FPaths::ProjectContentDir()); // .../MyProject/Content/
-            FString MPath = MaterialPath;
-            MPath.ReplaceInline(TEXT("\\"), TEXT("/"));
-            ContentAbs.ReplaceInline(TEXT("\\"), TEXT("/"));
+            TArray<UStaticMeshComponent*> MeshComponents;
+            Actor->GetComponents<UStaticMeshComponent>(MeshComponents);
 
-            if (MPath.StartsWith(ContentAbs))  // D:/.../Content/Textures/Foo_Mat
+            for (UStaticMeshComponent* MeshComp : MeshComponents)
             {
-                FString Rel = MPath.Mid(ContentAbs.Len()); // Textures/Foo_Mat
-                MaterialPath = TEXT("/Game/") + Rel;       // /Game/Textures/Foo_Mat
+                if (MeshComp->GetNumMaterials() <= SlotIndex) continue;
+                MeshComp->SetMaterial(SlotIndex, NewMaterial);
+                TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","slot","material","path"}
+                Data->SetStringField(TEXT("actor"), Actor->GetName());
+                Data->SetNumberField(TEXT("slot"), SlotIndex);
+                Data->SetStringField(TEXT("material"), NewMaterial->GetName());
+                Data->SetStringField(TEXT("path"), NewMaterial->GetPathName());
+                return FMyReply::Success(FString::Printf(TEXT("✅ '%s'의 %d번 슬롯 머티리얼 교체 성공 (%s)"),
+                    *ActorName, SlotIndex, *NewMaterial->GetName()), Data);
             }
         }
-
-        // ✅ (2) 점(.) 자동 보정: /Game/Foo/Bar → /Game/Foo/Bar.Bar
-        if (!MaterialPath.Contains(TEXT(".")))
-        {
-            const FString Short = FPackageName::GetShortName(MaterialPath);
-            MaterialPath += TEXT(".") + Short;
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), TEXT("❌ 적용 실패 (액터 또는 슬롯 없음)"));
         }
 
-        // 로드 시도
-        UMaterialInterface* NewMaterial =
-            Cast<UMaterialInterface>(StaticLoadObject(UMaterialInterface::StaticClass(), nullptr, *MaterialPath));
+    // 머티리얼 하나를 여러 (액터, 슬롯)에: "SET_MATERIAL_MULTI \"/Game/M_Foo\" A 0 B 0 C 1" (형식은 MySelectionSets.h)
+    else if (Tokens[0] == "SET_MATERIAL_MULTI")
+    {
+        FString MaterialPath;
+        TArray<MyGroupOps::FMaterialTarget> Targets;
+        if (!MyGroupOps::ParseMaterialTargets(Tokens, MaterialPath, Targets))
+            return FMyReply::Fail(FMyReply::BadRequest, TEXT("Args"), TEXT("❌ SET_MATERIAL_MULTI 형식 오류: <경로> <액터> <슬롯> ..."));
+
+        UMaterialInterface* NewMaterial = FMyAssetCache::Get().Resolve<UMaterialInterface>(MaterialPath);   // 로드 1회
         if (!NewMaterial)
-        {
-            return FString::Printf(TEXT("❌ 머티리얼 로드 실패: %s"), *MaterialPath);
-        }
+            return FMyReply::Fail(FMyReply::NotFound, TEXT("LoadFailed"), FString::Printf(TEXT("❌ 머티리얼 로드 실패: %s"), *MaterialPath));
 
-        // 적용
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
-        {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
-            {
-                TArray<UStaticMeshComponent*> MeshComponents;
-                It->GetComponents<UStaticMeshComponent>(MeshComponents);
+        const int32 Applied = MyGroupOps::ApplyMaterialTargets(ActorIndex, NewMaterial, Targets);
 
-                for (UStaticMeshComponent* MeshComp : MeshComponents)
-                {
-                    if (MeshComp->GetNumMaterials() <= SlotIndex) continue;
-                    MeshComp->SetMaterial(SlotIndex, NewMaterial);
-                    return FString::Printf(TEXT("✅ '%s'의 %d번 슬롯 머티리얼 교체 성공 (%s)"),
-                        *ActorName, SlotIndex, *NewMaterial->GetName());
-                }
-            }
-        }
-        return TEXT("❌ 적용 실패 (액터 또는 슬롯 없음)");
+        TArray<FString> Failed;
+        TArray<TSharedPtr<FJsonValue>> Results;   // data: {"path","material","applied","total","results":[{"actor","slot","status"}]}
+        Results.Reserve(Targets.Num());
+        for (const MyGroupOps::FMaterialTarget& Target : Targets)
+        {
+            TSharedPtr<FJsonObject> Item = MakeShared<FJsonObject>();
+            Item->SetStringField(TEXT("actor"), Target.Actor);
+            Item->SetNumberField(TEXT("slot"), Target.Slot);
+            Item->SetStringField(TEXT("status"), MyGroupOps::StatusName(Target.Status));
+            Results.Add(MakeShared<FJsonValueObject>(Item));
+            if (Target.Status != MyGroupOps::EMaterialStatus::Ok)
+                Failed.Add(FString::Printf(TEXT("%s#%d %s"), *Target.Actor, Target.Slot, MyGroupOps::StatusName(Target.Status)));
         }
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+        Data->SetStringField(TEXT("path"), NewMaterial->GetPathName());
+        Data->SetStringField(TEXT("material"), NewMaterial->GetName());
+        Data->SetNumberField(TEXT("applied"), Applied);
+        Data->SetNumberField(TEXT("total"), Targets.Num());
+        Data->SetArrayField(TEXT("results"), Results);
+
+        FString Result = FString::Printf(TEXT("✅ 머티리얼 일괄 교체: %d/%d (%s)"), Applied, Targets.Num(), *NewMaterial->GetName());
+        if (Failed.Num() > 0)
+            Result += FString::Printf(TEXT(" (실패: %s)"), *FString::Join(Failed, TEXT(", ")));
+        return FMyReply::Success(Result, Data);
+    }
 
 
 
@@ -758,51 +1181,36 @@ FString AMySocketServer::HandleCommand(const FString& Command)
     {
         FString ActorName = Tokens[1];
 
-        // 경로 재조립 + 따옴표/개행 정리
-        FString MeshPath;
-        {
-            TArray<FString> Tail;
-            for (int32 i = 2; i < Tokens.Num(); ++i) Tail.Add(Tokens[i]);
-            MeshPath = FString::Join(Tail, TEXT(" "));
-            MeshPath.ReplaceInline(TEXT("\r"), TEXT("")); MeshPath.ReplaceInline(TEXT("\n"), TEXT(""));
-            MeshPath.TrimStartAndEndInline();
-            if ((MeshPath.StartsWith(TEXT("\"")) && MeshPath.EndsWith(TEXT("\""))) ||
-                (MeshPath.StartsWith(TEXT("'")) && MeshPath.EndsWith(TEXT("'"))))
-            {
-                MeshPath = MeshPath.Mid(1, MeshPath.Len() - 2);
-                MeshPath.TrimStartAndEndInline();
-            }
-            // "/Game/Foo/Bar" → "/Game/Foo/Bar.Bar" 자동보정
-            if (!MeshPath.Contains(TEXT(".")))
-            {
-                const FString Short = FPackageName::GetShortName(MeshPath);
-                MeshPath += TEXT(".") + Short;
-            }
-        }
+        // 2번 인덱스부터 끝까지 = 경로 (따옴표는 토크나이저가 벗김)
+        FString MeshPath = Tokens.Join(2);
+        MeshPath.TrimStartAndEndInline();
 
-        UStaticMesh* NewMesh = Cast<UStaticMesh>(StaticLoadObject(UStaticMesh::StaticClass(), nullptr, *MeshPath));
-        if (!NewMesh) return FString::Printf(TEXT("❌ StaticMesh 로드 실패: %s"), *MeshPath);
+        // "/Game/Foo/Bar" → "/Game/Foo/Bar.Bar" 보정과 로드는 캐시에서
+        UStaticMesh* NewMesh = FMyAssetCache::Get().Resolve<UStaticMesh>(MeshPath);
+        if (!NewMesh) return FMyReply::Fail(FMyReply::NotFound, TEXT("LoadFailed"), FString::Printf(TEXT("❌ StaticMesh 로드 실패: %s"), *MeshPath));
 
-        for (TActorIterator<AActor> It(GetWorld()); It; ++It)
+        if (AActor* Actor = ActorIndex.FindByName(ActorName))
         {
-            if (It->GetName().Equals(ActorName, ESearchCase::IgnoreCase))
+            int32 Applied = 0;
+            TArray<UStaticMeshComponent*> Comps;
+            Actor->GetComponents<UStaticMeshComponent>(Comps);
+            for (UStaticMeshComponent* C : Comps)
             {
-                int32 Applied = 0;
-                TArray<UStaticMeshComponent*> Comps;
-                It->GetComponents<UStaticMeshComponent>(Comps);
-                for (UStaticMeshComponent* C : Comps)
-                {
-                    C->SetMobility(EComponentMobility::Movable); // 처음부터 Movable 유지
-                    C->SetStaticMesh(NewMesh);
-                    C->MarkRenderStateDirty();
-                    ++Applied;
-                }
-                return Applied > 0
-                    ? FString::Printf(TEXT("✅ '%s' 메쉬 교체 성공: %s"), *ActorName, *NewMesh->GetName())
-                    : TEXT("⚠️ StaticMeshComponent가 없습니다.");
+                C->SetMobility(EComponentMobility::Movable); // 처음부터 Movable 유지
+                C->SetStaticMesh(NewMesh);
+                C->MarkRenderStateDirty();
+                ++Applied;
             }
+            if (Applied == 0)
+                return FMyReply::Fail(FMyReply::Conflict, TEXT("NoSMC"), TEXT("⚠️ StaticMeshComponent가 없습니다."));
+
+            TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();   // {"actor","mesh","components"}
+            Data->SetStringField(TEXT("actor"), Actor->GetName());
+            Data->SetStringField(TEXT("mesh"), NewMesh->GetPathName());
+            Data->SetNumberField(TEXT("components"), Applied);
+            return FMyReply::Success(FString::Printf(TEXT("✅ '%s' 메쉬 교체 성공: %s"), *ActorName, *NewMesh->GetName()), Data);
         }
-        return FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName);
+        return FMyReply::Fail(FMyReply::NotFound, TEXT("NotFound"), FString::Printf(TEXT("❌ '%s' 이름의 액터를 찾을 수 없음"), *ActorName));
         }
 
 
@@ -810,7 +1218,7 @@ FString AMySocketServer::HandleCommand(const FString& Command)
 
     else if (Tokens[0] == "GET_BLUEPRINTS")
     {
-        FString Path = Tokens.Num() >= 2 ? Tokens[1] : "/Game";
+        FString Path = Tokens.Num() >= 2 ? FString(Tokens[1]) : FString(TEXT("/Game"));
         TArray<FAssetData> Assets;
         FARFilter Filter;
         Filter.ClassPaths.Add(FTopLevelAssetPath(TEXT("/Script/Engine"), TEXT("Blueprint")));
@@ -821,20 +1229,26 @@ FString AMySocketServer::HandleCommand(const FString& Command)
         AssetRegistry.Get().GetAssets(Filter, Assets);
 
         FString Result;
+        TArray<TSharedPtr<FJsonValue>> Classes;   // data: {"classes":[...]}
         for (const FAssetData& Asset : Assets)
         {
-            Result += Asset.GetObjectPathString() + TEXT("_C") + LINE_TERMINATOR;
+            if (bJson)
+                Classes.Add(MakeShared<FJsonValueString>(Asset.GetObjectPathString() + TEXT("_C")));
+            else
+                Result += Asset.GetObjectPathString() + TEXT("_C") + LINE_TERMINATOR;
         }
 
-        return Result.IsEmpty() ? TEXT("⚠️ 블루프린트 없음") : Result;
+        TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+        Data->SetArrayField(TEXT("classes"), Classes);
+        return FMyReply::Success(bJson || !Result.IsEmpty() ? Result : FString(TEXT("⚠️ 블루프린트 없음")), Data);
     }
 
     else if (Tokens.Num() >= 2 && Tokens[0] == "IMPORT_FBX")
     {
 #if WITH_EDITOR
-        return TEXT("❌ 에디터 모드에서만 사용 가능합니다. (PIE 상태에서는 FBX 임포트 불가)");
+        return FMyReply::Fail(FMyReply::Conflict, TEXT("EditorOnly"), TEXT("❌ 에디터 모드에서만 사용 가능합니다. (PIE 상태에서는 FBX 임포트 불가)"));
 #else
-        return TEXT("❌ 에디터 모드에서만 사용 가능합니다.");
+        return FMyReply::Fail(FMyReply::Conflict, TEXT("EditorOnly"), TEXT("❌ 에디터 모드에서만 사용 가능합니다."));
 #endif
     }
 
@@ -855,7 +1269,7 @@ FString AMySocketServer::HandleCommand(const FString& Command)
 
 
         // ... 기존 SAVE_PRESET / IMPORT_FBX / 마지막 else 등 유지
-        return TEXT("❌ 알 수 없는 명령");
+        return FMyReply::Fail(FMyReply::Unknown, TEXT("Unknown"), TEXT("❌ 알 수 없는 명령"));
 }
 
 FString AMySocketServer::GetAllActorNames()
@@ -886,23 +1300,79 @@ void AMySocketServer::ExecutePythonAfterDelay(const FString& ScriptPath)
         }, 0.1f, false);
 }
 
-void AMySocketServer::SendResponseToPython(const FString& Message)
+// BATCH: 명령 N개를 이 틱에서 모두 실행하고 응답 N개를 순서대로 한 번에 전송
+void AMySocketServer::HandleBatch(const TArray<FString>& Commands)
 {
-    if (!ClientSocket) return;
-    FTCHARToUTF8 Convert(*Message);
-    int32 Sent = 0;
-    ClientSocket->Send((uint8*)Convert.Get(), Convert.Length(), Sent);
-    UE_LOG(LogTemp, Log, TEXT("📤 응답 전송: %s"), *Message);
+    if (!CurrentClient || !CurrentClient->bFramed)
+    {
+        SendResponseToPython(FMyReply::Fail(FMyReply::BadRequest, TEXT("BatchNeedsProto"), TEXT("❌ BATCH는 PROTO 1 협상 후에만 사용 가능")), TEXT("BATCH"));
+        return;
+    }
+
+    TArray<uint8> Out;
+    for (int32 i = 0; i < Commands.Num(); ++i)
+    {
+        CommandTokens.Parse(Commands[i]);
+        const FString RequestId = CommandTokens.RequestId();
+
+        const double Start = FPlatformTime::Seconds();
+        const FString Verb = CommandTokens.IsEmpty() ? FString() : FString(CommandTokens[0]);
+        const FMyReply Result = i < MySocketProtocol::MaxBatchCommands
+            ? HandleCommand(CommandTokens)
+            : FMyReply::Fail(FMyReply::BadRequest, TEXT("BatchTooMany"), TEXT("❌ BATCH 명령 수 초과"));
+        MySocketProtocol::AppendResponse(Out, Result.Render(Verb, CurrentClient->bJson), true, RequestId);
+        Stats.RecordCommand(Verb, FPlatformTime::Seconds() - Start, Result.IsOk());
+    }
+    MySocketProtocol::SendAll(*CurrentClient, Out.GetData(), Out.Num());
+    Stats.AddBytesOut(Out.Num());
+    MYSOCKET_LOG(Summary, Log, TEXT("📤 BATCH 응답 전송: %d건"), Commands.Num());
 }
 
-void AMySocketServer::EndPlay(const EEndPlayReason::Type EndPlayReason)
+// 바이너리 미리보기: 응답 없이 바로 적용 (커밋은 텍스트 MOVE_COMMIT 등으로 따로 옴)
+void AMySocketServer::ApplyBinaryPacket(const MySocketProtocol::FBinaryPacketView& Packet)
 {
-    if (ClientSocket)
+    using MySocketProtocol::EBinaryOp;
+
+    for (int32 i = 0; i < Packet.Count; ++i)
     {
-        ClientSocket->Close();
-        ISocketSubsystem::Get(PLATFORM_SOCKETSUBSYSTEM)->DestroySocket(ClientSocket);
-        ClientSocket = nullptr;
+        AActor* Actor = ActorIndex.ResolveHandle(Packet.Handle(i));
+        const FVector V = Packet.Value(i);
+        if (!Actor || V.ContainsNaN() || !MyTransformBatch::EnsureMovable(Actor))   // 커밋(SET_TRANSFORMS)과 같은 Mobility 규칙
+            continue;
+
+        switch (Packet.Op)
+        {
+        case EBinaryOp::Move:
+            Actor->SetActorLocation(Packet.bDelta ? Actor->GetActorLocation() + V : V);
+            break;
+        case EBinaryOp::Scale:
+            Actor->SetActorScale3D(Packet.bDelta ? Actor->GetActorScale3D() + V : V);
+            break;
+        case EBinaryOp::Rotate:
+        {
+            const FRotator R(V.X, V.Y, V.Z);
+            Actor->SetActorRotation(Packet.bDelta ? Actor->GetActorRotation() + R : R);
+            break;
+        }
+        }
     }
+}
+
+void AMySocketServer::SendResponseToPython(const FMyReply& Reply, const FString& Verb, const FString& RequestId)
+{
+    // 응답은 지금 처리 중인 명령을 보낸 클라이언트에게만 (그 연결이 협상한 형식으로)
+    if (!CurrentClient || !CurrentClient->Socket) return;
+    const FString Message = Reply.Render(Verb, CurrentClient->bJson);
+    TArray<uint8> Out;
+    MySocketProtocol::AppendResponse(Out, Message, CurrentClient->bFramed, RequestId);
+    MySocketProtocol::SendAll(*CurrentClient, Out.GetData(), Out.Num());
+    Stats.AddBytesOut(Out.Num());
+    MYSOCKET_LOG(Verbose, Log, TEXT("📤 응답 전송: %s"), *Message);
+}
+
+void AMySocketServer::EndPlay(const EEndPlayReason::Type EndPlayReason)
+{
+    MySocketProtocol::CloseAll(Clients);
 
     if (ListenSocket)
     {
@@ -911,6 +1381,9 @@ void AMySocketServer::EndPlay(const EEndPlayReason::Type EndPlayReason)
         ListenSocket = nullptr;
     }
 
+    Watches.Reset();
+    MaterialPool.Reset();
+    ActorIndex.Unbind();
     Super::EndPlay(EndPlayReason);
 }
 
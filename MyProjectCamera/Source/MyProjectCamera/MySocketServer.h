@@ -5,6 +5,14 @@
 #include "Sockets.h"
 #include "SocketSubsystem.h"
 #include "CineCameraActor.h"
+#include "MyActorIndex.h"
+#include "MyActorWatch.h"
+#include "MySelectionSets.h"
+#include "MyMaterialPool.h"
+#include "MySocketProtocol.h"
+#include "MyCommandTokenizer.h"
+#include "MyReply.h"
+#include "MySocketStats.h"
 
 #include "MySocketServer.generated.h"
 
@@ -25,22 +33,34 @@ protected:
    // void ReceiveAndHandleCommand();
     void StartListening(int32 Port);
     void AcceptClients();
-    FString HandleCommand(const FString& Command);
-    void SendResponseToPython(const FString& Message);
+    bool ServiceClient(MySocketProtocol::FClientConnection& Client);
+    FMyReply HandleCommand(const MyCommandTokenizer::FTokens& Tokens);
+    void SendResponseToPython(const FMyReply& Reply, const FString& Verb = FString(), const FString& RequestId = FString());
+    void HandleBatch(const TArray<FString>& Commands);
+    void ApplyBinaryPacket(const MySocketProtocol::FBinaryPacketView& Packet);
     FString GetAllActorNames();
     FString GetStaticMeshActorNames();
-    FString CmdLoadPreset(const FString& Name, float Ox, float Oy, float Oz);  // ✅ 추가
-    FString CmdSavePreset(const FString& Name);
+    FMyReply CmdLoadPreset(const FString& Name, float Ox, float Oy, float Oz);  // ✅ 추가
+    FMyReply CmdSavePreset(const FString& Name);
 
 private:
     FSocket* ListenSocket = nullptr;
-    FSocket* ClientSocket = nullptr;
+    MySocketProtocol::FClientList Clients;                      // 접속 중인 클라이언트 (연결마다 PROTO 상태 / 수신 버퍼 따로)
+    MySocketProtocol::FClientConnection* CurrentClient = nullptr; // 지금 처리 중인 명령의 송신자 → 응답 대상
+    int32 NextClientIndex = 0;    // 라운드로빈 시작 위치
+    FMyActorIndex ActorIndex;     // 이름/"#핸들" → 액터 해시 조회 (명령마다 월드 전체 순회 방지)
+    MyCommandTokenizer::FTokens CommandTokens;   // 지금 처리 중인 명령의 토큰 (버퍼는 명령마다 재사용)
+    FMySocketStats Stats{ TEXT("PIE"), TEXT("bytes") };   // STATS 명령 (큐 깊이 = 틱 끝에 남은 수신 바이트)
+    FMyActorWatch Watches{ ActorIndex, Stats };   // WATCH 트랜스폼 변경 푸시 구독
+    FMySelectionSets SelectionSets{ ActorIndex };  // SELECT_SET 이름 있는 액터 집합 (GROUP_* 명령 대상)
+    FMyMaterialPool MaterialPool;   // SET_TEXTURE / SET_MATERIAL_PARAMS용 MID (컴포넌트, 슬롯당 1개 재사용)
     FTimerHandle ListenTimerHandle;
     TSharedPtr<FInternetAddr> PythonAddress;
 
     bool bCameraTracking = false;
     TWeakObjectPtr<ACineCameraActor> TrackedCamera;
     TWeakObjectPtr<AActor>           TrackedTarget;
+    FString                          TrackedSet;      // "$<집합>"을 트래킹하면 집합 이름 (매 틱 중심을 바라봄)
 
 #if WITH_EDITOR
     void ExecutePythonAfterDelay(const FString& ScriptPath);
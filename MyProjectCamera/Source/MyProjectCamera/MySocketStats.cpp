@@ -0,0 +1,237 @@
+#include "MySocketStats.h"
+#include "MyReply.h"
+#include "Dom/JsonObject.h"
+#include "HAL/FileManager.h"
+#include "HAL/IConsoleManager.h"
+#include "Misc/DateTime.h"
+#include "Misc/FileHelper.h"
+#include "Misc/Paths.h"
+
+static TAutoConsoleVariable<float> CVarStatsCsvSeconds(
+    TEXT("MySocket.StatsCsvSeconds"),
+    0.0f,
+    TEXT("소켓 서버 통계를 Saved/SocketStats/<서버>.csv에 추가하는 주기(초). 0이면 끔"));
+
+namespace
+{
+    // 버킷 i의 상한 (초) = 1us * 2^(i/4)
+    double BucketUpperSeconds(int32 Index)
+    {
+        return FMath::Pow(2.0, Index * 0.25) * 1e-6;
+    }
+
+    TSharedPtr<FJsonObject> HistogramJson(const FMySocketStats::FHistogram& H)
+    {
+        TSharedPtr<FJsonObject> O = MakeShared<FJsonObject>();
+        O->SetNumberField(TEXT("count"), static_cast<double>(H.Count));
+        O->SetNumberField(TEXT("avg_ms"), H.AverageSeconds() * 1000.0);
+        O->SetNumberField(TEXT("p50_ms"), H.Percentile(0.50) * 1000.0);
+        O->SetNumberField(TEXT("p95_ms"), H.Percentile(0.95) * 1000.0);
+        O->SetNumberField(TEXT("p99_ms"), H.Percentile(0.99) * 1000.0);
+        O->SetNumberField(TEXT("max_ms"), H.MaxSeconds * 1000.0);
+        return O;
+    }
+
+    FString HistogramText(const FMySocketStats::FHistogram& H)
+    {
+        return FString::Printf(TEXT("ms p50=%.3f p95=%.3f p99=%.3f max=%.3f"),
+            H.Percentile(0.50) * 1000.0, H.Percentile(0.95) * 1000.0, H.Percentile(0.99) * 1000.0, H.MaxSeconds * 1000.0);
+    }
+
+    FString HistogramCsv(const FMySocketStats::FHistogram& H)
+    {
+        return FString::Printf(TEXT("%.4f,%.4f,%.4f,%.4f,%.4f"),
+            H.AverageSeconds() * 1000.0, H.Percentile(0.50) * 1000.0, H.Percentile(0.95) * 1000.0,
+            H.Percentile(0.99) * 1000.0, H.MaxSeconds * 1000.0);
+    }
+}
+
+void FMySocketStats::FHistogram::Add(double Seconds)
+{
+    const double Micros = Seconds * 1e6;
+    const int32 Index = Micros <= 1.0
+        ? 0
+        : FMath::Min(NumBuckets - 1, FMath::CeilToInt32(4.0 * FMath::Log2(Micros)));
+    ++Buckets[Index];
+    ++Count;
+    SumSeconds += Seconds;
+    MaxSeconds = FMath::Max(MaxSeconds, Seconds);
+}
+
+double FMySocketStats::FHistogram::Percentile(double P) const
+{
+    if (Count == 0)
+        return 0.0;
+
+    const uint64 Target = FMath::Max<uint64>(1, static_cast<uint64>(FMath::CeilToDouble(P * Count)));
+    uint64 Seen = 0;
+    for (int32 i = 0; i < NumBuckets; ++i)
+    {
+        Seen += Buckets[i];
+        if (Seen >= Target)
+            return FMath::Min(BucketUpperSeconds(i), MaxSeconds);
+    }
+    return MaxSeconds;
+}
+
+FMySocketStats::FMySocketStats(const TCHAR* InServerName, const TCHAR* InQueueUnit)
+    : ServerName(InServerName)
+    , QueueUnit(InQueueUnit)
+{
+    Reset();
+}
+
+void FMySocketStats::RecordCommand(const FString& Verb, double Seconds, bool bOk)
+{
+    FVerbStats* Entry = Verbs.Find(Verb);
+    if (!Entry)
+        Entry = &Verbs.FindOrAdd(Verbs.Num() < MaxVerbs ? Verb : FString(TEXT("(other)")));
+
+    Entry->Time.Add(Seconds);
+    ++Commands;
+    if (!bOk)
+    {
+        ++Entry->Errors;
+        ++Errors;
+    }
+}
+
+void FMySocketStats::RecordTick(double InBusySeconds, double FrameSeconds, int64 InQueueDepth)
+{
+    QueueDepth = InQueueDepth;
+    MaxQueueDepth = FMath::Max(MaxQueueDepth, InQueueDepth);
+
+    const int32 TickCommands = static_cast<int32>(Commands - CommandsAtLastTick);
+    CommandsAtLastTick = Commands;
+    if (TickCommands <= 0)
+        return;
+
+    ++ActiveTicks;
+    MaxCommandsPerTick = FMath::Max(MaxCommandsPerTick, TickCommands);
+    BusySeconds += InBusySeconds;
+    TickTime.Add(InBusySeconds);
+    if (FrameSeconds > 0.0)
+        MaxFrameShare = FMath::Max(MaxFrameShare, InBusySeconds / FrameSeconds);
+
+    MaybeWriteCsv(FPlatformTime::Seconds());
+}
+
+void FMySocketStats::Reset()
+{
+    StartTime = FPlatformTime::Seconds();
+    LastCsvTime = StartTime;
+    BytesIn = 0;
+    BytesOut = 0;
+    Verbs.Reset();
+    Commands = 0;
+    Errors = 0;
+    CommandsAtLastTick = 0;
+    ActiveTicks = 0;
+    MaxCommandsPerTick = 0;
+    BusySeconds = 0.0;
+    MaxFrameShare = 0.0;
+    TickTime = FHistogram();
+    QueueDepth = 0;
+    MaxQueueDepth = 0;
+}
+
+// JSON data:
+//  {"server","uptime_s","commands","errors","bytes_in","bytes_out",
+//   "ticks":{"active","commands_avg","commands_max","busy_share_pct","max_frame_pct",
+//            "busy":{"count","avg_ms","p50_ms","p95_ms","p99_ms","max_ms"}},
+//   "queue":{"unit","last","max"},
+//   "verbs":{"MOVE":{"count","errors","avg_ms","p50_ms","p95_ms","p99_ms","max_ms"}, ...}}
+//  - busy_share_pct: 조회 시점까지 경과 시간 중 명령 처리에 쓴 게임 스레드 시간 비율
+FMyReply FMySocketStats::BuildReply() const
+{
+    const double Uptime = FMath::Max(1e-6, FPlatformTime::Seconds() - StartTime);
+    const double BusyShare = BusySeconds / Uptime * 100.0;
+    const double CommandsAvg = ActiveTicks ? static_cast<double>(Commands) / ActiveTicks : 0.0;
+
+    TArray<TPair<FString, const FVerbStats*>> Sorted;
+    for (const TPair<FString, FVerbStats>& Pair : Verbs)
+        Sorted.Emplace(Pair.Key, &Pair.Value);
+    Sorted.Sort([](const TPair<FString, const FVerbStats*>& A, const TPair<FString, const FVerbStats*>& B)
+        {
+            return A.Value->Time.Count > B.Value->Time.Count;
+        });
+
+    FString Text = FString::Printf(
+        TEXT("STATS %s uptime=%.1fs commands=%llu errors=%llu in=%lldB out=%lldB busy=%.2f%% ticks=%llu cmds/tick=%.1f(max %d) tick %s frame_max=%.1f%% queue=%lld %s(max %lld)"),
+        *ServerName, Uptime, Commands, Errors, BytesIn.load(), BytesOut.load(), BusyShare,
+        ActiveTicks, CommandsAvg, MaxCommandsPerTick, *HistogramText(TickTime), MaxFrameShare * 100.0,
+        QueueDepth, *QueueUnit, MaxQueueDepth);
+
+    TSharedPtr<FJsonObject> VerbsJson = MakeShared<FJsonObject>();
+    for (const TPair<FString, const FVerbStats*>& Pair : Sorted)
+    {
+        const FVerbStats& V = *Pair.Value;
+        Text += FString::Printf(TEXT("\n  %s n=%llu err=%llu %s"), *Pair.Key, V.Time.Count, V.Errors, *HistogramText(V.Time));
+
+        TSharedPtr<FJsonObject> O = HistogramJson(V.Time);
+        O->SetNumberField(TEXT("errors"), static_cast<double>(V.Errors));
+        VerbsJson->SetObjectField(Pair.Key, O);
+    }
+
+    TSharedPtr<FJsonObject> Ticks = MakeShared<FJsonObject>();
+    Ticks->SetNumberField(TEXT("active"), static_cast<double>(ActiveTicks));
+    Ticks->SetNumberField(TEXT("commands_avg"), CommandsAvg);
+    Ticks->SetNumberField(TEXT("commands_max"), MaxCommandsPerTick);
+    Ticks->SetNumberField(TEXT("busy_share_pct"), BusyShare);
+    Ticks->SetNumberField(TEXT("max_frame_pct"), MaxFrameShare * 100.0);
+    Ticks->SetObjectField(TEXT("busy"), HistogramJson(TickTime));
+
+    TSharedPtr<FJsonObject> Queue = MakeShared<FJsonObject>();
+    Queue->SetStringField(TEXT("unit"), QueueUnit);
+    Queue->SetNumberField(TEXT("last"), static_cast<double>(QueueDepth));
+    Queue->SetNumberField(TEXT("max"), static_cast<double>(MaxQueueDepth));
+
+    TSharedPtr<FJsonObject> Data = MakeShared<FJsonObject>();
+    Data->SetStringField(TEXT("server"), ServerName);
+    Data->SetNumberField(TEXT("uptime_s"), Uptime);
+    Data->SetNumberField(TEXT("commands"), static_cast<double>(Commands));
+    Data->SetNumberField(TEXT("errors"), static_cast<double>(Errors));
+    Data->SetNumberField(TEXT("bytes_in"), static_cast<double>(BytesIn.load()));
+    Data->SetNumberField(TEXT("bytes_out"), static_cast<double>(BytesOut.load()));
+    Data->SetObjectField(TEXT("ticks"), Ticks);
+    Data->SetObjectField(TEXT("queue"), Queue);
+    Data->SetObjectField(TEXT("verbs"), VerbsJson);
+    return FMyReply::Success(MoveTemp(Text), Data);
+}
+
+// 누적값을 세로(long) 형식으로 추가: 시각,서버,항목,count,errors,avg_ms,p50_ms,p95_ms,p99_ms,max_ms,value
+//  - 항목 = 명령 이름 / "(tick)" (명령 처리 시간, value = busy %) / "(bytes_in)" "(bytes_out)" "(queue)" (value만)
+void FMySocketStats::MaybeWriteCsv(double Now)
+{
+    const float Interval = CVarStatsCsvSeconds.GetValueOnGameThread();
+    if (Interval <= 0.f || Now - LastCsvTime < Interval)
+        return;
+    LastCsvTime = Now;
+
+    const FString Dir = FPaths::ProjectSavedDir() / TEXT("SocketStats");
+    const FString Path = Dir / (ServerName + TEXT(".csv"));
+    IFileManager& FileManager = IFileManager::Get();
+
+    FString Rows;
+    if (!FileManager.FileExists(*Path))
+    {
+        FileManager.MakeDirectory(*Dir, true);
+        Rows += TEXT("time,server,metric,count,errors,avg_ms,p50_ms,p95_ms,p99_ms,max_ms,value\n");
+    }
+
+    const FString Time = FDateTime::Now().ToIso8601();
+    const double Uptime = FMath::Max(1e-6, Now - StartTime);
+    for (const TPair<FString, FVerbStats>& Pair : Verbs)
+    {
+        Rows += FString::Printf(TEXT("%s,%s,%s,%llu,%llu,%s,\n"),
+            *Time, *ServerName, *Pair.Key, Pair.Value.Time.Count, Pair.Value.Errors, *HistogramCsv(Pair.Value.Time));
+    }
+    Rows += FString::Printf(TEXT("%s,%s,(tick),%llu,0,%s,%.3f\n"),
+        *Time, *ServerName, TickTime.Count, *HistogramCsv(TickTime), BusySeconds / Uptime * 100.0);
+    Rows += FString::Printf(TEXT("%s,%s,(bytes_in),,,,,,,,%lld\n"), *Time, *ServerName, BytesIn.load());
+    Rows += FString::Printf(TEXT("%s,%s,(bytes_out),,,,,,,,%lld\n"), *Time, *ServerName, BytesOut.load());
+    Rows += FString::Printf(TEXT("%s,%s,(queue),,,,,,,,%lld\n"), *Time, *ServerName, QueueDepth);
+
+    FFileHelper::SaveStringToFile(Rows, *Path, FFileHelper::EEncodingOptions::ForceUTF8WithoutBOM,
+        &FileManager, FILEWRITE_Append);
+}
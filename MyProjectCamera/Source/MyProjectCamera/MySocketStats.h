@@ -0,0 +1,84 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include <atomic>
+
+struct FMyReply;
+
+// 소켓 서버 계측 (9999 PIE / 9998 EDITOR 각각 하나)
+//
+//  - 명령별 호출 수 / 실패 수 / 처리 시간 히스토그램 (p50 / p95 / p99 / max)
+//  - 송수신 바이트, 틱당 처리 명령 수, 틱 끝에 남은 대기량(큐 깊이), 틱당 명령 처리에 쓴 게임 스레드 시간
+//  - "STATS" 명령으로 조회 (JSON 모드면 data에 전부), "STATS RESET"으로 초기화
+//  - 콘솔 변수 MySocket.StatsCsvSeconds > 0이면 그 주기로 Saved/SocketStats/<서버>.csv에 누적값을 추가
+//    (명령을 처리한 틱에서만 확인하므로 조용한 동안에는 줄이 추가되지 않음)
+//
+//  게임 스레드 전용. 수신 바이트(AddBytesIn)만 수신 스레드에서 불러도 됨
+class FMySocketStats
+{
+public:
+    // 처리 시간 히스토그램: 로그 스케일 버킷 (1us ~ 약 16초, 옥타브당 4칸 → 버킷 상한 기준 오차 19% 이내)
+    struct FHistogram
+    {
+        static constexpr int32 NumBuckets = 96;
+
+        uint32 Buckets[NumBuckets] = {};
+        uint64 Count = 0;
+        double SumSeconds = 0.0;
+        double MaxSeconds = 0.0;
+
+        void Add(double Seconds);
+        double Percentile(double P) const;   // 초 (해당 버킷의 상한, MaxSeconds를 넘지 않음)
+        double AverageSeconds() const { return Count ? SumSeconds / Count : 0.0; }
+    };
+
+    struct FVerbStats
+    {
+        uint64 Errors = 0;
+        FHistogram Time;
+    };
+
+    // ServerName: "PIE" / "EDITOR" (CSV 파일 이름), QueueUnit: 큐 깊이 단위 ("bytes" / "messages")
+    FMySocketStats(const TCHAR* InServerName, const TCHAR* InQueueUnit);
+
+    void AddBytesIn(int64 Num) { BytesIn += Num; }
+    void AddBytesOut(int64 Num) { BytesOut += Num; }
+
+    // 명령 1개 처리 완료 (Seconds = 실행 + 응답 전송까지)
+    void RecordCommand(const FString& Verb, double Seconds, bool bOk);
+
+    // 틱 1회 요약: 명령 처리에 쓴 시간 / 프레임 시간 / 틱 끝에 남은 대기량
+    // (이번 틱 명령 수 = 지난 RecordTick 이후 RecordCommand 횟수, BATCH는 안의 명령 수만큼)
+    void RecordTick(double BusySeconds, double FrameSeconds, int64 QueueDepth);
+
+    void Reset();
+
+    // STATS 응답 (텍스트: 요약 한 줄 + 명령별 한 줄씩, JSON data: MySocketStats.cpp 참고)
+    FMyReply BuildReply() const;
+
+private:
+    void MaybeWriteCsv(double Now);
+
+    static constexpr int32 MaxVerbs = 64;   // 넘으면 "(other)"로 합침 (잘못된 명령 이름으로 맵이 커지지 않게)
+
+    FString ServerName;
+    FString QueueUnit;
+    double StartTime = 0.0;
+    double LastCsvTime = 0.0;
+
+    std::atomic<int64> BytesIn{ 0 };
+    std::atomic<int64> BytesOut{ 0 };
+
+    TMap<FString, FVerbStats> Verbs;
+    uint64 Commands = 0;
+    uint64 Errors = 0;
+    uint64 CommandsAtLastTick = 0;
+
+    uint64 ActiveTicks = 0;         // 명령을 하나 이상 처리한 틱
+    int32 MaxCommandsPerTick = 0;
+    double BusySeconds = 0.0;       // 명령 처리에 쓴 게임 스레드 시간 합
+    double MaxFrameShare = 0.0;     // 한 틱에서 명령 처리가 차지한 프레임 비율 최대
+    FHistogram TickTime;            // 활성 틱의 명령 처리 시간
+    int64 QueueDepth = 0;
+    int64 MaxQueueDepth = 0;
+};
@@ -0,0 +1,260 @@
+#include "MyTransformBatch.h"
+#include "MyActorIndex.h"
+#include "MyCommandTokenizer.h"
+#include "MySelectionSets.h"
+#include "Engine/World.h"
+#include "GameFramework/Actor.h"
+#include "Components/SceneComponent.h"
+#include "Policies/CondensedJsonPrintPolicy.h"
+#include "Serialization/JsonWriter.h"
+
+namespace MyTransformBatch
+{
+    using FCondensedWriter = TJsonWriter<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>;
+
+    // Tokens[First]부터 "<액터> <필드마다 값 3개>" 반복
+    static bool ParseEntries(const MyCommandTokenizer::FTokens& Tokens, int32 First, TConstArrayView<EField> Fields, FRequest& Out, FString& OutError)
+    {
+        const int32 Stride = 1 + 3 * Fields.Num();
+        const int32 NumValues = Tokens.Num() - First;
+        if (Fields.Num() == 0 || NumValues <= 0 || NumValues % Stride != 0)
+        {
+            OutError = TEXT("Args");
+            return false;
+        }
+
+        Out.bLocation = Fields.Contains(EField::Location);
+        Out.bRotation = Fields.Contains(EField::Rotation);
+        Out.bScale = Fields.Contains(EField::Scale);
+        Out.Entries.SetNum(NumValues / Stride);
+
+        int32 t = First;
+        for (FEntry& Entry : Out.Entries)
+        {
+            Entry.Actor = FString(Tokens[t++]);
+            for (const EField Field : Fields)
+            {
+                const double A = FCString::Atod(*Tokens[t]);
+                const double B = FCString::Atod(*Tokens[t + 1]);
+                const double C = FCString::Atod(*Tokens[t + 2]);
+                t += 3;
+
+                switch (Field)
+                {
+                case EField::Location: Entry.Location = FVector(A, B, C); break;
+                case EField::Rotation: Entry.Rotation = FRotator(A, B, C); break;
+                case EField::Scale:    Entry.Scale = FVector(A, B, C); break;
+                }
+            }
+        }
+        return true;
+    }
+
+    bool Parse(const MyCommandTokenizer::FTokens& Tokens, FRequest& Out, FString& OutError)
+    {
+        if (Tokens.Num() < 2)
+        {
+            OutError = TEXT("Args");
+            return false;
+        }
+
+        TArray<EField, TInlineAllocator<3>> Fields;
+        for (const TCHAR C : Tokens[1].View())
+        {
+            const EField Field = C == 'L' ? EField::Location : C == 'R' ? EField::Rotation : EField::Scale;
+            if ((C != 'L' && C != 'R' && C != 'S') || Fields.Contains(Field))
+            {
+                OutError = FString::Printf(TEXT("Fields '%s'"), *Tokens[1]);
+                return false;
+            }
+            Fields.Add(Field);
+        }
+
+        Out.bRelative = false;
+        return ParseEntries(Tokens, 2, Fields, Out, OutError);
+    }
+
+    bool ParseRelative(const MyCommandTokenizer::FTokens& Tokens, FRequest& Out, FString& OutError)
+    {
+        EField Field;
+        if (Tokens.Num() > 0 && Tokens[0] == "MOVE_BY")        Field = EField::Location;
+        else if (Tokens.Num() > 0 && Tokens[0] == "ROTATE_BY") Field = EField::Rotation;
+        else if (Tokens.Num() > 0 && Tokens[0] == "SCALE_MUL") Field = EField::Scale;
+        else
+        {
+            OutError = TEXT("Verb");
+            return false;
+        }
+
+        Out.bRelative = true;
+        return ParseEntries(Tokens, 1, MakeArrayView(&Field, 1), Out, OutError);
+    }
+
+    bool ParseGroup(const MyCommandTokenizer::FTokens& Tokens, FGroupRequest& Out, FString& OutError)
+    {
+        if (Tokens.Num() > 0 && Tokens[0] == "GROUP_MOVE_BY")        Out.Field = EField::Location;
+        else if (Tokens.Num() > 0 && Tokens[0] == "GROUP_ROTATE_BY") Out.Field = EField::Rotation;
+        else if (Tokens.Num() > 0 && Tokens[0] == "GROUP_SCALE_MUL") Out.Field = EField::Scale;
+        else
+        {
+            OutError = TEXT("Verb");
+            return false;
+        }
+
+        if (Tokens.Num() < 5)
+        {
+            OutError = TEXT("Args");
+            return false;
+        }
+        Out.Set = FString(Tokens[1]);
+        Out.Value = FVector(FCString::Atod(*Tokens[2]), FCString::Atod(*Tokens[3]), FCString::Atod(*Tokens[4]));
+        Out.Pivot = EPivot::None;
+
+        if (Tokens.Num() == 5)
+            return true;
+        if (Out.Field == EField::Location || Tokens[5] != "PIVOT")
+        {
+            OutError = TEXT("Args");
+            return false;
+        }
+        if (Tokens.Num() == 7 && Tokens[6] == "CENTER")
+        {
+            Out.Pivot = EPivot::Center;
+            return true;
+        }
+        if (Tokens.Num() == 9)
+        {
+            Out.Pivot = EPivot::Point;
+            Out.PivotPoint = FVector(FCString::Atod(*Tokens[6]), FCString::Atod(*Tokens[7]), FCString::Atod(*Tokens[8]));
+            return true;
+        }
+        OutError = TEXT("Pivot");
+        return false;
+    }
+
+    bool EnsureMovable(AActor* Actor)
+    {
+        USceneComponent* Root = Actor ? Actor->GetRootComponent() : nullptr;
+        if (!Root)
+            return false;
+        if (Root->Mobility != EComponentMobility::Movable && Actor->GetWorld() && Actor->GetWorld()->IsGameWorld())
+            Root->SetMobility(EComponentMobility::Movable);
+        return true;
+    }
+
+    int32 ApplyGroup(TConstArrayView<AActor*> Actors, const FGroupRequest& Request, FVector& OutPivot)
+    {
+        const bool bPivot = Request.Pivot != EPivot::None;
+        OutPivot = Request.Pivot == EPivot::Center ? MyGroupOps::Center(Actors) : Request.PivotPoint;
+        const FQuat Delta = Request.Field == EField::Rotation ? FRotator(Request.Value.X, Request.Value.Y, Request.Value.Z).Quaternion() : FQuat::Identity;
+
+        int32 Count = 0;
+        for (AActor* Actor : Actors)
+        {
+            if (!EnsureMovable(Actor))
+                continue;
+
+            FTransform Transform = Actor->GetActorTransform();
+            switch (Request.Field)
+            {
+            case EField::Location:
+                Transform.AddToTranslation(Request.Value);
+                break;
+            case EField::Rotation:
+                Transform.SetRotation((Delta * Transform.GetRotation()).GetNormalized());
+                if (bPivot) Transform.SetLocation(OutPivot + Delta.RotateVector(Transform.GetLocation() - OutPivot));
+                break;
+            case EField::Scale:
+                Transform.SetScale3D(Transform.GetScale3D() * Request.Value);
+                if (bPivot) Transform.SetLocation(OutPivot + (Transform.GetLocation() - OutPivot) * Request.Value);
+                break;
+            }
+            Actor->SetActorTransform(Transform, false, nullptr, ETeleportType::TeleportPhysics);
+            ++Count;
+        }
+        return Count;
+    }
+
+    int32 Apply(FMyActorIndex& Index, const FRequest& Request, TArray<FString>& OutMissing, TArray<AActor*>* OutApplied)
+    {
+        // 1) 조회를 먼저 끝내고
+        TArray<TPair<AActor*, const FEntry*>> Targets;
+        Targets.Reserve(Request.Entries.Num());
+        for (const FEntry& Entry : Request.Entries)
+        {
+            AActor* Actor = Index.FindByName(Entry.Actor);
+            if (Actor && Actor->GetRootComponent())
+                Targets.Emplace(Actor, &Entry);
+            else
+                OutMissing.Add(Entry.Actor);
+        }
+
+        // 2) 한 패스로 적용 (렌더 트랜스폼은 프레임 끝에 한 번에 반영됨)
+        for (const TPair<AActor*, const FEntry*>& Target : Targets)
+        {
+            AActor* Actor = Target.Key;
+            const FEntry& Entry = *Target.Value;
+
+            EnsureMovable(Actor);
+
+            FTransform Transform = Actor->GetActorTransform();
+            if (Request.bRelative)
+            {
+                // 값은 보낸 순간이 아니라 지금(게임 스레드에서 적용하는 순간)의 트랜스폼 기준
+                if (Request.bLocation) Transform.AddToTranslation(Entry.Location);
+                if (Request.bRotation) Transform.SetRotation((Entry.Rotation.Quaternion() * Transform.GetRotation()).GetNormalized());
+                if (Request.bScale)    Transform.SetScale3D(Transform.GetScale3D() * Entry.Scale);
+            }
+            else
+            {
+                if (Request.bLocation) Transform.SetLocation(Entry.Location);
+                if (Request.bRotation) Transform.SetRotation(Entry.Rotation.Quaternion());
+                if (Request.bScale)    Transform.SetScale3D(Entry.Scale);
+            }
+            Actor->SetActorTransform(Transform, false, nullptr, ETeleportType::TeleportPhysics);
+            if (OutApplied)
+                OutApplied->Add(Actor);
+        }
+        return Targets.Num();
+    }
+
+    static void WriteVector(FCondensedWriter& W, const TCHAR* Field, double A, double B, double C)
+    {
+        W.WriteArrayStart(Field);
+        W.WriteValue(A);
+        W.WriteValue(B);
+        W.WriteValue(C);
+        W.WriteArrayEnd();
+    }
+
+    FString BuildJson(FMyActorIndex& Index, TConstArrayView<AActor*> Actors, const TCHAR* MissingField, const TArray<FString>& Missing)
+    {
+        FString Out;
+        Out.Reserve(160 * Actors.Num() + 32);
+        TSharedRef<FCondensedWriter> W = TJsonWriterFactory<TCHAR, TCondensedJsonPrintPolicy<TCHAR>>::Create(&Out);
+
+        W->WriteObjectStart();
+        W->WriteArrayStart(TEXT("actors"));
+        for (AActor* Actor : Actors)
+        {
+            const FVector L = Actor->GetActorLocation();
+            const FRotator R = Actor->GetActorRotation();
+            const FVector S = Actor->GetActorScale3D();
+            W->WriteObjectStart();
+            W->WriteValue(TEXT("name"), Actor->GetName());
+            W->WriteValue(TEXT("handle"), int64(Index.GetOrAddHandle(Actor)));
+            WriteVector(*W, TEXT("location"), L.X, L.Y, L.Z);
+            WriteVector(*W, TEXT("rotation"), R.Pitch, R.Yaw, R.Roll);
+            WriteVector(*W, TEXT("scale"), S.X, S.Y, S.Z);
+            W->WriteObjectEnd();
+        }
+        W->WriteArrayEnd();
+        W->WriteArrayStart(MissingField);
+        for (const FString& Name : Missing)
+            W->WriteValue(Name);
+        W->WriteArrayEnd();
+        W->WriteObjectEnd();
+        W->Close();
+        return Out;
+    }
+}
@@ -0,0 +1,82 @@
+#pragma once
+
+#include "CoreMinimal.h"
+
+class AActor;
+class FMyActorIndex;
+namespace MyCommandTokenizer { class FTokens; }
+
+// SET_TRANSFORMS: 여러 액터의 트랜스폼을 한 틱에 일괄 적용 (9999 PIE / 9998 EDITOR 공용)
+//
+//  SET_TRANSFORMS <필드> <액터> <값...> <액터> <값...> ...
+//  - 필드: L(위치 X Y Z) / R(회전 Pitch Yaw Roll) / S(스케일 X Y Z) 조합, 적은 순서대로 값이 옴
+//    예) "SET_TRANSFORMS LS Cube 0 0 100 1 1 1 Sphere 50 0 100 2 2 2"
+//  - 지정하지 않은 필드는 현재 값 유지
+//  - 액터를 전부 먼저 찾은 뒤 한 패스로 적용 → 그룹이 같은 프레임에 움직임
+//
+// MOVE_BY / ROTATE_BY / SCALE_MUL: 현재 트랜스폼 기준 상대 적용 (클라이언트의 읽기-계산-쓰기 왕복 없이)
+//
+//  MOVE_BY   <액터> dx dy dz [<액터> dx dy dz ...]   위치 += 델타 (월드 축)
+//  ROTATE_BY <액터> dp dy dr [...]                   회전 = 델타 * 현재 (월드 축으로 덧붙임)
+//  SCALE_MUL <액터> fx fy fz [...]                   스케일 *= 배율 (축별)
+//  → 적용 후 값 {"actors":[{"name","handle","location","rotation","scale"}],"missing":[...]} (WATCH 스냅샷과 같은 형식)
+//
+// GROUP_MOVE_BY / GROUP_ROTATE_BY / GROUP_SCALE_MUL: 선택 집합 전체에 같은 델타/배율 (MySelectionSets.h)
+//
+// Mobility: 게임 월드에서 루트가 Movable이 아니면 모든 트랜스폼 경로가 똑같이 Movable로 바꾸고 적용
+//  (MOVE / MOVE_COMMIT / SCALE / SET_TRANSFORMS / *_BY / GROUP_* / 바이너리 미리보기 → EnsureMovable)
+namespace MyTransformBatch
+{
+    enum class EField : uint8 { Location, Rotation, Scale };
+
+    struct FEntry
+    {
+        FString Actor;
+        FVector Location = FVector::ZeroVector;
+        FRotator Rotation = FRotator::ZeroRotator;
+        FVector Scale = FVector::OneVector;
+    };
+
+    enum class EPivot : uint8 { None, Center, Point };
+
+    struct FGroupRequest
+    {
+        FString Set;
+        EField Field = EField::Location;
+        FVector Value = FVector::ZeroVector;   // 델타 (Pitch Yaw Roll) 또는 배율
+        EPivot Pivot = EPivot::None;
+        FVector PivotPoint = FVector::ZeroVector;
+    };
+
+    struct FRequest
+    {
+        bool bRelative = false;   // MOVE_BY / ROTATE_BY / SCALE_MUL (필드 1개, 값은 델타/배율)
+        bool bLocation = false;
+        bool bRotation = false;
+        bool bScale = false;
+        TArray<FEntry> Entries;
+    };
+
+    // 루트가 없으면 false. 게임 월드에서 Movable이 아니면 Movable로 바꿈 (에디터 월드는 그대로 움직임)
+    bool EnsureMovable(AActor* Actor);
+
+    // Tokens[0]은 "SET_TRANSFORMS". 형식이 틀리면 false + OutError
+    bool Parse(const MyCommandTokenizer::FTokens& Tokens, FRequest& Out, FString& OutError);
+
+    // Tokens[0]은 MOVE_BY / ROTATE_BY / SCALE_MUL. 다른 동사거나 형식이 틀리면 false + OutError
+    bool ParseRelative(const MyCommandTokenizer::FTokens& Tokens, FRequest& Out, FString& OutError);
+
+    // Tokens[0]은 GROUP_MOVE_BY / GROUP_ROTATE_BY / GROUP_SCALE_MUL (PIVOT은 회전/스케일만)
+    bool ParseGroup(const MyCommandTokenizer::FTokens& Tokens, FGroupRequest& Out, FString& OutError);
+
+    // 적용한 액터 수 반환, 피벗을 썼으면 OutPivot (CENTER면 적용 전 위치 AABB 중심)
+    int32 ApplyGroup(TConstArrayView<AActor*> Actors, const FGroupRequest& Request, FVector& OutPivot);
+
+    // 적용한 액터 수 반환, 못 찾은 액터 이름은 OutMissing, 적용한 액터는 (있으면) OutApplied
+    // 액터마다 SetActorTransform 1회 (위치/회전/스케일을 따로 세팅하면 컴포넌트 갱신이 최대 3번)
+    int32 Apply(FMyActorIndex& Index, const FRequest& Request, TArray<FString>& OutMissing, TArray<AActor*>* OutApplied = nullptr);
+
+    // {"actors":[{"name","handle","location","rotation","scale"}],"<MissingField>":[...]}
+    // 상대 명령 응답 / WATCH 스냅샷·푸시 공용
+    FString BuildJson(FMyActorIndex& Index, TConstArrayView<AActor*> Actors, const TCHAR* MissingField, const TArray<FString>& Missing);
+}